@@ -0,0 +1,47 @@
+"""validated_transactions
+
+Revision ID: 202610190000_validated_transactions
+Revises: 202602220000_baseline_schema
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "202610190000_validated_transactions"
+down_revision: str | None = "202602220000_baseline_schema"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "validated_transactions",
+        sa.Column("tx_hash", sa.String(length=128), nullable=False),
+        sa.Column("transaction_type", sa.String(length=32), nullable=False),
+        sa.Column("engine_result", sa.String(length=32), nullable=False),
+        sa.Column("account", sa.String(length=64), nullable=False),
+        sa.Column("destination", sa.String(length=64), nullable=True),
+        sa.Column("owner", sa.String(length=64), nullable=True),
+        sa.Column("sequence", sa.BigInteger(), nullable=True),
+        sa.Column("offer_sequence", sa.BigInteger(), nullable=True),
+        sa.Column("amount_drops", sa.BigInteger(), nullable=True),
+        sa.Column("finish_after_ripple", sa.Integer(), nullable=True),
+        sa.Column("cancel_after_ripple", sa.Integer(), nullable=True),
+        sa.Column("condition_hex", sa.String(length=1024), nullable=True),
+        sa.Column("fulfillment_hex", sa.String(length=4096), nullable=True),
+        sa.Column("close_time_ripple", sa.BigInteger(), nullable=True),
+        sa.Column("ledger_index", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("tx_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("validated_transactions")
@@ -0,0 +1,51 @@
+"""escrow_deadlines
+
+Revision ID: 202610190100_escrow_deadlines
+Revises: 202610190000_validated_transactions
+Create Date: 2026-10-19 01:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "202610190100_escrow_deadlines"
+down_revision: str | None = "202610190000_validated_transactions"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "escrow_deadlines",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("escrow_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("bout_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("action", sa.String(length=16), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("due_at_ripple", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("unsigned_tx_json", sa.Text(), nullable=True),
+        sa.Column("xaman_sign_request_json", sa.Text(), nullable=True),
+        sa.Column("last_error", sa.String(length=64), nullable=True),
+        sa.Column("prepared_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["escrow_id"], ["escrows.id"]),
+        sa.ForeignKeyConstraint(["bout_id"], ["bouts.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("escrow_id", "action", name="uq_escrow_deadlines_escrow_action"),
+    )
+    op.create_index("idx_escrow_deadlines_status_due", "escrow_deadlines", ["status", "due_at_ripple"], unique=False)
+    op.create_index("ix_escrow_deadlines_bout_id", "escrow_deadlines", ["bout_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_escrow_deadlines_bout_id", table_name="escrow_deadlines")
+    op.drop_index("idx_escrow_deadlines_status_due", table_name="escrow_deadlines")
+    op.drop_table("escrow_deadlines")
@@ -0,0 +1,44 @@
+"""escrow_tx_payloads
+
+Revision ID: 202610190200_escrow_tx_payloads
+Revises: 202610190100_escrow_deadlines
+Create Date: 2026-10-19 02:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "202610190200_escrow_tx_payloads"
+down_revision: str | None = "202610190100_escrow_deadlines"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "escrow_tx_payloads",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("escrow_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("bout_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("transaction_type", sa.String(length=32), nullable=False),
+        sa.Column("tx_json", sa.Text(), nullable=False),
+        sa.Column("tx_sha256", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["escrow_id"], ["escrows.id"]),
+        sa.ForeignKeyConstraint(["bout_id"], ["bouts.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("escrow_id", "transaction_type", name="uq_escrow_tx_payloads_escrow_type"),
+    )
+    op.create_index("ix_escrow_tx_payloads_bout_id", "escrow_tx_payloads", ["bout_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_escrow_tx_payloads_bout_id", table_name="escrow_tx_payloads")
+    op.drop_table("escrow_tx_payloads")
@@ -0,0 +1,50 @@
+"""bout_listing_indexes
+
+Revision ID: 202610190300_bout_listing_indexes
+Revises: 202610190200_escrow_tx_payloads
+Create Date: 2026-10-19 03:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "202610190300_bout_listing_indexes"
+down_revision: str | None = "202610190200_escrow_tx_payloads"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+_LISTING_COLUMNS = ["winner", "fighter_a_user_id", "fighter_b_user_id"]
+
+
+def upgrade() -> None:
+    # Keyset listing walks (promoter, [status,] event time, id); the INCLUDE columns make it index-only.
+    op.create_index(
+        "idx_bouts_promoter_event_id",
+        "bouts",
+        ["promoter_user_id", "event_datetime_utc", "id"],
+        unique=False,
+        postgresql_include=["status", *_LISTING_COLUMNS],
+    )
+    op.create_index(
+        "idx_bouts_promoter_status_event_id",
+        "bouts",
+        ["promoter_user_id", "status", "event_datetime_utc", "id"],
+        unique=False,
+        postgresql_include=_LISTING_COLUMNS,
+    )
+    op.create_index("idx_escrows_bout_status", "escrows", ["bout_id", "status"], unique=False)
+    # Both are left-prefixes of the composites above.
+    op.drop_index("idx_bouts_promoter_user_id", table_name="bouts")
+    op.drop_index("idx_escrows_bout_id", table_name="escrows")
+
+
+def downgrade() -> None:
+    op.create_index("idx_escrows_bout_id", "escrows", ["bout_id"], unique=False)
+    op.create_index("idx_bouts_promoter_user_id", "bouts", ["promoter_user_id"], unique=False)
+    op.drop_index("idx_escrows_bout_status", table_name="escrows")
+    op.drop_index("idx_bouts_promoter_status_event_id", table_name="bouts")
+    op.drop_index("idx_bouts_promoter_event_id", table_name="bouts")
@@ -0,0 +1,70 @@
+"""bout_summaries
+
+Revision ID: 202610190400_bout_summaries
+Revises: 202610190300_bout_listing_indexes
+Create Date: 2026-10-19 04:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "202610190400_bout_summaries"
+down_revision: str | None = "202610190300_bout_listing_indexes"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+_KINDS = ("show_a", "show_b", "bonus_a", "bonus_b")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bout_summaries",
+        sa.Column("bout_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("promoter_user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("bout_status", sa.String(length=32), nullable=False),
+        sa.Column("winner", sa.String(length=8), nullable=True),
+        sa.Column("locked_drops", sa.BIGINT(), nullable=False),
+        sa.Column("paid_drops", sa.BIGINT(), nullable=False),
+        sa.Column("cancelled_drops", sa.BIGINT(), nullable=False),
+        *(sa.Column(f"{kind}_status", sa.String(length=32), nullable=False) for kind in _KINDS),
+        sa.Column("last_failure_code", sa.String(length=64), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["bout_id"], ["bouts.id"]),
+        sa.ForeignKeyConstraint(["promoter_user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("bout_id"),
+    )
+    op.create_index("ix_bout_summaries_promoter_user_id", "bout_summaries", ["promoter_user_id"], unique=False)
+    kind_columns = ", ".join(f"{kind}_status" for kind in _KINDS)
+    kind_values = ",\n            ".join(
+        f"COALESCE(MAX(CASE WHEN e.kind = '{kind}' THEN e.status::text END), 'planned')" for kind in _KINDS
+    )
+    op.execute(
+        f"""
+        INSERT INTO bout_summaries (
+            bout_id, promoter_user_id, bout_status, winner,
+            locked_drops, paid_drops, cancelled_drops, {kind_columns}, last_failure_code
+        )
+        SELECT
+            b.id, b.promoter_user_id, b.status::text, b.winner::text,
+            COALESCE(SUM(CASE WHEN e.status = 'created' THEN e.amount_drops END), 0),
+            COALESCE(SUM(CASE WHEN e.status = 'finished' THEN e.amount_drops END), 0),
+            COALESCE(SUM(CASE WHEN e.status = 'cancelled' THEN e.amount_drops END), 0),
+            {kind_values},
+            MAX(e.failure_code)
+        FROM bouts b
+        LEFT JOIN escrows e ON e.bout_id = b.id
+        GROUP BY b.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bout_summaries_promoter_user_id", table_name="bout_summaries")
+    op.drop_table("bout_summaries")
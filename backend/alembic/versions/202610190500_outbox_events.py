@@ -0,0 +1,47 @@
+"""outbox_events
+
+Revision ID: 202610190500_outbox_events
+Revises: 202610190400_bout_summaries
+Create Date: 2026-10-19 05:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "202610190500_outbox_events"
+down_revision: str | None = "202610190400_bout_summaries"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_events",
+        sa.Column("id", sa.BIGINT(), sa.Identity(always=False), nullable=False),
+        sa.Column("event_type", sa.String(length=64), nullable=False),
+        sa.Column("bout_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("payload_json", sa.Text(), nullable=False),
+        sa.Column("traceparent", sa.String(length=55), nullable=True),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.String(length=256), nullable=True),
+        sa.Column("dispatched_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_outbox_events_status_available", "outbox_events", ["status", "available_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_outbox_events_status_available", table_name="outbox_events")
+    op.drop_table("outbox_events")
@@ -0,0 +1,44 @@
+"""bout_archives
+
+Revision ID: 202610190600_bout_archives
+Revises: 202610190500_outbox_events
+Create Date: 2026-10-19 06:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "202610190600_bout_archives"
+down_revision: str | None = "202610190500_outbox_events"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bout_archives",
+        sa.Column("bout_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("promoter_user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_datetime_utc", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("format_version", sa.Integer(), nullable=False),
+        sa.Column("document", sa.LargeBinary(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["promoter_user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("bout_id"),
+    )
+    op.create_index("ix_bout_archives_promoter_user_id", "bout_archives", ["promoter_user_id"], unique=False)
+    # Archival deletes a bout's audit rows by entity; without this it scans the whole log per batch.
+    op.create_index("idx_audit_log_entity", "audit_log", ["entity_type", "entity_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_log_entity", table_name="audit_log")
+    op.drop_index("ix_bout_archives_promoter_user_id", table_name="bout_archives")
+    op.drop_table("bout_archives")
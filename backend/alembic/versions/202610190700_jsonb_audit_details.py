@@ -0,0 +1,91 @@
+"""jsonb audit details and binary idempotency bodies
+
+Revision ID: 202610190700_jsonb_audit_details
+Revises: 202610190600_bout_archives
+Create Date: 2026-10-19 07:00:00.000000
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "202610190700_jsonb_audit_details"
+down_revision: str | None = "202610190600_bout_archives"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "audit_log",
+        "details_json",
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="details_json::jsonb",
+    )
+    op.alter_column("audit_log", "details_json", new_column_name="details")
+    op.create_index(
+        "idx_audit_log_details",
+        "audit_log",
+        ["details"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"details": "jsonb_path_ops"},
+    )
+
+    # Existing bodies stay uncompressed; IdempotencyService compresses new ones past its size threshold.
+    op.alter_column(
+        "idempotency_keys",
+        "response_body",
+        type_=sa.LargeBinary(),
+        existing_type=sa.Text(),
+        existing_nullable=False,
+        postgresql_using="convert_to(response_body, 'UTF8')",
+    )
+    op.add_column(
+        "idempotency_keys",
+        sa.Column("response_encoding", sa.String(length=16), server_default="identity", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot inflate zlib, so compressed bodies are expanded here before the column goes back to text.
+    # Offline (--sql) runs cannot read rows; there convert_from below fails loudly on any compressed body instead.
+    if not op.get_context().as_sql:
+        bind = op.get_bind()
+        compressed = bind.execute(
+            sa.text("SELECT id, response_body FROM idempotency_keys WHERE response_encoding = 'zlib'")
+        ).all()
+        for row_id, body in compressed:
+            bind.execute(
+                sa.text("UPDATE idempotency_keys SET response_body = :body WHERE id = :id"),
+                {"id": row_id, "body": zlib.decompress(body)},
+            )
+    op.drop_column("idempotency_keys", "response_encoding")
+    op.alter_column(
+        "idempotency_keys",
+        "response_body",
+        type_=sa.Text(),
+        existing_type=sa.LargeBinary(),
+        existing_nullable=False,
+        postgresql_using="convert_from(response_body, 'UTF8')",
+    )
+
+    op.drop_index("idx_audit_log_details", table_name="audit_log")
+    op.alter_column("audit_log", "details", new_column_name="details_json")
+    op.alter_column(
+        "audit_log",
+        "details_json",
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="details_json::text",
+    )
@@ -0,0 +1,43 @@
+"""unique partial indexes on escrow tx hashes
+
+Revision ID: 202610190800_escrow_tx_hash_indexes
+Revises: 202610190700_jsonb_audit_details
+Create Date: 2026-10-19 08:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "202610190800_escrow_tx_hash_indexes"
+down_revision: str | None = "202610190700_jsonb_audit_details"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Fails if two escrows already share a hash; that data is wrong either way and must be repaired first.
+    op.create_index(
+        "uq_escrows_create_tx_hash",
+        "escrows",
+        ["create_tx_hash"],
+        unique=True,
+        postgresql_where=sa.text("create_tx_hash IS NOT NULL"),
+    )
+    op.create_index(
+        "uq_escrows_close_tx_hash",
+        "escrows",
+        ["close_tx_hash"],
+        unique=True,
+        postgresql_where=sa.text("close_tx_hash IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_escrows_close_tx_hash", table_name="escrows")
+    op.drop_index("uq_escrows_create_tx_hash", table_name="escrows")
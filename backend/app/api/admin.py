@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.dependencies import RequestActor, require_role
+from app.core.profiling import ProfileStore
+from app.models.enums import UserRole
+from app.schemas.profiling import RequestProfileListResponse, RequestProfileSummary
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/profiles", response_model=RequestProfileListResponse)
+def list_request_profiles(
+    request: Request,
+    _actor: RequestActor = Depends(require_role(UserRole.ADMIN)),
+) -> RequestProfileListResponse:
+    store = _profile_store(request)
+    return RequestProfileListResponse(
+        profiles=[
+            RequestProfileSummary(
+                profile_id=profile.profile_id,
+                method=profile.method,
+                route=profile.route,
+                trigger=profile.trigger,
+                started_at=profile.started_at,
+                duration_ms=round(profile.duration_ms, 3),
+                sample_count=profile.sample_count,
+            )
+            for profile in store.list()
+        ]
+    )
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_request_profile_collapsed_stacks(
+    profile_id: str,
+    request: Request,
+    _actor: RequestActor = Depends(require_role(UserRole.ADMIN)),
+) -> PlainTextResponse:
+    profile = _profile_store(request).get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile was not found.")
+    return PlainTextResponse(profile.collapsed_stacks)
+
+
+def _profile_store(request: Request) -> ProfileStore:
+    store = getattr(request.app.state, "profile_store", None)
+    if store is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request profiling is not enabled.")
+    return store
@@ -1,10 +1,17 @@
 from fastapi import APIRouter
 
+from app.api.bouts_routes.bout_routes import router as bout_router
+from app.api.bouts_routes.card_routes import router as card_router
 from app.api.bouts_routes.escrow_routes import router as escrow_router
+from app.api.bouts_routes.event_routes import router as event_router
 from app.api.bouts_routes.payout_routes import router as payout_router
 from app.api.bouts_routes.signing_routes import router as signing_router
 
-router = APIRouter(prefix="/bouts")
-router.include_router(escrow_router, tags=["bouts"])
-router.include_router(payout_router, tags=["bouts"])
-router.include_router(signing_router, tags=["bouts"])
+router = APIRouter()
+# Registered first so ``/bouts/events`` is not captured by ``/bouts/{bout_id}``.
+router.include_router(event_router, prefix="/bouts", tags=["bouts"])
+router.include_router(bout_router, prefix="/bouts", tags=["bouts"])
+router.include_router(card_router, prefix="/bouts", tags=["bouts"])
+router.include_router(escrow_router, prefix="/bouts", tags=["bouts"])
+router.include_router(payout_router, prefix="/bouts", tags=["bouts"])
+router.include_router(signing_router, prefix="/bouts", tags=["bouts"])
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import uuid
+from collections.abc import Iterator
+from datetime import datetime
+from typing import IO, Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import RequestActor, require_role
+from app.db.session import get_session
+from app.db.uow import SqlAlchemyUnitOfWork
+from app.models.enums import BoutStatus, EscrowKind, UserRole
+from app.schemas.bout import (
+    BoutCreateRequest,
+    BoutCreateResponse,
+    BoutDetailEscrowView,
+    BoutDetailResponse,
+    BoutEscrowView,
+    BoutListItem,
+    BoutListResponse,
+    BoutSummaryResponse,
+)
+from app.services.bout_listing import MAX_BOUT_PAGE_SIZE, BoutListingService
+from app.services.bout_service import BoutDraft
+from app.services.card_import import CardImportError, CardImportService, NdjsonBoutImporter, NdjsonLineReader
+
+from .error_map import map_bout_create_error, map_bout_listing_error
+from .http_utils import PreserializedJSONResponse, commit_or_raise_persistence_error
+
+router = APIRouter()
+
+BULK_CHUNK_LINES = 200
+_RESULT_SPOOL_BYTES = 1024 * 1024
+_ESCROW_KIND_ORDER = {kind: index for index, kind in enumerate(EscrowKind)}
+
+
+@router.get("", response_model=BoutListResponse)
+def list_bouts(
+    status_filter: BoutStatus | None = Query(default=None, alias="status"),
+    event_from: datetime | None = None,
+    event_to: datetime | None = None,
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=MAX_BOUT_PAGE_SIZE),
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+    session: Session = Depends(get_session),
+) -> PreserializedJSONResponse:
+    try:
+        page = BoutListingService(session=session).list_bouts(
+            promoter_user_id=actor.user_id,
+            status=status_filter,
+            event_from=event_from,
+            event_to=event_to,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as exc:
+        code, body = map_bout_listing_error(str(exc))
+        raise HTTPException(status_code=code, detail=body["detail"]) from exc
+    return PreserializedJSONResponse(
+        BoutListResponse(
+            items=[
+                BoutListItem(
+                    bout_id=str(item.bout_id),
+                    bout_status=item.status,
+                    winner=item.winner,
+                    event_datetime_utc=item.event_datetime_utc,
+                    fighter_a_user_id=str(item.fighter_a_user_id),
+                    fighter_b_user_id=str(item.fighter_b_user_id),
+                    escrow_status_counts=item.escrow_status_counts,
+                )
+                for item in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
+    )
+
+
+@router.get("/{bout_id}", response_model=BoutDetailResponse)
+def get_bout(
+    bout_id: uuid.UUID,
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+    session: Session = Depends(get_session),
+) -> PreserializedJSONResponse:
+    try:
+        bout, escrows = BoutListingService(session=session).get_bout(promoter_user_id=actor.user_id, bout_id=bout_id)
+    except ValueError as exc:
+        code, body = map_bout_listing_error(str(exc))
+        raise HTTPException(status_code=code, detail=body["detail"]) from exc
+    return PreserializedJSONResponse(
+        BoutDetailResponse(
+            bout_id=str(bout.id),
+            bout_status=bout.status,
+            winner=bout.winner,
+            fighter_a_user_id=str(bout.fighter_a_user_id),
+            fighter_b_user_id=str(bout.fighter_b_user_id),
+            event_datetime_utc=bout.event_datetime_utc,
+            finish_after_utc=bout.finish_after_utc,
+            cancel_after_utc=bout.cancel_after_utc,
+            escrows=[
+                BoutDetailEscrowView(
+                    escrow_id=str(escrow.id),
+                    escrow_kind=escrow.kind,
+                    escrow_status=escrow.status,
+                    amount_drops=escrow.amount_drops,
+                    finish_after_ripple=escrow.finish_after_ripple,
+                    cancel_after_ripple=escrow.cancel_after_ripple,
+                    condition_hex=escrow.condition_hex,
+                    create_tx_hash=escrow.create_tx_hash,
+                    close_tx_hash=escrow.close_tx_hash,
+                    failure_code=escrow.failure_code,
+                )
+                for escrow in sorted(escrows, key=lambda escrow: _ESCROW_KIND_ORDER[escrow.kind])
+            ],
+        )
+    )
+
+
+@router.get("/{bout_id}/summary", response_model=BoutSummaryResponse)
+def get_bout_summary(
+    bout_id: uuid.UUID,
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+    session: Session = Depends(get_session),
+) -> PreserializedJSONResponse:
+    try:
+        summary = BoutListingService(session=session).get_summary(promoter_user_id=actor.user_id, bout_id=bout_id)
+    except ValueError as exc:
+        code, body = map_bout_listing_error(str(exc))
+        raise HTTPException(status_code=code, detail=body["detail"]) from exc
+    return PreserializedJSONResponse(
+        BoutSummaryResponse(
+            bout_id=str(summary.bout_id),
+            bout_status=summary.bout_status,
+            winner=summary.winner,
+            locked_drops=summary.locked_drops,
+            paid_drops=summary.paid_drops,
+            cancelled_drops=summary.cancelled_drops,
+            escrow_statuses={
+                EscrowKind.SHOW_A: summary.show_a_status,
+                EscrowKind.SHOW_B: summary.show_b_status,
+                EscrowKind.BONUS_A: summary.bonus_a_status,
+                EscrowKind.BONUS_B: summary.bonus_b_status,
+            },
+            last_failure_code=summary.last_failure_code,
+            updated_at=summary.updated_at,
+        )
+    )
+
+
+@router.post("", response_model=BoutCreateResponse, status_code=status.HTTP_201_CREATED)
+def create_bout(
+    payload: BoutCreateRequest,
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+    session: Session = Depends(get_session),
+) -> PreserializedJSONResponse:
+    uow = SqlAlchemyUnitOfWork(session=session)
+    try:
+        (planned,) = CardImportService(session=session).import_card(
+            promoter_user_id=actor.user_id, drafts=[BoutDraft(**payload.model_dump())]
+        )
+    except CardImportError as exc:
+        uow.rollback()
+        code, body = map_bout_create_error(exc.code)
+        raise HTTPException(status_code=code, detail=body["detail"]) from exc
+    except Exception:
+        uow.rollback()
+        raise
+
+    # Read the new rows before the commit expires them, so the response costs no reload queries.
+    bout = planned.bout
+    created = BoutCreateResponse(
+        bout_id=str(bout.id),
+        bout_status=bout.status,
+        event_datetime_utc=bout.event_datetime_utc,
+        finish_after_utc=bout.finish_after_utc,
+        cancel_after_utc=bout.cancel_after_utc,
+        escrows=[
+            BoutEscrowView(
+                escrow_id=str(escrow.id),
+                escrow_kind=escrow.kind,
+                escrow_status=escrow.status,
+                amount_drops=escrow.amount_drops,
+                finish_after_ripple=escrow.finish_after_ripple,
+                cancel_after_ripple=escrow.cancel_after_ripple,
+                condition_hex=escrow.condition_hex,
+            )
+            for escrow in sorted(planned.escrows, key=lambda escrow: _ESCROW_KIND_ORDER[escrow.kind])
+        ],
+    )
+    commit_or_raise_persistence_error(uow=uow, detail="Bout could not be persisted safely.")
+    return PreserializedJSONResponse(created, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/bulk", response_class=StreamingResponse)
+async def create_bouts_ndjson(
+    request: Request,
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """Create bouts from an NDJSON body, ``BULK_CHUNK_LINES`` at a time, and stream back one result per line.
+
+    Each chunk is validated and inserted (in a worker thread) as soon as its lines have arrived and is committed on
+    its own, so a bad line rejects only itself. Results are spooled to a temporary file that spills to disk, so
+    memory stays flat however large the upload is.
+    """
+    importer = NdjsonBoutImporter(session=session, promoter_user_id=actor.user_id)
+    reader = NdjsonLineReader()
+    results = tempfile.SpooledTemporaryFile(max_size=_RESULT_SPOOL_BYTES, mode="w+b")
+    pending: list[tuple[int, bytes | None]] = []
+    try:
+        async for chunk in request.stream():
+            pending.extend(reader.feed(chunk))
+            while len(pending) >= BULK_CHUNK_LINES:
+                batch, pending = pending[:BULK_CHUNK_LINES], pending[BULK_CHUNK_LINES:]
+                _write_results(results, await run_in_threadpool(importer.import_lines, batch))
+        pending.extend(reader.finish())
+        if pending:
+            _write_results(results, await run_in_threadpool(importer.import_lines, pending))
+    except BaseException:
+        results.close()
+        raise
+    _write_results(results, [{"summary": {"created": importer.created, "rejected": importer.rejected}}])
+    results.seek(0)
+    return StreamingResponse(_drain(results), media_type="application/x-ndjson")
+
+
+def _write_results(results: IO[bytes], items: list[dict[str, Any]]) -> None:
+    results.write(b"".join(json.dumps(item, separators=(",", ":")).encode() + b"\n" for item in items))
+
+
+def _drain(results: IO[bytes]) -> Iterator[bytes]:
+    try:
+        while chunk := results.read(64 * 1024):
+            yield chunk
+    finally:
+        results.close()
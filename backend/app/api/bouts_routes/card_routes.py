@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import RequestActor, require_role
+from app.db.session import get_session
+from app.db.uow import SqlAlchemyUnitOfWork
+from app.models.enums import UserRole
+from app.schemas.bout import CardImportRequest, CardImportResponse
+from app.services.bout_service import BoutDraft
+from app.services.card_import import CardImportError, CardImportService, read_card_csv
+
+from .error_map import map_card_import_error
+from .http_utils import PreserializedJSONResponse, commit_or_raise_persistence_error
+
+router = APIRouter()
+
+
+@router.post("/cards/import", response_model=CardImportResponse, status_code=status.HTTP_201_CREATED)
+def import_card(
+    payload: CardImportRequest,
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+    session: Session = Depends(get_session),
+) -> PreserializedJSONResponse:
+    drafts = [BoutDraft(**item.model_dump()) for item in payload.bouts]
+    return _import_drafts(session=session, actor=actor, drafts=drafts)
+
+
+@router.post("/cards/import/csv", response_model=CardImportResponse, status_code=status.HTTP_201_CREATED)
+def import_card_csv(
+    body: Annotated[bytes, Body(media_type="text/csv")],
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+    session: Session = Depends(get_session),
+) -> PreserializedJSONResponse:
+    try:
+        drafts = read_card_csv(body.decode("utf-8-sig"))
+    except UnicodeDecodeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Card must be UTF-8 CSV."
+        ) from exc
+    except CardImportError as exc:
+        code, error_body = map_card_import_error(exc.code, row=exc.row)
+        raise HTTPException(status_code=code, detail=error_body["detail"]) from exc
+    return _import_drafts(session=session, actor=actor, drafts=drafts)
+
+
+def _import_drafts(*, session: Session, actor: RequestActor, drafts: list[BoutDraft]) -> PreserializedJSONResponse:
+    uow = SqlAlchemyUnitOfWork(session=session)
+    try:
+        planned = CardImportService(session=session).import_card(promoter_user_id=actor.user_id, drafts=drafts)
+    except CardImportError as exc:
+        uow.rollback()
+        code, error_body = map_card_import_error(exc.code, row=exc.row)
+        raise HTTPException(status_code=code, detail=error_body["detail"]) from exc
+    except Exception:
+        uow.rollback()
+        raise
+
+    bout_ids = [str(item.bout.id) for item in planned]
+    commit_or_raise_persistence_error(uow=uow, detail="Card could not be persisted safely.")
+    return PreserializedJSONResponse(
+        CardImportResponse(created=len(bout_ids), bout_ids=bout_ids), status_code=status.HTTP_201_CREATED
+    )
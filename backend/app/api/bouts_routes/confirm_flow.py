@@ -5,14 +5,14 @@ from dataclasses import dataclass
 from typing import Any
 
 from fastapi import HTTPException, status
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
+from app.core.tracing import start_span
 from app.db.uow import SqlAlchemyUnitOfWork
 from app.middleware.idempotency import build_confirm_scope, require_idempotency_key
 from app.services.idempotency_service import IdempotencyKeyMismatchError, IdempotencyService
 
-from .http_utils import commit_or_raise_persistence_error, store_idempotent_result
+from .http_utils import PreserializedJSONResponse, commit_or_raise_persistence_error, store_idempotent_result
 
 
 @dataclass(frozen=True)
@@ -31,7 +31,7 @@ def prepare_confirm_flow(
     request_payload: dict[str, Any],
     operation: str,
     bout_id: uuid.UUID,
-) -> tuple[ConfirmFlowContext, JSONResponse | None]:
+) -> tuple[ConfirmFlowContext, PreserializedJSONResponse | None]:
     uow = SqlAlchemyUnitOfWork(session=session)
     key = require_idempotency_key(idempotency_key_header)
     idem = IdempotencyService(session=session)
@@ -46,7 +46,9 @@ def prepare_confirm_flow(
     )
 
     try:
-        replay = idem.load_replay(scope=scope, idempotency_key=key, request_hash=request_hash)
+        with start_span("idempotency.load_replay", {"idempotency.scope": scope}) as span:
+            replay = idem.load_replay(scope=scope, idempotency_key=key, request_hash=request_hash)
+            span.set_attribute("idempotency.replayed", replay is not None)
     except IdempotencyKeyMismatchError as exc:
         uow.rollback()
         raise HTTPException(
@@ -55,45 +57,25 @@ def prepare_confirm_flow(
         ) from exc
 
     if replay is not None:
-        return context, JSONResponse(status_code=replay.status_code, content=replay.response_body)
+        return context, PreserializedJSONResponse(content=replay.response_body, status_code=replay.status_code)
     return context, None
 
 
-def persist_confirm_failure(
+def persist_confirm_response(
     *,
     context: ConfirmFlowContext,
-    status_code: int,
-    response_body: dict[str, Any],
+    response: PreserializedJSONResponse,
     persistence_error_detail: str,
 ) -> None:
+    # Failed and successful confirms alike: the rendered body is stored as-is, so a replay sends back
+    # byte-for-byte what this request sent.
     store_idempotent_result(
         callback=context.idem.store_response,
         scope=context.scope,
         idempotency_key=context.key,
         request_hash=context.request_hash,
-        status_code=status_code,
-        response_body=response_body,
-    )
-    commit_or_raise_persistence_error(
-        uow=context.uow,
-        detail=persistence_error_detail,
-    )
-
-
-def persist_confirm_success(
-    *,
-    context: ConfirmFlowContext,
-    status_code: int,
-    response_body: dict[str, Any],
-    persistence_error_detail: str,
-) -> None:
-    store_idempotent_result(
-        callback=context.idem.store_response,
-        scope=context.scope,
-        idempotency_key=context.key,
-        request_hash=context.request_hash,
-        status_code=status_code,
-        response_body=response_body,
+        status_code=response.status_code,
+        response_body=bytes(response.body),
     )
     commit_or_raise_persistence_error(
         uow=context.uow,
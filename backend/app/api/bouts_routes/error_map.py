@@ -42,6 +42,8 @@ _SIGNING_RECONCILIATION_NOT_FOUND_ERRORS = {
     "escrow_not_found",
 }
 
+_TX_HASH_REUSED_DETAIL = "Transaction hash is already recorded against an escrow."
+
 _CONFIRMATION_FAILURE_DETAILS: dict[str, str] = {
     "signing_declined": "Signing was declined; no state transition was applied.",
     "confirmation_timeout": "Confirmation timed out or remained unvalidated; no state transition was applied.",
@@ -55,6 +57,8 @@ _CONFIRMATION_FAILURE_DETAILS: dict[str, str] = {
 def map_escrow_create_confirm_error(error_code: str) -> tuple[int, dict[str, Any]]:
     if error_code in {"bout_not_found", "escrow_not_found"}:
         return status.HTTP_404_NOT_FOUND, {"detail": "Requested bout/escrow was not found."}
+    if error_code == "tx_hash_already_used":
+        return status.HTTP_409_CONFLICT, {"detail": _TX_HASH_REUSED_DETAIL}
     if error_code in _ESCROW_CREATE_CONFLICT_ERRORS:
         return status.HTTP_409_CONFLICT, {"detail": "Escrow confirmation is not allowed in current state."}
     if error_code in _ESCROW_CREATE_UNPROCESSABLE_CONFIRMATION_ERRORS:
@@ -85,6 +89,8 @@ def map_payout_prepare_error(error_code: str) -> tuple[int, dict[str, Any]]:
 def map_payout_confirm_error(error_code: str) -> tuple[int, dict[str, Any]]:
     if error_code in {"bout_not_found", "escrow_not_found"}:
         return status.HTTP_404_NOT_FOUND, {"detail": "Requested bout/escrow was not found."}
+    if error_code == "tx_hash_already_used":
+        return status.HTTP_409_CONFLICT, {"detail": _TX_HASH_REUSED_DETAIL}
     if error_code in _PAYOUT_CONFIRM_CONFLICT_ERRORS:
         return status.HTTP_409_CONFLICT, {"detail": "Payout confirmation is not allowed in current state."}
     if error_code in _PAYOUT_UNPROCESSABLE_CONFIRMATION_ERRORS:
@@ -101,13 +107,41 @@ def map_signing_reconcile_error(error_code: str) -> tuple[int, dict[str, Any]]:
         return status.HTTP_404_NOT_FOUND, {"detail": "Requested bout/escrow was not found."}
     if error_code == "xaman_observed_status_invalid":
         return status.HTTP_400_BAD_REQUEST, {"detail": "Observed signing status is invalid."}
+    if error_code == "xaman_api_rate_limited":
+        return status.HTTP_503_SERVICE_UNAVAILABLE, {"detail": "Xaman is rate limiting requests; retry shortly."}
+    if error_code == "xaman_circuit_open":
+        return status.HTTP_503_SERVICE_UNAVAILABLE, {"detail": "Xaman is temporarily unavailable; retry shortly."}
     if error_code in {
         "xaman_mode_invalid",
         "xaman_api_credentials_missing",
         "xaman_api_http_error",
         "xaman_api_connection_error",
+        "xaman_api_timeout",
         "xaman_api_invalid_json",
         "xaman_api_invalid_response",
     }:
         return status.HTTP_502_BAD_GATEWAY, {"detail": "Xaman payload status could not be reconciled."}
     return status.HTTP_400_BAD_REQUEST, {"detail": "Signing reconciliation request is invalid."}
+
+
+def map_card_import_error(error_code: str, *, row: int | None) -> tuple[int, dict[str, Any]]:
+    if error_code == "card_too_large":
+        return status.HTTP_413_CONTENT_TOO_LARGE, {"detail": "Card has too many bouts for one import."}
+    where = f"Bout {row}" if row is not None else "Card"
+    return status.HTTP_422_UNPROCESSABLE_CONTENT, {"detail": f"{where} was rejected: {error_code}."}
+
+
+def map_bout_create_error(error_code: str) -> tuple[int, dict[str, Any]]:
+    if error_code == "card_fighter_not_found":
+        return status.HTTP_422_UNPROCESSABLE_CONTENT, {"detail": "Both fighters must be registered fighter users."}
+    return status.HTTP_422_UNPROCESSABLE_CONTENT, {"detail": f"Bout definition was rejected: {error_code}."}
+
+
+def map_bout_listing_error(error_code: str) -> tuple[int, dict[str, Any]]:
+    if error_code == "bout_not_found":
+        return status.HTTP_404_NOT_FOUND, {"detail": "Requested bout was not found."}
+    if error_code == "bout_cursor_invalid":
+        return status.HTTP_422_UNPROCESSABLE_CONTENT, {"detail": "Pagination cursor is invalid."}
+    if error_code == "datetime_must_be_timezone_aware":
+        return status.HTTP_422_UNPROCESSABLE_CONTENT, {"detail": "Event window bounds must be timezone-aware."}
+    return status.HTTP_400_BAD_REQUEST, {"detail": "Bout listing request is invalid."}
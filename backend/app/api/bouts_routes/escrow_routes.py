@@ -3,12 +3,13 @@ from __future__ import annotations
 import uuid
 
 from fastapi import APIRouter, Depends, Header, HTTPException, status
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import RequestActor, require_role
 from app.db.session import get_session
-from app.integrations.xaman_service import XamanService
+from app.integrations import get_xaman_service
+from app.integrations.xrpl_client import XrplClientError, XrplJsonRpcClient, get_xrpl_ledger_client
+from app.middleware.idempotency import ESCROW_CREATE_CONFIRM_OPERATION
 from app.models.enums import UserRole
 from app.schemas.escrow import (
     EscrowConfirmRequest,
@@ -17,15 +18,15 @@ from app.schemas.escrow import (
     EscrowPrepareResponse,
 )
 from app.services.escrow_service import EscrowService
+from app.services.validated_tx_cache import build_ledger_tx_source
 from app.services.xrpl_escrow_service import EscrowCreateConfirmation
 
 from .confirm_flow import (
-    persist_confirm_failure,
-    persist_confirm_success,
+    persist_confirm_response,
     prepare_confirm_flow,
 )
 from .error_map import map_escrow_create_confirm_error
-from .http_utils import create_xaman_sign_request_view
+from .http_utils import PreserializedJSONResponse, create_xaman_sign_request_view
 
 router = APIRouter()
 
@@ -35,9 +36,9 @@ def prepare_escrow_create_payloads(
     bout_id: uuid.UUID,
     _actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
     session: Session = Depends(get_session),
-) -> EscrowPrepareResponse:
+) -> PreserializedJSONResponse:
     service = EscrowService(session=session)
-    xaman = XamanService.from_settings()
+    xaman = get_xaman_service()
     try:
         bout, items = service.prepare_escrow_create_payloads(bout_id=bout_id)
     except ValueError as exc:
@@ -54,21 +55,24 @@ def prepare_escrow_create_payloads(
             detail="Bout escrow plan is invalid.",
         ) from exc
 
-    return EscrowPrepareResponse(
-        bout_id=str(bout.id),
-        escrows=[
-            EscrowPrepareItem(
-                escrow_id=item["escrow_id"],
-                escrow_kind=item["escrow_kind"],
-                unsigned_tx=item["unsigned_tx"],
-                xaman_sign_request=create_xaman_sign_request_view(
-                    xaman=xaman,
-                    tx_json=item["unsigned_tx"],
-                    reference=f"escrow_create_prepare:{bout.id}:{item['escrow_id']}",
-                ),
-            )
-            for item in items
-        ],
+    return PreserializedJSONResponse(
+        EscrowPrepareResponse(
+            bout_id=str(bout.id),
+            escrows=[
+                EscrowPrepareItem(
+                    escrow_id=item["escrow_id"],
+                    escrow_kind=item["escrow_kind"],
+                    unsigned_tx=item["unsigned_tx"],
+                    unsigned_tx_hash=item["unsigned_tx_hash"],
+                    xaman_sign_request=create_xaman_sign_request_view(
+                        xaman=xaman,
+                        tx_json=item["unsigned_tx"],
+                        reference=f"escrow_create_prepare:{bout.id}:{item['escrow_id']}",
+                    ),
+                )
+                for item in items
+            ],
+        )
     )
 
 
@@ -79,18 +83,19 @@ def confirm_escrow_create(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
     _actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
     session: Session = Depends(get_session),
-) -> EscrowConfirmResponse | JSONResponse:
+    ledger: XrplJsonRpcClient | None = Depends(get_xrpl_ledger_client),
+) -> PreserializedJSONResponse:
     context, replay = prepare_confirm_flow(
         session=session,
         idempotency_key_header=idempotency_key,
         request_payload=payload.model_dump(mode="json"),
-        operation="escrow_create_confirm",
+        operation=ESCROW_CREATE_CONFIRM_OPERATION,
         bout_id=bout_id,
     )
     if replay is not None:
         return replay
 
-    service = EscrowService(session=session)
+    service = EscrowService(session=session, ledger=build_ledger_tx_source(session=session, ledger=ledger))
     confirmation = EscrowCreateConfirmation(
         tx_hash=payload.tx_hash,
         offer_sequence=payload.offer_sequence,
@@ -110,32 +115,39 @@ def confirm_escrow_create(
             escrow_kind=payload.escrow_kind,
             confirmation=confirmation,
         )
+    except XrplClientError as exc:
+        context.uow.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="XRPL ledger lookup failed; retry shortly.",
+        ) from exc
     except ValueError as exc:
         code, body = map_escrow_create_confirm_error(str(exc))
-        persist_confirm_failure(
+        failure = PreserializedJSONResponse(content=body, status_code=code)
+        persist_confirm_response(
             context=context,
-            status_code=code,
-            response_body=body,
+            response=failure,
             persistence_error_detail="Escrow confirmation could not be persisted safely.",
         )
-        raise HTTPException(status_code=code, detail=body["detail"]) from exc
+        return failure
     except Exception:
         context.uow.rollback()
         raise
 
-    response = EscrowConfirmResponse(
-        bout_id=str(bout.id),
-        escrow_id=str(escrow.id),
-        escrow_kind=escrow.kind,
-        escrow_status=escrow.status,
-        bout_status=bout.status,
-        tx_hash=escrow.create_tx_hash or "",
-        offer_sequence=escrow.offer_sequence or 0,
+    response = PreserializedJSONResponse(
+        EscrowConfirmResponse(
+            bout_id=str(bout.id),
+            escrow_id=str(escrow.id),
+            escrow_kind=escrow.kind,
+            escrow_status=escrow.status,
+            bout_status=bout.status,
+            tx_hash=escrow.create_tx_hash or "",
+            offer_sequence=escrow.offer_sequence or 0,
+        )
     )
-    persist_confirm_success(
+    persist_confirm_response(
         context=context,
-        status_code=status.HTTP_200_OK,
-        response_body=response.model_dump(mode="json"),
+        response=response,
         persistence_error_detail="Escrow confirmation could not be persisted safely.",
     )
     return response
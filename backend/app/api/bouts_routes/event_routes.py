@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import RequestActor, require_role
+from app.core.config import settings
+from app.db.session import get_session
+from app.models.enums import UserRole
+from app.services.bout_events import BoutEventSubscription, bout_event_hub
+from app.services.bout_listing import BoutListingService
+
+from .error_map import map_bout_listing_error
+
+router = APIRouter()
+
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def stream_promoter_events(
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+) -> StreamingResponse:
+    """Server-sent events for every bout the promoter owns, pushed as their state changes commit."""
+    subscription = bout_event_hub.subscribe(promoter_user_id=str(actor.user_id))
+    return StreamingResponse(_sse_frames(subscription), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
+@router.get("/{bout_id}/events", response_class=StreamingResponse)
+async def stream_bout_events(
+    bout_id: uuid.UUID,
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """Server-sent events for one owned bout."""
+    try:
+        await run_in_threadpool(_ensure_owned_bout, session, actor.user_id, bout_id)
+    except ValueError as exc:
+        code, body = map_bout_listing_error(str(exc))
+        raise HTTPException(status_code=code, detail=body["detail"]) from exc
+    subscription = bout_event_hub.subscribe(bout_id=str(bout_id))
+    return StreamingResponse(_sse_frames(subscription), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
+def _ensure_owned_bout(session: Session, promoter_user_id: uuid.UUID, bout_id: uuid.UUID) -> None:
+    try:
+        BoutListingService(session=session).get_owned_bout(promoter_user_id=promoter_user_id, bout_id=bout_id)
+    finally:
+        # The stream can stay open for hours; hand the connection back to the pool now rather than at teardown.
+        session.close()
+
+
+async def _sse_frames(subscription: BoutEventSubscription) -> AsyncIterator[bytes]:
+    try:
+        yield b"retry: 3000\n\n"
+        while True:
+            try:
+                item = await subscription.get(timeout_seconds=settings.bout_events_heartbeat_seconds)
+            except EOFError:
+                return
+            if item is None:
+                yield b": keep-alive\n\n"
+                continue
+            yield f"event: {item.event}\ndata: {item.to_json()}\n\n".encode()
+    finally:
+        subscription.close()
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+import math
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import pydantic_core
 from fastapi import HTTPException, status
+from fastapi.responses import Response
 from sqlalchemy.exc import IntegrityError
 
+from app import integrations
 from app.db.uow import SqlAlchemyUnitOfWork
-from app.integrations.xaman_service import XamanIntegrationError, XamanService
 from app.schemas.xaman import XamanSignRequestView
 
+if TYPE_CHECKING:
+    from app.integrations.xaman_service import XamanService
+
+
+class PreserializedJSONResponse(Response):
+    """JSON response rendered once, straight from a response model by pydantic-core (or passed in as bytes).
+
+    Returning one from a route skips FastAPI's ``response_model`` re-validation and encoding, and ``body`` is the
+    exact payload sent, so it can be stored for idempotent replay and sent back later without re-encoding.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return pydantic_core.to_json(content)
+
 
 def store_idempotent_result(
     *,
@@ -18,7 +39,7 @@ def store_idempotent_result(
     idempotency_key: str,
     request_hash: str,
     status_code: int,
-    response_body: dict[str, Any],
+    response_body: bytes,
 ) -> None:
     callback(
         scope=scope,
@@ -45,7 +66,19 @@ def create_xaman_sign_request_view(
 ) -> XamanSignRequestView:
     try:
         sign_request = xaman.create_sign_request(tx_json=tx_json, reference=reference)
-    except XamanIntegrationError as exc:
+    except integrations.XamanIntegrationError as exc:
+        if str(exc) == "xaman_api_rate_limited":
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Xaman is rate limiting requests; retry shortly.",
+                headers={"Retry-After": "1"},
+            ) from exc
+        if isinstance(exc, integrations.XamanCircuitOpenError):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Xaman is temporarily unavailable; retry shortly.",
+                headers={"Retry-After": str(max(1, math.ceil(exc.retry_after_seconds)))},
+            ) from exc
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Xaman signing request could not be prepared.",
@@ -3,14 +3,16 @@ from __future__ import annotations
 import uuid
 
 from fastapi import APIRouter, Depends, Header, HTTPException, status
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import RequestActor, require_role
 from app.db.session import get_session
 from app.db.uow import SqlAlchemyUnitOfWork
-from app.integrations.xaman_service import XamanService
+from app.integrations import get_xaman_service
+from app.integrations.xrpl_client import XrplClientError, XrplJsonRpcClient, get_xrpl_ledger_client
+from app.middleware.idempotency import PAYOUT_CONFIRM_OPERATION
 from app.models.enums import UserRole
+from app.repositories.escrow_deadline_repository import EscrowDeadlineRepository
 from app.schemas.payout import (
     BoutResultRequest,
     BoutResultResponse,
@@ -19,12 +21,13 @@ from app.schemas.payout import (
     PayoutPrepareItem,
     PayoutPrepareResponse,
 )
-from app.services.payout_service import PayoutService
-from app.services.xrpl_escrow_service import EscrowPayoutConfirmation
+from app.schemas.xaman import XamanSignRequestView
+from app.services.payout_service import PayoutService, payout_sign_request_reference
+from app.services.validated_tx_cache import build_ledger_tx_source
+from app.services.xrpl_escrow_service import EscrowPayoutConfirmation, tx_json_sha256
 
 from .confirm_flow import (
-    persist_confirm_failure,
-    persist_confirm_success,
+    persist_confirm_response,
     prepare_confirm_flow,
 )
 from .error_map import (
@@ -32,7 +35,7 @@ from .error_map import (
     map_payout_prepare_error,
     map_result_error,
 )
-from .http_utils import commit_or_raise_persistence_error, create_xaman_sign_request_view
+from .http_utils import PreserializedJSONResponse, commit_or_raise_persistence_error, create_xaman_sign_request_view
 
 router = APIRouter()
 
@@ -43,7 +46,7 @@ def enter_bout_result(
     payload: BoutResultRequest,
     actor: RequestActor = Depends(require_role(UserRole.ADMIN)),
     session: Session = Depends(get_session),
-) -> BoutResultResponse:
+) -> PreserializedJSONResponse:
     uow = SqlAlchemyUnitOfWork(session=session)
     service = PayoutService(session=session)
     try:
@@ -61,10 +64,12 @@ def enter_bout_result(
         raise
 
     commit_or_raise_persistence_error(uow=uow, detail="Bout result could not be persisted safely.")
-    return BoutResultResponse(
-        bout_id=str(bout.id),
-        bout_status=bout.status,
-        winner=bout.winner or payload.winner,
+    return PreserializedJSONResponse(
+        BoutResultResponse(
+            bout_id=str(bout.id),
+            bout_status=bout.status,
+            winner=bout.winner or payload.winner,
+        )
     )
 
 
@@ -73,32 +78,53 @@ def prepare_payout_payloads(
     bout_id: uuid.UUID,
     _actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
     session: Session = Depends(get_session),
-) -> PayoutPrepareResponse:
+) -> PreserializedJSONResponse:
     service = PayoutService(session=session)
-    xaman = XamanService.from_settings()
+    xaman = get_xaman_service()
     try:
         bout, items = service.prepare_payout_payloads(bout_id=bout_id)
     except ValueError as exc:
         code, body = map_payout_prepare_error(str(exc))
         raise HTTPException(status_code=code, detail=body["detail"]) from exc
 
-    return PayoutPrepareResponse(
-        bout_id=str(bout.id),
-        bout_status=bout.status,
-        escrows=[
-            PayoutPrepareItem(
-                escrow_id=item["escrow_id"],
-                escrow_kind=item["escrow_kind"],
-                action=item["action"],
-                unsigned_tx=item["unsigned_tx"],
-                xaman_sign_request=create_xaman_sign_request_view(
-                    xaman=xaman,
-                    tx_json=item["unsigned_tx"],
-                    reference=f"payout_prepare:{bout.id}:{item['escrow_id']}:{item['action']}",
-                ),
-            )
-            for item in items
-        ],
+    # Sign requests the deadline scheduler already created are reused while their transaction is unchanged.
+    prepared = {
+        (str(deadline.escrow_id), deadline.action.value): deadline
+        for deadline in EscrowDeadlineRepository(session=session).list_prepared_for_bout(bout_id=bout.id)
+    }
+
+    def sign_request_for(item: dict[str, object]) -> XamanSignRequestView:
+        deadline = prepared.get((str(item["escrow_id"]), str(item["action"])))
+        if (
+            deadline is not None
+            and deadline.xaman_sign_request_json
+            and tx_json_sha256(deadline.unsigned_tx_json or "") == item["unsigned_tx_hash"]
+        ):
+            return XamanSignRequestView.model_validate_json(deadline.xaman_sign_request_json)
+        return create_xaman_sign_request_view(
+            xaman=xaman,
+            tx_json=item["unsigned_tx"],
+            reference=payout_sign_request_reference(
+                bout_id=bout.id, escrow_id=item["escrow_id"], action=str(item["action"])
+            ),
+        )
+
+    return PreserializedJSONResponse(
+        PayoutPrepareResponse(
+            bout_id=str(bout.id),
+            bout_status=bout.status,
+            escrows=[
+                PayoutPrepareItem(
+                    escrow_id=item["escrow_id"],
+                    escrow_kind=item["escrow_kind"],
+                    action=item["action"],
+                    unsigned_tx=item["unsigned_tx"],
+                    unsigned_tx_hash=item["unsigned_tx_hash"],
+                    xaman_sign_request=sign_request_for(item),
+                )
+                for item in items
+            ],
+        )
     )
 
 
@@ -109,18 +135,19 @@ def confirm_payout(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
     _actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
     session: Session = Depends(get_session),
-) -> PayoutConfirmResponse | JSONResponse:
+    ledger: XrplJsonRpcClient | None = Depends(get_xrpl_ledger_client),
+) -> PreserializedJSONResponse:
     context, replay = prepare_confirm_flow(
         session=session,
         idempotency_key_header=idempotency_key,
         request_payload=payload.model_dump(mode="json"),
-        operation="payout_confirm",
+        operation=PAYOUT_CONFIRM_OPERATION,
         bout_id=bout_id,
     )
     if replay is not None:
         return replay
 
-    service = PayoutService(session=session)
+    service = PayoutService(session=session, ledger=build_ledger_tx_source(session=session, ledger=ledger))
     confirmation = EscrowPayoutConfirmation(
         tx_hash=payload.tx_hash,
         validated=payload.validated,
@@ -138,31 +165,38 @@ def confirm_payout(
             escrow_kind=payload.escrow_kind,
             confirmation=confirmation,
         )
+    except XrplClientError as exc:
+        context.uow.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="XRPL ledger lookup failed; retry shortly.",
+        ) from exc
     except ValueError as exc:
         code, body = map_payout_confirm_error(str(exc))
-        persist_confirm_failure(
+        failure = PreserializedJSONResponse(content=body, status_code=code)
+        persist_confirm_response(
             context=context,
-            status_code=code,
-            response_body=body,
+            response=failure,
             persistence_error_detail="Payout confirmation could not be persisted safely.",
         )
-        raise HTTPException(status_code=code, detail=body["detail"]) from exc
+        return failure
     except Exception:
         context.uow.rollback()
         raise
 
-    response = PayoutConfirmResponse(
-        bout_id=str(bout.id),
-        escrow_id=str(escrow.id),
-        escrow_kind=escrow.kind,
-        escrow_status=escrow.status,
-        bout_status=bout.status,
-        tx_hash=escrow.close_tx_hash or "",
+    response = PreserializedJSONResponse(
+        PayoutConfirmResponse(
+            bout_id=str(bout.id),
+            escrow_id=str(escrow.id),
+            escrow_kind=escrow.kind,
+            escrow_status=escrow.status,
+            bout_status=bout.status,
+            tx_hash=escrow.close_tx_hash or "",
+        )
     )
-    persist_confirm_success(
+    persist_confirm_response(
         context=context,
-        status_code=status.HTTP_200_OK,
-        response_body=response.model_dump(mode="json"),
+        response=response,
         persistence_error_detail="Payout confirmation could not be persisted safely.",
     )
     return response
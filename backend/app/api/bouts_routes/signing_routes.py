@@ -6,19 +6,16 @@ from collections.abc import Callable
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
+from app import integrations
 from app.api.dependencies import RequestActor, require_role
 from app.db.session import get_session
 from app.db.uow import SqlAlchemyUnitOfWork
-from app.integrations.xaman_service import XamanIntegrationError
 from app.models.enums import UserRole
 from app.schemas.signing import SigningReconcileRequest, SigningReconcileResponse
-from app.services.signing_reconciliation_service import (
-    SigningReconciliationOutcome,
-    SigningReconciliationService,
-)
+from app.services.signing_reconciliation_service import SigningReconciliationOutcome, SigningReconciliationService
 
 from .error_map import map_signing_reconcile_error
-from .http_utils import commit_or_raise_persistence_error
+from .http_utils import PreserializedJSONResponse, commit_or_raise_persistence_error
 
 router = APIRouter()
 
@@ -29,7 +26,7 @@ def reconcile_escrow_signing_status(
     payload: SigningReconcileRequest,
     actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
     session: Session = Depends(get_session),
-) -> SigningReconcileResponse:
+) -> PreserializedJSONResponse:
     return _reconcile_signing(
         session=session,
         action=lambda service: service.reconcile_escrow_create_signing(
@@ -50,7 +47,7 @@ def reconcile_payout_signing_status(
     payload: SigningReconcileRequest,
     actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
     session: Session = Depends(get_session),
-) -> SigningReconcileResponse:
+) -> PreserializedJSONResponse:
     return _reconcile_signing(
         session=session,
         action=lambda service: service.reconcile_payout_signing(
@@ -70,7 +67,7 @@ def _reconcile_signing(
     session: Session,
     action: Callable[[SigningReconciliationService], SigningReconciliationOutcome],
     persistence_error_detail: str,
-) -> SigningReconcileResponse:
+) -> PreserializedJSONResponse:
     uow = SqlAlchemyUnitOfWork(session=session)
     service = SigningReconciliationService(session=session)
     try:
@@ -79,7 +76,7 @@ def _reconcile_signing(
         uow.rollback()
         code, body = map_signing_reconcile_error(str(exc))
         raise HTTPException(status_code=code, detail=body["detail"]) from exc
-    except XamanIntegrationError as exc:
+    except integrations.XamanIntegrationError as exc:
         uow.rollback()
         code, body = map_signing_reconcile_error(str(exc))
         raise HTTPException(status_code=code, detail=body["detail"]) from exc
@@ -91,13 +88,15 @@ def _reconcile_signing(
         uow=uow,
         detail=persistence_error_detail,
     )
-    return SigningReconcileResponse(
-        bout_id=str(outcome.bout.id),
-        escrow_id=str(outcome.escrow.id),
-        escrow_kind=outcome.escrow.kind,
-        escrow_status=outcome.escrow.status,
-        payload_id=outcome.payload_id,
-        signing_status=outcome.signing_status.value,
-        tx_hash=outcome.tx_hash,
-        failure_code=outcome.escrow.failure_code,
+    return PreserializedJSONResponse(
+        SigningReconcileResponse(
+            bout_id=str(outcome.bout.id),
+            escrow_id=str(outcome.escrow.id),
+            escrow_kind=outcome.escrow.kind,
+            escrow_status=outcome.escrow.status,
+            payload_id=outcome.payload_id,
+            signing_status=outcome.signing_status.value,
+            tx_hash=outcome.tx_hash,
+            failure_code=outcome.escrow.failure_code,
+        )
     )
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import RequestActor, require_role
+from app.db.session import get_session
+from app.models.enums import UserRole
+from app.services.settlement_reports import SettlementReportScope, SettlementReportService, encode_report
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+@router.get("/{report}", response_class=StreamingResponse)
+def settlement_report(
+    report: Literal["statement", "purses"],
+    fmt: Literal["csv", "ndjson"] = Query(default="csv", alias="format"),
+    event_from: datetime | None = None,
+    event_to: datetime | None = None,
+    actor: RequestActor = Depends(require_role(UserRole.PROMOTER)),
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """Stream the promoter's settlement ``statement`` (one line per escrow) or per-fighter ``purses`` totals."""
+    service = SettlementReportService(session=session)
+    try:
+        rows = service.rows(
+            report,
+            SettlementReportScope(promoter_user_id=actor.user_id, event_from=event_from, event_to=event_to),
+        )
+    except ValueError as exc:
+        if str(exc) == "datetime_must_be_timezone_aware":
+            detail = "Event window bounds must be timezone-aware."
+        elif str(exc) == "report_window_invalid":
+            detail = "event_from must not be after event_to."
+        else:
+            raise
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=detail) from exc
+    return StreamingResponse(
+        _closing(session, encode_report(rows, columns=service.columns(report), fmt=fmt)),
+        media_type=_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{report}.{fmt}"'},
+    )
+
+
+def _closing(session: Session, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    # The body owns the session. FastAPI before 0.118 tears ``get_session`` down before the body streams, which
+    # would leave the report's queries on a connection nobody closes; closing here holds on every version.
+    try:
+        yield from chunks
+    finally:
+        session.close()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_LabelKey = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class _Metric:
+    name: str
+    help_text: str
+    kind: str
+    _values: dict[_LabelKey, float] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in items:
+            rendered_labels = ",".join(f'{name}="{_escape(label)}"' for name, label in key)
+            suffix = f"{{{rendered_labels}}}" if rendered_labels else ""
+            lines.append(f"{self.name}{suffix} {value:g}")
+        return lines
+
+
+@dataclass
+class Counter(_Metric):
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+@dataclass
+class Gauge(_Metric):
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+
+class MetricsRegistry:
+    """Process-local metrics rendered in the Prometheus text exposition format."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._register(Counter(name=name, help_text=help_text, kind="counter"))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._register(Gauge(name=name, help_text=help_text, kind="gauge"))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        return "".join(f"{line}\n" for metric in metrics for line in metric.render())
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if existing.kind != metric.kind:
+                    raise ValueError(f"metric_kind_conflict:{metric.name}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+def _label_key(labels: dict[str, str]) -> _LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from types import FrameType
+
+PROFILE_HEADER = "X-RingLedger-Profile"
+
+
+@dataclass(frozen=True)
+class RequestProfile:
+    profile_id: str
+    method: str
+    route: str
+    trigger: str
+    started_at: datetime
+    duration_ms: float
+    sample_count: int
+    collapsed_stacks: str
+
+
+class StackSampler:
+    """Statistical sampler that records the call stack of one thread at a fixed interval."""
+
+    def __init__(self, *, target_thread_id: int, interval_seconds: float) -> None:
+        self.target_thread_id = target_thread_id
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ringledger-stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.stacks.values())
+
+    def collapsed(self) -> str:
+        """Render samples in the collapsed-stack format consumed by flamegraph tooling."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            frame = sys._current_frames().get(self.target_thread_id)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+            self._stop.wait(self.interval_seconds)
+
+
+class ProfileStore:
+    """Keeps the most recent request profiles in memory and optionally mirrors them to disk."""
+
+    def __init__(self, *, max_profiles: int, output_dir: str | None = None) -> None:
+        self.max_profiles = max_profiles
+        self.output_dir = Path(output_dir) if output_dir else None
+        self._lock = threading.Lock()
+        self._profiles: OrderedDict[str, RequestProfile] = OrderedDict()
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles[profile.profile_id] = profile
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        if self.output_dir is not None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            (self.output_dir / f"{profile.profile_id}.collapsed").write_text(profile.collapsed_stacks, encoding="utf-8")
+
+    def get(self, profile_id: str) -> RequestProfile | None:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> list[RequestProfile]:
+        with self._lock:
+            return list(reversed(self._profiles.values()))
+
+
+def build_profile_token(*, secret: str, expires_at_unix: int) -> str:
+    """Build the value operators send in ``X-RingLedger-Profile`` to force profiling of one request."""
+    return f"{expires_at_unix}.{_sign(secret=secret, expires_at_unix=expires_at_unix)}"
+
+
+def verify_profile_token(token: str, *, secret: str, now_unix: int | None = None) -> bool:
+    expires_raw, _, signature = token.strip().partition(".")
+    try:
+        expires_at_unix = int(expires_raw)
+    except ValueError:
+        return False
+    if expires_at_unix < (now_unix if now_unix is not None else int(time.time())):
+        return False
+    return hmac.compare_digest(signature, _sign(secret=secret, expires_at_unix=expires_at_unix))
+
+
+def new_profile_id() -> str:
+    return f"{datetime.now(UTC):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+
+
+def _sign(*, secret: str, expires_at_unix: int) -> str:
+    return hmac.new(secret.encode("utf-8"), str(expires_at_unix).encode("ascii"), hashlib.sha256).hexdigest()
+
+
+def _collapse(frame: FrameType) -> str:
+    names: list[str] = []
+    current: FrameType | None = frame
+    while current is not None:
+        code = current.f_code
+        module = current.f_globals.get("__name__", "?")
+        names.append(f"{module}:{code.co_qualname}")
+        current = current.f_back
+    names.reverse()
+    return ";".join(names)
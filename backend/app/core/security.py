@@ -4,18 +4,29 @@ import hashlib
 import hmac
 import secrets
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import jwt
 from jwt import DecodeError, InvalidSignatureError, InvalidTokenError
-from passlib.context import CryptContext
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
 
 PBKDF2_ITERATIONS = 390_000
 JWT_ALGORITHM = "HS256"
-PASSWORD_CONTEXT = CryptContext(
-    schemes=["pbkdf2_sha256"],
-    deprecated="auto",
-    pbkdf2_sha256__default_rounds=PBKDF2_ITERATIONS,
-)
+
+
+@lru_cache(maxsize=1)
+def password_context() -> CryptContext:
+    """passlib is only needed to register or log in, so it is imported on first use rather than at startup."""
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["pbkdf2_sha256"],
+        deprecated="auto",
+        pbkdf2_sha256__default_rounds=PBKDF2_ITERATIONS,
+    )
 
 
 def _legacy_hash_password(password: str, *, salt: bytes | None = None) -> str:
@@ -43,14 +54,14 @@ def hash_password(password: str, *, salt: bytes | None = None) -> str:
     # Preserve deterministic salt support for compatibility tests and legacy tooling.
     if salt is not None:
         return _legacy_hash_password(password, salt=salt)
-    return PASSWORD_CONTEXT.hash(password)
+    return password_context().hash(password)
 
 
 def verify_password(password: str, encoded_hash: str) -> bool:
     if encoded_hash.startswith("pbkdf2_sha256$"):
         return _verify_legacy_password(password, encoded_hash)
     try:
-        return PASSWORD_CONTEXT.verify(password, encoded_hash)
+        return password_context().verify(password, encoded_hash)
     except (ValueError, TypeError):
         return False
 
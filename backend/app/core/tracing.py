@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import json
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+from app.core.config import Settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TRACEPARENT_HEADER = "traceparent"
+
+
+@dataclass
+class Span:
+    """Finished or in-flight span using OpenTelemetry/W3C identifiers and field names."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    start_time_unix_nano: int
+    end_time_unix_nano: int | None = None
+    status: str = "ok"
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def update_name(self, name: str) -> None:
+        self.name = name
+
+    def record_error(self, exc: BaseException) -> None:
+        self.status = "error"
+        self.attributes["error.type"] = type(exc).__name__
+        self.attributes["error.message"] = str(exc)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_unix_nano": self.start_time_unix_nano,
+            "end_time_unix_nano": self.end_time_unix_nano,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    traceparent: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        return None
+
+    def update_name(self, name: str) -> None:
+        return None
+
+    def record_error(self, exc: BaseException) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+_NOOP_SPAN_CONTEXT = nullcontext(_NOOP_SPAN)
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class InMemorySpanExporter:
+    """Collects finished spans in memory; intended for tests and local debugging."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonLinesSpanExporter:
+    """Appends one JSON document per finished span; a local stand-in for a collector."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), separators=(",", ":"), sort_keys=True, default=str)
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+
+_current_span: ContextVar[Span | None] = ContextVar("ringledger_current_span", default=None)
+
+
+class Tracer:
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.exporter = exporter
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+        *,
+        traceparent: str | None = None,
+    ) -> Iterator[Span]:
+        parent = _current_span.get()
+        remote_parent = _parse_traceparent(traceparent) if parent is None and traceparent else None
+        if parent is not None:
+            trace_id, parent_span_id = parent.trace_id, parent.span_id
+        elif remote_parent is not None:
+            trace_id, parent_span_id = remote_parent
+        else:
+            trace_id, parent_span_id = secrets.token_hex(16), None
+
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=secrets.token_hex(8),
+            parent_span_id=parent_span_id,
+            start_time_unix_nano=time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_error(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_time_unix_nano = time.time_ns()
+            self.exporter.export(span)
+
+    @staticmethod
+    def current_traceparent() -> str | None:
+        span = _current_span.get()
+        return span.traceparent if span is not None else None
+
+
+class OpenTelemetryTracer:
+    """Delegates span creation to the OpenTelemetry API configured by the deployment."""
+
+    def __init__(self) -> None:
+        try:
+            from opentelemetry import propagate, trace
+        except ImportError as exc:
+            raise ValueError("tracing_otel_unavailable") from exc
+        self._tracer = trace.get_tracer("ringledger")
+        self._propagate = propagate
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+        *,
+        traceparent: str | None = None,
+    ) -> Iterator[Any]:
+        context = self._propagate.extract({TRACEPARENT_HEADER: traceparent}) if traceparent else None
+        with self._tracer.start_as_current_span(name, context=context, attributes=attributes) as span:
+            yield span
+
+    def current_traceparent(self) -> str | None:
+        carrier: dict[str, str] = {}
+        self._propagate.inject(carrier)
+        return carrier.get(TRACEPARENT_HEADER)
+
+
+_active_tracer: Tracer | OpenTelemetryTracer | None = None
+
+
+def configure_tracing(tracer: Tracer | OpenTelemetryTracer | None) -> None:
+    """Install (or with ``None`` remove) the process-wide tracer."""
+    global _active_tracer
+    _active_tracer = tracer
+
+
+def configure_tracing_from_settings(settings: Settings) -> None:
+    exporter = settings.tracing_exporter
+    if exporter == "none":
+        return
+    if exporter == "file":
+        configure_tracing(Tracer(JsonLinesSpanExporter(settings.tracing_file_path)))
+        return
+    if exporter == "otel":
+        configure_tracing(OpenTelemetryTracer())
+        return
+    raise ValueError(f"tracing_exporter_invalid:{exporter}")
+
+
+def tracing_enabled() -> bool:
+    return _active_tracer is not None
+
+
+def start_span(name: str, attributes: dict[str, Any] | None = None, *, traceparent: str | None = None):
+    """Open a child span of the current context; returns a shared no-op context when tracing is off."""
+    tracer = _active_tracer
+    if tracer is None:
+        return _NOOP_SPAN_CONTEXT
+    return tracer.start_span(name, attributes, traceparent=traceparent)
+
+
+def current_traceparent() -> str | None:
+    tracer = _active_tracer
+    if tracer is None:
+        return None
+    return tracer.current_traceparent()
+
+
+def traced(name: str) -> Callable[[F], F]:
+    def decorator(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _active_tracer
+            if tracer is None:
+                return fn(*args, **kwargs)
+            with tracer.start_span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def bind_trace_context(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Capture the caller's trace context so work handed to another thread stays in the same trace."""
+    if _active_tracer is None:
+        return fn
+    context = copy_context()
+
+    @wraps(fn)
+    def bound(*args: Any, **kwargs: Any) -> Any:
+        return context.copy().run(fn, *args, **kwargs)
+
+    return bound
+
+
+def _parse_traceparent(value: str) -> tuple[str, str] | None:
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16)
+        int(parts[2], 16)
+    except ValueError:
+        return None
+    return parts[1].lower(), parts[2].lower()
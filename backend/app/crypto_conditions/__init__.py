@@ -1,5 +1,6 @@
 from app.crypto_conditions.fulfillment import (
     generate_preimage_hex,
+    generate_preimage_hexes,
     make_condition_hex,
     make_fulfillment_hex,
     verify_fulfillment,
@@ -7,6 +8,7 @@ from app.crypto_conditions.fulfillment import (
 
 __all__ = [
     "generate_preimage_hex",
+    "generate_preimage_hexes",
     "make_condition_hex",
     "make_fulfillment_hex",
     "verify_fulfillment",
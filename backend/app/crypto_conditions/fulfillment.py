@@ -9,6 +9,12 @@ def generate_preimage_hex() -> str:
     return secrets.token_hex(32).upper()
 
 
+def generate_preimage_hexes(count: int) -> list[str]:
+    """``count`` preimages from a single CSPRNG read, for planning many bonus escrows at once."""
+    raw = secrets.token_bytes(32 * count)
+    return [raw[offset : offset + 32].hex().upper() for offset in range(0, len(raw), 32)]
+
+
 def make_condition_hex(preimage_hex: str) -> str:
     raw = bytes.fromhex(_normalize_hex(preimage_hex))
     return hashlib.sha256(raw).hexdigest().upper()
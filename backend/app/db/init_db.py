@@ -1,29 +1,85 @@
 from __future__ import annotations
 
+import ast
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
-from alembic import command
 from app.core.config import settings
+from app.db.session import get_engine
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+_BACKEND_ROOT = Path(__file__).resolve().parents[2]
+_VERSIONS_DIR = _BACKEND_ROOT / "alembic" / "versions"
+_REVISION_LINE = re.compile(r"^(revision|down_revision)\s*(?::[^=]*)?=\s*(.+)$", re.MULTILINE)
 
 
 def _build_alembic_config() -> Config:
-    backend_root = Path(__file__).resolve().parents[2]
-    config = Config(str(backend_root / "alembic.ini"))
-    config.set_main_option("script_location", str(backend_root / "alembic"))
+    from alembic.config import Config
+
+    config = Config(str(_BACKEND_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(_BACKEND_ROOT / "alembic"))
     config.set_main_option("sqlalchemy.url", settings.database_url)
     return config
 
 
 def run_db_migrations(*, revision: str = "head") -> None:
+    from alembic import command
+
     command.upgrade(_build_alembic_config(), revision)
 
 
+def head_revisions(versions_dir: Path = _VERSIONS_DIR) -> set[str]:
+    """Head revision ids, read from the revision files' ``revision``/``down_revision`` lines.
+
+    Nothing is imported: this is the fast-boot check, so it must not pay for Alembic's script directory and
+    environment (or the migration modules) just to learn that there is nothing to run.
+    """
+    revisions: set[str] = set()
+    parents: set[str] = set()
+    for path in versions_dir.glob("*.py"):
+        try:
+            values = {name: ast.literal_eval(raw.strip()) for name, raw in _REVISION_LINE.findall(path.read_text())}
+        except (ValueError, SyntaxError):
+            # A layout this parser does not follow (e.g. a multi-line merge tuple): report no heads, so startup
+            # takes the full Alembic upgrade path instead.
+            return set()
+        if "revision" not in values:
+            continue
+        revisions.add(values["revision"])
+        down = values.get("down_revision")
+        if isinstance(down, str):
+            parents.add(down)
+        elif down:
+            parents.update(down)
+    return revisions - parents
+
+
+def current_revisions() -> set[str]:
+    """Revisions stamped in ``alembic_version``; empty when the database has never been migrated."""
+    try:
+        with get_engine().connect() as connection:
+            return set(connection.scalars(text("SELECT version_num FROM alembic_version")))
+    except SQLAlchemyError:
+        return set()
+
+
+def database_at_head() -> bool:
+    heads = head_revisions()
+    return bool(heads) and current_revisions() == heads
+
+
 def init_db() -> None:
     """Run startup migrations according to runtime safety policy."""
     if settings.app_env == "production":
         return
     if not settings.db_auto_migrate_on_startup:
         return
+    if settings.db_fast_boot and database_at_head():
+        return
     run_db_migrations(revision="head")
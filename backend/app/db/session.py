@@ -1,14 +1,27 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+from functools import lru_cache
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.database_url, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """The process-wide engine, created on first use so importing the app does not load the database driver."""
+    return create_engine(settings.database_url, future=True)
+
+
+@lru_cache(maxsize=1)
+def _sessionmaker() -> sessionmaker[Session]:
+    return sessionmaker(bind=get_engine(), autoflush=False, autocommit=False, future=True)
+
+
+def SessionLocal() -> Session:  # noqa: N802 - keeps the sessionmaker-style name callers already use
+    return _sessionmaker()()
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced
 from app.repositories.audit_log_repository import AuditLogRepository
 from app.repositories.bout_repository import BoutRepository
 from app.repositories.escrow_repository import EscrowRepository
@@ -24,8 +25,10 @@ class SqlAlchemyUnitOfWork:
         self.idempotency_keys = IdempotencyKeyRepository(session=self.session)
         self.audit_logs = AuditLogRepository(session=self.session)
 
+    @traced("uow.commit")
     def commit(self) -> None:
         self.session.commit()
 
+    @traced("uow.rollback")
     def rollback(self) -> None:
         self.session.rollback()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from decimal import ROUND_DOWN, Decimal
 
 DROP_SCALE = Decimal("1000000")
@@ -29,3 +30,13 @@ def xrp_to_drops(xrp: str | Decimal) -> int:
 def drops_to_xrp(drops: int) -> Decimal:
     clean_drops = ensure_valid_drops(drops)
     return Decimal(clean_drops) / DROP_SCALE
+
+
+def drops_to_xrp_strings(drops: Sequence[int]) -> list[str]:
+    """Fixed six-decimal XRP strings for a batch of drop amounts, for reports.
+
+    Same value as ``drops_to_xrp`` but formatted with integer arithmetic, which is several times faster than
+    ``Decimal`` division when exporting many rows.
+    """
+    scale = int(DROP_SCALE)
+    return [f"{whole}.{fraction:06d}" for whole, fraction in (divmod(ensure_valid_drops(d), scale) for d in drops)]
@@ -11,6 +11,11 @@ def ensure_utc(dt: datetime) -> datetime:
     return dt.astimezone(UTC)
 
 
+def stored_as_utc(dt: datetime) -> datetime:
+    """A timestamp read back from the database as aware UTC; SQLite returns them naive, but they were stored as UTC."""
+    return dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
+
+
 def unix_to_ripple_epoch(unix_seconds: int) -> int:
     return unix_seconds - RIPPLE_EPOCH_OFFSET
 
@@ -1,17 +1,38 @@
 """External integrations for signing and ledger-adjacent services."""
 
-from app.integrations.xaman_service import (
-    XamanIntegrationError,
-    XamanPayloadStatus,
-    XamanPayloadStatusResult,
-    XamanService,
-    XamanSignRequest,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.integrations.xaman_service import (
+        XamanCircuitOpenError,
+        XamanIntegrationError,
+        XamanPayloadStatus,
+        XamanPayloadStatusResult,
+        XamanService,
+        XamanSignRequest,
+    )
 
 __all__ = [
+    "XamanCircuitOpenError",
     "XamanIntegrationError",
     "XamanPayloadStatus",
     "XamanPayloadStatusResult",
     "XamanService",
     "XamanSignRequest",
+    "get_xaman_service",
 ]
+
+
+def get_xaman_service() -> XamanService:
+    """A Xaman client built from settings; the client module is imported on the first call, not with the app."""
+    return import_module("app.integrations.xaman_service").XamanService.from_settings()
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first access: importing a sibling such as ``xrpl_client`` must not load the Xaman client.
+    if name in __all__:
+        return getattr(import_module("app.integrations.xaman_service"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
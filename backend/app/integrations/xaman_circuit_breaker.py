@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+from app.core.metrics import registry
+
+_STATE_GAUGE = registry.gauge(
+    "ringledger_xaman_circuit_state",
+    "Xaman circuit breaker state (0=closed, 1=half_open, 2=open).",
+)
+_TRANSITIONS = registry.counter(
+    "ringledger_xaman_circuit_transitions_total",
+    "Xaman circuit breaker state transitions by target state.",
+)
+_REJECTED = registry.counter(
+    "ringledger_xaman_circuit_rejected_total",
+    "Xaman calls failed fast because the circuit was open.",
+)
+
+
+class XamanCircuitState(StrEnum):
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_VALUES = {XamanCircuitState.CLOSED: 0, XamanCircuitState.HALF_OPEN: 1, XamanCircuitState.OPEN: 2}
+
+
+class XamanCircuitOpen(RuntimeError):
+    """Raised when a Xaman call is rejected without reaching the provider."""
+
+    def __init__(self, retry_after_seconds: float) -> None:
+        super().__init__("xaman_circuit_open")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class XamanCircuitBreaker:
+    """Consecutive-failure circuit breaker shared by every Xaman call in the process.
+
+    ``failure_threshold`` consecutive transient failures open the circuit; after ``reset_timeout_seconds`` it
+    half-opens and admits at most ``half_open_max_probes`` concurrent probe calls. A probe success closes it again,
+    a probe failure re-opens it for another full reset interval.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int,
+        reset_timeout_seconds: float,
+        half_open_max_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1 or reset_timeout_seconds <= 0 or half_open_max_probes < 1:
+            raise ValueError("xaman_circuit_breaker_invalid")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.half_open_max_probes = half_open_max_probes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = XamanCircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        _STATE_GAUGE.set(_STATE_VALUES[self._state])
+
+    @property
+    def state(self) -> XamanCircuitState:
+        with self._lock:
+            self._maybe_half_open(self._clock())
+            return self._state
+
+    def before_call(self) -> None:
+        """Admit a call or raise ``XamanCircuitOpen``; every admitted call must be followed by a ``record_*``."""
+        with self._lock:
+            now = self._clock()
+            self._maybe_half_open(now)
+            if self._state is XamanCircuitState.CLOSED:
+                return
+            if self._state is XamanCircuitState.HALF_OPEN and self._probes_in_flight < self.half_open_max_probes:
+                self._probes_in_flight += 1
+                return
+            _REJECTED.inc()
+            retry_after = self.reset_timeout_seconds
+            if self._state is XamanCircuitState.OPEN:
+                retry_after = max(0.0, self._opened_at + self.reset_timeout_seconds - now)
+            raise XamanCircuitOpen(retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state is XamanCircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if self._state is not XamanCircuitState.CLOSED:
+                self._transition(XamanCircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._state is XamanCircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._open(now)
+                return
+            self._consecutive_failures += 1
+            if self._state is XamanCircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._open(now)
+
+    def record_neutral(self) -> None:
+        """Release an admitted call whose outcome says nothing about provider health (e.g. a 4xx)."""
+        with self._lock:
+            if self._state is XamanCircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state is XamanCircuitState.OPEN and now - self._opened_at >= self.reset_timeout_seconds:
+            self._probes_in_flight = 0
+            self._transition(XamanCircuitState.HALF_OPEN)
+
+    def _open(self, now: float) -> None:
+        self._opened_at = now
+        self._consecutive_failures = 0
+        self._transition(XamanCircuitState.OPEN)
+
+    def _transition(self, state: XamanCircuitState) -> None:
+        self._state = state
+        _STATE_GAUGE.set(_STATE_VALUES[state])
+        _TRANSITIONS.inc(to=state.value)
+
+
+_shared_breaker: XamanCircuitBreaker | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_xaman_circuit_breaker(
+    *,
+    failure_threshold: int,
+    reset_timeout_seconds: float,
+    half_open_max_probes: int,
+) -> XamanCircuitBreaker | None:
+    """Return the process-wide breaker shared by every ``XamanService`` built from settings (None disables it)."""
+    global _shared_breaker
+    if failure_threshold <= 0:
+        return None
+    with _shared_lock:
+        if (
+            _shared_breaker is None
+            or _shared_breaker.failure_threshold != failure_threshold
+            or _shared_breaker.reset_timeout_seconds != reset_timeout_seconds
+            or _shared_breaker.half_open_max_probes != half_open_max_probes
+        ):
+            _shared_breaker = XamanCircuitBreaker(
+                failure_threshold=failure_threshold,
+                reset_timeout_seconds=reset_timeout_seconds,
+                half_open_max_probes=half_open_max_probes,
+            )
+        return _shared_breaker
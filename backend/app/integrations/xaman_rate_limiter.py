@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+
+class XamanRequestPriority(IntEnum):
+    """Lower values are served first when callers queue for Xaman capacity."""
+
+    PAYOUT_SIGNING = 0
+    ESCROW_SIGNING = 1
+    STATUS_POLL = 2
+
+
+class XamanRateLimitTimeout(RuntimeError):
+    """Raised when a queued Xaman call cannot get capacity before its deadline."""
+
+
+class XamanRateLimiter:
+    """Thread-safe token bucket with priority queueing and adaptive slow-down on provider throttling.
+
+    Waiters are served strictly by (priority, arrival order). A 429 halves the effective refill rate (down to
+    ``min_rate_fraction`` of the configured rate) and pauses all callers for the Retry-After interval; each
+    success recovers a fraction of the configured rate.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_per_second: float,
+        burst: int,
+        min_rate_fraction: float = 0.1,
+        recovery_step: float = 0.05,
+        default_retry_after_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate_per_second <= 0 or burst < 1:
+            raise ValueError("xaman_rate_limit_invalid")
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.min_rate_fraction = min_rate_fraction
+        self.recovery_step = recovery_step
+        self.default_retry_after_seconds = default_retry_after_seconds
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._tokens = float(burst)
+        self._rate_fraction = 1.0
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def effective_rate_per_second(self) -> float:
+        with self._condition:
+            return self.rate_per_second * self._rate_fraction
+
+    def acquire(self, *, priority: XamanRequestPriority, timeout_seconds: float) -> None:
+        deadline = self._clock() + timeout_seconds
+        ticket = (int(priority), next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = self._clock()
+                    self._refill(now)
+                    is_head = self._waiters[0] == ticket
+                    if is_head and now >= self._paused_until and self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    if now >= deadline:
+                        raise XamanRateLimitTimeout("xaman_rate_limit_deadline_exceeded")
+                    wait = deadline - now
+                    if is_head:
+                        wait = min(wait, max(self._paused_until - now, self._seconds_until_token()))
+                    self._condition.wait(max(wait, 0.001))
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def record_throttled(self, *, retry_after_seconds: float | None) -> None:
+        with self._condition:
+            now = self._clock()
+            self._refill(now)
+            pause = retry_after_seconds if retry_after_seconds is not None else self.default_retry_after_seconds
+            self._paused_until = max(self._paused_until, now + max(pause, 0.0))
+            self._rate_fraction = max(self.min_rate_fraction, self._rate_fraction / 2)
+            self._tokens = 0.0
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        with self._condition:
+            if self._rate_fraction < 1.0:
+                self._refill(self._clock())
+                self._rate_fraction = min(1.0, self._rate_fraction + self.recovery_step)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._updated_at = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate_per_second * self._rate_fraction)
+
+    def _seconds_until_token(self) -> float:
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / (self.rate_per_second * self._rate_fraction)
+
+
+_shared_limiter: XamanRateLimiter | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_xaman_rate_limiter(*, rate_per_second: float, burst: int) -> XamanRateLimiter | None:
+    """Return the process-wide limiter shared by every ``XamanService`` built from settings (None disables it)."""
+    global _shared_limiter
+    if rate_per_second <= 0:
+        return None
+    with _shared_lock:
+        if (
+            _shared_limiter is None
+            or _shared_limiter.rate_per_second != rate_per_second
+            or _shared_limiter.burst != burst
+        ):
+            _shared_limiter = XamanRateLimiter(rate_per_second=rate_per_second, burst=burst)
+        return _shared_limiter
+
+
+def parse_retry_after(value: str | None, *, now: datetime | None = None) -> float | None:
+    """Parse a Retry-After header given either as delta-seconds or as an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value.strip()))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - (now or datetime.now(UTC))).total_seconds())
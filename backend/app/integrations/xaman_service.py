@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import contextvars
 import json
+import random
+import threading
+import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any
@@ -9,12 +14,65 @@ from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
 from app.core.config import settings
+from app.core.metrics import registry
+from app.core.tracing import TRACEPARENT_HEADER, current_traceparent, start_span
+from app.integrations.xaman_circuit_breaker import (
+    XamanCircuitBreaker,
+    XamanCircuitOpen,
+    get_shared_xaman_circuit_breaker,
+)
+from app.integrations.xaman_rate_limiter import (
+    XamanRateLimiter,
+    XamanRateLimitTimeout,
+    XamanRequestPriority,
+    get_shared_xaman_rate_limiter,
+    parse_retry_after,
+)
+from app.integrations.xaman_status_coalescer import XamanStatusCoalescer, get_shared_xaman_status_coalescer
+
+_PAYOUT_TRANSACTION_TYPES = {"EscrowFinish", "EscrowCancel"}
+_RETRY_MAX_DELAY_SECONDS = 2.0
+_HEDGE_MAX_WORKERS = 16
+
+_REQUESTS = registry.counter(
+    "ringledger_xaman_requests_total",
+    "Xaman API calls by operation and outcome.",
+)
+_RETRIES = registry.counter(
+    "ringledger_xaman_retries_total",
+    "Retried idempotent Xaman API calls by operation.",
+)
+_HEDGES = registry.counter(
+    "ringledger_xaman_hedged_requests_total",
+    "Hedged Xaman API calls by operation and winning attempt.",
+)
+
+_hedge_executor: ThreadPoolExecutor | None = None
+_hedge_executor_lock = threading.Lock()
 
 
 class XamanIntegrationError(RuntimeError):
     """Raised when Xaman sign-request creation cannot be completed safely."""
 
 
+class XamanCircuitOpenError(XamanIntegrationError):
+    """Raised without contacting Xaman while the circuit breaker is open."""
+
+    def __init__(self, retry_after_seconds: float) -> None:
+        super().__init__("xaman_circuit_open")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class _XamanTransientError(XamanIntegrationError):
+    """Connection failures, timeouts and 5xx answers: counted by the breaker and retryable when idempotent."""
+
+
+class _XamanThrottled(Exception):
+    def __init__(self, retry_after_seconds: float | None) -> None:
+        super().__init__("xaman_api_throttled")
+        self.retry_after_seconds = retry_after_seconds
+
+
 @dataclass(frozen=True)
 class XamanSignRequest:
     payload_id: str
@@ -32,6 +90,9 @@ class XamanPayloadStatus(StrEnum):
     UNKNOWN = "unknown"
 
 
+_RESOLVED_STATUSES = {XamanPayloadStatus.SIGNED, XamanPayloadStatus.DECLINED, XamanPayloadStatus.EXPIRED}
+
+
 @dataclass(frozen=True)
 class XamanPayloadStatusResult:
     payload_id: str
@@ -47,6 +108,13 @@ class XamanService:
     api_key: str | None
     api_secret: str | None
     timeout_seconds: int = 10
+    rate_limiter: XamanRateLimiter | None = None
+    queue_deadline_seconds: float = 5.0
+    circuit_breaker: XamanCircuitBreaker | None = None
+    status_max_retries: int = 0
+    retry_base_delay_seconds: float = 0.1
+    hedge_after_seconds: float | None = None
+    status_coalescer: XamanStatusCoalescer[XamanPayloadStatusResult] | None = None
 
     @classmethod
     def from_settings(cls) -> XamanService:
@@ -56,6 +124,22 @@ class XamanService:
             api_key=settings.xaman_api_key,
             api_secret=settings.xaman_api_secret,
             timeout_seconds=settings.xaman_timeout_seconds,
+            rate_limiter=get_shared_xaman_rate_limiter(
+                rate_per_second=settings.xaman_rate_limit_per_second,
+                burst=settings.xaman_rate_limit_burst,
+            ),
+            queue_deadline_seconds=settings.xaman_queue_deadline_seconds,
+            circuit_breaker=get_shared_xaman_circuit_breaker(
+                failure_threshold=settings.xaman_circuit_failure_threshold,
+                reset_timeout_seconds=settings.xaman_circuit_reset_seconds,
+                half_open_max_probes=settings.xaman_circuit_half_open_probes,
+            ),
+            status_max_retries=settings.xaman_status_max_retries,
+            retry_base_delay_seconds=settings.xaman_retry_base_delay_ms / 1000,
+            hedge_after_seconds=settings.xaman_hedge_after_ms / 1000 if settings.xaman_hedge_after_ms > 0 else None,
+            status_coalescer=get_shared_xaman_status_coalescer(
+                resolved_ttl_seconds=settings.xaman_status_cache_ttl_seconds,
+            ),
         )
 
     def create_sign_request(self, *, tx_json: dict[str, Any], reference: str) -> XamanSignRequest:
@@ -82,7 +166,13 @@ class XamanService:
             raise XamanIntegrationError("xaman_mode_invalid")
         if not self.api_key or not self.api_secret:
             raise XamanIntegrationError("xaman_api_credentials_missing")
-        return self._get_api_payload_status(payload_id=payload_id)
+        if self.status_coalescer is None:
+            return self._get_api_payload_status(payload_id=payload_id)
+        return self.status_coalescer.lookup(
+            f"{self.api_base_url.rstrip('/')}|{payload_id}",
+            lambda: self._get_api_payload_status(payload_id=payload_id),
+            cacheable=_is_resolved_status,
+        )
 
     def _create_stub_sign_request(self, *, tx_json: dict[str, Any], reference: str) -> XamanSignRequest:
         serialized = json.dumps(tx_json, separators=(",", ":"), sort_keys=True, ensure_ascii=True)
@@ -107,16 +197,12 @@ class XamanService:
         request.add_header("Content-Type", "application/json")
         request.add_header("X-API-Key", self.api_key)
         request.add_header("X-API-Secret", self.api_secret)
-
-        try:
-            with urlopen(request, timeout=self.timeout_seconds) as response:
-                response_payload = json.loads(response.read().decode("utf-8"))
-        except HTTPError as exc:
-            raise XamanIntegrationError("xaman_api_http_error") from exc
-        except URLError as exc:
-            raise XamanIntegrationError("xaman_api_connection_error") from exc
-        except json.JSONDecodeError as exc:
-            raise XamanIntegrationError("xaman_api_invalid_json") from exc
+        priority = (
+            XamanRequestPriority.PAYOUT_SIGNING
+            if tx_json.get("TransactionType") in _PAYOUT_TRANSACTION_TYPES
+            else XamanRequestPriority.ESCROW_SIGNING
+        )
+        response_payload = self._send_api_request(request, operation="xaman.create_payload", priority=priority)
 
         payload_id = response_payload.get("uuid")
         next_data = response_payload.get("next")
@@ -149,20 +235,195 @@ class XamanService:
         request = Request(url=url, method="GET")
         request.add_header("X-API-Key", self.api_key)
         request.add_header("X-API-Secret", self.api_secret)
-        try:
-            with urlopen(request, timeout=self.timeout_seconds) as response:
-                response_payload = json.loads(response.read().decode("utf-8"))
-        except HTTPError as exc:
-            raise XamanIntegrationError("xaman_api_http_error") from exc
-        except URLError as exc:
-            raise XamanIntegrationError("xaman_api_connection_error") from exc
-        except json.JSONDecodeError as exc:
-            raise XamanIntegrationError("xaman_api_invalid_json") from exc
+        response_payload = self._send_api_request(
+            request,
+            operation="xaman.get_payload_status",
+            priority=XamanRequestPriority.STATUS_POLL,
+            idempotent=True,
+        )
 
         status = _parse_api_payload_status(response_payload)
         tx_hash = _extract_api_tx_hash(response_payload)
         return XamanPayloadStatusResult(payload_id=payload_id, status=status, tx_hash=tx_hash, mode="api")
 
+    def _send_api_request(
+        self,
+        request: Request,
+        *,
+        operation: str,
+        priority: XamanRequestPriority,
+        idempotent: bool = False,
+    ) -> dict[str, Any]:
+        """Send behind the circuit breaker; idempotent calls get jittered-backoff retries and optional hedging."""
+        max_retries = max(0, self.status_max_retries) if idempotent else 0
+        attempt = 0
+        while True:
+            try:
+                return self._send_guarded(request, operation=operation, priority=priority, hedge=idempotent)
+            except _XamanTransientError:
+                attempt += 1
+                if attempt > max_retries:
+                    raise
+            _RETRIES.inc(operation=operation)
+            time.sleep(self._retry_delay(attempt))
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff, capped so a retried status poll stays well inside request budgets."""
+        ceiling = min(_RETRY_MAX_DELAY_SECONDS, self.retry_base_delay_seconds * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def _send_guarded(
+        self,
+        request: Request,
+        *,
+        operation: str,
+        priority: XamanRequestPriority,
+        hedge: bool,
+    ) -> dict[str, Any]:
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            try:
+                breaker.before_call()
+            except XamanCircuitOpen as exc:
+                _REQUESTS.inc(operation=operation, outcome="circuit_open")
+                raise XamanCircuitOpenError(exc.retry_after_seconds) from exc
+        try:
+            if hedge and self.hedge_after_seconds is not None:
+                response_payload = self._send_hedged(request, operation=operation, priority=priority)
+            else:
+                response_payload = self._send_rate_limited(request, operation=operation, priority=priority)
+        except _XamanTransientError:
+            _REQUESTS.inc(operation=operation, outcome="transient_error")
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            _REQUESTS.inc(operation=operation, outcome="error")
+            if breaker is not None:
+                breaker.record_neutral()
+            raise
+        _REQUESTS.inc(operation=operation, outcome="success")
+        if breaker is not None:
+            breaker.record_success()
+        return response_payload
+
+    def _send_hedged(
+        self,
+        request: Request,
+        *,
+        operation: str,
+        priority: XamanRequestPriority,
+    ) -> dict[str, Any]:
+        """Race a duplicate request against a slow primary and return whichever succeeds first."""
+        executor = _get_hedge_executor()
+
+        def submit(attempt_request: Request) -> Future[dict[str, Any]]:
+            return executor.submit(
+                contextvars.copy_context().run,
+                self._send_rate_limited,
+                attempt_request,
+                operation=operation,
+                priority=priority,
+            )
+
+        primary = submit(_clone_request(request))
+        done, _ = wait([primary], timeout=self.hedge_after_seconds)
+        if done:
+            return primary.result()
+        hedge = submit(_clone_request(request))
+        pending: set[Future[dict[str, Any]]] = {primary, hedge}
+        first_error: XamanIntegrationError | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response_payload = future.result()
+                except XamanIntegrationError as exc:
+                    first_error = first_error or exc
+                    continue
+                _HEDGES.inc(operation=operation, winner="hedge" if future is hedge else "primary")
+                return response_payload
+        _HEDGES.inc(operation=operation, winner="none")
+        assert first_error is not None
+        raise first_error
+
+    def _send_rate_limited(
+        self,
+        request: Request,
+        *,
+        operation: str,
+        priority: XamanRequestPriority,
+    ) -> dict[str, Any]:
+        """Send through the shared rate limiter, retrying throttled (429) calls until the queue deadline."""
+        deadline = time.monotonic() + self.queue_deadline_seconds
+        while True:
+            if self.rate_limiter is not None:
+                try:
+                    self.rate_limiter.acquire(
+                        priority=priority,
+                        timeout_seconds=max(0.0, deadline - time.monotonic()),
+                    )
+                except XamanRateLimitTimeout as exc:
+                    raise XamanIntegrationError("xaman_api_rate_limited") from exc
+            try:
+                response_payload = self._send_api_request_once(request, operation=operation)
+            except _XamanThrottled as throttled:
+                if self.rate_limiter is None:
+                    raise XamanIntegrationError("xaman_api_rate_limited") from throttled
+                self.rate_limiter.record_throttled(retry_after_seconds=throttled.retry_after_seconds)
+                continue
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_success()
+            return response_payload
+
+    def _send_api_request_once(self, request: Request, *, operation: str) -> dict[str, Any]:
+        with start_span(operation, {"http.method": request.get_method(), "http.url": request.full_url}) as span:
+            traceparent = current_traceparent()
+            if traceparent is not None:
+                request.add_header(TRACEPARENT_HEADER, traceparent)
+            try:
+                with urlopen(request, timeout=self.timeout_seconds) as response:
+                    span.set_attribute("http.status_code", response.status)
+                    response_payload = json.loads(response.read().decode("utf-8"))
+            except HTTPError as exc:
+                span.set_attribute("http.status_code", exc.code)
+                if exc.code == 429:
+                    raise _XamanThrottled(parse_retry_after(exc.headers.get("Retry-After"))) from exc
+                if exc.code >= 500:
+                    raise _XamanTransientError("xaman_api_http_error") from exc
+                raise XamanIntegrationError("xaman_api_http_error") from exc
+            except URLError as exc:
+                raise _XamanTransientError("xaman_api_connection_error") from exc
+            except TimeoutError as exc:
+                raise _XamanTransientError("xaman_api_timeout") from exc
+            except json.JSONDecodeError as exc:
+                raise XamanIntegrationError("xaman_api_invalid_json") from exc
+        if not isinstance(response_payload, dict):
+            raise XamanIntegrationError("xaman_api_invalid_response")
+        return response_payload
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=_HEDGE_MAX_WORKERS, thread_name_prefix="xaman-hedge")
+        return _hedge_executor
+
+
+def _clone_request(request: Request) -> Request:
+    """Give each concurrent attempt its own Request so per-attempt headers (traceparent) never race."""
+    return Request(
+        url=request.full_url,
+        data=request.data,
+        headers=dict(request.header_items()),
+        method=request.get_method(),
+    )
+
+
+def _is_resolved_status(result: XamanPayloadStatusResult) -> bool:
+    return result.status in _RESOLVED_STATUSES
+
 
 def _parse_observed_status(observed_status: str | None) -> XamanPayloadStatus:
     if observed_status is None:
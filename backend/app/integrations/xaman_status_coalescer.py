@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from app.core.metrics import registry
+
+T = TypeVar("T")
+
+_LOOKUPS = registry.counter(
+    "ringledger_xaman_status_lookups_total",
+    "Xaman payload status lookups by how they were answered (network, coalesced, cache).",
+)
+
+
+class _Flight(Generic[T]):
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class XamanStatusCoalescer(Generic[T]):
+    """Single-flight deduplication of concurrent status lookups plus a micro-TTL cache for final results.
+
+    Concurrent ``lookup`` calls for the same key share one in-flight ``load``; followers get the leader's result or
+    its exception. Results accepted by ``cacheable`` (resolved statuses, which never change) are served from memory
+    for ``resolved_ttl_seconds``; everything else is always loaded fresh.
+    """
+
+    def __init__(
+        self,
+        *,
+        resolved_ttl_seconds: float,
+        max_cached: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.resolved_ttl_seconds = resolved_ttl_seconds
+        self.max_cached = max_cached
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, _Flight[T]] = {}
+        self._cache: OrderedDict[str, tuple[float, T]] = OrderedDict()
+
+    def lookup(self, key: str, load: Callable[[], T], *, cacheable: Callable[[T], bool]) -> T:
+        with self._lock:
+            cached = self._cached(key)
+            if cached is not None:
+                _LOOKUPS.inc(source="cache")
+                return cached
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._in_flight[key] = flight
+
+        if not leader:
+            _LOOKUPS.inc(source="coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        _LOOKUPS.inc(source="network")
+        try:
+            result = load()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        else:
+            flight.result = result
+            if self.resolved_ttl_seconds > 0 and cacheable(result):
+                with self._lock:
+                    self._store(key, result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.done.set()
+
+    def _cached(self, key: str) -> T | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._cache[key]
+            return None
+        return value
+
+    def _store(self, key: str, value: T) -> None:
+        self._cache[key] = (self._clock() + self.resolved_ttl_seconds, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+
+
+_shared_coalescer: XamanStatusCoalescer | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_xaman_status_coalescer(*, resolved_ttl_seconds: float) -> XamanStatusCoalescer:
+    """Return the process-wide coalescer shared by every ``XamanService`` built from settings."""
+    global _shared_coalescer
+    with _shared_lock:
+        if _shared_coalescer is None or _shared_coalescer.resolved_ttl_seconds != resolved_ttl_seconds:
+            _shared_coalescer = XamanStatusCoalescer(resolved_ttl_seconds=resolved_ttl_seconds)
+        return _shared_coalescer
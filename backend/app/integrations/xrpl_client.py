@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.client import HTTPConnection, HTTPException, HTTPSConnection, RemoteDisconnected
+from typing import Any
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+from app.core.tracing import TRACEPARENT_HEADER, current_traceparent, start_span
+
+_STALE_CONNECTION_ERRORS = (RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class XrplClientError(RuntimeError):
+    """Raised when a rippled JSON-RPC call cannot be completed (transport, HTTP or protocol failure)."""
+
+
+@dataclass
+class XrplJsonRpcClient:
+    """Minimal rippled JSON-RPC client over a bounded pool of keep-alive connections.
+
+    Only read methods used for confirmation are implemented: ``tx``, ``account_objects`` and ``ledger``.
+    ``tx_many`` looks up a set of hashes concurrently over the pool, de-duplicating repeats.
+    """
+
+    url: str
+    timeout_seconds: float = 10.0
+    pool_size: int = 8
+    connections_opened: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.pool_size < 1:
+            raise ValueError("xrpl_pool_size_invalid")
+        parsed = urlsplit(self.url)
+        if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+            raise ValueError("xrpl_json_rpc_url_invalid")
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._path = parsed.path or "/"
+        self._idle: queue.LifoQueue[HTTPConnection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._lock = threading.Lock()
+
+    def tx(self, tx_hash: str) -> dict[str, Any] | None:
+        """Return the ``tx`` result for a hash, or None when rippled reports ``txnNotFound``."""
+        result = self.call("tx", {"transaction": tx_hash, "binary": False}, allow_errors={"txnNotFound"})
+        if result.get("error") == "txnNotFound":
+            return None
+        return result
+
+    def tx_many(self, tx_hashes: Iterable[str]) -> dict[str, dict[str, Any] | None]:
+        unique_hashes = list(dict.fromkeys(tx_hashes))
+        if len(unique_hashes) <= 1:
+            return {tx_hash: self.tx(tx_hash) for tx_hash in unique_hashes}
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(unique_hashes))) as executor:
+            futures = {
+                tx_hash: executor.submit(contextvars.copy_context().run, self.tx, tx_hash) for tx_hash in unique_hashes
+            }
+            return {tx_hash: future.result() for tx_hash, future in futures.items()}
+
+    def account_objects(
+        self,
+        account: str,
+        *,
+        object_type: str | None = None,
+        ledger_index: str | int = "validated",
+        limit: int = 200,
+    ) -> list[dict[str, Any]]:
+        """Return every ledger object owned by ``account``, following ``marker`` pagination."""
+        params: dict[str, Any] = {"account": account, "ledger_index": ledger_index, "limit": limit}
+        if object_type is not None:
+            params["type"] = object_type
+        objects: list[dict[str, Any]] = []
+        while True:
+            result = self.call("account_objects", params)
+            page = result.get("account_objects")
+            if not isinstance(page, list):
+                raise XrplClientError("xrpl_rpc_invalid_response")
+            objects.extend(page)
+            marker = result.get("marker")
+            if marker is None:
+                return objects
+            params = {**params, "marker": marker, "ledger_index": result.get("ledger_index", ledger_index)}
+
+    def ledger(self, ledger_index: str | int = "validated") -> dict[str, Any]:
+        result = self.call("ledger", {"ledger_index": ledger_index, "transactions": False, "expand": False})
+        if not isinstance(result.get("ledger"), dict):
+            raise XrplClientError("xrpl_rpc_invalid_response")
+        return result
+
+    def call(
+        self,
+        method: str,
+        params: dict[str, Any],
+        *,
+        allow_errors: set[str] | frozenset[str] = frozenset(),
+    ) -> dict[str, Any]:
+        body = json.dumps({"method": method, "params": [params]}, separators=(",", ":")).encode("utf-8")
+        with start_span(f"xrpl.{method}", {"rpc.system": "jsonrpc", "rpc.method": method}) as span:
+            payload = self._post(body)
+            result = payload.get("result") if isinstance(payload, dict) else None
+            if not isinstance(result, dict):
+                raise XrplClientError("xrpl_rpc_invalid_response")
+            error = result.get("error")
+            span.set_attribute("rpc.error", error or "")
+        if result.get("status") == "error" and error not in allow_errors:
+            raise XrplClientError("xrpl_rpc_error")
+        return result
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _post(self, body: bytes) -> Any:
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        traceparent = current_traceparent()
+        if traceparent is not None:
+            headers[TRACEPARENT_HEADER] = traceparent
+        for attempt in range(2):
+            with self._connection() as (connection, reused):
+                try:
+                    connection.request("POST", self._path, body=body, headers=headers)
+                    response = connection.getresponse()
+                    raw = response.read()
+                except _STALE_CONNECTION_ERRORS as exc:
+                    connection.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise XrplClientError("xrpl_rpc_connection_error") from exc
+                except (OSError, HTTPException) as exc:
+                    raise XrplClientError("xrpl_rpc_connection_error") from exc
+            if response.status != 200:
+                raise XrplClientError("xrpl_rpc_http_error")
+            try:
+                return json.loads(raw.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                raise XrplClientError("xrpl_rpc_invalid_json") from exc
+        raise XrplClientError("xrpl_rpc_connection_error")
+
+    @contextmanager
+    def _connection(self) -> Iterator[tuple[HTTPConnection, bool]]:
+        if not self._slots.acquire(timeout=self.timeout_seconds):
+            raise XrplClientError("xrpl_rpc_pool_exhausted")
+        try:
+            try:
+                connection, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                connection, reused = self._open_connection(), False
+            try:
+                yield connection, reused
+            except BaseException:
+                connection.close()
+                raise
+            if connection.sock is None:
+                connection.close()
+            else:
+                self._idle.put(connection)
+        finally:
+            self._slots.release()
+
+    def _open_connection(self) -> HTTPConnection:
+        with self._lock:
+            self.connections_opened += 1
+        if self._scheme == "https":
+            return HTTPSConnection(self._host, self._port, timeout=self.timeout_seconds)
+        return HTTPConnection(self._host, self._port, timeout=self.timeout_seconds)
+
+
+_shared_client: XrplJsonRpcClient | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_xrpl_client(*, url: str, timeout_seconds: float, pool_size: int) -> XrplJsonRpcClient:
+    """Return the process-wide client so every request reuses the same connection pool."""
+    global _shared_client
+    with _shared_lock:
+        if (
+            _shared_client is None
+            or _shared_client.url != url
+            or _shared_client.timeout_seconds != timeout_seconds
+            or _shared_client.pool_size != pool_size
+        ):
+            if _shared_client is not None:
+                _shared_client.close()
+            _shared_client = XrplJsonRpcClient(url=url, timeout_seconds=timeout_seconds, pool_size=pool_size)
+        return _shared_client
+
+
+def get_xrpl_ledger_client() -> XrplJsonRpcClient | None:
+    """FastAPI dependency: the shared client in ``ledger`` verification mode, None when confirmations are trusted."""
+    if settings.xrpl_verification_mode == "client":
+        return None
+    if settings.xrpl_verification_mode != "ledger":
+        raise XrplClientError("xrpl_verification_mode_invalid")
+    return get_shared_xrpl_client(
+        url=settings.xrpl_json_rpc_url,
+        timeout_seconds=settings.xrpl_timeout_seconds,
+        pool_size=settings.xrpl_pool_size,
+    )
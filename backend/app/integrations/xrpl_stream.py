@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import socket
+import ssl
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OPCODE_CONTINUATION = 0x0
+_OPCODE_TEXT = 0x1
+_OPCODE_BINARY = 0x2
+_OPCODE_CLOSE = 0x8
+_OPCODE_PING = 0x9
+_OPCODE_PONG = 0xA
+_MAX_HANDSHAKE_BYTES = 16 * 1024
+
+
+class XrplStreamError(RuntimeError):
+    """Raised when the rippled websocket stream cannot be opened or is closed by the server."""
+
+
+def websocket_accept_key(client_key: str) -> str:
+    digest = hashlib.sha1((client_key + _WEBSOCKET_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def encode_websocket_frame(opcode: int, payload: bytes, *, mask: bool) -> bytes:
+    """Encode a single final frame; clients must mask (RFC 6455 §5.3), servers must not."""
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+    if not mask:
+        return bytes(header) + payload
+    key = os.urandom(4)
+    return bytes(header) + key + _apply_mask(payload, key)
+
+
+@dataclass
+class WebSocketFrameDecoder:
+    """Incremental frame parser: ``feed`` raw socket bytes, then drain complete messages with ``next_message``.
+
+    Fragmented messages are reassembled; control frames (ping/pong/close) are returned as soon as they arrive.
+    """
+
+    _buffer: bytearray = field(default_factory=bytearray)
+    _fragments: list[bytes] = field(default_factory=list)
+    _fragment_opcode: int | None = None
+
+    def feed(self, data: bytes) -> None:
+        self._buffer += data
+
+    def next_message(self) -> tuple[int, bytes] | None:
+        while True:
+            frame = self._next_frame()
+            if frame is None:
+                return None
+            fin, opcode, payload = frame
+            if opcode >= _OPCODE_CLOSE:
+                return opcode, payload
+            if opcode != _OPCODE_CONTINUATION:
+                self._fragment_opcode = opcode
+                self._fragments = []
+            self._fragments.append(payload)
+            if fin and self._fragment_opcode is not None:
+                message = (self._fragment_opcode, b"".join(self._fragments))
+                self._fragment_opcode = None
+                self._fragments = []
+                return message
+
+    def _next_frame(self) -> tuple[bool, int, bytes] | None:
+        buffer = self._buffer
+        if len(buffer) < 2:
+            return None
+        fin = bool(buffer[0] & 0x80)
+        opcode = buffer[0] & 0x0F
+        masked = bool(buffer[1] & 0x80)
+        length = buffer[1] & 0x7F
+        offset = 2
+        if length == 126:
+            if len(buffer) < offset + 2:
+                return None
+            (length,) = struct.unpack_from("!H", buffer, offset)
+            offset += 2
+        elif length == 127:
+            if len(buffer) < offset + 8:
+                return None
+            (length,) = struct.unpack_from("!Q", buffer, offset)
+            offset += 8
+        key = b""
+        if masked:
+            if len(buffer) < offset + 4:
+                return None
+            key = bytes(buffer[offset : offset + 4])
+            offset += 4
+        if len(buffer) < offset + length:
+            return None
+        payload = bytes(buffer[offset : offset + length])
+        del buffer[: offset + length]
+        return fin, opcode, _apply_mask(payload, key) if masked else payload
+
+
+@dataclass
+class XrplStreamConnection:
+    """Minimal rippled websocket client for the ``subscribe`` API (text JSON frames only).
+
+    ``recv_json`` returns None when nothing arrives within the timeout so callers can interleave housekeeping.
+    Pings are answered transparently; a server close raises ``XrplStreamError("xrpl_stream_closed")``.
+    """
+
+    url: str
+    timeout_seconds: float = 10.0
+    _socket: socket.socket | None = field(default=None, init=False, repr=False)
+    _decoder: WebSocketFrameDecoder = field(default_factory=WebSocketFrameDecoder, init=False, repr=False)
+    _next_id: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        parsed = urlsplit(self.url)
+        if parsed.scheme not in {"ws", "wss"} or not parsed.hostname:
+            raise ValueError("xrpl_stream_url_invalid")
+        self._secure = parsed.scheme == "wss"
+        self._host = parsed.hostname
+        self._port = parsed.port or (443 if self._secure else 80)
+        self._path = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+
+    def connect(self) -> XrplStreamConnection:
+        try:
+            raw = socket.create_connection((self._host, self._port), timeout=self.timeout_seconds)
+        except OSError as exc:
+            raise XrplStreamError("xrpl_stream_connection_error") from exc
+        sock: socket.socket = raw
+        try:
+            if self._secure:
+                sock = ssl.create_default_context().wrap_socket(raw, server_hostname=self._host)
+            self._handshake(sock)
+        except (OSError, XrplStreamError) as exc:
+            sock.close()
+            if isinstance(exc, XrplStreamError):
+                raise
+            raise XrplStreamError("xrpl_stream_connection_error") from exc
+        self._socket = sock
+        return self
+
+    def close(self) -> None:
+        sock, self._socket = self._socket, None
+        if sock is None:
+            return
+        try:
+            sock.sendall(encode_websocket_frame(_OPCODE_CLOSE, struct.pack("!H", 1000), mask=True))
+        except OSError:
+            pass
+        sock.close()
+
+    def __enter__(self) -> XrplStreamConnection:
+        return self.connect() if self._socket is None else self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def subscribe_accounts(self, accounts: Iterable[str]) -> None:
+        self._command("subscribe", accounts=sorted(accounts))
+
+    def unsubscribe_accounts(self, accounts: Iterable[str]) -> None:
+        self._command("unsubscribe", accounts=sorted(accounts))
+
+    def send_json(self, message: dict[str, Any]) -> None:
+        payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+        self._send_frame(_OPCODE_TEXT, payload)
+
+    def recv_json(self, *, timeout_seconds: float) -> dict[str, Any] | None:
+        sock = self._require_socket()
+        while True:
+            message = self._decoder.next_message()
+            if message is None:
+                sock.settimeout(timeout_seconds)
+                try:
+                    data = sock.recv(65536)
+                except TimeoutError:
+                    return None
+                except OSError as exc:
+                    raise XrplStreamError("xrpl_stream_connection_error") from exc
+                if not data:
+                    raise XrplStreamError("xrpl_stream_closed")
+                self._decoder.feed(data)
+                continue
+            opcode, payload = message
+            if opcode == _OPCODE_PING:
+                self._send_frame(_OPCODE_PONG, payload)
+                continue
+            if opcode == _OPCODE_CLOSE:
+                raise XrplStreamError("xrpl_stream_closed")
+            if opcode not in {_OPCODE_TEXT, _OPCODE_BINARY}:
+                continue
+            try:
+                decoded = json.loads(payload.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                raise XrplStreamError("xrpl_stream_invalid_json") from exc
+            if isinstance(decoded, dict):
+                return decoded
+
+    def _command(self, command: str, **params: Any) -> None:
+        self._next_id += 1
+        self.send_json({"id": self._next_id, "command": command, **params})
+
+    def _send_frame(self, opcode: int, payload: bytes) -> None:
+        sock = self._require_socket()
+        try:
+            sock.sendall(encode_websocket_frame(opcode, payload, mask=True))
+        except OSError as exc:
+            raise XrplStreamError("xrpl_stream_connection_error") from exc
+
+    def _require_socket(self) -> socket.socket:
+        if self._socket is None:
+            raise XrplStreamError("xrpl_stream_not_connected")
+        return self._socket
+
+    def _handshake(self, sock: socket.socket) -> None:
+        client_key = base64.b64encode(os.urandom(16)).decode("ascii")
+        host_header = self._host if self._port in {80, 443} else f"{self._host}:{self._port}"
+        request = (
+            f"GET {self._path} HTTP/1.1\r\n"
+            f"Host: {host_header}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {client_key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        sock.sendall(request.encode("ascii"))
+
+        response = bytearray()
+        while b"\r\n\r\n" not in response:
+            chunk = sock.recv(4096)
+            if not chunk or len(response) > _MAX_HANDSHAKE_BYTES:
+                raise XrplStreamError("xrpl_stream_handshake_failed")
+            response += chunk
+        head, _, rest = bytes(response).partition(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        if len(lines[0].split()) < 2 or lines[0].split()[1] != "101":
+            raise XrplStreamError("xrpl_stream_handshake_failed")
+        headers = {
+            name.strip().lower(): value.strip() for name, _, value in (line.partition(":") for line in lines[1:])
+        }
+        if headers.get("sec-websocket-accept") != websocket_accept_key(client_key):
+            raise XrplStreamError("xrpl_stream_handshake_failed")
+        self._decoder.feed(rest)
+
+
+def ledger_result_from_stream(message: dict[str, Any]) -> dict[str, Any] | None:
+    """Map a validated ``transaction`` stream message onto the API v1 ``tx`` result shape.
+
+    Returns None for anything else (command responses, ``ledgerClosed``, proposed/unvalidated transactions) so the
+    confirmation mappers in ``xrpl_escrow_service`` treat streamed and fetched transactions identically.
+    """
+    if message.get("type") != "transaction" or message.get("validated") is not True:
+        return None
+    tx = message.get("tx_json")
+    if not isinstance(tx, dict):
+        tx = message.get("transaction")
+    if not isinstance(tx, dict):
+        return None
+    tx_hash = message.get("hash") or tx.get("hash")
+    if not isinstance(tx_hash, str) or not tx_hash:
+        return None
+    meta = message.get("meta")
+    if not isinstance(meta, dict):
+        meta = {"TransactionResult": message.get("engine_result")}
+    return {
+        **tx,
+        "hash": tx_hash.upper(),
+        "validated": True,
+        "meta": meta,
+        "date": tx.get("date", message.get("date")),
+        "ledger_index": message.get("ledger_index"),
+    }
+
+
+def _apply_mask(payload: bytes, key: bytes) -> bytes:
+    if not payload:
+        return payload
+    repeated = (key * (len(payload) // 4 + 1))[: len(payload)]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(len(payload), "big")
@@ -3,25 +3,105 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
+from app.api.admin import router as admin_router
 from app.api.router import api_router
 from app.core.config import settings
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, registry
+from app.core.profiling import ProfileStore
+from app.core.tracing import configure_tracing_from_settings
 from app.db.init_db import init_db
+from app.db.session import SessionLocal
+from app.middleware.profiling import install_request_profiling
+from app.middleware.tracing import RequestTracingMiddleware
+from app.services.bout_events import bout_event_hub
 
 
 def create_app() -> FastAPI:
     @asynccontextmanager
     async def lifespan(_app: FastAPI):
         init_db()
-        yield
+        # Background workers are imported only when enabled, so a plain API process never loads their modules
+        # (or the Xaman integration the deadline scheduler pulls in).
+        watcher = None
+        if settings.xrpl_stream_url:
+            from app.services.ledger_stream_watcher import LedgerStreamWatcher
 
+            watcher = LedgerStreamWatcher(
+                url=settings.xrpl_stream_url,
+                session_factory=SessionLocal,
+                timeout_seconds=settings.xrpl_timeout_seconds,
+                refresh_seconds=settings.xrpl_stream_refresh_seconds,
+            ).start()
+        scheduler = None
+        if settings.deadline_scheduler_enabled:
+            from app.services.deadline_scheduler import EscrowDeadlineScheduler
+
+            scheduler = EscrowDeadlineScheduler(
+                session_factory=SessionLocal,
+                lookahead_seconds=settings.deadline_lookahead_seconds,
+                batch_size=settings.deadline_batch_size,
+                poll_seconds=settings.deadline_poll_seconds,
+                max_attempts=settings.deadline_max_attempts,
+            ).start()
+        event_bridge = None
+        if settings.bout_events_pg_bridge:
+            from app.services.bout_event_bridge import PostgresEventBridge
+
+            event_bridge = PostgresEventBridge(database_url=settings.database_url).start()
+        dispatcher = None
+        if settings.outbox_dispatcher_enabled:
+            from app.services.outbox import OutboxDispatcher
+
+            dispatcher = OutboxDispatcher(
+                session_factory=SessionLocal,
+                batch_size=settings.outbox_batch_size,
+                poll_seconds=settings.outbox_poll_seconds,
+                max_attempts=settings.outbox_max_attempts,
+                lease_seconds=settings.outbox_lease_seconds,
+                retention_days=settings.outbox_retention_days,
+            ).start()
+        try:
+            yield
+        finally:
+            # Open event streams would otherwise hold the shutdown until their clients go away.
+            bout_event_hub.close_all()
+            if dispatcher is not None:
+                dispatcher.stop()
+            if event_bridge is not None:
+                event_bridge.stop()
+            if scheduler is not None:
+                scheduler.stop()
+            if watcher is not None:
+                watcher.stop()
+
+    configure_tracing_from_settings(settings)
     app = FastAPI(title=settings.app_name, version="0.1.0", lifespan=lifespan)
+    app.add_middleware(RequestTracingMiddleware)
 
     @app.get("/healthz", tags=["health"])
     def healthz() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/metrics", tags=["health"], include_in_schema=False)
+    def metrics() -> PlainTextResponse:
+        return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
     app.include_router(api_router)
+    if settings.profiling_sample_rate > 0 or settings.profiling_debug_secret:
+        app.state.profile_store = ProfileStore(
+            max_profiles=settings.profiling_max_stored,
+            output_dir=settings.profiling_output_dir,
+        )
+        app.include_router(admin_router)
+        install_request_profiling(
+            app,
+            store=app.state.profile_store,
+            sample_rate=settings.profiling_sample_rate,
+            debug_secret=settings.profiling_debug_secret,
+            interval_seconds=settings.profiling_interval_ms / 1000,
+        )
     return app
 
 
@@ -4,6 +4,10 @@ import uuid
 
 from fastapi import HTTPException, status
 
+ESCROW_CREATE_CONFIRM_OPERATION = "escrow_create_confirm"
+PAYOUT_CONFIRM_OPERATION = "payout_confirm"
+CONFIRM_OPERATIONS = (ESCROW_CREATE_CONFIRM_OPERATION, PAYOUT_CONFIRM_OPERATION)
+
 
 def require_idempotency_key(idempotency_key: str | None) -> str:
     if idempotency_key is None or not idempotency_key.strip():
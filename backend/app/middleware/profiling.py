@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+
+from app.core.profiling import (
+    PROFILE_HEADER,
+    ProfileStore,
+    RequestProfile,
+    StackSampler,
+    new_profile_id,
+    verify_profile_token,
+)
+
+
+@dataclass(frozen=True)
+class _ProfileDecision:
+    trigger: str
+
+
+_profile_decision: ContextVar[_ProfileDecision | None] = ContextVar("ringledger_profile_decision", default=None)
+
+
+class RequestProfilingMiddleware:
+    """ASGI middleware that marks sampled or explicitly signed requests for handler profiling."""
+
+    def __init__(self, app: Any, *, sample_rate: float, debug_secret: str | None) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.debug_secret = debug_secret
+        self._header = PROFILE_HEADER.lower().encode("latin-1")
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        decision = self._decide(scope)
+        if decision is None:
+            await self.app(scope, receive, send)
+            return
+
+        token = _profile_decision.set(decision)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _profile_decision.reset(token)
+
+    def _decide(self, scope: dict[str, Any]) -> _ProfileDecision | None:
+        if self.debug_secret is not None:
+            for key, value in scope.get("headers", []):
+                if key == self._header:
+                    if verify_profile_token(value.decode("latin-1"), secret=self.debug_secret):
+                        return _ProfileDecision(trigger="signed_header")
+                    break
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return _ProfileDecision(trigger="sampled")
+        return None
+
+
+def install_request_profiling(
+    app: FastAPI,
+    *,
+    store: ProfileStore,
+    sample_rate: float,
+    debug_secret: str | None,
+    interval_seconds: float,
+) -> None:
+    """Wrap every sync route handler with an on-demand stack sampler and register the decision middleware.
+
+    Sync handlers run on threadpool workers, so sampling happens inside the wrapped call where the worker
+    thread id is known; async handlers are left untouched.
+    """
+    for route in app.router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        call = route.dependant.call
+        if call is None or iscoroutinefunction(call):
+            continue
+        route.dependant.call = _profiled_call(
+            call,
+            store=store,
+            method=next(iter(sorted(route.methods or {"GET"}))),
+            route_path=route.path,
+            interval_seconds=interval_seconds,
+        )
+    app.add_middleware(RequestProfilingMiddleware, sample_rate=sample_rate, debug_secret=debug_secret)
+
+
+def _profiled_call(
+    call: Callable[..., Any],
+    *,
+    store: ProfileStore,
+    method: str,
+    route_path: str,
+    interval_seconds: float,
+) -> Callable[..., Any]:
+    @wraps(call)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        decision = _profile_decision.get()
+        if decision is None:
+            return call(*args, **kwargs)
+
+        sampler = StackSampler(target_thread_id=threading.get_ident(), interval_seconds=interval_seconds)
+        started_at = datetime.now(UTC)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            sampler.stop()
+            store.add(
+                RequestProfile(
+                    profile_id=new_profile_id(),
+                    method=method,
+                    route=route_path,
+                    trigger=decision.trigger,
+                    started_at=started_at,
+                    duration_ms=(time.perf_counter() - started) * 1000,
+                    sample_count=sampler.sample_count,
+                    collapsed_stacks=sampler.collapsed(),
+                )
+            )
+
+    return wrapper
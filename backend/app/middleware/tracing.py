@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.core.tracing import TRACEPARENT_HEADER, start_span, tracing_enabled
+
+Scope = dict[str, Any]
+
+
+class RequestTracingMiddleware:
+    """ASGI middleware opening one root span per HTTP request when tracing is enabled."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or not tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        with start_span(
+            f"{method} {scope.get('path', '')}",
+            {"http.method": method, "http.target": scope.get("path", "")},
+            traceparent=_header(scope, TRACEPARENT_HEADER),
+        ) as span:
+
+            async def send_with_status(message: dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            await self.app(scope, receive, send_with_status)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None)
+            if route_path is not None:
+                span.update_name(f"{method} {route_path}")
+                span.set_attribute("http.route", route_path)
+
+
+def _header(scope: Scope, name: str) -> str | None:
+    encoded = name.encode("latin-1")
+    for key, value in scope.get("headers", []):
+        if key == encoded:
+            return value.decode("latin-1")
+    return None
@@ -2,16 +2,28 @@
 
 from app.models.audit_log import AuditLog
 from app.models.bout import Bout
+from app.models.bout_archive import BoutArchive
+from app.models.bout_summary import BoutSummary
 from app.models.escrow import Escrow
+from app.models.escrow_deadline import EscrowDeadline
+from app.models.escrow_tx_payload import EscrowTxPayload
 from app.models.fighter_profile import FighterProfile
 from app.models.idempotency_key import IdempotencyKey
+from app.models.outbox_event import OutboxEvent
 from app.models.user import User
+from app.models.validated_transaction import ValidatedTransaction
 
 __all__ = [
     "AuditLog",
     "Bout",
+    "BoutArchive",
+    "BoutSummary",
     "Escrow",
+    "EscrowDeadline",
+    "EscrowTxPayload",
     "FighterProfile",
     "IdempotencyKey",
+    "OutboxEvent",
     "User",
+    "ValidatedTransaction",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import BIGINT, DateTime, ForeignKey, func
+from sqlalchemy import BIGINT, DateTime, ForeignKey, Index, func
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -14,6 +14,23 @@ from app.models.enums import BoutStatus, BoutWinner
 
 class Bout(Base):
     __tablename__ = "bouts"
+    __table_args__ = (
+        Index(
+            "idx_bouts_promoter_event_id",
+            "promoter_user_id",
+            "event_datetime_utc",
+            "id",
+            postgresql_include=["status", "winner", "fighter_a_user_id", "fighter_b_user_id"],
+        ),
+        Index(
+            "idx_bouts_promoter_status_event_id",
+            "promoter_user_id",
+            "status",
+            "event_datetime_utc",
+            "id",
+            postgresql_include=["winner", "fighter_a_user_id", "fighter_b_user_id"],
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     promoter_user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
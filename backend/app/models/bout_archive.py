@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, LargeBinary, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class BoutArchive(Base):
+    """A closed bout moved out of the hot tables: every row that belonged to it, as one compressed JSON document."""
+
+    __tablename__ = "bout_archives"
+
+    bout_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    promoter_user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+    )
+    event_datetime_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    format_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    document: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
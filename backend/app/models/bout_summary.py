@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BIGINT, DateTime, ForeignKey, String, func
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.enums import BoutStatus, BoutWinner, EscrowStatus
+
+_ESCROW_STATUS = SAEnum(EscrowStatus, native_enum=False, length=32, values_callable=lambda e: [x.value for x in e])
+
+
+class BoutSummary(Base):
+    """Denormalized one-row-per-bout overview, rewritten in the same transaction as every bout/escrow state change."""
+
+    __tablename__ = "bout_summaries"
+
+    bout_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("bouts.id"), primary_key=True)
+    promoter_user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+    )
+    bout_status: Mapped[BoutStatus] = mapped_column(
+        SAEnum(BoutStatus, native_enum=False, length=32, values_callable=lambda e: [x.value for x in e]),
+        nullable=False,
+    )
+    winner: Mapped[BoutWinner | None] = mapped_column(
+        SAEnum(BoutWinner, native_enum=False, length=8, values_callable=lambda e: [x.value for x in e]),
+        nullable=True,
+    )
+
+    locked_drops: Mapped[int] = mapped_column(BIGINT, nullable=False, default=0)
+    paid_drops: Mapped[int] = mapped_column(BIGINT, nullable=False, default=0)
+    cancelled_drops: Mapped[int] = mapped_column(BIGINT, nullable=False, default=0)
+
+    show_a_status: Mapped[EscrowStatus] = mapped_column(_ESCROW_STATUS, nullable=False, default=EscrowStatus.PLANNED)
+    show_b_status: Mapped[EscrowStatus] = mapped_column(_ESCROW_STATUS, nullable=False, default=EscrowStatus.PLANNED)
+    bonus_a_status: Mapped[EscrowStatus] = mapped_column(_ESCROW_STATUS, nullable=False, default=EscrowStatus.PLANNED)
+    bonus_b_status: Mapped[EscrowStatus] = mapped_column(_ESCROW_STATUS, nullable=False, default=EscrowStatus.PLANNED)
+
+    last_failure_code: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -39,6 +39,20 @@ class EscrowCloseAction(StrEnum):
     CANCEL = "cancel"
 
 
+class EscrowDeadlineStatus(StrEnum):
+    PENDING = "pending"
+    AWAITING_RESULT = "awaiting_result"
+    PREPARED = "prepared"
+    NOT_APPLICABLE = "not_applicable"
+    FAILED = "failed"
+
+
 class BoutWinner(StrEnum):
     A = "A"
     B = "B"
+
+
+class OutboxStatus(StrEnum):
+    PENDING = "pending"
+    DISPATCHED = "dispatched"
+    DEAD = "dead"
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import BIGINT, DateTime, ForeignKey, Integer, String, UniqueConstraint, func
+from sqlalchemy import BIGINT, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, func, text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -14,10 +14,28 @@ from app.models.enums import EscrowKind, EscrowStatus
 
 class Escrow(Base):
     __tablename__ = "escrows"
-    __table_args__ = (UniqueConstraint("bout_id", "kind", name="uq_escrow_bout_kind"),)
+    __table_args__ = (
+        UniqueConstraint("bout_id", "kind", name="uq_escrow_bout_kind"),
+        Index("idx_escrows_bout_status", "bout_id", "status"),
+        # A ledger transaction creates or closes exactly one escrow; partial, so unconfirmed rows take no space.
+        Index(
+            "uq_escrows_create_tx_hash",
+            "create_tx_hash",
+            unique=True,
+            postgresql_where=text("create_tx_hash IS NOT NULL"),
+            sqlite_where=text("create_tx_hash IS NOT NULL"),
+        ),
+        Index(
+            "uq_escrows_close_tx_hash",
+            "close_tx_hash",
+            unique=True,
+            postgresql_where=text("close_tx_hash IS NOT NULL"),
+            sqlite_where=text("close_tx_hash IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    bout_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("bouts.id"), nullable=False, index=True)
+    bout_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("bouts.id"), nullable=False)
     kind: Mapped[EscrowKind] = mapped_column(
         SAEnum(EscrowKind, name="escrow_kind", values_callable=lambda e: [x.value for x in e]),
         nullable=False,
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.enums import EscrowCloseAction, EscrowDeadlineStatus
+
+
+class EscrowDeadline(Base):
+    """Persisted due-time queue entry: when an escrow becomes finishable or cancellable, and what was prepared."""
+
+    __tablename__ = "escrow_deadlines"
+    __table_args__ = (
+        UniqueConstraint("escrow_id", "action", name="uq_escrow_deadlines_escrow_action"),
+        Index("idx_escrow_deadlines_status_due", "status", "due_at_ripple"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    escrow_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("escrows.id"), nullable=False)
+    bout_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("bouts.id"), nullable=False, index=True)
+    action: Mapped[EscrowCloseAction] = mapped_column(
+        SAEnum(EscrowCloseAction, native_enum=False, length=16, values_callable=lambda e: [x.value for x in e]),
+        nullable=False,
+    )
+    status: Mapped[EscrowDeadlineStatus] = mapped_column(
+        SAEnum(EscrowDeadlineStatus, native_enum=False, length=32, values_callable=lambda e: [x.value for x in e]),
+        nullable=False,
+        default=EscrowDeadlineStatus.PENDING,
+    )
+    due_at_ripple: Mapped[int] = mapped_column(Integer, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unsigned_tx_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    xaman_sign_request_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    prepared_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
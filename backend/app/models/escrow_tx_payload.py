@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class EscrowTxPayload(Base):
+    """Canonical unsigned transaction for an escrow's next ledger step, materialized when the escrow reaches it."""
+
+    __tablename__ = "escrow_tx_payloads"
+    __table_args__ = (UniqueConstraint("escrow_id", "transaction_type", name="uq_escrow_tx_payloads_escrow_type"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    escrow_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("escrows.id"), nullable=False)
+    bout_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("bouts.id"), nullable=False, index=True)
+    transaction_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    tx_json: Mapped[str] = mapped_column(Text, nullable=False)
+    tx_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
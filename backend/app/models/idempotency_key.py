@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, Text, UniqueConstraint, func
+from sqlalchemy import DateTime, LargeBinary, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -19,5 +19,9 @@ class IdempotencyKey(Base):
     idempotency_key: Mapped[str] = mapped_column(String(128), nullable=False)
     request_hash: Mapped[str] = mapped_column(String(128), nullable=False)
     response_code: Mapped[int] = mapped_column(nullable=False)
-    response_body: Mapped[str] = mapped_column(Text, nullable=False)
+    # UTF-8 JSON; zlib-compressed when ``response_encoding`` is ``zlib`` (see ``IdempotencyService``).
+    response_body: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    response_encoding: Mapped[str] = mapped_column(
+        String(16), nullable=False, default="identity", server_default="identity"
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BIGINT, DateTime, Index, Integer, String, Text, func
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.enums import OutboxStatus
+
+
+class OutboxEvent(Base):
+    """Domain event written in the same transaction as the state change it describes, awaiting dispatch."""
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (Index("idx_outbox_events_status_available", "status", "available_at", "id"),)
+
+    # Monotonic ids give consumers a per-bout delivery order; SQLite only auto-increments INTEGER keys.
+    id: Mapped[int] = mapped_column(BIGINT().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    bout_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False)
+    # W3C trace context of the committing request, handed on with the event so consumers can join its trace.
+    traceparent: Mapped[str | None] = mapped_column(String(55), nullable=True)
+    status: Mapped[OutboxStatus] = mapped_column(
+        SAEnum(OutboxStatus, native_enum=False, length=16, values_callable=lambda e: [x.value for x in e]),
+        nullable=False,
+        default=OutboxStatus.PENDING,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_error: Mapped[str | None] = mapped_column(String(256), nullable=True)
+    dispatched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
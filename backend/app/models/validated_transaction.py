@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BIGINT, DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ValidatedTransaction(Base):
+    """Immutable snapshot of a validated XRPL transaction, keyed by hash, so repeat lookups stay local."""
+
+    __tablename__ = "validated_transactions"
+
+    tx_hash: Mapped[str] = mapped_column(String(128), primary_key=True)
+    transaction_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    engine_result: Mapped[str] = mapped_column(String(32), nullable=False)
+    account: Mapped[str] = mapped_column(String(64), nullable=False)
+    destination: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    owner: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    sequence: Mapped[int | None] = mapped_column(BIGINT, nullable=True)
+    offer_sequence: Mapped[int | None] = mapped_column(BIGINT, nullable=True)
+    amount_drops: Mapped[int | None] = mapped_column(BIGINT, nullable=True)
+    finish_after_ripple: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    cancel_after_ripple: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    condition_hex: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    fulfillment_hex: Mapped[str | None] = mapped_column(String(4096), nullable=True)
+    close_time_ripple: Mapped[int | None] = mapped_column(BIGINT, nullable=True)
+    ledger_index: Mapped[int | None] = mapped_column(BIGINT, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
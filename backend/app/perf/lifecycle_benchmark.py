@@ -0,0 +1,392 @@
+"""Bout lifecycle benchmark: drives the money paths in-process and gates results against a stored baseline.
+
+Usage:
+    python -m app.perf.lifecycle_benchmark --iterations 20 --output results.json \
+        --baseline backend/tests/performance/baselines/lifecycle_benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.models.enums import EscrowKind, UserRole
+from app.models.escrow import Escrow
+from app.models.user import User
+from app.services.bout_service import BoutService
+
+RESULTS_SCHEMA_VERSION = 1
+DEFAULT_DATABASE_URL = "sqlite+pysqlite:///:memory:"
+LIFECYCLE_STEPS = (
+    "create_draft",
+    "escrow_prepare",
+    "escrow_confirm",
+    "result_enter",
+    "payout_prepare",
+    "payout_confirm",
+)
+# Loser bonus is cancelled first so the closing winner-bonus finish is the last confirmation.
+_PAYOUT_ORDER = (
+    (EscrowKind.BONUS_B, "EscrowCancel"),
+    (EscrowKind.SHOW_A, "EscrowFinish"),
+    (EscrowKind.SHOW_B, "EscrowFinish"),
+    (EscrowKind.BONUS_A, "EscrowFinish"),
+)
+
+
+@dataclass(frozen=True)
+class StepResult:
+    step: str
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    throughput_per_s: float
+    peak_alloc_kib: float | None
+
+
+@dataclass
+class _StepSamples:
+    durations: list[float] = field(default_factory=list)
+    peak_alloc_bytes: list[int] = field(default_factory=list)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; ``values`` does not need to be sorted."""
+    if not values:
+        raise ValueError("benchmark_no_samples")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_lifecycle_benchmark(
+    *,
+    iterations: int,
+    database_url: str = DEFAULT_DATABASE_URL,
+    allocation_iterations: int = 3,
+) -> dict[str, Any]:
+    """Run ``iterations`` full bout lifecycles and return JSON-ready per-step results.
+
+    Latency samples are taken without tracemalloc; allocation peaks come from a separate, shorter pass so
+    tracing overhead never leaks into latency figures.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+
+    engine = _create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+    def override_get_session() -> Iterator[Session]:
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app = create_app()
+    app.dependency_overrides[get_session] = override_get_session
+    client = TestClient(app)
+    try:
+        driver = _LifecycleDriver(client=client, engine=engine, run_tag=uuid.uuid4().hex[:8])
+        samples = {step: _StepSamples() for step in LIFECYCLE_STEPS}
+        for _ in range(iterations):
+            driver.run_once(measure=lambda step, fn: _timed(samples[step], fn))
+        for _ in range(allocation_iterations):
+            driver.run_once(measure=lambda step, fn: _traced_allocations(samples[step], fn))
+    finally:
+        client.close()
+        engine.dispose()
+
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "database": engine.dialect.name,
+        "iterations": iterations,
+        "recorded_at": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "steps": {step: asdict(_summarize(step, samples[step])) for step in LIFECYCLE_STEPS},
+    }
+
+
+def compare_to_baseline(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    latency_tolerance: float,
+    allocation_tolerance: float,
+    latency_metrics: tuple[str, ...] = ("p50_ms", "p95_ms"),
+) -> list[str]:
+    """Return human-readable regressions where a step exceeds the baseline by more than the tolerance ratio."""
+    regressions: list[str] = []
+    for step, base in baseline["steps"].items():
+        current = results["steps"].get(step)
+        if current is None:
+            regressions.append(f"{step}: missing from results")
+            continue
+        for metric in latency_metrics:
+            limit = base[metric] * (1 + latency_tolerance)
+            if current[metric] > limit:
+                regressions.append(
+                    f"{step}: {metric} {current[metric]:.3f} > {limit:.3f} (baseline {base[metric]:.3f})"
+                )
+        base_alloc, current_alloc = base.get("peak_alloc_kib"), current.get("peak_alloc_kib")
+        if base_alloc is not None and current_alloc is not None:
+            limit = base_alloc * (1 + allocation_tolerance)
+            if current_alloc > limit:
+                regressions.append(
+                    f"{step}: peak_alloc_kib {current_alloc:.1f} > {limit:.1f} (baseline {base_alloc:.1f})"
+                )
+    return regressions
+
+
+@dataclass
+class _LifecycleDriver:
+    client: Any
+    engine: Engine
+    run_tag: str
+    _sequence: int = 0
+
+    def __post_init__(self) -> None:
+        with Session(self.engine) as session:
+            self.promoter_id = self._insert_user(session, "promoter", UserRole.PROMOTER)
+            self.admin_id = self._insert_user(session, "admin", UserRole.ADMIN)
+            self.fighter_a_id = self._insert_user(session, "fighter-a", UserRole.FIGHTER)
+            self.fighter_b_id = self._insert_user(session, "fighter-b", UserRole.FIGHTER)
+            session.commit()
+        self.promoter_headers = _auth_headers(self.promoter_id, UserRole.PROMOTER)
+        self.admin_headers = _auth_headers(self.admin_id, UserRole.ADMIN)
+
+    def run_once(self, *, measure: Callable[[str, Callable[[], Any]], Any]) -> None:
+        self._sequence += 1
+        bout_id = measure("create_draft", self._create_draft)
+        self._expect_ok(measure("escrow_prepare", lambda: self._post(bout_id, "escrows/prepare")))
+
+        escrows = self._load_escrows(bout_id)
+        for index, kind in enumerate(EscrowKind, start=1):
+            escrow = escrows[kind]
+            payload = {
+                "escrow_kind": kind.value,
+                "tx_hash": f"BENCHCREATE{self.run_tag}{self._sequence:06d}{index}",
+                "offer_sequence": self._sequence * 10 + index,
+                "validated": True,
+                "engine_result": "tesSUCCESS",
+                "owner_address": escrow.owner_address,
+                "destination_address": escrow.destination_address,
+                "amount_drops": escrow.amount_drops,
+                "finish_after_ripple": escrow.finish_after_ripple,
+                "cancel_after_ripple": escrow.cancel_after_ripple,
+                "condition_hex": escrow.condition_hex,
+            }
+            self._expect_ok(
+                measure("escrow_confirm", lambda payload=payload: self._post(bout_id, "escrows/confirm", payload))
+            )
+
+        self._expect_ok(
+            measure("result_enter", lambda: self._post(bout_id, "result", {"winner": "A"}, admin=True)),
+        )
+        self._expect_ok(measure("payout_prepare", lambda: self._post(bout_id, "payouts/prepare")))
+
+        escrows = self._load_escrows(bout_id)
+        for index, (kind, transaction_type) in enumerate(_PAYOUT_ORDER, start=1):
+            escrow = escrows[kind]
+            payload = {
+                "escrow_kind": kind.value,
+                "tx_hash": f"BENCHPAYOUT{self.run_tag}{self._sequence:06d}{index}",
+                "validated": True,
+                "engine_result": "tesSUCCESS",
+                "transaction_type": transaction_type,
+                "owner_address": escrow.owner_address,
+                "offer_sequence": escrow.offer_sequence,
+                "close_time_ripple": (
+                    escrow.cancel_after_ripple if transaction_type == "EscrowCancel" else escrow.finish_after_ripple
+                ),
+                "fulfillment_hex": escrow.encrypted_preimage_hex if kind == EscrowKind.BONUS_A else None,
+            }
+            self._expect_ok(
+                measure("payout_confirm", lambda payload=payload: self._post(bout_id, "payouts/confirm", payload))
+            )
+
+    def _create_draft(self) -> uuid.UUID:
+        with Session(self.engine) as session:
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=self.promoter_id,
+                fighter_a_user_id=self.fighter_a_id,
+                fighter_b_user_id=self.fighter_b_id,
+                event_datetime_utc=datetime(2026, 2, 18, 20, 0, 0, tzinfo=UTC),
+                promoter_owner_address="rBenchPromoter",
+                fighter_a_destination="rBenchFighterA",
+                fighter_b_destination="rBenchFighterB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_000_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            session.commit()
+            return bout.id
+
+    def _post(self, bout_id: uuid.UUID, path: str, payload: dict[str, Any] | None = None, *, admin: bool = False):
+        headers = dict(self.admin_headers if admin else self.promoter_headers)
+        if path.endswith("confirm"):
+            headers["Idempotency-Key"] = f"bench-{bout_id}-{payload['escrow_kind']}-{path}"
+        return self.client.post(f"/bouts/{bout_id}/{path}", headers=headers, json=payload)
+
+    def _load_escrows(self, bout_id: uuid.UUID) -> dict[EscrowKind, Escrow]:
+        with Session(self.engine, expire_on_commit=False) as session:
+            escrows = session.scalars(select(Escrow).where(Escrow.bout_id == bout_id)).all()
+            session.expunge_all()
+        return {item.kind: item for item in escrows}
+
+    def _insert_user(self, session: Session, label: str, role: UserRole) -> uuid.UUID:
+        user = User(
+            id=uuid.uuid4(),
+            email=f"{label}.{self.run_tag}@bench.example.test",
+            password_hash="pbkdf2_sha256$1$00$00",
+            role=role,
+        )
+        session.add(user)
+        session.flush()
+        return user.id
+
+    @staticmethod
+    def _expect_ok(response: Any) -> None:
+        if response.status_code != 200:
+            raise RuntimeError(f"benchmark_step_failed:{response.status_code}:{response.text}")
+
+
+def _create_engine(database_url: str) -> Engine:
+    if database_url.startswith("sqlite") and ":memory:" in database_url:
+        return create_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+    return create_engine(database_url, future=True)
+
+
+def _timed(samples: _StepSamples, fn: Callable[[], Any]) -> Any:
+    started = time.perf_counter()
+    result = fn()
+    samples.durations.append(time.perf_counter() - started)
+    return result
+
+
+def _traced_allocations(samples: _StepSamples, fn: Callable[[], Any]) -> Any:
+    with _tracemalloc_session():
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    samples.peak_alloc_bytes.append(max(0, peak - baseline))
+    return result
+
+
+@contextmanager
+def _tracemalloc_session() -> Iterator[None]:
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def _summarize(step: str, samples: _StepSamples) -> StepResult:
+    durations_ms = [value * 1000 for value in samples.durations]
+    total_seconds = sum(samples.durations)
+    return StepResult(
+        step=step,
+        samples=len(durations_ms),
+        p50_ms=round(percentile(durations_ms, 50), 3),
+        p95_ms=round(percentile(durations_ms, 95), 3),
+        p99_ms=round(percentile(durations_ms, 99), 3),
+        throughput_per_s=round(len(durations_ms) / total_seconds, 1) if total_seconds else 0.0,
+        peak_alloc_kib=(
+            round(percentile([float(value) for value in samples.peak_alloc_bytes], 50) / 1024, 1)
+            if samples.peak_alloc_bytes
+            else None
+        ),
+    )
+
+
+def _auth_headers(user_id: uuid.UUID, role: UserRole) -> dict[str, str]:
+    token = create_access_token(
+        subject=str(user_id),
+        email=f"{role.value}@bench.example.test",
+        role=role.value,
+        secret_key=settings.jwt_secret,
+        expires_minutes=settings.jwt_exp_minutes,
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the bout lifecycle money paths.")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--allocation-iterations", type=int, default=3)
+    parser.add_argument(
+        "--database-url",
+        default=DEFAULT_DATABASE_URL,
+        help="SQLAlchemy URL; defaults to in-memory SQLite (use a disposable Postgres database for PG runs).",
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results to this path.")
+    parser.add_argument("--baseline", type=Path, help="Compare results against this baseline JSON.")
+    parser.add_argument("--latency-tolerance", type=float, default=0.5)
+    parser.add_argument("--allocation-tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite --baseline with these results.")
+    args = parser.parse_args(argv)
+
+    results = run_lifecycle_benchmark(
+        iterations=args.iterations,
+        database_url=args.database_url,
+        allocation_iterations=args.allocation_iterations,
+    )
+    rendered = json.dumps(results, indent=2, sort_keys=True)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    else:
+        print(rendered)
+
+    if args.baseline is None:
+        return 0
+    if args.update_baseline:
+        args.baseline.write_text(rendered + "\n", encoding="utf-8")
+        return 0
+    regressions = compare_to_baseline(
+        results,
+        json.loads(args.baseline.read_text(encoding="utf-8")),
+        latency_tolerance=args.latency_tolerance,
+        allocation_tolerance=args.allocation_tolerance,
+    )
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
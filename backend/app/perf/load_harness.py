@@ -0,0 +1,490 @@
+"""Concurrent load harness: N simulated promoters drive the bout lifecycle against a live app and Xaman stand-in.
+
+Usage (from ``backend/``):
+    python -m app.perf.load_harness --promoters 1,4,8,16 --bouts-per-promoter 3 \
+        --xaman-latency-ms 40 --xaman-error-rate 0.02 --output load.json
+
+App modules are imported only after the Xaman stand-in is listening, because runtime settings are read from the
+environment at import time; run the harness as its own process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from app.perf.xaman_stand_in import XamanStandInConfig, XamanStandInServer
+
+_WINNER = "A"
+_PAYOUT_ORDER = ("bonus_b", "show_a", "show_b", "bonus_a")
+
+
+@dataclass(frozen=True)
+class RequestSample:
+    step: str
+    status_code: int
+    latency_ms: float
+
+
+@dataclass(frozen=True)
+class LoadLevelReport:
+    promoters: int
+    requests: int
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    pool_checkouts: int
+    pool_wait_p95_ms: float
+    pool_wait_max_ms: float
+    rate_409: float
+    rate_502: float
+    rate_other_errors: float
+    completed_bouts: int
+    failed_bouts: int
+
+
+@dataclass
+class _LevelRecorder:
+    samples: list[RequestSample] = field(default_factory=list)
+    completed_bouts: int = 0
+    failed_bouts: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, sample: RequestSample) -> None:
+        with self._lock:
+            self.samples.append(sample)
+
+    def finish_bout(self, *, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self.completed_bouts += 1
+            else:
+                self.failed_bouts += 1
+
+
+class _StepFailed(Exception):
+    pass
+
+
+def run_load(
+    *,
+    promoter_levels: list[int],
+    bouts_per_promoter: int,
+    xaman_config: XamanStandInConfig,
+    database_url: str | None = None,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+) -> list[LoadLevelReport]:
+    with (
+        tempfile.TemporaryDirectory(prefix="ringledger-load-") as tmp,
+        XamanStandInServer(config=xaman_config) as xaman,
+    ):
+        resolved_url = database_url or f"sqlite+pysqlite:///{Path(tmp) / 'load.db'}"
+        _configure_environment(database_url=resolved_url, xaman_base_url=xaman.base_url)
+        harness = _AppUnderLoad(database_url=resolved_url, pool_size=pool_size, max_overflow=max_overflow)
+        with harness.serving():
+            return [
+                harness.run_level(promoters=promoters, bouts_per_promoter=bouts_per_promoter)
+                for promoters in promoter_levels
+            ]
+
+
+def _configure_environment(*, database_url: str, xaman_base_url: str) -> None:
+    if "app.core.config" in sys.modules:
+        raise RuntimeError("load_harness_settings_already_loaded")
+    os.environ.update(
+        {
+            "DATABASE_URL": database_url,
+            "XAMAN_MODE": "api",
+            "XAMAN_API_BASE_URL": xaman_base_url,
+            "XAMAN_API_KEY": os.environ.get("XAMAN_API_KEY", "load-harness-key"),
+            "XAMAN_API_SECRET": os.environ.get("XAMAN_API_SECRET", "load-harness-secret"),
+            "DB_AUTO_MIGRATE_ON_STARTUP": "false",
+        }
+    )
+
+
+class _AppUnderLoad:
+    def __init__(self, *, database_url: str, pool_size: int, max_overflow: int) -> None:
+        from sqlalchemy import create_engine, event
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import QueuePool
+
+        import app.models  # noqa: F401
+        from app.db.base import Base
+
+        self.pool_waits: list[float] = []
+        self._pool_lock = threading.Lock()
+        waits, lock = self.pool_waits, self._pool_lock
+
+        class _TimedQueuePool(QueuePool):
+            def _do_get(self):  # type: ignore[override]
+                started = time.perf_counter()
+                try:
+                    return super()._do_get()
+                finally:
+                    with lock:
+                        waits.append((time.perf_counter() - started) * 1000)
+
+        connect_args = {"check_same_thread": False, "timeout": 30} if database_url.startswith("sqlite") else {}
+        self.engine = create_engine(
+            database_url,
+            poolclass=_TimedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            connect_args=connect_args,
+            future=True,
+        )
+        if database_url.startswith("sqlite"):
+            event.listen(self.engine, "connect", _enable_sqlite_wal)
+        Base.metadata.create_all(bind=self.engine)
+        self.session_factory = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.admin_id = self._insert_user("admin", "ADMIN")
+        self.fighter_a_id = self._insert_user("fighter-a", "FIGHTER")
+        self.fighter_b_id = self._insert_user("fighter-b", "FIGHTER")
+        self.base_url = ""
+
+    def _insert_user(self, label: str, role_name: str) -> uuid.UUID:
+        from app.models.enums import UserRole
+        from app.models.user import User
+
+        with self.session_factory() as session:
+            user = User(
+                id=uuid.uuid4(),
+                email=f"{label}.{uuid.uuid4().hex[:10]}@load.example.test",
+                password_hash="pbkdf2_sha256$1$00$00",
+                role=UserRole[role_name],
+            )
+            session.add(user)
+            session.commit()
+            return user.id
+
+    def headers_for(self, user_id: uuid.UUID, role_name: str) -> dict[str, str]:
+        from app.core.config import settings
+        from app.core.security import create_access_token
+        from app.models.enums import UserRole
+
+        token = create_access_token(
+            subject=str(user_id),
+            email=f"{role_name.lower()}@load.example.test",
+            role=UserRole[role_name].value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    def create_draft(self, promoter_id: uuid.UUID) -> uuid.UUID:
+        from app.services.bout_service import BoutService
+
+        with self.session_factory() as session:
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=promoter_id,
+                fighter_a_user_id=self.fighter_a_id,
+                fighter_b_user_id=self.fighter_b_id,
+                event_datetime_utc=datetime(2026, 2, 18, 20, 0, 0, tzinfo=UTC),
+                promoter_owner_address="rLoadPromoter",
+                fighter_a_destination="rLoadFighterA",
+                fighter_b_destination="rLoadFighterB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_000_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            session.commit()
+            return bout.id
+
+    @contextmanager
+    def serving(self) -> Iterator[None]:
+        import uvicorn
+
+        from app.db.session import get_session
+        from app.main import create_app
+
+        def override_get_session():
+            session = self.session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app = create_app()
+        app.dependency_overrides[get_session] = override_get_session
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        self.base_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        server = uvicorn.Server(uvicorn.Config(app, lifespan="off", log_level="warning", access_log=False))
+        thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, name="load-harness-app", daemon=True)
+        thread.start()
+        while not server.started:
+            if not thread.is_alive():
+                raise RuntimeError("load_harness_app_failed_to_start")
+            time.sleep(0.01)
+        try:
+            yield
+        finally:
+            server.should_exit = True
+            thread.join()
+            sock.close()
+            self.engine.dispose()
+
+    def run_level(self, *, promoters: int, bouts_per_promoter: int) -> LoadLevelReport:
+        recorder = _LevelRecorder()
+        with self._pool_lock:
+            self.pool_waits.clear()
+        admin_headers = self.headers_for(self.admin_id, "ADMIN")
+        promoter_ids = [self._insert_user("promoter", "PROMOTER") for _ in range(promoters)]
+        workers = [
+            threading.Thread(
+                target=_SimulatedPromoter(
+                    harness=self,
+                    recorder=recorder,
+                    promoter_id=promoter_id,
+                    promoter_headers=self.headers_for(promoter_id, "PROMOTER"),
+                    admin_headers=admin_headers,
+                ).run,
+                args=(bouts_per_promoter,),
+                name=f"promoter-{index}",
+            )
+            for index, promoter_id in enumerate(promoter_ids)
+        ]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        duration = time.perf_counter() - started
+        with self._pool_lock:
+            waits = list(self.pool_waits)
+        return _build_report(promoters=promoters, duration=duration, recorder=recorder, pool_waits=waits)
+
+
+@dataclass
+class _SimulatedPromoter:
+    harness: _AppUnderLoad
+    recorder: _LevelRecorder
+    promoter_id: uuid.UUID
+    promoter_headers: dict[str, str]
+    admin_headers: dict[str, str]
+
+    def run(self, bouts: int) -> None:
+        for _ in range(bouts):
+            try:
+                self._run_bout()
+            except _StepFailed:
+                self.recorder.finish_bout(ok=False)
+            else:
+                self.recorder.finish_bout(ok=True)
+
+    def _run_bout(self) -> None:
+        started = time.perf_counter()
+        try:
+            bout_id = self.harness.create_draft(self.promoter_id)
+        except Exception as exc:
+            self.recorder.record(RequestSample("create_draft", 500, (time.perf_counter() - started) * 1000))
+            raise _StepFailed from exc
+        self.recorder.record(RequestSample("create_draft", 200, (time.perf_counter() - started) * 1000))
+
+        prepared = self._post("escrow_prepare", f"/bouts/{bout_id}/escrows/prepare")
+        create_txs = {item["escrow_kind"]: item for item in prepared["escrows"]}
+        first = prepared["escrows"][0]
+        self._post(
+            "escrow_signing_reconcile",
+            f"/bouts/{bout_id}/escrows/signing/reconcile",
+            {"escrow_kind": first["escrow_kind"], "payload_id": first["xaman_sign_request"]["payload_id"]},
+        )
+        for index, (kind, item) in enumerate(create_txs.items(), start=1):
+            tx = item["unsigned_tx"]
+            self._post(
+                "escrow_confirm",
+                f"/bouts/{bout_id}/escrows/confirm",
+                {
+                    "escrow_kind": kind,
+                    "tx_hash": f"LOADCREATE{bout_id.hex}{index}",
+                    "offer_sequence": index,
+                    "validated": True,
+                    "engine_result": "tesSUCCESS",
+                    "owner_address": tx["Account"],
+                    "destination_address": tx["Destination"],
+                    "amount_drops": int(tx["Amount"]),
+                    "finish_after_ripple": tx["FinishAfter"],
+                    "cancel_after_ripple": tx.get("CancelAfter"),
+                    "condition_hex": tx.get("Condition"),
+                },
+                idempotency_key=f"load-create-{bout_id}-{kind}",
+            )
+
+        self._post("result_enter", f"/bouts/{bout_id}/result", {"winner": _WINNER}, admin=True)
+        payouts = {
+            item["escrow_kind"]: item
+            for item in self._post("payout_prepare", f"/bouts/{bout_id}/payouts/prepare")["escrows"]
+        }
+        for kind in _PAYOUT_ORDER:
+            item = payouts[kind]
+            tx = item["unsigned_tx"]
+            create_tx = create_txs[kind]["unsigned_tx"]
+            cancel = item["action"] == "cancel"
+            self._post(
+                "payout_confirm",
+                f"/bouts/{bout_id}/payouts/confirm",
+                {
+                    "escrow_kind": kind,
+                    "tx_hash": f"LOADPAYOUT{bout_id.hex}{kind}",
+                    "validated": True,
+                    "engine_result": "tesSUCCESS",
+                    "transaction_type": "EscrowCancel" if cancel else "EscrowFinish",
+                    "owner_address": tx["Owner"],
+                    "offer_sequence": tx["OfferSequence"],
+                    "close_time_ripple": create_tx["CancelAfter"] if cancel else create_tx["FinishAfter"],
+                    "fulfillment_hex": tx.get("Fulfillment"),
+                },
+                idempotency_key=f"load-payout-{bout_id}-{kind}",
+            )
+
+    def _post(
+        self,
+        step: str,
+        path: str,
+        body: dict[str, Any] | None = None,
+        *,
+        admin: bool = False,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        request = Request(
+            url=f"{self.harness.base_url}{path}",
+            data=json.dumps(body or {}).encode("utf-8") if body is not None else None,
+            method="POST",
+        )
+        for name, value in (self.admin_headers if admin else self.promoter_headers).items():
+            request.add_header(name, value)
+        request.add_header("Content-Type", "application/json")
+        if idempotency_key is not None:
+            request.add_header("Idempotency-Key", idempotency_key)
+
+        started = time.perf_counter()
+        try:
+            with urlopen(request, timeout=60) as response:
+                payload = json.loads(response.read().decode("utf-8"))
+                status_code = response.status
+        except HTTPError as exc:
+            exc.read()
+            self.recorder.record(RequestSample(step, exc.code, (time.perf_counter() - started) * 1000))
+            raise _StepFailed(step) from exc
+        except URLError as exc:
+            self.recorder.record(RequestSample(step, 599, (time.perf_counter() - started) * 1000))
+            raise _StepFailed(step) from exc
+        self.recorder.record(RequestSample(step, status_code, (time.perf_counter() - started) * 1000))
+        return payload
+
+
+def _build_report(
+    *, promoters: int, duration: float, recorder: _LevelRecorder, pool_waits: list[float]
+) -> LoadLevelReport:
+    latencies = [sample.latency_ms for sample in recorder.samples]
+    total = len(recorder.samples) or 1
+    by_status = [sample.status_code for sample in recorder.samples]
+    errors_409 = sum(1 for code in by_status if code == 409)
+    errors_502 = sum(1 for code in by_status if code == 502)
+    other_errors = sum(1 for code in by_status if code >= 400 and code not in {409, 502})
+    return LoadLevelReport(
+        promoters=promoters,
+        requests=len(recorder.samples),
+        duration_s=round(duration, 3),
+        throughput_rps=round(len(recorder.samples) / duration, 1) if duration else 0.0,
+        p50_ms=_percentile(latencies, 50),
+        p95_ms=_percentile(latencies, 95),
+        p99_ms=_percentile(latencies, 99),
+        pool_checkouts=len(pool_waits),
+        pool_wait_p95_ms=_percentile(pool_waits, 95),
+        pool_wait_max_ms=round(max(pool_waits), 3) if pool_waits else 0.0,
+        rate_409=round(errors_409 / total, 4),
+        rate_502=round(errors_502 / total, 4),
+        rate_other_errors=round(other_errors / total, 4),
+        completed_bouts=recorder.completed_bouts,
+        failed_bouts=recorder.failed_bouts,
+    )
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return round(ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1], 3)
+
+
+def _enable_sqlite_wal(dbapi_connection: Any, _record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+def render_table(reports: list[LoadLevelReport]) -> str:
+    header = (
+        f"{'promoters':>9} {'req':>6} {'rps':>8} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} "
+        f"{'poolp95':>8} {'poolmax':>8} {'409%':>6} {'502%':>6} {'err%':>6} {'ok':>4} {'fail':>4}"
+    )
+    rows = [
+        f"{r.promoters:>9} {r.requests:>6} {r.throughput_rps:>8.1f} {r.p50_ms:>8.1f} {r.p95_ms:>8.1f} "
+        f"{r.p99_ms:>8.1f} {r.pool_wait_p95_ms:>8.1f} {r.pool_wait_max_ms:>8.1f} {r.rate_409 * 100:>6.2f} "
+        f"{r.rate_502 * 100:>6.2f} {r.rate_other_errors * 100:>6.2f} {r.completed_bouts:>4} {r.failed_bouts:>4}"
+        for r in reports
+    ]
+    return "\n".join([header, *rows])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Drive concurrent promoters through the bout lifecycle.")
+    parser.add_argument("--promoters", default="1,2,4,8", help="Comma-separated concurrency levels.")
+    parser.add_argument("--bouts-per-promoter", type=int, default=2)
+    parser.add_argument("--database-url", help="SQLAlchemy URL of a disposable database (default: temp SQLite).")
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--max-overflow", type=int, default=10)
+    parser.add_argument("--xaman-latency-ms", type=float, default=25.0)
+    parser.add_argument("--xaman-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--xaman-error-rate", type=float, default=0.0)
+    parser.add_argument("--xaman-error-status", type=int, default=503)
+    parser.add_argument("--xaman-rate-limit", type=float, default=0.0, help="Stand-in provider limit (req/s).")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this path.")
+    args = parser.parse_args(argv)
+
+    reports = run_load(
+        promoter_levels=[int(value) for value in args.promoters.split(",") if value.strip()],
+        bouts_per_promoter=args.bouts_per_promoter,
+        database_url=args.database_url,
+        pool_size=args.pool_size,
+        max_overflow=args.max_overflow,
+        xaman_config=XamanStandInConfig(
+            latency_ms=args.xaman_latency_ms,
+            jitter_ms=args.xaman_jitter_ms,
+            error_rate=args.xaman_error_rate,
+            error_status=args.xaman_error_status,
+            rate_limit_per_second=args.xaman_rate_limit,
+            seed=args.seed,
+        ),
+    )
+    print(render_table(reports))
+    if args.output is not None:
+        args.output.write_text(json.dumps([asdict(item) for item in reports], indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,225 @@
+"""Local HTTP stand-in for the Xaman payload API used by load runs and integration tests.
+
+Implements ``POST /api/v1/platform/payload`` and ``GET /api/v1/platform/payload/{uuid}`` with the response shape
+``XamanService`` parses, plus configurable latency, jitter, error injection and a provider-side rate limit that answers
+429 with ``Retry-After``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+_PAYLOAD_PATH = "/api/v1/platform/payload"
+
+
+@dataclass(frozen=True)
+class XamanStandInConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit_per_second: float = 0.0
+    retry_after_seconds: float = 1.0
+    seed: int | None = None
+
+
+@dataclass
+class XamanStandInStats:
+    payloads_created: int = 0
+    status_requests: int = 0
+    injected_errors: int = 0
+    throttled: int = 0
+
+
+@dataclass
+class _StoredPayload:
+    signed: bool = False
+    cancelled: bool = False
+    expired: bool = False
+    tx_hash: str | None = None
+
+
+@dataclass
+class XamanStandInServer:
+    config: XamanStandInConfig = field(default_factory=XamanStandInConfig)
+    host: str = "127.0.0.1"
+    port: int = 0
+    stats: XamanStandInStats = field(default_factory=XamanStandInStats, init=False)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._payloads: dict[str, _StoredPayload] = {}
+        self._bucket_tokens = max(1.0, self.config.rate_limit_per_second)
+        self._bucket_updated_at = time.monotonic()
+        self._server = ThreadingHTTPServer((self.host, self.port), _build_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="xaman-stand-in", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> XamanStandInServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> XamanStandInServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.stop()
+        return False
+
+    def resolve(
+        self,
+        payload_id: str,
+        *,
+        signed: bool = False,
+        cancelled: bool = False,
+        expired: bool = False,
+        tx_hash: str | None = None,
+    ) -> None:
+        """Resolve a stored payload the way a wallet would, so status polls observe it."""
+        with self._lock:
+            self._payloads[payload_id] = _StoredPayload(
+                signed=signed, cancelled=cancelled, expired=expired, tx_hash=tx_hash
+            )
+
+    def _throttle(self) -> bool:
+        """Return True when the provider-side rate limit rejects this request."""
+        if self.config.rate_limit_per_second <= 0:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            capacity = max(1.0, self.config.rate_limit_per_second)
+            elapsed = now - self._bucket_updated_at
+            self._bucket_tokens = min(capacity, self._bucket_tokens + elapsed * self.config.rate_limit_per_second)
+            self._bucket_updated_at = now
+            if self._bucket_tokens >= 1:
+                self._bucket_tokens -= 1
+                return False
+            self.stats.throttled += 1
+            return True
+
+    def _simulate_network(self) -> bool:
+        """Sleep for the configured latency and return True when this request should fail."""
+        with self._lock:
+            jitter = self._random.uniform(-self.config.jitter_ms, self.config.jitter_ms)
+            fail = self._random.random() < self.config.error_rate
+            if fail:
+                self.stats.injected_errors += 1
+        delay_ms = max(0.0, self.config.latency_ms + jitter)
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+        return fail
+
+    def _create_payload(self, body: dict[str, Any]) -> dict[str, Any]:
+        payload_id = str(uuid.uuid4())
+        with self._lock:
+            self._payloads[payload_id] = _StoredPayload()
+            self.stats.payloads_created += 1
+        return {
+            "uuid": payload_id,
+            "next": {"always": f"https://xumm.app/sign/{payload_id}"},
+            "refs": {
+                "qr_png": f"https://xumm.app/sign/{payload_id}_q.png",
+                "websocket_status": f"wss://xumm.app/sign/{payload_id}",
+            },
+            "pushed": False,
+        }
+
+    def _payload_status(self, payload_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            self.stats.status_requests += 1
+            stored = self._payloads.get(payload_id)
+        if stored is None:
+            return None
+        resolved = stored.signed or stored.cancelled or stored.expired
+        return {
+            "meta": {
+                "uuid": payload_id,
+                "resolved": resolved,
+                "signed": stored.signed,
+                "cancelled": stored.cancelled,
+                "expired": stored.expired,
+            },
+            "response": {"txid": stored.tx_hash},
+        }
+
+
+def _build_handler(stand_in: XamanStandInServer) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            if self.path.rstrip("/") != _PAYLOAD_PATH:
+                self._send(404, {"error": "not_found"})
+                return
+            if stand_in._throttle():
+                self._send(
+                    429,
+                    {"error": "rate_limited"},
+                    headers={"Retry-After": f"{stand_in.config.retry_after_seconds:g}"},
+                )
+                return
+            if stand_in._simulate_network():
+                self._send(stand_in.config.error_status, {"error": "injected"})
+                return
+            try:
+                body = json.loads(raw.decode("utf-8") or "{}")
+            except json.JSONDecodeError:
+                self._send(400, {"error": "invalid_json"})
+                return
+            self._send(200, stand_in._create_payload(body))
+
+        def do_GET(self) -> None:  # noqa: N802
+            prefix = f"{_PAYLOAD_PATH}/"
+            if not self.path.startswith(prefix):
+                self._send(404, {"error": "not_found"})
+                return
+            if stand_in._throttle():
+                self._send(
+                    429,
+                    {"error": "rate_limited"},
+                    headers={"Retry-After": f"{stand_in.config.retry_after_seconds:g}"},
+                )
+                return
+            if stand_in._simulate_network():
+                self._send(stand_in.config.error_status, {"error": "injected"})
+                return
+            status = stand_in._payload_status(self.path[len(prefix) :])
+            if status is None:
+                self._send(404, {"error": "payload_not_found"})
+                return
+            self._send(200, status)
+
+        def _send(self, status_code: int, body: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+            encoded = json.dumps(body).encode("utf-8")
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    return _Handler
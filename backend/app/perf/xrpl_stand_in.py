@@ -0,0 +1,305 @@
+"""Local rippled-compatible JSON-RPC stand-in for ledger verification tests and load runs.
+
+Serves ``tx``, ``account_objects`` and ``ledger`` over HTTP/1.1 keep-alive with the result shapes rippled returns
+(API v1: transaction fields at the top level of ``result``, engine result under ``meta.TransactionResult``).
+The same port accepts websocket upgrades for ``subscribe``/``unsubscribe`` on ``accounts``; ``publish_transaction``
+records a transaction and pushes the validated ``transaction`` stream message to every matching subscriber.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import struct
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from app.integrations.xrpl_stream import WebSocketFrameDecoder, encode_websocket_frame, websocket_accept_key
+
+
+@dataclass
+class XrplStandInStats:
+    connections: int = 0
+    requests: int = 0
+    requests_by_method: dict[str, int] = field(default_factory=dict)
+    stream_messages: int = 0
+
+
+@dataclass
+class XrplStandInServer:
+    host: str = "127.0.0.1"
+    port: int = 0
+    ledger_index: int = 90_000_000
+    ledger_close_time_ripple: int = 800_000_000
+    stats: XrplStandInStats = field(default_factory=XrplStandInStats, init=False)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._transactions: dict[str, dict[str, Any]] = {}
+        self._account_objects: dict[str, list[dict[str, Any]]] = {}
+        self._subscribers: list[_StreamSubscriber] = []
+        self._server = ThreadingHTTPServer((self.host, self.port), _build_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="xrpl-stand-in", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def ws_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"ws://{host}:{port}/"
+
+    @property
+    def subscribed_accounts(self) -> set[str]:
+        with self._lock:
+            return {account for subscriber in self._subscribers for account in subscriber.accounts}
+
+    def start(self) -> XrplStandInServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.disconnect_streams()
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> XrplStandInServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.stop()
+        return False
+
+    def add_transaction(
+        self,
+        tx_hash: str,
+        tx_json: dict[str, Any],
+        *,
+        engine_result: str = "tesSUCCESS",
+        validated: bool = True,
+        close_time_ripple: int | None = None,
+    ) -> None:
+        with self._lock:
+            self._transactions[tx_hash.upper()] = {
+                **tx_json,
+                "hash": tx_hash.upper(),
+                "date": close_time_ripple if close_time_ripple is not None else self.ledger_close_time_ripple,
+                "ledger_index": self.ledger_index,
+                "meta": {"TransactionResult": engine_result},
+                "validated": validated,
+            }
+
+    def publish_transaction(
+        self,
+        tx_hash: str,
+        tx_json: dict[str, Any],
+        *,
+        engine_result: str = "tesSUCCESS",
+        close_time_ripple: int | None = None,
+    ) -> int:
+        """Validate a transaction into the next ledger and stream it; returns how many subscribers received it."""
+        with self._lock:
+            self.ledger_index += 1
+        self.add_transaction(tx_hash, tx_json, engine_result=engine_result, close_time_ripple=close_time_ripple)
+        with self._lock:
+            stored = dict(self._transactions[tx_hash.upper()])
+            affected = {tx_json.get(name) for name in ("Account", "Destination", "Owner")} - {None}
+            targets = [subscriber for subscriber in self._subscribers if subscriber.accounts & affected]
+        message = {
+            "type": "transaction",
+            "engine_result": engine_result,
+            "ledger_index": stored.pop("ledger_index"),
+            "meta": stored.pop("meta"),
+            "validated": stored.pop("validated"),
+            "transaction": stored,
+        }
+        delivered = 0
+        for subscriber in targets:
+            if subscriber.send_json(message):
+                delivered += 1
+        with self._lock:
+            self.stats.stream_messages += delivered
+        return delivered
+
+    def disconnect_streams(self) -> None:
+        """Drop every websocket subscriber, as a rippled restart would."""
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            subscriber.close()
+
+    def add_account_object(self, account: str, ledger_object: dict[str, Any]) -> None:
+        with self._lock:
+            self._account_objects.setdefault(account, []).append(ledger_object)
+
+    def _dispatch(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.requests_by_method[method] = self.stats.requests_by_method.get(method, 0) + 1
+            if method == "tx":
+                tx = self._transactions.get(str(params.get("transaction", "")).upper())
+                if tx is None:
+                    return {"status": "error", "error": "txnNotFound", "error_message": "Transaction not found."}
+                return {**tx, "status": "success"}
+            if method == "account_objects":
+                objects = self._account_objects.get(str(params.get("account")), [])
+                start = int(params.get("marker") or 0)
+                limit = int(params.get("limit") or 200)
+                page = objects[start : start + limit]
+                result: dict[str, Any] = {
+                    "account": params.get("account"),
+                    "account_objects": page,
+                    "ledger_index": self.ledger_index,
+                    "validated": True,
+                    "status": "success",
+                }
+                if start + limit < len(objects):
+                    result["marker"] = str(start + limit)
+                return result
+            if method == "ledger":
+                return {
+                    "ledger": {
+                        "ledger_index": str(self.ledger_index),
+                        "close_time": self.ledger_close_time_ripple,
+                        "closed": True,
+                    },
+                    "ledger_index": self.ledger_index,
+                    "validated": True,
+                    "status": "success",
+                }
+        return {"status": "error", "error": "unknownCmd", "error_message": "Unknown method."}
+
+    def _stream_command(self, subscriber: _StreamSubscriber, request: dict[str, Any]) -> dict[str, Any]:
+        command = request.get("command")
+        accounts = {str(account) for account in request.get("accounts") or []}
+        with self._lock:
+            if command == "subscribe":
+                subscriber.accounts |= accounts
+            elif command == "unsubscribe":
+                subscriber.accounts -= accounts
+            else:
+                return {"id": request.get("id"), "type": "response", "status": "error", "error": "unknownCmd"}
+        return {"id": request.get("id"), "type": "response", "status": "success", "result": {}}
+
+
+@dataclass(eq=False)
+class _StreamSubscriber:
+    connection: socket.socket
+    accounts: set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        self._send_lock = threading.Lock()
+
+    def send_json(self, message: dict[str, Any]) -> bool:
+        frame = encode_websocket_frame(0x1, json.dumps(message).encode("utf-8"), mask=False)
+        try:
+            with self._send_lock:
+                self.connection.sendall(frame)
+        except OSError:
+            return False
+        return True
+
+    def close(self) -> None:
+        try:
+            with self._send_lock:
+                self.connection.sendall(encode_websocket_frame(0x8, struct.pack("!H", 1001), mask=False))
+        except OSError:
+            pass
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def _build_handler(stand_in: XrplStandInServer) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            with stand_in._lock:
+                stand_in.stats.connections += 1
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            try:
+                request = json.loads(raw.decode("utf-8") or "{}")
+            except json.JSONDecodeError:
+                self._send(400, {"error": "invalid_json"})
+                return
+            params = request.get("params") or [{}]
+            result = stand_in._dispatch(str(request.get("method")), params[0] if params else {})
+            self._send(200, {"result": result})
+
+        def do_GET(self) -> None:  # noqa: N802
+            client_key = self.headers.get("Sec-WebSocket-Key")
+            if (self.headers.get("Upgrade") or "").lower() != "websocket" or not client_key:
+                self._send(400, {"error": "websocket_upgrade_required"})
+                return
+            self.send_response(101)
+            self.send_header("Upgrade", "websocket")
+            self.send_header("Connection", "Upgrade")
+            self.send_header("Sec-WebSocket-Accept", websocket_accept_key(client_key))
+            self.end_headers()
+            self.wfile.flush()
+            self.close_connection = True
+
+            subscriber = _StreamSubscriber(connection=self.connection)
+            with stand_in._lock:
+                stand_in._subscribers.append(subscriber)
+            try:
+                self._serve_stream(subscriber)
+            finally:
+                with stand_in._lock:
+                    if subscriber in stand_in._subscribers:
+                        stand_in._subscribers.remove(subscriber)
+
+        def _serve_stream(self, subscriber: _StreamSubscriber) -> None:
+            decoder = WebSocketFrameDecoder()
+            while True:
+                message = decoder.next_message()
+                if message is None:
+                    try:
+                        data = self.connection.recv(65536)
+                    except OSError:
+                        return
+                    if not data:
+                        return
+                    decoder.feed(data)
+                    continue
+                opcode, payload = message
+                if opcode == 0x8:
+                    subscriber.close()
+                    return
+                if opcode == 0x9:
+                    with subscriber._send_lock:
+                        self.connection.sendall(encode_websocket_frame(0xA, payload, mask=False))
+                    continue
+                if opcode != 0x1:
+                    continue
+                try:
+                    request = json.loads(payload.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    subscriber.send_json({"type": "response", "status": "error", "error": "invalidParams"})
+                    continue
+                subscriber.send_json(stand_in._stream_command(subscriber, request))
+
+        def _send(self, status_code: int, body: dict[str, Any]) -> None:
+            encoded = json.dumps(body).encode("utf-8")
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    return _Handler
@@ -1,11 +1,23 @@
 from app.repositories.audit_log_repository import AuditLogRepository
+from app.repositories.bout_archive_repository import BoutArchiveRepository
 from app.repositories.bout_repository import BoutRepository
+from app.repositories.bout_summary_repository import BoutSummaryRepository
+from app.repositories.escrow_deadline_repository import EscrowDeadlineRepository
 from app.repositories.escrow_repository import EscrowRepository
+from app.repositories.escrow_tx_payload_repository import EscrowTxPayloadRepository
 from app.repositories.idempotency_key_repository import IdempotencyKeyRepository
+from app.repositories.outbox_repository import OutboxRepository
+from app.repositories.validated_transaction_repository import ValidatedTransactionRepository
 
 __all__ = [
     "AuditLogRepository",
+    "BoutArchiveRepository",
     "BoutRepository",
+    "BoutSummaryRepository",
+    "EscrowDeadlineRepository",
     "EscrowRepository",
+    "EscrowTxPayloadRepository",
     "IdempotencyKeyRepository",
+    "OutboxRepository",
+    "ValidatedTransactionRepository",
 ]
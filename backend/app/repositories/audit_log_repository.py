@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from sqlalchemy import ColumnElement, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced
 from app.models.audit_log import AuditLog
 
 
@@ -11,5 +14,24 @@ from app.models.audit_log import AuditLog
 class AuditLogRepository:
     session: Session
 
+    @traced("repository.audit_logs.add")
     def add(self, *, audit_log: AuditLog) -> None:
         self.session.add(audit_log)
+
+    @traced("repository.audit_logs.list_by_detail")
+    def list_by_detail(self, *, key: str, value: str, entity_type: str | None = None) -> list[AuditLog]:
+        """Audit rows whose ``details[key]`` equals ``value``, e.g. which escrow a tx hash belonged to."""
+        statement = select(AuditLog).where(
+            details_match(key=key, value=value, dialect_name=self.session.get_bind().dialect.name)
+        )
+        if entity_type is not None:
+            statement = statement.where(AuditLog.entity_type == entity_type)
+        return list(self.session.scalars(statement.order_by(AuditLog.created_at, AuditLog.id)))
+
+
+def details_match(*, key: str, value: str, dialect_name: str) -> ColumnElement[bool]:
+    # On PostgreSQL, ``@>`` is what the jsonb_path_ops GIN index (idx_audit_log_details) serves; a ``->>`` equality
+    # would scan. Other dialects only back the tests, so a plain JSON path comparison is enough there.
+    if dialect_name == "postgresql":
+        return type_coerce(AuditLog.details, JSONB).contains({key: value})
+    return AuditLog.details[key].as_string() == value
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced
+from app.models.bout_archive import BoutArchive
+
+
+@dataclass
+class BoutArchiveRepository:
+    session: Session
+
+    @traced("repository.bout_archives.get")
+    def get(self, *, bout_id: uuid.UUID) -> BoutArchive | None:
+        return self.session.get(BoutArchive, bout_id)
+
+    @traced("repository.bout_archives.add_many")
+    def add_many(self, *, archives: Sequence[BoutArchive]) -> None:
+        self.session.add_all(archives)
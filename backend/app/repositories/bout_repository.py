@@ -2,18 +2,63 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass
+from datetime import datetime
 
+from sqlalchemy import Row, select, tuple_
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced
 from app.models.bout import Bout
+from app.models.enums import BoutStatus
 
 
 @dataclass
 class BoutRepository:
     session: Session
 
+    @traced("repository.bouts.get")
     def get(self, *, bout_id: uuid.UUID) -> Bout | None:
         return self.session.get(Bout, bout_id)
 
+    @traced("repository.bouts.add")
     def add(self, *, bout: Bout) -> None:
         self.session.add(bout)
+
+    @traced("repository.bouts.add_many")
+    def add_many(self, *, bouts: list[Bout]) -> None:
+        self.session.add_all(bouts)
+
+    @traced("repository.bouts.list_page_for_promoter")
+    def list_page_for_promoter(
+        self,
+        *,
+        promoter_user_id: uuid.UUID,
+        status: BoutStatus | None,
+        event_from: datetime | None,
+        event_to: datetime | None,
+        after: tuple[datetime, uuid.UUID] | None,
+        limit: int,
+    ) -> list[Row]:
+        """One keyset page ordered by ``(event_datetime_utc, id)``.
+
+        Only columns carried by ``idx_bouts_promoter_event_id`` / ``idx_bouts_promoter_status_event_id`` are
+        selected, so PostgreSQL can answer the page with an index-only scan however many bouts precede it.
+        """
+        query = select(
+            Bout.id,
+            Bout.status,
+            Bout.winner,
+            Bout.event_datetime_utc,
+            Bout.fighter_a_user_id,
+            Bout.fighter_b_user_id,
+        ).where(Bout.promoter_user_id == promoter_user_id)
+        if status is not None:
+            query = query.where(Bout.status == status)
+        if event_from is not None:
+            query = query.where(Bout.event_datetime_utc >= event_from)
+        if event_to is not None:
+            query = query.where(Bout.event_datetime_utc < event_to)
+        if after is not None:
+            query = query.where(tuple_(Bout.event_datetime_utc, Bout.id) > tuple_(*after))
+        query = query.order_by(Bout.event_datetime_utc, Bout.id).limit(limit)
+        return list(self.session.execute(query).all())
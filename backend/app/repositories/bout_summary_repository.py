@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced
+from app.models.bout_summary import BoutSummary
+
+
+@dataclass
+class BoutSummaryRepository:
+    session: Session
+
+    @traced("repository.bout_summaries.get")
+    def get(self, *, bout_id: uuid.UUID) -> BoutSummary | None:
+        return self.session.get(BoutSummary, bout_id)
+
+    @traced("repository.bout_summaries.add_many")
+    def add_many(self, *, summaries: Sequence[BoutSummary]) -> None:
+        self.session.add_all(summaries)
+
+    @traced("repository.bout_summaries.update")
+    def update(self, *, bout_id: uuid.UUID, values: dict[str, Any]) -> None:
+        """Write the given columns in one UPDATE; the row is never read back first."""
+        self.session.execute(update(BoutSummary).where(BoutSummary.bout_id == bout_id).values(**values))
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced
+from app.models.enums import EscrowCloseAction, EscrowDeadlineStatus
+from app.models.escrow import Escrow
+from app.models.escrow_deadline import EscrowDeadline
+
+
+@dataclass
+class EscrowDeadlineRepository:
+    session: Session
+
+    @traced("repository.escrow_deadlines.add_for_escrow")
+    def add_for_escrow(self, *, escrow: Escrow) -> list[EscrowDeadline]:
+        """Queue the finish deadline and, for escrows with a CancelAfter, the cancel deadline."""
+        deadlines = [
+            EscrowDeadline(
+                escrow_id=escrow.id,
+                bout_id=escrow.bout_id,
+                action=EscrowCloseAction.FINISH,
+                status=EscrowDeadlineStatus.PENDING,
+                due_at_ripple=escrow.finish_after_ripple,
+                attempts=0,
+            )
+        ]
+        if escrow.cancel_after_ripple is not None:
+            deadlines.append(
+                EscrowDeadline(
+                    escrow_id=escrow.id,
+                    bout_id=escrow.bout_id,
+                    action=EscrowCloseAction.CANCEL,
+                    status=EscrowDeadlineStatus.PENDING,
+                    due_at_ripple=escrow.cancel_after_ripple,
+                    attempts=0,
+                )
+            )
+        self.session.add_all(deadlines)
+        return deadlines
+
+    @traced("repository.escrow_deadlines.get")
+    def get(self, *, deadline_id: uuid.UUID) -> EscrowDeadline | None:
+        return self.session.get(EscrowDeadline, deadline_id)
+
+    @traced("repository.escrow_deadlines.list_pending_due")
+    def list_pending_due(self, *, due_at_or_before: int, limit: int) -> list[tuple[uuid.UUID, int]]:
+        """Earliest pending deadlines up to a horizon, read from ``idx_escrow_deadlines_status_due``."""
+        rows = self.session.execute(
+            select(EscrowDeadline.id, EscrowDeadline.due_at_ripple)
+            .where(
+                EscrowDeadline.status == EscrowDeadlineStatus.PENDING,
+                EscrowDeadline.due_at_ripple <= due_at_or_before,
+            )
+            .order_by(EscrowDeadline.due_at_ripple)
+            .limit(limit)
+        ).all()
+        return [(row.id, row.due_at_ripple) for row in rows]
+
+    @traced("repository.escrow_deadlines.release_awaiting_result")
+    def release_awaiting_result(self, *, bout_id: uuid.UUID) -> None:
+        self.session.execute(
+            update(EscrowDeadline)
+            .where(
+                EscrowDeadline.bout_id == bout_id,
+                EscrowDeadline.status == EscrowDeadlineStatus.AWAITING_RESULT,
+            )
+            .values(status=EscrowDeadlineStatus.PENDING)
+        )
+
+    @traced("repository.escrow_deadlines.list_prepared_for_bout")
+    def list_prepared_for_bout(self, *, bout_id: uuid.UUID) -> list[EscrowDeadline]:
+        return list(
+            self.session.scalars(
+                select(EscrowDeadline).where(
+                    EscrowDeadline.bout_id == bout_id,
+                    EscrowDeadline.status == EscrowDeadlineStatus.PREPARED,
+                )
+            )
+        )
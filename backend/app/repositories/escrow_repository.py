@@ -3,10 +3,11 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
-from app.models.enums import EscrowKind
+from app.core.tracing import traced
+from app.models.enums import EscrowKind, EscrowStatus
 from app.models.escrow import Escrow
 
 
@@ -14,12 +15,30 @@ from app.models.escrow import Escrow
 class EscrowRepository:
     session: Session
 
+    @traced("repository.escrows.add_many")
     def add_many(self, *, escrows: list[Escrow]) -> None:
         self.session.add_all(escrows)
 
+    @traced("repository.escrows.list_for_bout")
     def list_for_bout(self, *, bout_id: uuid.UUID) -> list[Escrow]:
         return self.session.scalars(select(Escrow).where(Escrow.bout_id == bout_id)).all()
 
+    @traced("repository.escrows.count_statuses_by_bout")
+    def count_statuses_by_bout(self, *, bout_ids: list[uuid.UUID]) -> dict[uuid.UUID, dict[EscrowStatus, int]]:
+        """Escrow counts per status for many bouts in one grouped query over ``idx_escrows_bout_status``."""
+        counts: dict[uuid.UUID, dict[EscrowStatus, int]] = {bout_id: {} for bout_id in bout_ids}
+        if not bout_ids:
+            return counts
+        rows = self.session.execute(
+            select(Escrow.bout_id, Escrow.status, func.count())
+            .where(Escrow.bout_id.in_(bout_ids))
+            .group_by(Escrow.bout_id, Escrow.status)
+        )
+        for bout_id, escrow_status, count in rows:
+            counts[bout_id][escrow_status] = count
+        return counts
+
+    @traced("repository.escrows.get_for_bout_kind")
     def get_for_bout_kind(self, *, bout_id: uuid.UUID, escrow_kind: EscrowKind) -> Escrow | None:
         return self.session.scalar(
             select(Escrow).where(
@@ -27,3 +46,63 @@ class EscrowRepository:
                 Escrow.kind == escrow_kind,
             )
         )
+
+    @traced("repository.escrows.get_by_owner_offer_sequence")
+    def get_by_owner_offer_sequence(self, *, owner_address: str, offer_sequence: int) -> Escrow | None:
+        """Resolve a ledger escrow reference (``idx_escrows_owner_offer_sequence``) to its row."""
+        return self.session.scalar(
+            select(Escrow).where(
+                Escrow.owner_address == owner_address,
+                Escrow.offer_sequence == offer_sequence,
+            )
+        )
+
+    @traced("repository.escrows.get_by_tx_hash")
+    def get_by_tx_hash(self, *, tx_hash: str) -> Escrow | None:
+        """The escrow a ledger transaction created or closed; one probe of each unique ``uq_escrows_*_tx_hash``."""
+        return self.session.scalar(
+            select(Escrow).where(or_(Escrow.create_tx_hash == tx_hash, Escrow.close_tx_hash == tx_hash)).limit(1)
+        )
+
+    @traced("repository.escrows.find_planned_for_create")
+    def find_planned_for_create(
+        self,
+        *,
+        owner_address: str,
+        destination_address: str,
+        amount_drops: int,
+        finish_after_ripple: int,
+        cancel_after_ripple: int | None,
+        condition_hex: str | None,
+    ) -> Escrow | None:
+        """Find the planned escrow whose terms an EscrowCreate carries; the offer sequence is unknown until then."""
+        candidates = self.session.scalars(
+            select(Escrow)
+            .where(
+                Escrow.owner_address == owner_address,
+                Escrow.status == EscrowStatus.PLANNED,
+                Escrow.destination_address == destination_address,
+                Escrow.amount_drops == amount_drops,
+                Escrow.finish_after_ripple == finish_after_ripple,
+            )
+            .order_by(Escrow.created_at, Escrow.id)
+        ).all()
+        normalized_condition = condition_hex.upper() if condition_hex else None
+        for escrow in candidates:
+            if escrow.cancel_after_ripple != cancel_after_ripple:
+                continue
+            if (escrow.condition_hex.upper() if escrow.condition_hex else None) != normalized_condition:
+                continue
+            return escrow
+        return None
+
+    @traced("repository.escrows.list_open_owner_addresses")
+    def list_open_owner_addresses(self) -> set[str]:
+        """Owner accounts with escrows still awaiting a create or close transaction."""
+        return set(
+            self.session.scalars(
+                select(Escrow.owner_address)
+                .where(Escrow.status.in_([EscrowStatus.PLANNED, EscrowStatus.CREATED]))
+                .distinct()
+            ).all()
+        )
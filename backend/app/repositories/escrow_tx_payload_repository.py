@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import and_, delete, select
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced
+from app.models.escrow import Escrow
+from app.models.escrow_tx_payload import EscrowTxPayload
+
+
+@dataclass
+class EscrowTxPayloadRepository:
+    session: Session
+
+    @traced("repository.escrow_tx_payloads.add_many")
+    def add_many(self, *, payloads: Sequence[EscrowTxPayload]) -> None:
+        self.session.add_all(payloads)
+
+    @traced("repository.escrow_tx_payloads.delete_for_escrow")
+    def delete_for_escrow(self, *, escrow_id: uuid.UUID, transaction_types: Sequence[str]) -> None:
+        self.session.execute(
+            delete(EscrowTxPayload).where(
+                EscrowTxPayload.escrow_id == escrow_id,
+                EscrowTxPayload.transaction_type.in_(transaction_types),
+            )
+        )
+
+    @traced("repository.escrow_tx_payloads.list_escrows_with_payloads")
+    def list_escrows_with_payloads(
+        self, *, bout_id: uuid.UUID, transaction_types: Sequence[str]
+    ) -> list[tuple[Escrow, EscrowTxPayload | None]]:
+        """The bout's escrows with their stored payloads of the given types, in the same round trip."""
+        rows = self.session.execute(
+            select(Escrow, EscrowTxPayload)
+            .outerjoin(
+                EscrowTxPayload,
+                and_(
+                    EscrowTxPayload.escrow_id == Escrow.id,
+                    EscrowTxPayload.transaction_type.in_(transaction_types),
+                ),
+            )
+            .where(Escrow.bout_id == bout_id)
+        ).all()
+        return [(row[0], row[1]) for row in rows]
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced
 from app.models.idempotency_key import IdempotencyKey
 
 
@@ -12,6 +13,7 @@ from app.models.idempotency_key import IdempotencyKey
 class IdempotencyKeyRepository:
     session: Session
 
+    @traced("repository.idempotency_keys.get")
     def get(self, *, scope: str, idempotency_key: str) -> IdempotencyKey | None:
         return self.session.scalar(
             select(IdempotencyKey).where(
@@ -20,5 +22,6 @@ class IdempotencyKeyRepository:
             )
         )
 
+    @traced("repository.idempotency_keys.add")
     def add(self, *, idempotency_key: IdempotencyKey) -> None:
         self.session.add(idempotency_key)
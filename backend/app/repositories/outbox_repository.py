@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced
+from app.models.enums import OutboxStatus
+from app.models.outbox_event import OutboxEvent
+
+
+@dataclass
+class OutboxRepository:
+    session: Session
+
+    @traced("repository.outbox_events.insert_many")
+    def insert_many(self, *, rows: Sequence[dict[str, Any]]) -> None:
+        """One executemany INSERT; rows are not loaded back, so no per-row RETURNING round trip is needed."""
+        self.session.execute(insert(OutboxEvent), list(rows))
+
+    @traced("repository.outbox_events.claim_batch")
+    def claim_batch(self, *, available_at_or_before: datetime, limit: int) -> list[OutboxEvent]:
+        """Lock up to ``limit`` due pending events, oldest id first; rows another dispatcher holds are skipped.
+
+        Ids come from the sequence when the row is inserted, not when its transaction commits, so a batch is in
+        insert order and an event may be claimed after a later-inserted one that committed first.
+        """
+        return list(
+            self.session.scalars(
+                select(OutboxEvent)
+                .where(OutboxEvent.status == OutboxStatus.PENDING, OutboxEvent.available_at <= available_at_or_before)
+                .order_by(OutboxEvent.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+        )
+
+    @traced("repository.outbox_events.list_leased")
+    def list_leased(self, *, ids: Sequence[int], leased_until: datetime) -> list[OutboxEvent]:
+        """The claimed rows still under this dispatcher's lease (another one re-leases them once it expires)."""
+        return list(
+            self.session.scalars(
+                select(OutboxEvent)
+                .where(
+                    OutboxEvent.id.in_(ids),
+                    OutboxEvent.status == OutboxStatus.PENDING,
+                    OutboxEvent.available_at == leased_until,
+                )
+                .order_by(OutboxEvent.id)
+                .with_for_update()
+            )
+        )
+
+    @traced("repository.outbox_events.purge_dispatched")
+    def purge_dispatched(self, *, dispatched_before: datetime, limit: int) -> int:
+        """Delete up to ``limit`` events dispatched before the cutoff, oldest first.
+
+        Filters on ``available_at`` (a dispatched row keeps its lease end there, never earlier than
+        ``dispatched_at``) so the delete walks ``idx_outbox_events_status_available`` instead of the table.
+        """
+        doomed = (
+            select(OutboxEvent.id)
+            .where(OutboxEvent.status == OutboxStatus.DISPATCHED, OutboxEvent.available_at < dispatched_before)
+            .order_by(OutboxEvent.available_at, OutboxEvent.id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = self.session.execute(
+            delete(OutboxEvent).where(OutboxEvent.id.in_(doomed)).execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced
+from app.models.validated_transaction import ValidatedTransaction
+
+
+@dataclass
+class ValidatedTransactionRepository:
+    session: Session
+
+    @traced("repository.validated_transactions.list_by_hashes")
+    def list_by_hashes(self, *, tx_hashes: Sequence[str]) -> list[ValidatedTransaction]:
+        if not tx_hashes:
+            return []
+        return list(
+            self.session.scalars(select(ValidatedTransaction).where(ValidatedTransaction.tx_hash.in_(tx_hashes)))
+        )
+
+    @traced("repository.validated_transactions.insert_missing")
+    def insert_missing(self, *, rows: Sequence[dict[str, Any]]) -> None:
+        """Multi-row insert that silently skips hashes another request already stored."""
+        if not rows:
+            return
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            statement = postgresql.insert(ValidatedTransaction).on_conflict_do_nothing(index_elements=["tx_hash"])
+        elif dialect == "sqlite":
+            statement = sqlite.insert(ValidatedTransaction).on_conflict_do_nothing(index_elements=["tx_hash"])
+        else:
+            known = {item.tx_hash for item in self.list_by_hashes(tx_hashes=[row["tx_hash"] for row in rows])}
+            rows = [row for row in rows if row["tx_hash"] not in known]
+            if not rows:
+                return
+            statement = insert(ValidatedTransaction)
+        self.session.execute(statement, list(rows))
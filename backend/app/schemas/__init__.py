@@ -1,4 +1,17 @@
 from app.schemas.auth import LoginRequest, RegisterRequest, RegisterResponse, TokenResponse
+from app.schemas.bout import (
+    BoutCreateRequest,
+    BoutCreateResponse,
+    BoutDetailEscrowView,
+    BoutDetailResponse,
+    BoutEscrowView,
+    BoutListItem,
+    BoutListResponse,
+    BoutSummaryResponse,
+    CardBoutItem,
+    CardImportRequest,
+    CardImportResponse,
+)
 from app.schemas.escrow import (
     EscrowConfirmRequest,
     EscrowConfirmResponse,
@@ -21,6 +34,17 @@ __all__ = [
     "RegisterRequest",
     "RegisterResponse",
     "TokenResponse",
+    "BoutCreateRequest",
+    "BoutCreateResponse",
+    "BoutDetailEscrowView",
+    "BoutDetailResponse",
+    "BoutEscrowView",
+    "BoutListItem",
+    "BoutListResponse",
+    "BoutSummaryResponse",
+    "CardBoutItem",
+    "CardImportRequest",
+    "CardImportResponse",
     "EscrowPrepareItem",
     "EscrowPrepareResponse",
     "EscrowConfirmRequest",
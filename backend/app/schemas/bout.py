@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.models.enums import BoutStatus, BoutWinner, EscrowKind, EscrowStatus
+
+
+class CardBoutItem(BaseModel):
+    fighter_a_user_id: uuid.UUID
+    fighter_b_user_id: uuid.UUID
+    event_datetime_utc: datetime
+    promoter_owner_address: str = Field(min_length=1, max_length=64)
+    fighter_a_destination: str = Field(min_length=1, max_length=64)
+    fighter_b_destination: str = Field(min_length=1, max_length=64)
+    show_a_drops: int
+    show_b_drops: int
+    bonus_a_drops: int
+    bonus_b_drops: int
+
+
+class CardImportRequest(BaseModel):
+    bouts: list[CardBoutItem] = Field(min_length=1)
+
+
+class CardImportResponse(BaseModel):
+    created: int
+    bout_ids: list[str]
+
+
+class BoutCreateRequest(CardBoutItem):
+    pass
+
+
+class BoutEscrowView(BaseModel):
+    escrow_id: str
+    escrow_kind: EscrowKind
+    escrow_status: EscrowStatus
+    amount_drops: int
+    finish_after_ripple: int
+    cancel_after_ripple: int | None
+    condition_hex: str | None
+
+
+class BoutCreateResponse(BaseModel):
+    bout_id: str
+    bout_status: BoutStatus
+    event_datetime_utc: datetime
+    finish_after_utc: datetime
+    cancel_after_utc: datetime
+    escrows: list[BoutEscrowView]
+
+
+class BoutListItem(BaseModel):
+    bout_id: str
+    bout_status: BoutStatus
+    winner: BoutWinner | None
+    event_datetime_utc: datetime
+    fighter_a_user_id: str
+    fighter_b_user_id: str
+    escrow_status_counts: dict[EscrowStatus, int]
+
+
+class BoutListResponse(BaseModel):
+    items: list[BoutListItem]
+    next_cursor: str | None
+
+
+class BoutDetailEscrowView(BoutEscrowView):
+    create_tx_hash: str | None
+    close_tx_hash: str | None
+    failure_code: str | None
+
+
+class BoutDetailResponse(BaseModel):
+    bout_id: str
+    bout_status: BoutStatus
+    winner: BoutWinner | None
+    fighter_a_user_id: str
+    fighter_b_user_id: str
+    event_datetime_utc: datetime
+    finish_after_utc: datetime
+    cancel_after_utc: datetime
+    escrows: list[BoutDetailEscrowView]
+
+
+class BoutSummaryResponse(BaseModel):
+    bout_id: str
+    bout_status: BoutStatus
+    winner: BoutWinner | None
+    locked_drops: int
+    paid_drops: int
+    cancelled_drops: int
+    escrow_statuses: dict[EscrowKind, EscrowStatus]
+    last_failure_code: str | None
+    updated_at: datetime
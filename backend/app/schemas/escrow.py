@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
 
 from app.models.enums import BoutStatus, EscrowKind, EscrowStatus
 from app.schemas.xaman import XamanSignRequestView
 
+# Ledger hashes are hex and compared case-sensitively everywhere they are stored, probed and uniquely indexed,
+# so every confirm normalizes to the uppercase form rippled itself reports.
+TxHash = Annotated[str, StringConstraints(strip_whitespace=True, to_upper=True, min_length=8, max_length=128)]
+
 
 class EscrowPrepareItem(BaseModel):
     escrow_id: str
     escrow_kind: EscrowKind
     unsigned_tx: dict[str, Any]
+    unsigned_tx_hash: str | None = None
     xaman_sign_request: XamanSignRequestView | None = None
 
 
@@ -22,7 +27,7 @@ class EscrowPrepareResponse(BaseModel):
 
 class EscrowConfirmRequest(BaseModel):
     escrow_kind: EscrowKind
-    tx_hash: str = Field(min_length=8, max_length=128)
+    tx_hash: TxHash
     offer_sequence: int = Field(ge=1)
     validated: bool
     engine_result: str = Field(min_length=3, max_length=32)
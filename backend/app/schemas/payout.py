@@ -5,6 +5,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from app.models.enums import BoutStatus, BoutWinner, EscrowCloseAction, EscrowKind, EscrowStatus
+from app.schemas.escrow import TxHash
 from app.schemas.xaman import XamanSignRequestView
 
 
@@ -23,6 +24,7 @@ class PayoutPrepareItem(BaseModel):
     escrow_kind: EscrowKind
     action: EscrowCloseAction
     unsigned_tx: dict[str, Any]
+    unsigned_tx_hash: str | None = None
     xaman_sign_request: XamanSignRequestView | None = None
 
 
@@ -34,7 +36,7 @@ class PayoutPrepareResponse(BaseModel):
 
 class PayoutConfirmRequest(BaseModel):
     escrow_kind: EscrowKind
-    tx_hash: str = Field(min_length=8, max_length=128)
+    tx_hash: TxHash
     validated: bool
     engine_result: str = Field(min_length=3, max_length=32)
     transaction_type: str = Field(min_length=10, max_length=32)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class RequestProfileSummary(BaseModel):
+    profile_id: str
+    method: str
+    route: str
+    trigger: str
+    started_at: datetime
+    duration_ms: float
+    sample_count: int
+
+
+class RequestProfileListResponse(BaseModel):
+    profiles: list[RequestProfileSummary]
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import argparse
+import base64
+import enum
+import json
+import sys
+import time
+import uuid
+import zlib
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import DateTime, LargeBinary, Uuid, create_engine, delete, inspect, or_, select
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.db.base import Base
+from app.domain.time_rules import stored_as_utc
+from app.middleware.idempotency import CONFIRM_OPERATIONS, build_confirm_scope
+from app.models.audit_log import AuditLog
+from app.models.bout import Bout
+from app.models.bout_archive import BoutArchive
+from app.models.bout_summary import BoutSummary
+from app.models.enums import BoutStatus
+from app.models.escrow import Escrow
+from app.models.escrow_deadline import EscrowDeadline
+from app.models.escrow_tx_payload import EscrowTxPayload
+from app.models.idempotency_key import IdempotencyKey
+from app.repositories.bout_archive_repository import BoutArchiveRepository
+
+ARCHIVE_FORMAT_VERSION = 1
+
+_ARCHIVED = registry.counter(
+    "ringledger_bouts_archived_total",
+    "Closed bouts moved from the hot tables into bout_archives.",
+)
+
+
+@dataclass(frozen=True)
+class ArchivedBout:
+    """A bout read back from ``bout_archives``; the model instances are transient and never attached to a session."""
+
+    bout: Bout
+    escrows: list[Escrow]
+    summary: BoutSummary | None
+    archived_at: datetime
+
+
+def encode_archive(
+    *,
+    bout: Bout,
+    escrows: Sequence[Escrow],
+    summary: BoutSummary | None,
+    payloads: Sequence[EscrowTxPayload],
+    deadlines: Sequence[EscrowDeadline],
+    idempotency_keys: Sequence[IdempotencyKey],
+    audit_rows: Sequence[AuditLog],
+) -> bytes:
+    document = {
+        "bout": _row_to_json(bout),
+        "escrows": [_row_to_json(row) for row in escrows],
+        "summary": _row_to_json(summary) if summary is not None else None,
+        "escrow_tx_payloads": [_row_to_json(row) for row in payloads],
+        "escrow_deadlines": [_row_to_json(row) for row in deadlines],
+        "idempotency_keys": [_row_to_json(row) for row in idempotency_keys],
+        "audit_log": [_row_to_json(row) for row in audit_rows],
+    }
+    return zlib.compress(json.dumps(document, separators=(",", ":"), sort_keys=True).encode())
+
+
+def decode_archive(archive: BoutArchive) -> ArchivedBout:
+    if archive.format_version != ARCHIVE_FORMAT_VERSION:
+        raise ValueError("bout_archive_format_unsupported")
+    document = json.loads(zlib.decompress(archive.document))
+    return ArchivedBout(
+        bout=_row_from_json(Bout, document["bout"]),
+        escrows=[_row_from_json(Escrow, row) for row in document["escrows"]],
+        summary=_row_from_json(BoutSummary, document["summary"]) if document["summary"] is not None else None,
+        archived_at=stored_as_utc(archive.archived_at),
+    )
+
+
+@dataclass
+class BoutArchiveReader:
+    """Read path for bouts that are no longer in the hot tables."""
+
+    session: Session
+
+    def get(self, *, bout_id: uuid.UUID) -> ArchivedBout | None:
+        archive = BoutArchiveRepository(session=self.session).get(bout_id=bout_id)
+        return decode_archive(archive) if archive is not None else None
+
+
+@dataclass
+class BoutArchiver:
+    """Moves closed bouts whose event is older than ``retention_days`` out of the hot tables.
+
+    Each batch runs in one transaction: the bouts are locked with ``SKIP LOCKED`` (so concurrent archivers split
+    the work), every dependent row is read with one ``IN`` query per table, one compressed document per bout is
+    inserted into ``bout_archives``, and the hot rows are deleted with one statement per table. The statement
+    count per batch is fixed whatever ``batch_size`` is.
+    """
+
+    session_factory: Callable[[], Session]
+    retention_days: int = 365
+    batch_size: int = 200
+    clock: Callable[[], float] = time.time
+
+    def cutoff(self) -> datetime:
+        return datetime.fromtimestamp(self.clock(), UTC) - timedelta(days=self.retention_days)
+
+    def archive_batch(self) -> int:
+        with self.session_factory() as session:
+            bouts = list(
+                session.scalars(
+                    select(Bout)
+                    .where(Bout.status == BoutStatus.CLOSED, Bout.event_datetime_utc < self.cutoff())
+                    .order_by(Bout.event_datetime_utc, Bout.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            )
+            if not bouts:
+                return 0
+            self._archive(session, bouts)
+            session.commit()
+        _ARCHIVED.inc(len(bouts))
+        return len(bouts)
+
+    def run(self, *, max_batches: int | None = None) -> int:
+        """Archive batches until none is full (or ``max_batches`` ran); returns how many bouts were moved."""
+        total = batches = 0
+        while max_batches is None or batches < max_batches:
+            moved = self.archive_batch()
+            total += moved
+            batches += 1
+            if moved < self.batch_size:
+                break
+        return total
+
+    def _archive(self, session: Session, bouts: list[Bout]) -> None:
+        bout_ids = [bout.id for bout in bouts]
+        escrows = list(session.scalars(select(Escrow).where(Escrow.bout_id.in_(bout_ids))))
+        scopes = [
+            build_confirm_scope(operation=op, bout_id=bout_id) for bout_id in bout_ids for op in CONFIRM_OPERATIONS
+        ]
+        audit_scope = or_(
+            (AuditLog.entity_type == "bout") & AuditLog.entity_id.in_([str(bout_id) for bout_id in bout_ids]),
+            (AuditLog.entity_type == "escrow") & AuditLog.entity_id.in_([str(escrow.id) for escrow in escrows]),
+        )
+        grouped = {bout_id: _ArchiveParts() for bout_id in bout_ids}
+        escrow_bout = {escrow.id: escrow.bout_id for escrow in escrows}
+        for escrow in escrows:
+            grouped[escrow.bout_id].escrows.append(escrow)
+        for payload in session.scalars(select(EscrowTxPayload).where(EscrowTxPayload.bout_id.in_(bout_ids))):
+            grouped[payload.bout_id].payloads.append(payload)
+        for deadline in session.scalars(select(EscrowDeadline).where(EscrowDeadline.bout_id.in_(bout_ids))):
+            grouped[deadline.bout_id].deadlines.append(deadline)
+        for summary in session.scalars(select(BoutSummary).where(BoutSummary.bout_id.in_(bout_ids))):
+            grouped[summary.bout_id].summary = summary
+        for key in session.scalars(select(IdempotencyKey).where(IdempotencyKey.scope.in_(scopes))):
+            grouped[uuid.UUID(key.scope.rsplit(":", 1)[1])].idempotency_keys.append(key)
+        for row in session.scalars(select(AuditLog).where(audit_scope)):
+            entity_id = uuid.UUID(row.entity_id)
+            grouped[escrow_bout.get(entity_id, entity_id)].audit_rows.append(row)
+
+        BoutArchiveRepository(session=session).add_many(
+            archives=[
+                BoutArchive(
+                    bout_id=bout.id,
+                    promoter_user_id=bout.promoter_user_id,
+                    event_datetime_utc=bout.event_datetime_utc,
+                    format_version=ARCHIVE_FORMAT_VERSION,
+                    document=encode_archive(
+                        bout=bout,
+                        escrows=grouped[bout.id].escrows,
+                        summary=grouped[bout.id].summary,
+                        payloads=grouped[bout.id].payloads,
+                        deadlines=grouped[bout.id].deadlines,
+                        idempotency_keys=grouped[bout.id].idempotency_keys,
+                        audit_rows=grouped[bout.id].audit_rows,
+                    ),
+                )
+                for bout in bouts
+            ]
+        )
+        session.flush()
+        # Children first, so the foreign keys into escrows and bouts never dangle.
+        statements = [
+            delete(AuditLog).where(audit_scope),
+            delete(IdempotencyKey).where(IdempotencyKey.scope.in_(scopes)),
+            *(
+                delete(model).where(model.bout_id.in_(bout_ids))
+                for model in (EscrowTxPayload, EscrowDeadline, BoutSummary, Escrow)
+            ),
+            delete(Bout).where(Bout.id.in_(bout_ids)),
+        ]
+        for statement in statements:
+            session.execute(statement.execution_options(synchronize_session=False))
+        # The bulk deletes bypass the identity map; drop the loaded objects so nothing tries to flush them.
+        session.expunge_all()
+
+
+@dataclass
+class _ArchiveParts:
+    escrows: list[Escrow] = field(default_factory=list)
+    summary: BoutSummary | None = None
+    payloads: list[EscrowTxPayload] = field(default_factory=list)
+    deadlines: list[EscrowDeadline] = field(default_factory=list)
+    idempotency_keys: list[IdempotencyKey] = field(default_factory=list)
+    audit_rows: list[AuditLog] = field(default_factory=list)
+
+
+def _row_to_json(row: Base) -> dict[str, Any]:
+    return {attr.key: _json_value(getattr(row, attr.key)) for attr in inspect(type(row)).column_attrs}
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    return value
+
+
+def _row_from_json(model: type[Any], data: dict[str, Any]) -> Any:
+    values: dict[str, Any] = {}
+    for attr in inspect(model).column_attrs:
+        raw = data.get(attr.key)
+        column_type = attr.columns[0].type
+        if raw is None:
+            values[attr.key] = None
+        elif isinstance(column_type, SAEnum) and column_type.enum_class is not None:
+            values[attr.key] = column_type.enum_class(raw)
+        elif isinstance(column_type, Uuid):
+            values[attr.key] = uuid.UUID(raw)
+        elif isinstance(column_type, DateTime):
+            values[attr.key] = stored_as_utc(datetime.fromisoformat(raw))
+        elif isinstance(column_type, LargeBinary):
+            values[attr.key] = base64.b64decode(raw)
+        else:
+            values[attr.key] = raw
+    return model(**values)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Move closed bouts past the retention window into bout_archives.")
+    parser.add_argument("--retention-days", type=int, default=settings.archive_retention_days)
+    parser.add_argument("--batch-size", type=int, default=settings.archive_batch_size)
+    parser.add_argument("--max-batches", type=int, help="Stop after this many batches (default: until done).")
+    parser.add_argument(
+        "--database-url", default=settings.database_url, help="SQLAlchemy URL; defaults to DATABASE_URL."
+    )
+    args = parser.parse_args(argv)
+    if args.retention_days < 0 or args.batch_size < 1:
+        print("retention must be >= 0 days and batch size >= 1", file=sys.stderr)
+        return 2
+
+    engine = create_engine(args.database_url, future=True)
+    started = time.perf_counter()
+    try:
+        archiver = BoutArchiver(
+            session_factory=sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True),
+            retention_days=args.retention_days,
+            batch_size=args.batch_size,
+        )
+        archived = archiver.run(max_batches=args.max_batches)
+    finally:
+        engine.dispose()
+    summary = {
+        "archived": archived,
+        "cutoff": archiver.cutoff().isoformat(),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
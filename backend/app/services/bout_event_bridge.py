@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+
+import psycopg
+from sqlalchemy.engine import make_url
+
+from app.core.metrics import registry
+from app.core.tracing import start_span
+from app.services.bout_events import BOUT_EVENTS_CHANNEL, BoutEvent, BoutEventHub, bout_event_hub
+
+logger = logging.getLogger(__name__)
+
+_CONNECTED = registry.gauge(
+    "ringledger_bout_event_bridge_connected",
+    "1 while this worker holds a LISTEN connection for bout events, else 0.",
+)
+_RECONNECTS = registry.counter(
+    "ringledger_bout_event_bridge_reconnects_total",
+    "Bout event LISTEN connections that failed or were dropped.",
+)
+
+
+def psycopg_conninfo(database_url: str) -> str:
+    """libpq connection string for a SQLAlchemy ``postgresql+psycopg://`` URL."""
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+@dataclass
+class PostgresEventBridge:
+    """Background thread that LISTENs for committed bout events and republishes them to this worker's hub.
+
+    While running, commits announce their events with ``pg_notify`` instead of publishing locally, so every worker
+    (the committing one included) delivers each event exactly once. Notifications sent while the connection is
+    down are lost; stream clients re-read bout state when they reconnect.
+    """
+
+    database_url: str
+    hub: BoutEventHub = field(default=bout_event_hub)
+    poll_seconds: float = 1.0
+    reconnect_max_seconds: float = 30.0
+
+    def __post_init__(self) -> None:
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> PostgresEventBridge:
+        if self._thread is None:
+            self.hub.notify_via_postgres = True
+            self._thread = threading.Thread(target=self._run, name="bout-event-bridge", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, *, timeout_seconds: float = 5.0) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout_seconds)
+            self._thread = None
+        self.hub.notify_via_postgres = False
+
+    def handle_payload(self, payload: str) -> None:
+        try:
+            item = BoutEvent.from_json(payload)
+        except (TypeError, ValueError):
+            logger.warning("ignoring malformed bout event notification")
+            return
+        # Joins the trace of the request that committed the event, whichever worker that was.
+        with start_span("bout_events.bridge_publish", {"bout_event": item.event}, traceparent=item.traceparent):
+            self.hub.publish(item)
+
+    def _run(self) -> None:
+        backoff = 0.0
+        while not self._stopping.is_set():
+            try:
+                with psycopg.connect(psycopg_conninfo(self.database_url), autocommit=True) as connection:
+                    connection.execute(f"LISTEN {BOUT_EVENTS_CHANNEL}")
+                    _CONNECTED.set(1)
+                    backoff = 0.0
+                    while not self._stopping.is_set():
+                        for notification in connection.notifies(timeout=self.poll_seconds):
+                            self.handle_payload(notification.payload)
+            except psycopg.Error as exc:
+                _RECONNECTS.inc()
+                logger.warning("bout event bridge disconnected: %s", exc)
+            except Exception:
+                _RECONNECTS.inc()
+                logger.exception("bout event bridge failed")
+            finally:
+                _CONNECTED.set(0)
+            backoff = min(self.reconnect_max_seconds, max(0.5, backoff * 2))
+            self._stopping.wait(backoff)
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.metrics import registry
+from app.core.tracing import current_traceparent
+from app.models.bout import Bout
+from app.models.enums import OutboxStatus
+from app.models.escrow import Escrow
+from app.repositories.outbox_repository import OutboxRepository
+
+BOUT_EVENTS_CHANNEL = "ringledger_bout_events"
+_PENDING_KEY = "ringledger_pending_bout_events"
+
+_PUBLISHED = registry.counter(
+    "ringledger_bout_events_published_total",
+    "Committed bout/escrow state-change events delivered to this process's hub, by event type.",
+)
+_SUBSCRIBERS = registry.gauge(
+    "ringledger_bout_event_subscribers",
+    "Event-stream clients currently connected to this process.",
+)
+_DROPPED = registry.counter(
+    "ringledger_bout_event_subscribers_dropped_total",
+    "Event-stream clients disconnected because they fell too far behind.",
+)
+
+
+@dataclass(frozen=True)
+class BoutEvent:
+    """One committed state change: ``escrow_created|finished|cancelled``, ``escrow_failed`` or ``bout_status``."""
+
+    event: str
+    bout_id: str
+    promoter_user_id: str
+    bout_status: str
+    winner: str | None = None
+    escrow_kind: str | None = None
+    escrow_status: str | None = None
+    failure_code: str | None = None
+    # W3C trace context of the transaction that committed the event; internal, never sent to stream clients.
+    traceparent: str | None = None
+
+    def to_json(self) -> str:
+        """The public payload, as sent to stream clients and stored in the outbox."""
+        fields = asdict(self)
+        fields.pop("traceparent")
+        return json.dumps(fields, separators=(",", ":"), sort_keys=True)
+
+    def to_notification(self) -> str:
+        """The payload with its trace context, for the ``pg_notify`` hop between workers."""
+        return json.dumps(asdict(self), separators=(",", ":"), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, raw: str) -> BoutEvent:
+        return cls(**json.loads(raw))
+
+
+_CLOSED = object()
+
+
+class BoutEventSubscription:
+    """A stream client's queue, owned by the event loop it was created on; publishers may be any thread."""
+
+    def __init__(
+        self,
+        *,
+        hub: BoutEventHub,
+        loop: asyncio.AbstractEventLoop,
+        bout_id: str | None,
+        promoter_user_id: str | None,
+        max_pending: int,
+    ) -> None:
+        self.bout_id = bout_id
+        self.promoter_user_id = promoter_user_id
+        self._hub = hub
+        self._loop = loop
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._max_pending = max_pending
+        self._closed = False
+
+    def matches(self, item: BoutEvent) -> bool:
+        if self.bout_id is not None:
+            return item.bout_id == self.bout_id
+        return item.promoter_user_id == self.promoter_user_id
+
+    async def get(self, *, timeout_seconds: float) -> BoutEvent | None:
+        """Next event, ``None`` after ``timeout_seconds`` of silence; raises ``EOFError`` once closed."""
+        try:
+            item = await asyncio.wait_for(self._queue.get(), timeout_seconds)
+        except TimeoutError:
+            return None
+        if item is _CLOSED:
+            raise EOFError
+        return item
+
+    def close(self) -> None:
+        self._hub._remove(self)
+        self._deliver_threadsafe(_CLOSED)
+
+    def _deliver_threadsafe(self, item: Any) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, item)
+        except RuntimeError:
+            # The loop is gone (server shutting down); nothing is left to read this queue.
+            self._hub._remove(self)
+
+    def _deliver(self, item: Any) -> None:
+        if self._closed:
+            return
+        if item is not _CLOSED and self._queue.qsize() >= self._max_pending:
+            # A client this far behind resynchronises faster by reconnecting and re-reading the bout.
+            _DROPPED.inc()
+            self._hub._remove(self)
+            item = _CLOSED
+        if item is _CLOSED:
+            self._closed = True
+        self._queue.put_nowait(item)
+
+
+class BoutEventHub:
+    """In-process fan-out of committed bout events to connected stream clients.
+
+    With ``notify_via_postgres`` set, commits emit ``pg_notify`` instead of publishing locally and every worker's
+    ``PostgresEventBridge`` feeds the notifications back in, so clients see changes committed by any worker.
+    """
+
+    def __init__(self, *, max_pending: int = 256) -> None:
+        self.max_pending = max_pending
+        self.notify_via_postgres = False
+        self._lock = threading.Lock()
+        self._subscriptions: set[BoutEventSubscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    def subscribe(self, *, bout_id: str | None = None, promoter_user_id: str | None = None) -> BoutEventSubscription:
+        """Register a client; must be called from the event loop that will read the subscription."""
+        if (bout_id is None) == (promoter_user_id is None):
+            raise ValueError("bout_event_filter_invalid")
+        subscription = BoutEventSubscription(
+            hub=self,
+            loop=asyncio.get_running_loop(),
+            bout_id=bout_id,
+            promoter_user_id=promoter_user_id,
+            max_pending=self.max_pending,
+        )
+        with self._lock:
+            self._subscriptions.add(subscription)
+            _SUBSCRIBERS.set(len(self._subscriptions))
+        return subscription
+
+    def publish(self, item: BoutEvent) -> None:
+        _PUBLISHED.inc(event=item.event)
+        with self._lock:
+            targets = [subscription for subscription in self._subscriptions if subscription.matches(item)]
+        for subscription in targets:
+            subscription._deliver_threadsafe(item)
+
+    def close_all(self) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.close()
+
+    def _remove(self, subscription: BoutEventSubscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+            _SUBSCRIBERS.set(len(self._subscriptions))
+
+
+bout_event_hub = BoutEventHub()
+
+
+def queue_bout_event(
+    session: Session,
+    *,
+    event_type: str,
+    bout: Bout,
+    escrow: Escrow | None = None,
+    failure_code: str | None = None,
+) -> None:
+    """Stage an event on the session; it is published only if and when the session commits.
+
+    On commit the staged events are also written to ``outbox_events`` inside the committing transaction, for the
+    outbox dispatcher to deliver downstream: the hub is a best-effort live feed, the outbox the durable record.
+    """
+    item = BoutEvent(
+        event=event_type,
+        bout_id=str(bout.id),
+        promoter_user_id=str(bout.promoter_user_id),
+        bout_status=bout.status.value,
+        winner=bout.winner.value if bout.winner is not None else None,
+        escrow_kind=escrow.kind.value if escrow is not None else None,
+        escrow_status=escrow.status.value if escrow is not None else None,
+        failure_code=failure_code,
+        traceparent=current_traceparent(),
+    )
+    session.info.setdefault(_PENDING_KEY, []).append(item)
+
+
+@event.listens_for(Session, "before_commit")
+def _write_pending_events(session: Session) -> None:
+    pending = session.info.get(_PENDING_KEY)
+    if not pending:
+        return
+    now = datetime.now(UTC)
+    OutboxRepository(session=session).insert_many(
+        rows=[
+            {
+                "event_type": item.event,
+                "bout_id": uuid.UUID(item.bout_id),
+                "payload_json": item.to_json(),
+                "traceparent": item.traceparent,
+                "status": OutboxStatus.PENDING,
+                "attempts": 0,
+                "available_at": now,
+            }
+            for item in pending
+        ]
+    )
+    if not bout_event_hub.notify_via_postgres:
+        return
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    # NOTIFY is transactional: listeners (this worker's bridge included) see it exactly when the commit lands.
+    for item in pending:
+        session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": BOUT_EVENTS_CHANNEL, "payload": item.to_notification()},
+        )
+    session.info[_PENDING_KEY] = []
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    for item in pending or ():
+        bout_event_hub.publish(item)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.domain.time_rules import ensure_utc, stored_as_utc
+from app.models.bout import Bout
+from app.models.bout_summary import BoutSummary
+from app.models.enums import BoutStatus, BoutWinner, EscrowStatus
+from app.models.escrow import Escrow
+from app.repositories.bout_repository import BoutRepository
+from app.repositories.bout_summary_repository import BoutSummaryRepository
+from app.repositories.escrow_repository import EscrowRepository
+from app.services.bout_archive import ArchivedBout, BoutArchiveReader
+
+MAX_BOUT_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class BoutListing:
+    bout_id: uuid.UUID
+    status: BoutStatus
+    winner: BoutWinner | None
+    event_datetime_utc: datetime
+    fighter_a_user_id: uuid.UUID
+    fighter_b_user_id: uuid.UUID
+    escrow_status_counts: dict[EscrowStatus, int]
+
+
+@dataclass(frozen=True)
+class BoutPage:
+    items: list[BoutListing]
+    next_cursor: str | None
+
+
+def encode_bout_cursor(*, event_datetime_utc: datetime, bout_id: uuid.UUID) -> str:
+    raw = json.dumps([stored_as_utc(event_datetime_utc).isoformat(), str(bout_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_bout_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        event_iso, bout_id = json.loads(raw)
+        return ensure_utc(datetime.fromisoformat(event_iso)), uuid.UUID(bout_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise ValueError("bout_cursor_invalid") from exc
+
+
+@dataclass
+class BoutListingService:
+    """Read side of the promoter dashboard: keyset-paged bout lists and single-bout detail."""
+
+    session: Session
+    bouts: BoutRepository = field(init=False)
+    escrows: EscrowRepository = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.bouts = BoutRepository(session=self.session)
+        self.escrows = EscrowRepository(session=self.session)
+
+    def list_bouts(
+        self,
+        *,
+        promoter_user_id: uuid.UUID,
+        status: BoutStatus | None = None,
+        event_from: datetime | None = None,
+        event_to: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> BoutPage:
+        """Two statements per page whatever the page size: the keyset bout page and one grouped escrow count."""
+        if not 1 <= limit <= MAX_BOUT_PAGE_SIZE:
+            raise ValueError("bout_page_size_invalid")
+        rows = self.bouts.list_page_for_promoter(
+            promoter_user_id=promoter_user_id,
+            status=status,
+            event_from=ensure_utc(event_from) if event_from is not None else None,
+            event_to=ensure_utc(event_to) if event_to is not None else None,
+            after=decode_bout_cursor(cursor) if cursor is not None else None,
+            limit=limit + 1,
+        )
+        page, has_more = rows[:limit], len(rows) > limit
+        counts = self.escrows.count_statuses_by_bout(bout_ids=[row.id for row in page])
+        items = [
+            BoutListing(
+                bout_id=row.id,
+                status=row.status,
+                winner=row.winner,
+                event_datetime_utc=stored_as_utc(row.event_datetime_utc),
+                fighter_a_user_id=row.fighter_a_user_id,
+                fighter_b_user_id=row.fighter_b_user_id,
+                escrow_status_counts=counts[row.id],
+            )
+            for row in page
+        ]
+        next_cursor = None
+        if has_more:
+            last = items[-1]
+            next_cursor = encode_bout_cursor(event_datetime_utc=last.event_datetime_utc, bout_id=last.bout_id)
+        return BoutPage(items=items, next_cursor=next_cursor)
+
+    def get_owned_bout(self, *, promoter_user_id: uuid.UUID, bout_id: uuid.UUID) -> Bout:
+        bout = self.bouts.get(bout_id=bout_id)
+        # Another promoter's bout is reported as missing rather than forbidden so ids cannot be probed.
+        if bout is None or bout.promoter_user_id != promoter_user_id:
+            raise ValueError("bout_not_found")
+        return bout
+
+    def get_bout(self, *, promoter_user_id: uuid.UUID, bout_id: uuid.UUID) -> tuple[Bout, list[Escrow]]:
+        """A bout and its escrows, from the hot tables or, once archived, from ``bout_archives``."""
+        bout = self.bouts.get(bout_id=bout_id)
+        if bout is None:
+            archived = self._get_owned_archive(promoter_user_id=promoter_user_id, bout_id=bout_id)
+            return archived.bout, archived.escrows
+        if bout.promoter_user_id != promoter_user_id:
+            raise ValueError("bout_not_found")
+        return bout, list(self.escrows.list_for_bout(bout_id=bout_id))
+
+    def get_summary(self, *, promoter_user_id: uuid.UUID, bout_id: uuid.UUID) -> BoutSummary:
+        """The bout's ``bout_summaries`` row: one primary-key read, no escrow join (archived bouts keep theirs)."""
+        summary = BoutSummaryRepository(session=self.session).get(bout_id=bout_id)
+        if summary is None:
+            summary = self._get_owned_archive(promoter_user_id=promoter_user_id, bout_id=bout_id).summary
+        if summary is None or summary.promoter_user_id != promoter_user_id:
+            raise ValueError("bout_not_found")
+        return summary
+
+    def _get_owned_archive(self, *, promoter_user_id: uuid.UUID, bout_id: uuid.UUID) -> ArchivedBout:
+        archived = BoutArchiveReader(session=self.session).get(bout_id=bout_id)
+        if archived is None or archived.bout.promoter_user_id != promoter_user_id:
+            raise ValueError("bout_not_found")
+        return archived
@@ -1,22 +1,55 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from sqlalchemy.orm import Session
 
-from app.crypto_conditions import generate_preimage_hex, make_condition_hex, make_fulfillment_hex
+from app.crypto_conditions import (
+    generate_preimage_hex,
+    generate_preimage_hexes,
+    make_condition_hex,
+    make_fulfillment_hex,
+)
 from app.domain.time_rules import (
     compute_bonus_cancel_after,
     compute_finish_after,
     to_ripple_epoch,
 )
 from app.models.bout import Bout
-from app.models.enums import EscrowKind, EscrowStatus
+from app.models.enums import BoutStatus, EscrowKind, EscrowStatus
 from app.models.escrow import Escrow
 from app.repositories.bout_repository import BoutRepository
+from app.repositories.bout_summary_repository import BoutSummaryRepository
 from app.repositories.escrow_repository import EscrowRepository
+from app.repositories.escrow_tx_payload_repository import EscrowTxPayloadRepository
+from app.services.bout_summaries import build_bout_summary
+from app.services.tx_payloads import materialize_tx_payload
+from app.services.xrpl_escrow_service import XrplEscrowService
+
+
+@dataclass(frozen=True)
+class BoutDraft:
+    """One bout of a fight card, as accepted by ``BoutService.create_card``."""
+
+    fighter_a_user_id: uuid.UUID
+    fighter_b_user_id: uuid.UUID
+    event_datetime_utc: datetime
+    promoter_owner_address: str
+    fighter_a_destination: str
+    fighter_b_destination: str
+    show_a_drops: int
+    show_b_drops: int
+    bonus_a_drops: int
+    bonus_b_drops: int
+
+
+@dataclass(frozen=True)
+class PlannedBout:
+    bout: Bout
+    escrows: list[Escrow]
 
 
 @dataclass
@@ -44,77 +77,135 @@ class BoutService:
         bonus_a_drops: int,
         bonus_b_drops: int,
     ) -> Bout:
-        finish_after = compute_finish_after(event_datetime_utc)
-        cancel_after = compute_bonus_cancel_after(event_datetime_utc)
-        finish_after_ripple = to_ripple_epoch(finish_after)
-        cancel_after_ripple = to_ripple_epoch(cancel_after)
-        bonus_a_preimage = generate_preimage_hex()
-        bonus_b_preimage = generate_preimage_hex()
-        bonus_a_fulfillment = make_fulfillment_hex(bonus_a_preimage)
-        bonus_b_fulfillment = make_fulfillment_hex(bonus_b_preimage)
-        bonus_a_condition = make_condition_hex(bonus_a_fulfillment)
-        bonus_b_condition = make_condition_hex(bonus_b_fulfillment)
-
-        bout = Bout(
-            promoter_user_id=promoter_user_id,
+        draft = BoutDraft(
             fighter_a_user_id=fighter_a_user_id,
             fighter_b_user_id=fighter_b_user_id,
             event_datetime_utc=event_datetime_utc,
-            finish_after_utc=finish_after,
-            cancel_after_utc=cancel_after,
+            promoter_owner_address=promoter_owner_address,
+            fighter_a_destination=fighter_a_destination,
+            fighter_b_destination=fighter_b_destination,
             show_a_drops=show_a_drops,
             show_b_drops=show_b_drops,
             bonus_a_drops=bonus_a_drops,
             bonus_b_drops=bonus_b_drops,
         )
-        self.bouts.add(bout=bout)
-        self.session.flush()
-
-        escrows = [
-            Escrow(
-                bout_id=bout.id,
-                kind=EscrowKind.SHOW_A,
-                status=EscrowStatus.PLANNED,
-                owner_address=promoter_owner_address,
-                destination_address=fighter_a_destination,
-                amount_drops=show_a_drops,
-                finish_after_ripple=finish_after_ripple,
-                cancel_after_ripple=None,
-            ),
-            Escrow(
-                bout_id=bout.id,
-                kind=EscrowKind.SHOW_B,
-                status=EscrowStatus.PLANNED,
-                owner_address=promoter_owner_address,
-                destination_address=fighter_b_destination,
-                amount_drops=show_b_drops,
-                finish_after_ripple=finish_after_ripple,
-                cancel_after_ripple=None,
-            ),
-            Escrow(
-                bout_id=bout.id,
-                kind=EscrowKind.BONUS_A,
-                status=EscrowStatus.PLANNED,
-                owner_address=promoter_owner_address,
-                destination_address=fighter_a_destination,
-                amount_drops=bonus_a_drops,
-                finish_after_ripple=finish_after_ripple,
-                cancel_after_ripple=cancel_after_ripple,
-                condition_hex=bonus_a_condition,
-                encrypted_preimage_hex=bonus_a_fulfillment,
-            ),
-            Escrow(
-                bout_id=bout.id,
-                kind=EscrowKind.BONUS_B,
-                status=EscrowStatus.PLANNED,
-                owner_address=promoter_owner_address,
-                destination_address=fighter_b_destination,
-                amount_drops=bonus_b_drops,
-                finish_after_ripple=finish_after_ripple,
-                cancel_after_ripple=cancel_after_ripple,
-                condition_hex=bonus_b_condition,
-                encrypted_preimage_hex=bonus_b_fulfillment,
-            ),
-        ]
-        self.escrows.add_many(escrows=escrows)
+        bout, escrows = _plan_bout(
+            promoter_user_id=promoter_user_id,
+            draft=draft,
+            bonus_preimages=(generate_preimage_hex(), generate_preimage_hex()),
+        )
+        self._add_planned(planned=[PlannedBout(bout=bout, escrows=escrows)])
         return bout
+
+    def create_card(self, *, promoter_user_id: uuid.UUID, drafts: Sequence[BoutDraft]) -> list[PlannedBout]:
+        """Plan every bout of a card in memory and stage them for one multi-row insert per table.
+
+        IDs are assigned client-side and bonus preimages come from a single CSPRNG read, so nothing is flushed
+        per bout; the caller's flush or commit writes the whole card in the same transaction.
+        """
+        preimages = generate_preimage_hexes(2 * len(drafts))
+        planned: list[PlannedBout] = []
+        for index, draft in enumerate(drafts):
+            bout, escrows = _plan_bout(
+                promoter_user_id=promoter_user_id,
+                draft=draft,
+                bonus_preimages=(preimages[2 * index], preimages[2 * index + 1]),
+            )
+            planned.append(PlannedBout(bout=bout, escrows=escrows))
+        self._add_planned(planned=planned)
+        return planned
+
+    def _add_planned(self, *, planned: list[PlannedBout]) -> None:
+        escrows = [escrow for item in planned for escrow in item.escrows]
+        self.bouts.add_many(bouts=[item.bout for item in planned])
+        self.escrows.add_many(escrows=escrows)
+        EscrowTxPayloadRepository(session=self.session).add_many(
+            payloads=[
+                materialize_tx_payload(escrow=escrow, tx=XrplEscrowService.build_escrow_create_tx(escrow))
+                for escrow in escrows
+            ]
+        )
+        BoutSummaryRepository(session=self.session).add_many(
+            summaries=[build_bout_summary(bout=item.bout, escrows=item.escrows) for item in planned]
+        )
+
+
+def _plan_bout(
+    *, promoter_user_id: uuid.UUID, draft: BoutDraft, bonus_preimages: tuple[str, str]
+) -> tuple[Bout, list[Escrow]]:
+    finish_after = compute_finish_after(draft.event_datetime_utc)
+    cancel_after = compute_bonus_cancel_after(draft.event_datetime_utc)
+    finish_after_ripple = to_ripple_epoch(finish_after)
+    cancel_after_ripple = to_ripple_epoch(cancel_after)
+    bonus_a_fulfillment = make_fulfillment_hex(bonus_preimages[0])
+    bonus_b_fulfillment = make_fulfillment_hex(bonus_preimages[1])
+    bonus_a_condition = make_condition_hex(bonus_a_fulfillment)
+    bonus_b_condition = make_condition_hex(bonus_b_fulfillment)
+
+    # IDs are assigned here rather than at flush so escrows and payloads can reference the bout without a round trip.
+    bout = Bout(
+        id=uuid.uuid4(),
+        promoter_user_id=promoter_user_id,
+        fighter_a_user_id=draft.fighter_a_user_id,
+        fighter_b_user_id=draft.fighter_b_user_id,
+        event_datetime_utc=draft.event_datetime_utc,
+        finish_after_utc=finish_after,
+        cancel_after_utc=cancel_after,
+        show_a_drops=draft.show_a_drops,
+        show_b_drops=draft.show_b_drops,
+        bonus_a_drops=draft.bonus_a_drops,
+        bonus_b_drops=draft.bonus_b_drops,
+        status=BoutStatus.DRAFT,
+    )
+
+    escrows = [
+        Escrow(
+            id=uuid.uuid4(),
+            bout_id=bout.id,
+            kind=EscrowKind.SHOW_A,
+            status=EscrowStatus.PLANNED,
+            owner_address=draft.promoter_owner_address,
+            destination_address=draft.fighter_a_destination,
+            amount_drops=draft.show_a_drops,
+            finish_after_ripple=finish_after_ripple,
+            cancel_after_ripple=None,
+        ),
+        Escrow(
+            id=uuid.uuid4(),
+            bout_id=bout.id,
+            kind=EscrowKind.SHOW_B,
+            status=EscrowStatus.PLANNED,
+            owner_address=draft.promoter_owner_address,
+            destination_address=draft.fighter_b_destination,
+            amount_drops=draft.show_b_drops,
+            finish_after_ripple=finish_after_ripple,
+            cancel_after_ripple=None,
+        ),
+        Escrow(
+            id=uuid.uuid4(),
+            bout_id=bout.id,
+            kind=EscrowKind.BONUS_A,
+            status=EscrowStatus.PLANNED,
+            owner_address=draft.promoter_owner_address,
+            destination_address=draft.fighter_a_destination,
+            amount_drops=draft.bonus_a_drops,
+            finish_after_ripple=finish_after_ripple,
+            cancel_after_ripple=cancel_after_ripple,
+            condition_hex=bonus_a_condition,
+            encrypted_preimage_hex=bonus_a_fulfillment,
+        ),
+        Escrow(
+            id=uuid.uuid4(),
+            bout_id=bout.id,
+            kind=EscrowKind.BONUS_B,
+            status=EscrowStatus.PLANNED,
+            owner_address=draft.promoter_owner_address,
+            destination_address=draft.fighter_b_destination,
+            amount_drops=draft.bonus_b_drops,
+            finish_after_ripple=finish_after_ripple,
+            cancel_after_ripple=cancel_after_ripple,
+            condition_hex=bonus_b_condition,
+            encrypted_preimage_hex=bonus_b_fulfillment,
+        ),
+    ]
+    return bout, escrows
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.models.bout import Bout
+from app.models.bout_summary import BoutSummary
+from app.models.enums import EscrowKind, EscrowStatus
+from app.models.escrow import Escrow
+from app.repositories.bout_summary_repository import BoutSummaryRepository
+from app.repositories.escrow_repository import EscrowRepository
+
+_KIND_STATUS_COLUMNS = {
+    EscrowKind.SHOW_A: "show_a_status",
+    EscrowKind.SHOW_B: "show_b_status",
+    EscrowKind.BONUS_A: "bonus_a_status",
+    EscrowKind.BONUS_B: "bonus_b_status",
+}
+_KIND_ORDER = list(_KIND_STATUS_COLUMNS)
+
+
+def build_bout_summary(*, bout: Bout, escrows: Iterable[Escrow]) -> BoutSummary:
+    return BoutSummary(
+        bout_id=bout.id,
+        promoter_user_id=bout.promoter_user_id,
+        **bout_summary_values(bout=bout, escrows=escrows),
+    )
+
+
+def bout_summary_values(*, bout: Bout, escrows: Iterable[Escrow] | None = None) -> dict[str, Any]:
+    """Summary columns derived from in-memory state; without escrows only the bout columns are returned.
+
+    ``last_failure_code`` is the outstanding failure of the first escrow (in kind order) that still has one.
+    """
+    values: dict[str, Any] = {"bout_status": bout.status, "winner": bout.winner}
+    if escrows is None:
+        return values
+    escrows = sorted(escrows, key=lambda escrow: _KIND_ORDER.index(escrow.kind))
+    totals = dict.fromkeys((EscrowStatus.CREATED, EscrowStatus.FINISHED, EscrowStatus.CANCELLED), 0)
+    for escrow in escrows:
+        values[_KIND_STATUS_COLUMNS[escrow.kind]] = escrow.status
+        if escrow.status in totals:
+            totals[escrow.status] += escrow.amount_drops
+    values["locked_drops"] = totals[EscrowStatus.CREATED]
+    values["paid_drops"] = totals[EscrowStatus.FINISHED]
+    values["cancelled_drops"] = totals[EscrowStatus.CANCELLED]
+    values["last_failure_code"] = next((escrow.failure_code for escrow in escrows if escrow.failure_code), None)
+    return values
+
+
+def sync_bout_summary(*, session: Session, bout: Bout, escrows: Iterable[Escrow] | None = None) -> None:
+    """Rewrite the bout's summary row inside the caller's transaction (one UPDATE, no read)."""
+    BoutSummaryRepository(session=session).update(
+        bout_id=bout.id, values=bout_summary_values(bout=bout, escrows=escrows)
+    )
+
+
+def refresh_bout_summary(*, session: Session, bout: Bout, escrows: Iterable[Escrow] | None = None) -> None:
+    """Rewrite the summary after an escrow failure was recorded or cleared, reading the escrows if not given.
+
+    ``last_failure_code`` thereby keeps the one meaning :func:`bout_summary_values` gives it; the changed escrow
+    is already in the session, so the read returns it with its new failure code.
+    """
+    if escrows is None:
+        escrows = EscrowRepository(session=session).list_for_bout(bout_id=bout.id)
+    sync_bout_summary(session=session, bout=bout, escrows=escrows)
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.domain.money import ensure_valid_drops
+from app.domain.time_rules import ensure_utc
+from app.models.enums import UserRole
+from app.models.user import User
+from app.services.bout_service import BoutDraft, BoutService, PlannedBout
+
+MAX_CARD_BOUTS = 1000
+MAX_NDJSON_LINE_BYTES = 16 * 1024
+CARD_FIELDS = (
+    "fighter_a_user_id",
+    "fighter_b_user_id",
+    "event_datetime_utc",
+    "promoter_owner_address",
+    "fighter_a_destination",
+    "fighter_b_destination",
+    "show_a_drops",
+    "show_b_drops",
+    "bonus_a_drops",
+    "bonus_b_drops",
+)
+_DROPS_FIELDS = ("show_a_drops", "show_b_drops", "bonus_a_drops", "bonus_b_drops")
+_ADDRESS_FIELDS = ("promoter_owner_address", "fighter_a_destination", "fighter_b_destination")
+_MAX_ADDRESS_LENGTH = 64
+
+
+class CardImportError(ValueError):
+    """A fight card that cannot be imported; ``row`` is the 1-based bout number (CSV header excluded), if any."""
+
+    def __init__(self, code: str, *, row: int | None = None) -> None:
+        super().__init__(code)
+        self.code = code
+        self.row = row
+
+
+def read_card_csv(text: str) -> list[BoutDraft]:
+    """Parse a CSV card with one bout per row; the header must name every field in ``CARD_FIELDS``."""
+    reader = csv.DictReader(io.StringIO(text))
+    if reader.fieldnames is None or set(CARD_FIELDS) - {name.strip() for name in reader.fieldnames}:
+        raise CardImportError("card_columns_missing")
+    rows = [{key.strip(): value for key, value in row.items() if key is not None} for row in reader]
+    return [bout_draft_from_fields(row, row_number=index) for index, row in enumerate(rows, start=1)]
+
+
+def read_card_json(data: Any) -> list[BoutDraft]:
+    """Parse a JSON card: a list of bout objects, or an object with a ``bouts`` list."""
+    if isinstance(data, Mapping):
+        data = data.get("bouts")
+    if not isinstance(data, list):
+        raise CardImportError("card_bouts_missing")
+    drafts = []
+    for index, item in enumerate(data, start=1):
+        if not isinstance(item, Mapping):
+            raise CardImportError("card_row_invalid", row=index)
+        drafts.append(bout_draft_from_fields(item, row_number=index))
+    return drafts
+
+
+def bout_draft_from_fields(fields: Mapping[str, Any], *, row_number: int) -> BoutDraft:
+    """Coerce one card row (CSV strings or JSON values) to a ``BoutDraft``; domain checks run at import."""
+    missing = [name for name in CARD_FIELDS if fields.get(name) in (None, "")]
+    if missing:
+        raise CardImportError("card_field_missing", row=row_number)
+    try:
+        fighter_a_user_id = uuid.UUID(str(fields["fighter_a_user_id"]))
+        fighter_b_user_id = uuid.UUID(str(fields["fighter_b_user_id"]))
+    except ValueError as exc:
+        raise CardImportError("card_fighter_id_invalid", row=row_number) from exc
+    event_value = fields["event_datetime_utc"]
+    try:
+        event_datetime_utc = (
+            event_value if isinstance(event_value, datetime) else datetime.fromisoformat(str(event_value))
+        )
+    except ValueError as exc:
+        raise CardImportError("card_event_datetime_invalid", row=row_number) from exc
+    drops: dict[str, int] = {}
+    for name in _DROPS_FIELDS:
+        value = fields[name]
+        if isinstance(value, bool) or not isinstance(value, int | str):
+            raise CardImportError("card_drops_invalid", row=row_number)
+        try:
+            drops[name] = int(value)
+        except ValueError as exc:
+            raise CardImportError("card_drops_invalid", row=row_number) from exc
+    addresses = {name: str(fields[name]).strip() for name in _ADDRESS_FIELDS}
+    return BoutDraft(
+        fighter_a_user_id=fighter_a_user_id,
+        fighter_b_user_id=fighter_b_user_id,
+        event_datetime_utc=event_datetime_utc,
+        **addresses,
+        **drops,
+    )
+
+
+def validate_bout_draft(draft: BoutDraft, *, row_number: int) -> None:
+    try:
+        for name in _DROPS_FIELDS:
+            ensure_valid_drops(getattr(draft, name))
+        ensure_utc(draft.event_datetime_utc)
+    except (TypeError, ValueError) as exc:
+        raise CardImportError(str(exc), row=row_number) from exc
+    if draft.fighter_a_user_id == draft.fighter_b_user_id:
+        raise CardImportError("card_fighters_identical", row=row_number)
+    if not all(0 < len(getattr(draft, name)) <= _MAX_ADDRESS_LENGTH for name in _ADDRESS_FIELDS):
+        raise CardImportError("card_address_invalid", row=row_number)
+
+
+@dataclass
+class CardImportService:
+    """Validate a whole fight card up front, then create every bout in the caller's transaction."""
+
+    session: Session
+
+    def import_card(self, *, promoter_user_id: uuid.UUID, drafts: Sequence[BoutDraft]) -> list[PlannedBout]:
+        if not drafts:
+            raise CardImportError("card_empty")
+        if len(drafts) > MAX_CARD_BOUTS:
+            raise CardImportError("card_too_large")
+        for index, draft in enumerate(drafts, start=1):
+            validate_bout_draft(draft, row_number=index)
+
+        known = _known_fighter_ids(self.session, drafts)
+        for index, draft in enumerate(drafts, start=1):
+            if draft.fighter_a_user_id not in known or draft.fighter_b_user_id not in known:
+                raise CardImportError("card_fighter_not_found", row=index)
+
+        planned = BoutService(session=self.session).create_card(promoter_user_id=promoter_user_id, drafts=drafts)
+        self.session.flush()
+        return planned
+
+
+@dataclass
+class NdjsonLineReader:
+    """Split an NDJSON byte stream into numbered lines as chunks arrive, holding at most one partial line.
+
+    Lines longer than ``max_line_bytes`` are reported as ``None`` and skipped without being buffered.
+    """
+
+    max_line_bytes: int = MAX_NDJSON_LINE_BYTES
+
+    def __post_init__(self) -> None:
+        self._buffer = bytearray()
+        self._line_number = 0
+        self._overlong = False
+
+    def feed(self, chunk: bytes) -> list[tuple[int, bytes | None]]:
+        lines: list[tuple[int, bytes | None]] = []
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            self._append(chunk[start:end])
+            self._emit(lines)
+            start = end + 1
+        self._append(chunk[start:])
+        return lines
+
+    def finish(self) -> list[tuple[int, bytes | None]]:
+        lines: list[tuple[int, bytes | None]] = []
+        if self._buffer.strip() or self._overlong:
+            self._emit(lines)
+        return lines
+
+    def _append(self, data: bytes) -> None:
+        if self._overlong:
+            return
+        if len(self._buffer) + len(data) > self.max_line_bytes:
+            self._overlong = True
+            self._buffer.clear()
+            return
+        self._buffer.extend(data)
+
+    def _emit(self, lines: list[tuple[int, bytes | None]]) -> None:
+        self._line_number += 1
+        if self._overlong:
+            lines.append((self._line_number, None))
+        elif self._buffer.strip():
+            lines.append((self._line_number, bytes(self._buffer)))
+        self._buffer.clear()
+        self._overlong = False
+
+
+@dataclass
+class NdjsonBoutImporter:
+    """Import NDJSON bout definitions one chunk at a time, committing each chunk and reporting every line.
+
+    Unlike a card import, a bad line only rejects itself; the caller bounds memory by the chunk size it passes in.
+    """
+
+    session: Session
+    promoter_user_id: uuid.UUID
+    created: int = 0
+    rejected: int = 0
+
+    def import_lines(self, lines: Sequence[tuple[int, bytes | None]]) -> list[dict[str, Any]]:
+        results: dict[int, dict[str, Any]] = {}
+        drafts: list[tuple[int, BoutDraft]] = []
+        for line_number, raw in lines:
+            try:
+                drafts.append((line_number, _bout_draft_from_line(raw, line_number=line_number)))
+            except CardImportError as exc:
+                results[line_number] = {"line": line_number, "status": "rejected", "error": exc.code}
+
+        known = _known_fighter_ids(self.session, [draft for _, draft in drafts])
+        accepted: list[tuple[int, BoutDraft]] = []
+        for line_number, draft in drafts:
+            if draft.fighter_a_user_id in known and draft.fighter_b_user_id in known:
+                accepted.append((line_number, draft))
+            else:
+                results[line_number] = {"line": line_number, "status": "rejected", "error": "card_fighter_not_found"}
+
+        if accepted:
+            try:
+                planned = BoutService(session=self.session).create_card(
+                    promoter_user_id=self.promoter_user_id, drafts=[draft for _, draft in accepted]
+                )
+                bout_ids = [str(item.bout.id) for item in planned]
+                self.session.commit()
+            except IntegrityError:
+                self.session.rollback()
+                for line_number, _ in accepted:
+                    results[line_number] = {"line": line_number, "status": "rejected", "error": "bout_insert_failed"}
+            else:
+                for (line_number, _), bout_id in zip(accepted, bout_ids, strict=True):
+                    results[line_number] = {"line": line_number, "status": "created", "bout_id": bout_id}
+
+        ordered = [results[line_number] for line_number, _ in lines]
+        for result in ordered:
+            if result["status"] == "created":
+                self.created += 1
+            else:
+                self.rejected += 1
+        return ordered
+
+
+def _bout_draft_from_line(raw: bytes | None, *, line_number: int) -> BoutDraft:
+    if raw is None:
+        raise CardImportError("line_too_long", row=line_number)
+    try:
+        fields = json.loads(raw)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise CardImportError("line_json_invalid", row=line_number) from exc
+    if not isinstance(fields, Mapping):
+        raise CardImportError("card_row_invalid", row=line_number)
+    draft = bout_draft_from_fields(fields, row_number=line_number)
+    validate_bout_draft(draft, row_number=line_number)
+    return draft
+
+
+def _known_fighter_ids(session: Session, drafts: Sequence[BoutDraft]) -> set[uuid.UUID]:
+    fighter_ids = {draft.fighter_a_user_id for draft in drafts} | {draft.fighter_b_user_id for draft in drafts}
+    if not fighter_ids:
+        return set()
+    return set(session.scalars(select(User.id).where(User.id.in_(fighter_ids), User.role == UserRole.FIGHTER)))
+
+
+def _is_promoter(session: Session, user_id: uuid.UUID) -> bool:
+    return session.scalar(select(User.id).where(User.id == user_id, User.role == UserRole.PROMOTER)) is not None
+
+
+def read_card_file(path: Path) -> list[BoutDraft]:
+    text = path.read_text(encoding="utf-8-sig")
+    if path.suffix.lower() == ".json":
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise CardImportError("card_json_invalid") from exc
+        return read_card_json(data)
+    return read_card_csv(text)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Import a fight card (CSV or JSON) as draft bouts in one transaction.")
+    parser.add_argument("card", type=Path, help="Card file; .json is read as JSON, anything else as CSV.")
+    parser.add_argument("--promoter-user-id", type=uuid.UUID, required=True)
+    parser.add_argument(
+        "--database-url", default=settings.database_url, help="SQLAlchemy URL; defaults to DATABASE_URL."
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Validate the card and roll back instead of committing.")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url, future=True)
+    started = time.perf_counter()
+    try:
+        with sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)() as session:
+            try:
+                # The API gets its promoter from the token; here it is a bare argument, so check it names one.
+                if not _is_promoter(session, args.promoter_user_id):
+                    raise CardImportError("card_promoter_not_found")
+                drafts = read_card_file(args.card)
+                planned = CardImportService(session=session).import_card(
+                    promoter_user_id=args.promoter_user_id, drafts=drafts
+                )
+                bout_ids = [str(item.bout.id) for item in planned]
+                if args.dry_run:
+                    session.rollback()
+                else:
+                    session.commit()
+            except CardImportError as exc:
+                session.rollback()
+                where = f" (bout {exc.row})" if exc.row is not None else ""
+                print(f"card rejected: {exc.code}{where}", file=sys.stderr)
+                return 1
+            except IntegrityError:
+                session.rollback()
+                print("card rejected: bout_insert_failed", file=sys.stderr)
+                return 1
+    finally:
+        engine.dispose()
+
+    summary = {
+        "bouts": len(bout_ids),
+        "committed": not args.dry_run,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "bout_ids": bout_ids,
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
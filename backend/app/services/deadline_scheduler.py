@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.metrics import registry
+from app.core.tracing import start_span
+from app.domain.time_rules import RIPPLE_EPOCH_OFFSET, unix_to_ripple_epoch
+from app.integrations import get_xaman_service
+from app.integrations.xaman_service import XamanIntegrationError, XamanService, XamanSignRequest
+from app.models.bout import Bout
+from app.models.enums import EscrowDeadlineStatus, EscrowStatus
+from app.models.escrow import Escrow
+from app.models.escrow_deadline import EscrowDeadline
+from app.repositories.escrow_deadline_repository import EscrowDeadlineRepository
+from app.services.payout_service import PayoutService, payout_sign_request_reference
+from app.services.xrpl_escrow_service import canonical_tx_json
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+_PROCESSED = registry.counter(
+    "ringledger_escrow_deadlines_processed_total",
+    "Due escrow deadlines handled by outcome (prepared, awaiting_result, not_applicable, retry, failed, stale, error).",
+)
+_QUEUED = registry.gauge(
+    "ringledger_escrow_deadlines_queued",
+    "Pending escrow deadlines held in the in-process due-time heap.",
+)
+
+
+@dataclass(frozen=True)
+class DeadlineClaim:
+    """A due deadline leased to one scheduler until ``leased_until`` while its sign request is created."""
+
+    deadline_id: uuid.UUID
+    leased_until: int
+    unsigned_tx: dict[str, Any]
+    reference: str
+
+
+@dataclass
+class EscrowDeadlinePreparer:
+    """Claim and settle due deadlines; each method runs in one short transaction the caller owns.
+
+    ``claim`` builds the close transaction the bout result calls for and leases the row by moving ``due_at`` to
+    ``leased_until``; the caller commits, creates the Xaman sign request with no transaction open, then ``settle``s.
+    Deadlines for escrows that already closed, or whose action the result does not call for (the loser bonus finish,
+    the winner bonus cancel), become ``not_applicable`` at claim time; deadlines that pass before the result is
+    entered wait in ``awaiting_result`` until ``enter_bout_result`` releases them. Failures back off exponentially and
+    the row becomes ``failed`` after ``max_attempts``.
+    """
+
+    session: Session
+    max_attempts: int = 5
+    retry_base_seconds: int = 30
+    lease_seconds: int = 120
+
+    def claim(self, *, deadline_id: uuid.UUID, now_ripple: int) -> DeadlineClaim | str:
+        deadline = self._locked_pending(deadline_id)
+        if deadline is None or deadline.due_at_ripple > now_ripple:
+            return "stale"
+
+        escrow = self.session.get(Escrow, deadline.escrow_id)
+        bout = self.session.get(Bout, deadline.bout_id)
+        if escrow is None or bout is None or escrow.status != EscrowStatus.CREATED:
+            deadline.status = EscrowDeadlineStatus.NOT_APPLICABLE
+            return "not_applicable"
+        if bout.winner is None:
+            deadline.status = EscrowDeadlineStatus.AWAITING_RESULT
+            return "awaiting_result"
+
+        try:
+            action, unsigned_tx = PayoutService(session=self.session).build_close_tx(
+                bout_winner=bout.winner, escrow=escrow
+            )
+        except ValueError as exc:
+            deadline.status = EscrowDeadlineStatus.FAILED
+            deadline.last_error = str(exc)[:64]
+            return "failed"
+        if action.value != deadline.action.value:
+            deadline.status = EscrowDeadlineStatus.NOT_APPLICABLE
+            return "not_applicable"
+
+        deadline.due_at_ripple = now_ripple + self.lease_seconds
+        return DeadlineClaim(
+            deadline_id=deadline.id,
+            leased_until=deadline.due_at_ripple,
+            unsigned_tx=unsigned_tx,
+            reference=payout_sign_request_reference(bout_id=bout.id, escrow_id=escrow.id, action=action.value),
+        )
+
+    def settle_prepared(self, *, claim: DeadlineClaim, sign_request: XamanSignRequest) -> str:
+        deadline = self._locked_pending(claim.deadline_id)
+        if deadline is None or deadline.due_at_ripple != claim.leased_until:
+            # The lease ran out and another scheduler claimed the row; its sign request wins.
+            return "stale"
+        deadline.unsigned_tx_json = canonical_tx_json(claim.unsigned_tx)
+        deadline.xaman_sign_request_json = json.dumps(asdict(sign_request), separators=(",", ":"), sort_keys=True)
+        deadline.status = EscrowDeadlineStatus.PREPARED
+        deadline.last_error = None
+        deadline.prepared_at = datetime.now(UTC)
+        return "prepared"
+
+    def back_off(self, *, deadline_id: uuid.UUID, error: str, now_ripple: int) -> str:
+        deadline = self._locked_pending(deadline_id)
+        if deadline is None:
+            return "stale"
+        deadline.attempts += 1
+        deadline.last_error = error[:64]
+        if deadline.attempts >= self.max_attempts:
+            deadline.status = EscrowDeadlineStatus.FAILED
+            return "failed"
+        deadline.due_at_ripple = now_ripple + self.retry_base_seconds * 2 ** (deadline.attempts - 1)
+        return "retry"
+
+    def _locked_pending(self, deadline_id: uuid.UUID) -> EscrowDeadline | None:
+        deadline = self.session.scalar(
+            select(EscrowDeadline).where(EscrowDeadline.id == deadline_id).with_for_update(skip_locked=True)
+        )
+        if deadline is None or deadline.status != EscrowDeadlineStatus.PENDING:
+            return None
+        return deadline
+
+
+@dataclass
+class EscrowDeadlineScheduler:
+    """In-process due-time heap over the persisted ``escrow_deadlines`` queue.
+
+    Each refill reads only pending rows due within ``lookahead_seconds`` (an index range on ``(status, due_at)``,
+    capped at ``batch_size``), so the cost tracks what is about to come due rather than how many escrows are open.
+    Rows are claimed with ``SKIP LOCKED`` and leased for ``lease_seconds`` while their sign request is created
+    outside any transaction, so several instances can run the scheduler side by side.
+    """
+
+    session_factory: Callable[[], Session]
+    xaman_factory: Callable[[], XamanService] = get_xaman_service
+    lookahead_seconds: int = 300
+    batch_size: int = 500
+    poll_seconds: float = 5.0
+    max_attempts: int = 5
+    retry_base_seconds: int = 30
+    lease_seconds: int = 120
+    clock: Callable[[], float] = time.time
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._heap: list[tuple[int, uuid.UUID]] = []
+        self._queued: set[uuid.UUID] = set()
+        self._stopping = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def now_ripple(self) -> int:
+        return unix_to_ripple_epoch(int(self.clock()))
+
+    def refill(self) -> int:
+        with start_span("deadline_scheduler.refill"), self.session_factory() as session:
+            due = EscrowDeadlineRepository(session=session).list_pending_due(
+                due_at_or_before=self.now_ripple() + self.lookahead_seconds,
+                limit=self.batch_size,
+            )
+        with self._lock:
+            added = sum(self._push(deadline_id, due_at) for deadline_id, due_at in due)
+        return added
+
+    def run_due(self) -> dict[str, int]:
+        outcomes: dict[str, int] = {}
+        xaman: XamanService | None = None
+        while True:
+            now_ripple = self.now_ripple()
+            with self._lock:
+                if not self._heap or self._heap[0][0] > now_ripple:
+                    break
+                _, deadline_id = heapq.heappop(self._heap)
+                self._queued.discard(deadline_id)
+                _QUEUED.set(len(self._heap))
+            if xaman is None:
+                xaman = self.xaman_factory()
+            outcome = self._prepare(deadline_id=deadline_id, now_ripple=now_ripple, xaman=xaman)
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+            _PROCESSED.inc(outcome=outcome)
+        return outcomes
+
+    def seconds_until_next_due(self) -> float | None:
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] + RIPPLE_EPOCH_OFFSET - self.clock())
+
+    def start(self) -> EscrowDeadlineScheduler:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="escrow-deadline-scheduler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, *, timeout_seconds: float = 5.0) -> None:
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout_seconds)
+            self._thread = None
+
+    def _prepare(self, *, deadline_id: uuid.UUID, now_ripple: int, xaman: XamanService) -> str:
+        with start_span("deadline_scheduler.prepare", {"escrow_deadline.id": str(deadline_id)}) as span:
+            try:
+                outcome = self._claim_and_prepare(deadline_id=deadline_id, now_ripple=now_ripple, xaman=xaman)
+            except Exception as exc:
+                logger.exception("escrow deadline %s could not be prepared", deadline_id)
+                self._back_off_after_error(deadline_id=deadline_id, error=type(exc).__name__)
+                outcome = "error"
+            span.set_attribute("escrow_deadline.outcome", outcome)
+        return outcome
+
+    def _claim_and_prepare(self, *, deadline_id: uuid.UUID, now_ripple: int, xaman: XamanService) -> str:
+        claim = self._in_transaction(lambda preparer: preparer.claim(deadline_id=deadline_id, now_ripple=now_ripple))
+        if not isinstance(claim, DeadlineClaim):
+            return claim
+        # The row is leased and its lock released: the Xaman round trip holds no transaction or connection.
+        try:
+            sign_request = xaman.create_sign_request(tx_json=claim.unsigned_tx, reference=claim.reference)
+        except XamanIntegrationError as exc:
+            error = str(exc)
+            return self._in_transaction(
+                lambda preparer: preparer.back_off(deadline_id=deadline_id, error=error, now_ripple=self.now_ripple())
+            )
+        return self._in_transaction(lambda preparer: preparer.settle_prepared(claim=claim, sign_request=sign_request))
+
+    def _back_off_after_error(self, *, deadline_id: uuid.UUID, error: str) -> None:
+        # Without this the row stays due and is picked again on every poll.
+        try:
+            self._in_transaction(
+                lambda preparer: preparer.back_off(deadline_id=deadline_id, error=error, now_ripple=self.now_ripple())
+            )
+        except Exception:
+            logger.exception("escrow deadline %s could not be backed off", deadline_id)
+
+    def _in_transaction(self, step: Callable[[EscrowDeadlinePreparer], _T]) -> _T:
+        with self.session_factory() as session:
+            try:
+                result = step(
+                    EscrowDeadlinePreparer(
+                        session=session,
+                        max_attempts=self.max_attempts,
+                        retry_base_seconds=self.retry_base_seconds,
+                        lease_seconds=self.lease_seconds,
+                    )
+                )
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        return result
+
+    def _push(self, deadline_id: uuid.UUID, due_at_ripple: int) -> bool:
+        if deadline_id in self._queued:
+            return False
+        heapq.heappush(self._heap, (due_at_ripple, deadline_id))
+        self._queued.add(deadline_id)
+        _QUEUED.set(len(self._heap))
+        return True
+
+    def _run(self) -> None:
+        next_refill = 0.0
+        while not self._stopping.is_set():
+            try:
+                if self.clock() >= next_refill:
+                    self.refill()
+                    next_refill = self.clock() + self.poll_seconds
+                self.run_due()
+            except Exception:
+                logger.exception("escrow deadline scheduler iteration failed")
+            wait = next_refill - self.clock()
+            until_due = self.seconds_until_next_due()
+            if until_due is not None:
+                wait = min(wait, until_due)
+            self._wake.wait(max(0.05, wait))
+            self._wake.clear()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import uuid
 from dataclasses import dataclass, field
 from typing import Any
@@ -13,9 +12,20 @@ from app.models.enums import BoutStatus, EscrowKind, EscrowStatus
 from app.models.escrow import Escrow
 from app.repositories.audit_log_repository import AuditLogRepository
 from app.repositories.bout_repository import BoutRepository
+from app.repositories.escrow_deadline_repository import EscrowDeadlineRepository
 from app.repositories.escrow_repository import EscrowRepository
+from app.repositories.escrow_tx_payload_repository import EscrowTxPayloadRepository
+from app.services.bout_events import queue_bout_event
+from app.services.bout_summaries import refresh_bout_summary, sync_bout_summary
 from app.services.failure_taxonomy import build_failure_reason, classify_confirmation_failure
-from app.services.xrpl_escrow_service import EscrowCreateConfirmation, XrplEscrowService, XrplEscrowValidationError
+from app.services.tx_payloads import ESCROW_CREATE, PreparedTx, materialize_close_payloads
+from app.services.validated_tx_cache import LedgerTxSource
+from app.services.xrpl_escrow_service import (
+    EscrowCreateConfirmation,
+    XrplEscrowService,
+    XrplEscrowValidationError,
+    escrow_create_confirmation_from_ledger,
+)
 
 _ESCROW_KIND_ORDER = {
     EscrowKind.SHOW_A: 0,
@@ -30,6 +40,7 @@ _EXPECTED_ESCROW_KINDS = set(_ESCROW_KIND_ORDER)
 class EscrowService:
     session: Session
     xrpl_service: XrplEscrowService = field(default_factory=XrplEscrowService)
+    ledger: LedgerTxSource | None = None
     bouts: BoutRepository = field(init=False)
     escrows: EscrowRepository = field(init=False)
     audit_logs: AuditLogRepository = field(init=False)
@@ -46,20 +57,29 @@ class EscrowService:
         if bout.status not in {BoutStatus.DRAFT, BoutStatus.ESCROWS_CREATED}:
             raise ValueError("bout_not_preparable_for_escrow_create")
 
-        escrows = self.escrows.list_for_bout(bout_id=bout_id)
-        escrows.sort(key=lambda escrow: _ESCROW_KIND_ORDER[escrow.kind])
-        if {escrow.kind for escrow in escrows} != _EXPECTED_ESCROW_KINDS:
+        rows = EscrowTxPayloadRepository(session=self.session).list_escrows_with_payloads(
+            bout_id=bout_id, transaction_types=(ESCROW_CREATE,)
+        )
+        rows.sort(key=lambda row: _ESCROW_KIND_ORDER[row[0].kind])
+        if {escrow.kind for escrow, _ in rows} != _EXPECTED_ESCROW_KINDS:
             raise ValueError("bout_escrow_set_invalid")
 
         items: list[dict[str, Any]] = []
-        for escrow in escrows:
+        for escrow, payload in rows:
             if escrow.status not in {EscrowStatus.PLANNED, EscrowStatus.CREATED}:
                 raise ValueError("escrow_not_preparable_for_create")
+            # Bouts drafted before payloads were persisted have no stored row; build theirs on the fly.
+            prepared = (
+                PreparedTx.from_payload(payload)
+                if payload is not None
+                else PreparedTx.from_tx(self.xrpl_service.build_escrow_create_tx(escrow))
+            )
             items.append(
                 {
                     "escrow_id": str(escrow.id),
                     "escrow_kind": escrow.kind,
-                    "unsigned_tx": self.xrpl_service.build_escrow_create_tx(escrow),
+                    "unsigned_tx": prepared.tx,
+                    "unsigned_tx_hash": prepared.sha256,
                 }
             )
         return bout, items
@@ -82,6 +102,13 @@ class EscrowService:
             raise ValueError("escrow_not_found")
         if escrow.status != EscrowStatus.PLANNED:
             raise ValueError("escrow_not_planned")
+        if self.escrows.get_by_tx_hash(tx_hash=confirmation.tx_hash) is not None:
+            raise ValueError("tx_hash_already_used")
+        if self.ledger is not None:
+            confirmation = escrow_create_confirmation_from_ledger(
+                tx_hash=confirmation.tx_hash,
+                tx_result=self.ledger.tx(confirmation.tx_hash),
+            )
 
         try:
             self.xrpl_service.validate_escrow_create_confirmation(escrow=escrow, confirmation=confirmation)
@@ -111,6 +138,10 @@ class EscrowService:
                     "tx_hash": confirmation.tx_hash,
                 },
             )
+            refresh_bout_summary(session=self.session, bout=bout)
+            queue_bout_event(
+                self.session, event_type="escrow_failed", bout=bout, escrow=escrow, failure_code=failure_code
+            )
             raise ValueError(failure_code) from exc
 
         escrow.status = EscrowStatus.CREATED
@@ -118,6 +149,8 @@ class EscrowService:
         escrow.create_tx_hash = confirmation.tx_hash
         escrow.failure_code = None
         escrow.failure_reason = None
+        EscrowDeadlineRepository(session=self.session).add_for_escrow(escrow=escrow)
+        self._store_close_payloads(escrow=escrow)
         self._append_audit_entry(
             action="escrow_create_confirm",
             entity_type="escrow",
@@ -130,6 +163,8 @@ class EscrowService:
             },
         )
 
+        queue_bout_event(self.session, event_type="escrow_created", bout=bout, escrow=escrow)
+
         escrows = self.escrows.list_for_bout(bout_id=bout_id)
         if {item.kind for item in escrows} == _EXPECTED_ESCROW_KINDS and all(
             item.status == EscrowStatus.CREATED for item in escrows
@@ -142,9 +177,17 @@ class EscrowService:
                 outcome="success",
                 details={"status": bout.status.value},
             )
+            queue_bout_event(self.session, event_type="bout_status", bout=bout)
+        sync_bout_summary(session=self.session, bout=bout, escrows=escrows)
 
         return bout, escrow
 
+    def _store_close_payloads(self, *, escrow: Escrow) -> None:
+        """Swap the spent create payload for the close payloads that need no result, now the offer sequence is known."""
+        payloads = EscrowTxPayloadRepository(session=self.session)
+        payloads.delete_for_escrow(escrow_id=escrow.id, transaction_types=(ESCROW_CREATE,))
+        payloads.add_many(payloads=materialize_close_payloads(escrow=escrow, xrpl_service=self.xrpl_service))
+
     def _append_audit_entry(
         self,
         *,
@@ -161,6 +204,6 @@ class EscrowService:
                 entity_type=entity_type,
                 entity_id=entity_id,
                 outcome=outcome,
-                details_json=json.dumps(details, separators=(",", ":"), sort_keys=True, ensure_ascii=True),
+                details=details,
             )
         )
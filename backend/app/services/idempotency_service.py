@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import zlib
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -10,6 +11,11 @@ from sqlalchemy.orm import Session
 from app.models.idempotency_key import IdempotencyKey
 from app.repositories.idempotency_key_repository import IdempotencyKeyRepository
 
+# Stored response bodies at least this large are zlib-compressed; smaller ones are kept as plain UTF-8 JSON.
+# Confirm responses (~250-300 bytes, mostly repeated keys, UUIDs and a hex tx hash) shrink by ~40%; error bodies
+# such as ``{"detail":"tx_hash_already_used"}`` stay under ~100 bytes, where zlib's framing makes them larger.
+RESPONSE_COMPRESS_MIN_BYTES = 128
+
 
 class IdempotencyKeyMismatchError(ValueError):
     """Raised when an idempotency key is reused with a different request payload."""
@@ -18,7 +24,7 @@ class IdempotencyKeyMismatchError(ValueError):
 @dataclass(frozen=True)
 class IdempotencyReplay:
     status_code: int
-    response_body: dict[str, Any]
+    response_body: bytes
 
 
 @dataclass
@@ -47,9 +53,7 @@ class IdempotencyService:
         if existing.request_hash != request_hash:
             raise IdempotencyKeyMismatchError("idempotency_key_reused_with_different_payload")
 
-        body = json.loads(existing.response_body)
-        if not isinstance(body, dict):
-            raise ValueError("idempotency_response_body_must_be_json_object")
+        body = decode_response_body(existing.response_body, encoding=existing.response_encoding)
         return IdempotencyReplay(status_code=existing.response_code, response_body=body)
 
     def store_response(
@@ -59,14 +63,36 @@ class IdempotencyService:
         idempotency_key: str,
         request_hash: str,
         status_code: int,
-        response_body: dict[str, Any],
+        response_body: bytes,
     ) -> None:
+        """Store the exact response bytes sent, so a replay can send them again without parsing or re-encoding."""
+        body, encoding = encode_response_body(response_body)
         self.idempotency_keys.add(
             idempotency_key=IdempotencyKey(
                 scope=scope,
                 idempotency_key=idempotency_key,
                 request_hash=request_hash,
                 response_code=status_code,
-                response_body=json.dumps(response_body, separators=(",", ":"), sort_keys=True, ensure_ascii=True),
+                response_body=body,
+                response_encoding=encoding,
             )
         )
+
+
+def encode_response_body(body: bytes) -> tuple[bytes, str]:
+    """Return the bytes to store for a serialized response and the ``response_encoding`` that names their form."""
+    if len(body) >= RESPONSE_COMPRESS_MIN_BYTES:
+        # Size the window and hash table to the body: zlib's defaults allocate ~300 KiB per call, which would
+        # dominate a ~300 byte confirm response. ``zlib.decompress`` reads the window size from the header.
+        window_bits = min(15, max(9, (len(body) - 1).bit_length()))
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, window_bits, max(1, window_bits - 7))
+        return compressor.compress(body) + compressor.flush(), "zlib"
+    return body, "identity"
+
+
+def decode_response_body(stored: bytes, *, encoding: str) -> bytes:
+    if encoding == "zlib":
+        return zlib.decompress(stored)
+    if encoding == "identity":
+        return bytes(stored)
+    raise ValueError("idempotency_response_encoding_unsupported")
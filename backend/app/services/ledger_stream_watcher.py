@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import registry
+from app.core.tracing import start_span
+from app.integrations.xrpl_stream import XrplStreamConnection, XrplStreamError, ledger_result_from_stream
+from app.models.enums import EscrowStatus
+from app.models.escrow import Escrow
+from app.repositories.escrow_repository import EscrowRepository
+from app.repositories.validated_transaction_repository import ValidatedTransactionRepository
+from app.services.escrow_service import EscrowService
+from app.services.payout_service import PayoutService
+from app.services.validated_tx_cache import ValidatedTx
+from app.services.xrpl_escrow_service import (
+    escrow_create_confirmation_from_ledger,
+    payout_confirmation_from_ledger,
+)
+
+logger = logging.getLogger(__name__)
+
+_EVENTS = registry.counter(
+    "ringledger_ledger_stream_events_total",
+    "Account-stream transactions by outcome (confirmed, rejected, skipped, duplicate, unmatched, ignored, error).",
+)
+_CONNECTED = registry.gauge(
+    "ringledger_ledger_stream_connected",
+    "1 while the ledger account-stream watcher holds an open subscription, else 0.",
+)
+_RECONNECTS = registry.counter(
+    "ringledger_ledger_stream_reconnects_total",
+    "Ledger account-stream connection attempts that failed or were dropped.",
+)
+
+_PAYOUT_TRANSACTION_TYPES = {"EscrowFinish", "EscrowCancel"}
+_ESCROW_TRANSACTION_TYPES = {"EscrowCreate", *_PAYOUT_TRANSACTION_TYPES}
+
+
+@dataclass
+class LedgerStreamConfirmer:
+    """Apply one validated stream transaction through the same escrow/payout transitions as the confirm endpoints.
+
+    EscrowCreate is matched against planned escrows by owner and terms (its sequence becomes the offer sequence);
+    EscrowFinish/EscrowCancel are matched by ``Owner`` + ``OfferSequence``. The caller owns the transaction.
+    """
+
+    session: Session
+    escrows: EscrowRepository = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.escrows = EscrowRepository(session=self.session)
+
+    def apply(self, message: dict[str, Any]) -> str:
+        tx_result = ledger_result_from_stream(message)
+        if tx_result is None:
+            return "ignored"
+        transaction_type = tx_result.get("TransactionType")
+        if transaction_type not in _ESCROW_TRANSACTION_TYPES:
+            return "ignored"
+        # Redelivered transactions (reconnect overlap, several watched owners) stop at one tx-hash index probe.
+        if self.escrows.get_by_tx_hash(tx_hash=tx_result["hash"].upper()) is not None:
+            return "duplicate"
+        if transaction_type == "EscrowCreate":
+            outcome = self._apply_escrow_create(tx_result)
+        else:
+            outcome = self._apply_payout(tx_result)
+        if outcome in {"confirmed", "rejected"}:
+            snapshot = ValidatedTx.from_ledger_result(tx_result)
+            if snapshot is not None:
+                ValidatedTransactionRepository(session=self.session).insert_missing(rows=[snapshot.as_row()])
+        return outcome
+
+    def _apply_escrow_create(self, tx_result: dict[str, Any]) -> str:
+        confirmation = escrow_create_confirmation_from_ledger(tx_hash=tx_result["hash"], tx_result=tx_result)
+        if not confirmation.offer_sequence:
+            return "unmatched"
+        existing = self.escrows.get_by_owner_offer_sequence(
+            owner_address=confirmation.owner_address,
+            offer_sequence=confirmation.offer_sequence,
+        )
+        if existing is not None:
+            return "duplicate"
+        escrow = self.escrows.find_planned_for_create(
+            owner_address=confirmation.owner_address,
+            destination_address=confirmation.destination_address,
+            amount_drops=confirmation.amount_drops,
+            finish_after_ripple=confirmation.finish_after_ripple,
+            cancel_after_ripple=confirmation.cancel_after_ripple,
+            condition_hex=confirmation.condition_hex,
+        )
+        if escrow is None:
+            return "unmatched"
+        try:
+            EscrowService(session=self.session).confirm_escrow_create(
+                bout_id=escrow.bout_id,
+                escrow_kind=escrow.kind,
+                confirmation=confirmation,
+            )
+        except ValueError as exc:
+            return _rejected_or_skipped(escrow=escrow, error_code=str(exc))
+        return "confirmed"
+
+    def _apply_payout(self, tx_result: dict[str, Any]) -> str:
+        confirmation = payout_confirmation_from_ledger(tx_hash=tx_result["hash"], tx_result=tx_result)
+        escrow = self.escrows.get_by_owner_offer_sequence(
+            owner_address=confirmation.owner_address,
+            offer_sequence=confirmation.offer_sequence,
+        )
+        if escrow is None:
+            return "unmatched"
+        if escrow.status != EscrowStatus.CREATED:
+            return "duplicate"
+        try:
+            PayoutService(session=self.session).confirm_payout(
+                bout_id=escrow.bout_id,
+                escrow_kind=escrow.kind,
+                confirmation=confirmation,
+            )
+        except ValueError as exc:
+            return _rejected_or_skipped(escrow=escrow, error_code=str(exc))
+        return "confirmed"
+
+
+def _rejected_or_skipped(*, escrow: Escrow, error_code: str) -> str:
+    """Validation failures are recorded on the escrow (and must be committed); state conflicts change nothing."""
+    return "rejected" if escrow.failure_code == error_code else "skipped"
+
+
+@dataclass
+class LedgerStreamWatcher:
+    """Background thread that subscribes to open escrow owner accounts and confirms their transactions on arrival.
+
+    The watched account set is refreshed from the database every ``refresh_seconds``; dropped connections are
+    retried with capped exponential backoff. Transactions validated while disconnected are not replayed, so the
+    confirm endpoints remain the fallback path for them.
+    """
+
+    url: str
+    session_factory: Callable[[], Session]
+    timeout_seconds: float = 10.0
+    refresh_seconds: float = 5.0
+    poll_seconds: float = 0.5
+    reconnect_max_seconds: float = 30.0
+    clock: Callable[[], float] = time.monotonic
+
+    def __post_init__(self) -> None:
+        self._stopping = threading.Event()
+        self._refresh_requested = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> LedgerStreamWatcher:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ledger-stream-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, *, timeout_seconds: float = 5.0) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout_seconds)
+            self._thread = None
+
+    def request_refresh(self) -> None:
+        """Re-read the watched accounts on the next poll instead of waiting for ``refresh_seconds``."""
+        self._refresh_requested.set()
+
+    def handle_message(self, message: dict[str, Any]) -> str:
+        # One trace per streamed message: confirms, repository calls and queued events all hang off this span.
+        with start_span("ledger_stream.apply", {"ledger_stream.message_type": str(message.get("type"))}) as span:
+            with self.session_factory() as session:
+                try:
+                    outcome = LedgerStreamConfirmer(session=session).apply(message)
+                    if outcome in {"confirmed", "rejected"}:
+                        session.commit()
+                    else:
+                        session.rollback()
+                except Exception:
+                    session.rollback()
+                    raise
+            span.set_attribute("ledger_stream.outcome", outcome)
+        if message.get("type") == "transaction":
+            _EVENTS.inc(outcome=outcome)
+        return outcome
+
+    def _run(self) -> None:
+        backoff = 0.0
+        while not self._stopping.is_set():
+            try:
+                with XrplStreamConnection(url=self.url, timeout_seconds=self.timeout_seconds) as connection:
+                    _CONNECTED.set(1)
+                    backoff = 0.0
+                    self._follow(connection)
+            except XrplStreamError as exc:
+                _RECONNECTS.inc()
+                logger.warning("ledger stream disconnected: %s", exc)
+            except Exception:
+                _RECONNECTS.inc()
+                logger.exception("ledger stream watcher failed")
+            finally:
+                _CONNECTED.set(0)
+            backoff = min(self.reconnect_max_seconds, max(0.5, backoff * 2))
+            self._stopping.wait(backoff)
+
+    def _follow(self, connection: XrplStreamConnection) -> None:
+        subscribed: set[str] = set()
+        next_refresh = 0.0
+        while not self._stopping.is_set():
+            if self._refresh_requested.is_set() or self.clock() >= next_refresh:
+                self._refresh_requested.clear()
+                subscribed = self._resubscribe(connection, subscribed)
+                next_refresh = self.clock() + self.refresh_seconds
+            message = connection.recv_json(timeout_seconds=self.poll_seconds)
+            if message is None:
+                continue
+            try:
+                self.handle_message(message)
+            except Exception:
+                logger.exception("ledger stream transaction could not be applied")
+                _EVENTS.inc(outcome="error")
+
+    def _resubscribe(self, connection: XrplStreamConnection, subscribed: set[str]) -> set[str]:
+        with start_span("ledger_stream.resubscribe"), self.session_factory() as session:
+            wanted = EscrowRepository(session=session).list_open_owner_addresses()
+        if wanted - subscribed:
+            connection.subscribe_accounts(wanted - subscribed)
+        if subscribed - wanted:
+            connection.unsubscribe_accounts(subscribed - wanted)
+        return wanted
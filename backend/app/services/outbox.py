@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.tracing import TRACEPARENT_HEADER, current_traceparent, start_span
+from app.models.enums import OutboxStatus
+from app.models.outbox_event import OutboxEvent
+from app.repositories.outbox_repository import OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+_DISPATCHED = registry.counter(
+    "ringledger_outbox_events_total",
+    "Outbox events processed by the dispatcher, by outcome (dispatched, retried, dead).",
+)
+_BATCHES = registry.counter(
+    "ringledger_outbox_batches_total",
+    "Outbox batches claimed by the dispatcher, by outcome (delivered, isolated, unavailable).",
+)
+_PURGED = registry.counter(
+    "ringledger_outbox_events_purged_total",
+    "Dispatched outbox events deleted after the retention window.",
+)
+
+
+class OutboxDeliveryError(RuntimeError):
+    """Raised by a sink that could not deliver; the dispatcher retries the affected events later."""
+
+
+class OutboxSinkUnavailableError(OutboxDeliveryError):
+    """The sink itself is down (unreachable, timing out, 5xx), so retrying events one by one cannot help."""
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """An outbox row as handed to sinks; ``id`` is unique and increasing, so consumers can de-duplicate on it."""
+
+    id: int
+    event_type: str
+    bout_id: str
+    payload: dict[str, Any]
+    attempts: int
+    traceparent: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        item = {"id": self.id, "event": self.event_type, "bout_id": self.bout_id, "payload": self.payload}
+        if self.traceparent is not None:
+            # Consumers continue the trace of the request that committed the event.
+            item["traceparent"] = self.traceparent
+        return item
+
+
+class OutboxSink(Protocol):
+    name: str
+
+    def deliver(self, messages: Sequence[OutboxMessage]) -> None:
+        """Deliver every message or raise; partial success is retried in full."""
+
+
+@dataclass
+class LoggingSink:
+    """Writes events to the application log; the default when no downstream consumer is configured."""
+
+    name: str = "log"
+
+    def deliver(self, messages: Sequence[OutboxMessage]) -> None:
+        for message in messages:
+            logger.info("outbox event %s %s bout=%s", message.id, message.event_type, message.bout_id)
+
+
+@dataclass
+class WebhookSink:
+    """POSTs each batch as one JSON document (``{"events": [...]}``); any non-2xx answer fails the batch."""
+
+    url: str
+    timeout_seconds: float = 10.0
+    name: str = "webhook"
+
+    def deliver(self, messages: Sequence[OutboxMessage]) -> None:
+        body = json.dumps({"events": [message.to_dict() for message in messages]}, separators=(",", ":")).encode()
+        headers = {"Content-Type": "application/json"}
+        traceparent = current_traceparent()
+        if traceparent is not None:
+            headers[TRACEPARENT_HEADER] = traceparent
+        request = Request(self.url, data=body, method="POST", headers=headers)
+        try:
+            with urlopen(request, timeout=self.timeout_seconds) as response:
+                response.read()
+        except HTTPError as exc:
+            if exc.code >= 500:
+                raise OutboxSinkUnavailableError(f"outbox_webhook_http_{exc.code}") from exc
+            raise OutboxDeliveryError(f"outbox_webhook_http_{exc.code}") from exc
+        except (URLError, TimeoutError, OSError) as exc:
+            raise OutboxSinkUnavailableError("outbox_webhook_unreachable") from exc
+
+
+def sinks_from_settings() -> list[OutboxSink]:
+    if settings.outbox_webhook_url:
+        return [WebhookSink(url=settings.outbox_webhook_url)]
+    return [LoggingSink()]
+
+
+@dataclass
+class OutboxDispatcher:
+    """Drains ``outbox_events`` to the configured sinks, at least once per event.
+
+    Each pass runs three steps, and no transaction or row lock is held while a sink is called:
+
+    1. claim: in one short transaction, lock up to ``batch_size`` due events with ``SKIP LOCKED`` (so several
+       dispatchers can share the table), lease them by moving ``available_at`` ``lease_seconds`` ahead, commit;
+    2. deliver the batch to every sink. When a sink rejects it, its events are retried one by one so a single
+       poison event cannot hold back the rest, unless the sink reports itself unavailable;
+    3. settle: in a second short transaction, mark the rows still under this lease dispatched, or back them off
+       exponentially and park them as ``dead`` after ``max_attempts``.
+
+    A crash or a delivery outliving the lease lets another pass claim the events again, hence at-least-once.
+    Dispatched events are deleted once they are ``retention_days`` old.
+    """
+
+    session_factory: Callable[[], Session]
+    sinks: Sequence[OutboxSink] = field(default_factory=sinks_from_settings)
+    batch_size: int = 100
+    poll_seconds: float = 1.0
+    max_attempts: int = 10
+    retry_base_seconds: int = 5
+    retry_max_seconds: int = 3600
+    lease_seconds: int = 300
+    retention_days: int = 7
+    purge_interval_seconds: float = 60.0
+    purge_batch_size: int = 1000
+    clock: Callable[[], float] = time.time
+
+    def __post_init__(self) -> None:
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_purge: float | None = None
+
+    def run_once(self) -> dict[str, int]:
+        # Each pass is its own trace; the originating request's trace travels on with every event.
+        with start_span("outbox.dispatch") as span:
+            outcomes = self._dispatch()
+            span.set_attribute("outbox.outcomes", json.dumps(outcomes, sort_keys=True))
+        return outcomes
+
+    def _dispatch(self) -> dict[str, int]:
+        outcomes: dict[str, int] = {}
+        claimed = self._claim()
+        if claimed is None:
+            return outcomes
+        messages, leased_until = claimed
+        errors = self._deliver(messages)
+        now = datetime.fromtimestamp(self.clock(), UTC)
+        with self.session_factory() as session:
+            rows = OutboxRepository(session=session).list_leased(
+                ids=[message.id for message in messages], leased_until=leased_until
+            )
+            for row in rows:
+                outcome = self._settle(row, error=errors.get(row.id), now=now)
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+                _DISPATCHED.inc(outcome=outcome)
+            session.commit()
+        if len(rows) < len(messages):
+            logger.warning("outbox lease expired for %d of %d events", len(messages) - len(rows), len(messages))
+        return outcomes
+
+    def purge_dispatched(self) -> int:
+        """Delete dispatched events past ``retention_days``, ``purge_batch_size`` rows per transaction."""
+        cutoff = datetime.fromtimestamp(self.clock(), UTC) - timedelta(days=self.retention_days)
+        total = 0
+        with start_span("outbox.purge") as span:
+            while True:
+                with self.session_factory() as session:
+                    deleted = OutboxRepository(session=session).purge_dispatched(
+                        dispatched_before=cutoff, limit=self.purge_batch_size
+                    )
+                    session.commit()
+                total += deleted
+                if deleted < self.purge_batch_size:
+                    break
+            span.set_attribute("outbox.purged", total)
+        return total
+
+    def start(self) -> OutboxDispatcher:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run_forever, name="outbox-dispatcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, *, timeout_seconds: float = 5.0) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout_seconds)
+            self._thread = None
+
+    def run_forever(self) -> None:
+        """Dispatch and purge on the calling thread until ``stop`` is called; ``start`` runs this in the background."""
+        while not self._stopping.is_set():
+            claimed = 0
+            try:
+                claimed = sum(self.run_once().values())
+            except Exception:
+                logger.exception("outbox dispatcher iteration failed")
+            self._maybe_purge()
+            # A full batch means more are waiting; go straight back for them.
+            if claimed < self.batch_size:
+                self._stopping.wait(self.poll_seconds)
+
+    def _claim(self) -> tuple[list[OutboxMessage], datetime] | None:
+        with self.session_factory() as session:
+            now = datetime.fromtimestamp(self.clock(), UTC)
+            rows = OutboxRepository(session=session).claim_batch(available_at_or_before=now, limit=self.batch_size)
+            if not rows:
+                session.rollback()
+                return None
+            leased_until = now + timedelta(seconds=self.lease_seconds)
+            messages = []
+            for row in rows:
+                messages.append(_message(row))
+                row.available_at = leased_until
+            session.commit()
+        return messages, leased_until
+
+    def _deliver(self, messages: list[OutboxMessage]) -> dict[int, str]:
+        errors: dict[int, str] = {}
+        for sink in self.sinks:
+            try:
+                sink.deliver(messages)
+                _BATCHES.inc(outcome="delivered", sink=sink.name)
+                continue
+            except OutboxSinkUnavailableError as exc:
+                logger.warning("outbox sink %s unavailable: %s", sink.name, exc)
+                _BATCHES.inc(outcome="unavailable", sink=sink.name)
+                for message in messages:
+                    errors.setdefault(message.id, f"{sink.name}:{exc}"[:256])
+                continue
+            except Exception:
+                logger.warning("outbox sink %s rejected a batch of %d; retrying singly", sink.name, len(messages))
+            _BATCHES.inc(outcome="isolated", sink=sink.name)
+            for position, message in enumerate(messages):
+                try:
+                    sink.deliver([message])
+                except OutboxSinkUnavailableError as exc:
+                    # The sink went down mid-isolation; fail the rest without one timeout each.
+                    for pending in messages[position:]:
+                        errors.setdefault(pending.id, f"{sink.name}:{exc}"[:256])
+                    break
+                except Exception as exc:
+                    errors.setdefault(message.id, f"{sink.name}:{exc}"[:256])
+        return errors
+
+    def _settle(self, row: OutboxEvent, *, error: str | None, now: datetime) -> str:
+        if error is None:
+            row.status = OutboxStatus.DISPATCHED
+            row.dispatched_at = now
+            row.last_error = None
+            return "dispatched"
+        row.attempts += 1
+        row.last_error = error
+        if row.attempts >= self.max_attempts:
+            row.status = OutboxStatus.DEAD
+            logger.error("outbox event %s parked after %d attempts: %s", row.id, row.attempts, error)
+            return "dead"
+        delay = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (row.attempts - 1))
+        row.available_at = now + timedelta(seconds=delay)
+        return "retried"
+
+    def _maybe_purge(self) -> None:
+        now = self.clock()
+        if self._last_purge is not None and now - self._last_purge < self.purge_interval_seconds:
+            return
+        self._last_purge = now
+        try:
+            purged = self.purge_dispatched()
+        except Exception:
+            logger.exception("outbox purge failed")
+            return
+        if purged:
+            _PURGED.inc(purged)
+
+
+def _message(row: OutboxEvent) -> OutboxMessage:
+    return OutboxMessage(
+        id=row.id,
+        event_type=row.event_type,
+        bout_id=str(row.bout_id),
+        payload=json.loads(row.payload_json),
+        attempts=row.attempts,
+        traceparent=row.traceparent,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Dispatch outbox events to the configured sinks.")
+    parser.add_argument(
+        "--database-url", default=settings.database_url, help="SQLAlchemy URL; defaults to DATABASE_URL."
+    )
+    parser.add_argument("--once", action="store_true", help="Dispatch one batch, print its outcomes and exit.")
+    parser.add_argument(
+        "--purge", action="store_true", help="Delete dispatched events past OUTBOX_RETENTION_DAYS and exit."
+    )
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url, future=True)
+    dispatcher = OutboxDispatcher(
+        session_factory=sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True),
+        batch_size=settings.outbox_batch_size,
+        poll_seconds=settings.outbox_poll_seconds,
+        max_attempts=settings.outbox_max_attempts,
+        lease_seconds=settings.outbox_lease_seconds,
+        retention_days=settings.outbox_retention_days,
+    )
+    try:
+        if args.purge:
+            print(json.dumps({"purged": dispatcher.purge_dispatched()}))
+            return 0
+        if args.once:
+            print(json.dumps(dispatcher.run_once()))
+            return 0
+        dispatcher.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import uuid
 from dataclasses import dataclass, field
 from typing import Any
@@ -13,13 +12,20 @@ from app.models.enums import BoutStatus, BoutWinner, EscrowKind, EscrowStatus
 from app.models.escrow import Escrow
 from app.repositories.audit_log_repository import AuditLogRepository
 from app.repositories.bout_repository import BoutRepository
+from app.repositories.escrow_deadline_repository import EscrowDeadlineRepository
 from app.repositories.escrow_repository import EscrowRepository
+from app.repositories.escrow_tx_payload_repository import EscrowTxPayloadRepository
+from app.services.bout_events import queue_bout_event
+from app.services.bout_summaries import refresh_bout_summary, sync_bout_summary
 from app.services.failure_taxonomy import build_failure_reason, classify_confirmation_failure
+from app.services.tx_payloads import ESCROW_CLOSE_TYPES, PreparedTx, materialize_winner_bonus_finish
+from app.services.validated_tx_cache import LedgerTxSource
 from app.services.xrpl_escrow_service import (
     EscrowPayoutAction,
     EscrowPayoutConfirmation,
     XrplEscrowService,
     XrplEscrowValidationError,
+    payout_confirmation_from_ledger,
 )
 
 _EXPECTED_ESCROW_KINDS = {EscrowKind.SHOW_A, EscrowKind.SHOW_B, EscrowKind.BONUS_A, EscrowKind.BONUS_B}
@@ -29,6 +35,7 @@ _EXPECTED_ESCROW_KINDS = {EscrowKind.SHOW_A, EscrowKind.SHOW_B, EscrowKind.BONUS
 class PayoutService:
     session: Session
     xrpl_service: XrplEscrowService = field(default_factory=XrplEscrowService)
+    ledger: LedgerTxSource | None = None
     bouts: BoutRepository = field(init=False)
     escrows: EscrowRepository = field(init=False)
     audit_logs: AuditLogRepository = field(init=False)
@@ -53,6 +60,8 @@ class PayoutService:
 
         bout.winner = winner
         bout.status = BoutStatus.RESULT_ENTERED
+        EscrowDeadlineRepository(session=self.session).release_awaiting_result(bout_id=bout.id)
+        self._store_winner_bonus_finish(bout_id=bout.id, winner=winner)
         self._append_audit_entry(
             actor_user_id=actor_user_id,
             action="bout_result_enter",
@@ -61,6 +70,8 @@ class PayoutService:
             outcome="success",
             details={"winner": winner.value, "status": bout.status.value},
         )
+        sync_bout_summary(session=self.session, bout=bout)
+        queue_bout_event(self.session, event_type="bout_status", bout=bout)
         return bout
 
     def prepare_payout_payloads(self, *, bout_id: uuid.UUID) -> tuple[Bout, list[dict[str, Any]]]:
@@ -72,7 +83,11 @@ class PayoutService:
         if bout.winner is None:
             raise ValueError("bout_winner_not_set")
 
-        escrows_by_kind = self._load_escrows_by_kind(bout_id=bout_id)
+        rows = EscrowTxPayloadRepository(session=self.session).list_escrows_with_payloads(
+            bout_id=bout_id, transaction_types=ESCROW_CLOSE_TYPES
+        )
+        escrows_by_kind = _require_complete_escrow_set({escrow.kind: escrow for escrow, _ in rows})
+        stored = {(escrow.kind, payload.transaction_type): payload for escrow, payload in rows if payload is not None}
         winner_bonus_kind, loser_bonus_kind = _resolve_bonus_kinds(winner=bout.winner)
 
         payout_plan: list[tuple[EscrowKind, EscrowPayoutAction, str | None]] = [
@@ -90,18 +105,23 @@ class PayoutService:
         for escrow_kind, action, fulfillment_hex in payout_plan:
             escrow = escrows_by_kind[escrow_kind]
             if escrow.status == EscrowStatus.CREATED:
-                if action == EscrowPayoutAction.FINISH:
-                    unsigned_tx = self.xrpl_service.build_escrow_finish_tx(
-                        escrow=escrow, fulfillment_hex=fulfillment_hex
+                transaction_type = "EscrowFinish" if action == EscrowPayoutAction.FINISH else "EscrowCancel"
+                payload = stored.get((escrow_kind, transaction_type))
+                if payload is not None:
+                    prepared = PreparedTx.from_payload(payload)
+                elif action == EscrowPayoutAction.FINISH:
+                    prepared = PreparedTx.from_tx(
+                        self.xrpl_service.build_escrow_finish_tx(escrow=escrow, fulfillment_hex=fulfillment_hex)
                     )
                 else:
-                    unsigned_tx = self.xrpl_service.build_escrow_cancel_tx(escrow)
+                    prepared = PreparedTx.from_tx(self.xrpl_service.build_escrow_cancel_tx(escrow))
                 items.append(
                     {
                         "escrow_id": str(escrow.id),
                         "escrow_kind": escrow.kind,
                         "action": action.value,
-                        "unsigned_tx": unsigned_tx,
+                        "unsigned_tx": prepared.tx,
+                        "unsigned_tx_hash": prepared.sha256,
                     }
                 )
                 continue
@@ -114,6 +134,13 @@ class PayoutService:
 
         return bout, items
 
+    def build_close_tx(self, *, bout_winner: BoutWinner, escrow: Escrow) -> tuple[EscrowPayoutAction, dict[str, Any]]:
+        """The close action the result calls for on one escrow, with its unsigned transaction."""
+        action, fulfillment_hex = self._expected_action_for_escrow(bout_winner=bout_winner, escrow=escrow)
+        if action == EscrowPayoutAction.FINISH:
+            return action, self.xrpl_service.build_escrow_finish_tx(escrow=escrow, fulfillment_hex=fulfillment_hex)
+        return action, self.xrpl_service.build_escrow_cancel_tx(escrow)
+
     def confirm_payout(
         self,
         *,
@@ -129,11 +156,19 @@ class PayoutService:
         if bout.winner is None:
             raise ValueError("bout_winner_not_set")
 
-        escrow = self.escrows.get_for_bout_kind(bout_id=bout_id, escrow_kind=escrow_kind)
+        bout_escrows = {item.kind: item for item in self.escrows.list_for_bout(bout_id=bout_id)}
+        escrow = bout_escrows.get(escrow_kind)
         if escrow is None:
             raise ValueError("escrow_not_found")
         if escrow.status != EscrowStatus.CREATED:
             raise ValueError("escrow_not_created")
+        if self.escrows.get_by_tx_hash(tx_hash=confirmation.tx_hash) is not None:
+            raise ValueError("tx_hash_already_used")
+        if self.ledger is not None:
+            confirmation = payout_confirmation_from_ledger(
+                tx_hash=confirmation.tx_hash,
+                tx_result=self.ledger.tx(confirmation.tx_hash),
+            )
 
         expected_action, expected_fulfillment = self._expected_action_for_escrow(bout_winner=bout.winner, escrow=escrow)
 
@@ -171,6 +206,10 @@ class PayoutService:
                     "tx_hash": confirmation.tx_hash,
                 },
             )
+            refresh_bout_summary(session=self.session, bout=bout, escrows=bout_escrows.values())
+            queue_bout_event(
+                self.session, event_type="escrow_failed", bout=bout, escrow=escrow, failure_code=failure_code
+            )
             raise ValueError(failure_code) from exc
 
         if expected_action == EscrowPayoutAction.FINISH:
@@ -180,7 +219,11 @@ class PayoutService:
         escrow.close_tx_hash = confirmation.tx_hash
         escrow.failure_code = None
         escrow.failure_reason = None
+        EscrowTxPayloadRepository(session=self.session).delete_for_escrow(
+            escrow_id=escrow.id, transaction_types=ESCROW_CLOSE_TYPES
+        )
 
+        previous_bout_status = bout.status
         if bout.status == BoutStatus.RESULT_ENTERED:
             bout.status = BoutStatus.PAYOUTS_IN_PROGRESS
         self._append_audit_entry(
@@ -197,7 +240,7 @@ class PayoutService:
             },
         )
 
-        escrows_by_kind = self._load_escrows_by_kind(bout_id=bout_id)
+        escrows_by_kind = _require_complete_escrow_set(bout_escrows)
         if _can_close_bout(winner=bout.winner, escrows_by_kind=escrows_by_kind):
             bout.status = BoutStatus.CLOSED
             self._append_audit_entry(
@@ -208,9 +251,29 @@ class PayoutService:
                 outcome="success",
                 details={"status": bout.status.value},
             )
+        sync_bout_summary(session=self.session, bout=bout, escrows=bout_escrows.values())
+        queue_bout_event(self.session, event_type=f"escrow_{escrow.status.value}", bout=bout, escrow=escrow)
+        if bout.status != previous_bout_status:
+            queue_bout_event(self.session, event_type="bout_status", bout=bout)
 
         return bout, escrow
 
+    def _store_winner_bonus_finish(self, *, bout_id: uuid.UUID, winner: BoutWinner) -> None:
+        """Only now that the result is known may the winner's fulfillment go into a stored payload."""
+        winner_bonus_kind, _ = _resolve_bonus_kinds(winner=winner)
+        escrow = self.escrows.get_for_bout_kind(bout_id=bout_id, escrow_kind=winner_bonus_kind)
+        if escrow is None or escrow.status != EscrowStatus.CREATED:
+            return
+        EscrowTxPayloadRepository(session=self.session).add_many(
+            payloads=[
+                materialize_winner_bonus_finish(
+                    escrow=escrow,
+                    fulfillment_hex=_required_fulfillment_hex(escrow),
+                    xrpl_service=self.xrpl_service,
+                )
+            ]
+        )
+
     def _expected_action_for_escrow(
         self,
         *,
@@ -226,13 +289,6 @@ class PayoutService:
             return EscrowPayoutAction.CANCEL, None
         raise ValueError("escrow_kind_not_supported")
 
-    def _load_escrows_by_kind(self, *, bout_id: uuid.UUID) -> dict[EscrowKind, Escrow]:
-        escrows = self.escrows.list_for_bout(bout_id=bout_id)
-        escrows_by_kind = {item.kind: item for item in escrows}
-        if set(escrows_by_kind) != _EXPECTED_ESCROW_KINDS:
-            raise ValueError("bout_escrow_set_invalid")
-        return escrows_by_kind
-
     def _append_audit_entry(
         self,
         *,
@@ -250,11 +306,21 @@ class PayoutService:
                 entity_type=entity_type,
                 entity_id=entity_id,
                 outcome=outcome,
-                details_json=json.dumps(details, separators=(",", ":"), sort_keys=True, ensure_ascii=True),
+                details=details,
             )
         )
 
 
+def payout_sign_request_reference(*, bout_id: uuid.UUID, escrow_id: uuid.UUID | str, action: str) -> str:
+    return f"payout_prepare:{bout_id}:{escrow_id}:{action}"
+
+
+def _require_complete_escrow_set(escrows_by_kind: dict[EscrowKind, Escrow]) -> dict[EscrowKind, Escrow]:
+    if set(escrows_by_kind) != _EXPECTED_ESCROW_KINDS:
+        raise ValueError("bout_escrow_set_invalid")
+    return escrows_by_kind
+
+
 def _resolve_bonus_kinds(*, winner: BoutWinner) -> tuple[EscrowKind, EscrowKind]:
     if winner == BoutWinner.A:
         return EscrowKind.BONUS_A, EscrowKind.BONUS_B
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Select, case, create_engine, func, literal, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.domain.money import drops_to_xrp_strings
+from app.domain.time_rules import ensure_utc, stored_as_utc
+from app.models.bout import Bout
+from app.models.enums import EscrowKind, EscrowStatus
+from app.models.escrow import Escrow
+
+REPORT_KINDS = ("statement", "purses")
+REPORT_FORMATS = ("csv", "ndjson")
+# Rows fetched (and converted to XRP) per round trip; with PostgreSQL the result is read from a server-side cursor,
+# so memory stays at one chunk whatever the report covers.
+REPORT_CHUNK_ROWS = 2000
+
+STATEMENT_COLUMNS = (
+    "event_datetime_utc",
+    "bout_id",
+    "promoter_user_id",
+    "fighter_user_id",
+    "purse",
+    "escrow_kind",
+    "escrow_status",
+    "amount_drops",
+    "amount_xrp",
+    "create_tx_hash",
+    "close_tx_hash",
+)
+PURSE_COLUMNS = (
+    "fighter_user_id",
+    "purse",
+    "bouts",
+    "planned_drops",
+    "locked_drops",
+    "paid_drops",
+    "cancelled_drops",
+    "planned_xrp",
+    "locked_xrp",
+    "paid_xrp",
+    "cancelled_xrp",
+)
+_PURSE_AMOUNTS = (
+    ("planned_drops", EscrowStatus.PLANNED),
+    ("locked_drops", EscrowStatus.CREATED),
+    ("paid_drops", EscrowStatus.FINISHED),
+    ("cancelled_drops", EscrowStatus.CANCELLED),
+)
+
+
+@dataclass(frozen=True)
+class SettlementReportScope:
+    """Which bouts a report covers: one promoter's (or, from the CLI, every promoter's) within an event window."""
+
+    promoter_user_id: uuid.UUID | None = None
+    event_from: datetime | None = None
+    event_to: datetime | None = None
+
+    def normalized(self) -> SettlementReportScope:
+        event_from = ensure_utc(self.event_from) if self.event_from is not None else None
+        event_to = ensure_utc(self.event_to) if self.event_to is not None else None
+        if event_from is not None and event_to is not None and event_from > event_to:
+            raise ValueError("report_window_invalid")
+        return SettlementReportScope(promoter_user_id=self.promoter_user_id, event_from=event_from, event_to=event_to)
+
+
+@dataclass
+class SettlementReportService:
+    """Finance statements over ``bouts``/``escrows``, produced by set-based queries and streamed in chunks.
+
+    ``statement`` is one line per escrow (purse, status, amount, tx hashes); ``purses`` sums each fighter's show
+    and bonus purses by escrow status in the database. Neither ever holds more than ``REPORT_CHUNK_ROWS`` rows.
+    """
+
+    session: Session
+
+    def columns(self, report: str) -> tuple[str, ...]:
+        if report == "statement":
+            return STATEMENT_COLUMNS
+        if report == "purses":
+            return PURSE_COLUMNS
+        raise ValueError("report_kind_invalid")
+
+    def rows(self, report: str, scope: SettlementReportScope) -> Iterator[dict[str, Any]]:
+        """Validate eagerly, then return a lazy row iterator (so errors surface before any output is written)."""
+        self.columns(report)
+        scope = scope.normalized()
+        if report == "statement":
+            return self._statement_rows(scope)
+        return self._purse_rows(scope)
+
+    def _statement_rows(self, scope: SettlementReportScope) -> Iterator[dict[str, Any]]:
+        statement = _scoped(
+            select(
+                Bout.event_datetime_utc,
+                Bout.id,
+                Bout.promoter_user_id,
+                _fighter_user_id(),
+                _purse(),
+                Escrow.kind,
+                Escrow.status,
+                Escrow.amount_drops,
+                Escrow.create_tx_hash,
+                Escrow.close_tx_hash,
+            ).join(Escrow, Escrow.bout_id == Bout.id),
+            scope,
+        ).order_by(Bout.event_datetime_utc, Bout.id, Escrow.kind)
+        for chunk in self._chunks(statement):
+            amounts = drops_to_xrp_strings([row[7] for row in chunk])
+            for row, amount_xrp in zip(chunk, amounts, strict=True):
+                yield {
+                    "event_datetime_utc": stored_as_utc(row[0]).isoformat(),
+                    "bout_id": str(row[1]),
+                    "promoter_user_id": str(row[2]),
+                    "fighter_user_id": str(row[3]),
+                    "purse": row[4],
+                    "escrow_kind": row[5].value,
+                    "escrow_status": row[6].value,
+                    "amount_drops": row[7],
+                    "amount_xrp": amount_xrp,
+                    "create_tx_hash": row[8],
+                    "close_tx_hash": row[9],
+                }
+
+    def _purse_rows(self, scope: SettlementReportScope) -> Iterator[dict[str, Any]]:
+        # Fighter and purse are derived in a subquery so the outer GROUP BY names plain columns (PostgreSQL will not
+        # match a CASE with bound parameters in the select list against its copy in GROUP BY).
+        lines = _scoped(
+            select(_fighter_user_id(), _purse(), Bout.id.label("bout_id"), Escrow.status, Escrow.amount_drops).join(
+                Escrow, Escrow.bout_id == Bout.id
+            ),
+            scope,
+        ).subquery()
+        sums = [
+            func.coalesce(func.sum(case((lines.c.status == status, lines.c.amount_drops), else_=0)), 0).label(name)
+            for name, status in _PURSE_AMOUNTS
+        ]
+        statement = (
+            select(lines.c.fighter_user_id, lines.c.purse, func.count(func.distinct(lines.c.bout_id)), *sums)
+            .group_by(lines.c.fighter_user_id, lines.c.purse)
+            .order_by(lines.c.fighter_user_id, lines.c.purse)
+        )
+        for chunk in self._chunks(statement):
+            # One conversion call per amount column per chunk rather than one per cell.
+            converted = [drops_to_xrp_strings([int(row[3 + index]) for row in chunk]) for index in range(4)]
+            for position, row in enumerate(chunk):
+                item: dict[str, Any] = {"fighter_user_id": str(row[0]), "purse": row[1], "bouts": row[2]}
+                for index, (name, _status) in enumerate(_PURSE_AMOUNTS):
+                    item[name] = int(row[3 + index])
+                    item[name.replace("_drops", "_xrp")] = converted[index][position]
+                yield item
+
+    def _chunks(self, statement: Select[Any]) -> Iterator[list[Any]]:
+        result = self.session.execute(statement.execution_options(yield_per=REPORT_CHUNK_ROWS))
+        try:
+            for partition in result.partitions():
+                yield list(partition)
+        finally:
+            result.close()
+
+
+def _fighter_user_id() -> Any:
+    return case(
+        (Escrow.kind.in_([EscrowKind.SHOW_A, EscrowKind.BONUS_A]), Bout.fighter_a_user_id),
+        else_=Bout.fighter_b_user_id,
+    ).label("fighter_user_id")
+
+
+def _purse() -> Any:
+    return case(
+        (Escrow.kind.in_([EscrowKind.SHOW_A, EscrowKind.SHOW_B]), literal("show")),
+        else_=literal("bonus"),
+    ).label("purse")
+
+
+def _scoped(statement: Select[Any], scope: SettlementReportScope) -> Select[Any]:
+    if scope.promoter_user_id is not None:
+        statement = statement.where(Bout.promoter_user_id == scope.promoter_user_id)
+    if scope.event_from is not None:
+        statement = statement.where(Bout.event_datetime_utc >= scope.event_from)
+    if scope.event_to is not None:
+        statement = statement.where(Bout.event_datetime_utc < scope.event_to)
+    return statement
+
+
+def encode_report(rows: Iterator[dict[str, Any]], *, columns: tuple[str, ...], fmt: str) -> Iterator[bytes]:
+    """Render rows as CSV (with a header) or NDJSON, one encoded chunk per ``REPORT_CHUNK_ROWS`` rows."""
+    if fmt not in REPORT_FORMATS:
+        raise ValueError("report_format_invalid")
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n") if fmt == "csv" else None
+    if writer is not None:
+        writer.writeheader()
+    pending = 0
+    for row in rows:
+        if writer is not None:
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(row, separators=(",", ":")) + "\n")
+        pending += 1
+        if pending >= REPORT_CHUNK_ROWS:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Stream a settlement statement or purse summary as CSV or NDJSON.")
+    parser.add_argument("report", choices=REPORT_KINDS)
+    parser.add_argument("--promoter-user-id", type=uuid.UUID, help="Limit to one promoter's bouts.")
+    parser.add_argument("--event-from", type=datetime.fromisoformat, help="Inclusive ISO-8601 bound with offset.")
+    parser.add_argument("--event-to", type=datetime.fromisoformat, help="Exclusive ISO-8601 bound with offset.")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="csv")
+    parser.add_argument("--output", type=Path, help="File to write; defaults to standard output.")
+    parser.add_argument(
+        "--database-url", default=settings.database_url, help="SQLAlchemy URL; defaults to DATABASE_URL."
+    )
+    args = parser.parse_args(argv)
+
+    scope = SettlementReportScope(
+        promoter_user_id=args.promoter_user_id, event_from=args.event_from, event_to=args.event_to
+    )
+    engine = create_engine(args.database_url, future=True)
+    try:
+        with sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)() as session:
+            service = SettlementReportService(session=session)
+            try:
+                rows = service.rows(args.report, scope)
+            except ValueError as exc:
+                print(f"report rejected: {exc}", file=sys.stderr)
+                return 1
+            output = args.output.open("wb") if args.output is not None else sys.stdout.buffer
+            try:
+                for chunk in encode_report(rows, columns=service.columns(args.report), fmt=args.format):
+                    output.write(chunk)
+            finally:
+                if args.output is not None:
+                    output.close()
+                else:
+                    output.flush()
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 import uuid
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Session
 
-from app.integrations.xaman_service import XamanPayloadStatus, XamanService
+from app import integrations
+from app.integrations import get_xaman_service
 from app.models.audit_log import AuditLog
 from app.models.bout import Bout
 from app.models.enums import EscrowKind
@@ -14,6 +15,11 @@ from app.models.escrow import Escrow
 from app.repositories.audit_log_repository import AuditLogRepository
 from app.repositories.bout_repository import BoutRepository
 from app.repositories.escrow_repository import EscrowRepository
+from app.services.bout_events import queue_bout_event
+from app.services.bout_summaries import refresh_bout_summary
+
+if TYPE_CHECKING:
+    from app.integrations.xaman_service import XamanPayloadStatus, XamanService
 
 
 @dataclass(frozen=True)
@@ -28,7 +34,7 @@ class SigningReconciliationOutcome:
 @dataclass
 class SigningReconciliationService:
     session: Session
-    xaman_service: XamanService = field(default_factory=XamanService.from_settings)
+    xaman_service: XamanService = field(default_factory=get_xaman_service)
     bouts: BoutRepository = field(init=False)
     escrows: EscrowRepository = field(init=False)
     audit_logs: AuditLogRepository = field(init=False)
@@ -92,7 +98,9 @@ class SigningReconciliationService:
         bout = self.bouts.get(bout_id=bout_id)
         if bout is None:
             raise ValueError("bout_not_found")
-        escrow = self.escrows.get_for_bout_kind(bout_id=bout_id, escrow_kind=escrow_kind)
+        # All of the bout's escrows, not just this one: a failure change rewrites the summary from them.
+        bout_escrows = self.escrows.list_for_bout(bout_id=bout_id)
+        escrow = next((item for item in bout_escrows if item.kind == escrow_kind), None)
         if escrow is None:
             raise ValueError("escrow_not_found")
 
@@ -102,7 +110,9 @@ class SigningReconciliationService:
             observed_tx_hash=observed_tx_hash,
         )
         self._apply_failure_classification(
+            bout=bout,
             escrow=escrow,
+            bout_escrows=bout_escrows,
             payload_id=status_result.payload_id,
             status=status_result.status,
             tx_hash=status_result.tx_hash,
@@ -136,30 +146,42 @@ class SigningReconciliationService:
     def _apply_failure_classification(
         self,
         *,
+        bout: Bout,
         escrow: Escrow,
+        bout_escrows: list[Escrow],
         payload_id: str,
         status: XamanPayloadStatus,
         tx_hash: str | None,
     ) -> None:
-        if status == XamanPayloadStatus.DECLINED:
+        statuses = integrations.XamanPayloadStatus
+        if status == statuses.DECLINED:
             escrow.failure_code = "signing_declined"
             escrow.failure_reason = _build_signing_failure_reason(
                 payload_id=payload_id,
                 signing_status=status,
                 tx_hash=tx_hash,
             )
+            refresh_bout_summary(session=self.session, bout=bout, escrows=bout_escrows)
+            queue_bout_event(
+                self.session, event_type="escrow_failed", bout=bout, escrow=escrow, failure_code="signing_declined"
+            )
             return
-        if status == XamanPayloadStatus.EXPIRED:
+        if status == statuses.EXPIRED:
             escrow.failure_code = "signing_expired"
             escrow.failure_reason = _build_signing_failure_reason(
                 payload_id=payload_id,
                 signing_status=status,
                 tx_hash=tx_hash,
             )
+            refresh_bout_summary(session=self.session, bout=bout, escrows=bout_escrows)
+            queue_bout_event(
+                self.session, event_type="escrow_failed", bout=bout, escrow=escrow, failure_code="signing_expired"
+            )
             return
-        if status == XamanPayloadStatus.SIGNED and escrow.failure_code in {"signing_declined", "signing_expired"}:
+        if status == statuses.SIGNED and escrow.failure_code in {"signing_declined", "signing_expired"}:
             escrow.failure_code = None
             escrow.failure_reason = None
+            refresh_bout_summary(session=self.session, bout=bout, escrows=bout_escrows)
 
     def _append_audit_entry(
         self,
@@ -177,17 +199,18 @@ class SigningReconciliationService:
                 entity_type="escrow",
                 entity_id=entity_id,
                 outcome=outcome,
-                details_json=json.dumps(details, separators=(",", ":"), sort_keys=True, ensure_ascii=True),
+                details=details,
             )
         )
 
 
 def _status_to_outcome(status: XamanPayloadStatus) -> str:
-    if status == XamanPayloadStatus.OPEN:
+    statuses = integrations.XamanPayloadStatus
+    if status == statuses.OPEN:
         return "pending"
-    if status in {XamanPayloadStatus.DECLINED, XamanPayloadStatus.EXPIRED}:
+    if status in {statuses.DECLINED, statuses.EXPIRED}:
         return "rejected"
-    if status == XamanPayloadStatus.SIGNED:
+    if status == statuses.SIGNED:
         return "observed"
     return "unknown"
 
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from app.models.enums import EscrowKind
+from app.models.escrow import Escrow
+from app.models.escrow_tx_payload import EscrowTxPayload
+from app.services.xrpl_escrow_service import XrplEscrowService, canonical_tx_json, tx_json_sha256
+
+ESCROW_CREATE = "EscrowCreate"
+ESCROW_CLOSE_TYPES = ("EscrowFinish", "EscrowCancel")
+SHOW_ESCROW_KINDS = frozenset({EscrowKind.SHOW_A, EscrowKind.SHOW_B})
+
+
+@dataclass(frozen=True)
+class PreparedTx:
+    """An unsigned transaction with the SHA-256 of its canonical JSON, as served by the prepare endpoints."""
+
+    tx: dict[str, Any]
+    sha256: str
+
+    @classmethod
+    def from_tx(cls, tx: dict[str, Any]) -> PreparedTx:
+        return cls(tx=tx, sha256=tx_json_sha256(canonical_tx_json(tx)))
+
+    @classmethod
+    def from_payload(cls, payload: EscrowTxPayload) -> PreparedTx:
+        return cls(tx=json.loads(payload.tx_json), sha256=payload.tx_sha256)
+
+
+def materialize_tx_payload(*, escrow: Escrow, tx: dict[str, Any]) -> EscrowTxPayload:
+    if escrow.id is None:
+        escrow.id = uuid.uuid4()
+    canonical = canonical_tx_json(tx)
+    return EscrowTxPayload(
+        id=uuid.uuid4(),
+        escrow_id=escrow.id,
+        bout_id=escrow.bout_id,
+        transaction_type=tx["TransactionType"],
+        tx_json=canonical,
+        tx_sha256=tx_json_sha256(canonical),
+    )
+
+
+def materialize_close_payloads(*, escrow: Escrow, xrpl_service: XrplEscrowService) -> list[EscrowTxPayload]:
+    """Close payloads that can be stored as soon as an escrow is created, before any result exists.
+
+    Show escrows get their (unconditional) finish. Bonus escrows get only their cancel, where CancelAfter is set:
+    a bonus finish carries the fulfillment, so it is built for the winner alone, at result entry.
+    """
+    payloads = []
+    if escrow.kind in SHOW_ESCROW_KINDS:
+        payloads.append(
+            materialize_tx_payload(
+                escrow=escrow, tx=xrpl_service.build_escrow_finish_tx(escrow=escrow, fulfillment_hex=None)
+            )
+        )
+    elif escrow.cancel_after_ripple is not None:
+        payloads.append(materialize_tx_payload(escrow=escrow, tx=xrpl_service.build_escrow_cancel_tx(escrow)))
+    return payloads
+
+
+def materialize_winner_bonus_finish(
+    *, escrow: Escrow, fulfillment_hex: str, xrpl_service: XrplEscrowService
+) -> EscrowTxPayload:
+    return materialize_tx_payload(
+        escrow=escrow, tx=xrpl_service.build_escrow_finish_tx(escrow=escrow, fulfillment_hex=fulfillment_hex)
+    )
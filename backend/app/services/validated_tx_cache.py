@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from typing import Any, Protocol
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.models.validated_transaction import ValidatedTransaction
+from app.repositories.validated_transaction_repository import ValidatedTransactionRepository
+
+_LOOKUPS = registry.counter(
+    "ringledger_validated_tx_lookups_total",
+    "Validated XRPL transaction lookups by the tier that answered (memory, database, ledger, missing).",
+)
+
+
+class LedgerTxSource(Protocol):
+    def tx(self, tx_hash: str) -> dict[str, Any] | None: ...
+
+    def tx_many(self, tx_hashes: Iterable[str]) -> dict[str, dict[str, Any] | None]: ...
+
+
+@dataclass(frozen=True)
+class ValidatedTx:
+    """The subset of a validated rippled ``tx`` result that escrow confirmation and audits rely on."""
+
+    tx_hash: str
+    transaction_type: str
+    engine_result: str
+    account: str
+    destination: str | None = None
+    owner: str | None = None
+    sequence: int | None = None
+    offer_sequence: int | None = None
+    amount_drops: int | None = None
+    finish_after_ripple: int | None = None
+    cancel_after_ripple: int | None = None
+    condition_hex: str | None = None
+    fulfillment_hex: str | None = None
+    close_time_ripple: int | None = None
+    ledger_index: int | None = None
+
+    @classmethod
+    def from_ledger_result(cls, result: dict[str, Any]) -> ValidatedTx | None:
+        """Snapshot a ``tx`` result; None unless the transaction is in a validated ledger (and thus immutable)."""
+        if result.get("validated") is not True or not isinstance(result.get("hash"), str):
+            return None
+        tx_json = result.get("tx_json")
+        tx = tx_json if isinstance(tx_json, dict) else result
+        meta = result.get("meta")
+        engine_result = meta.get("TransactionResult") if isinstance(meta, dict) else None
+        amount = tx.get("Amount")
+        sequence = _int_or_none(tx.get("Sequence"))
+        if not sequence:
+            sequence = _int_or_none(tx.get("TicketSequence"))
+        close_time = _int_or_none(result.get("date"))
+        return cls(
+            tx_hash=result["hash"].upper(),
+            transaction_type=str(tx.get("TransactionType") or ""),
+            engine_result=engine_result if isinstance(engine_result, str) else "unknown",
+            account=str(tx.get("Account") or ""),
+            destination=_str_or_none(tx.get("Destination")),
+            owner=_str_or_none(tx.get("Owner")),
+            sequence=sequence,
+            offer_sequence=_int_or_none(tx.get("OfferSequence")),
+            amount_drops=int(amount) if isinstance(amount, str) and amount.isdigit() else None,
+            finish_after_ripple=_int_or_none(tx.get("FinishAfter")),
+            cancel_after_ripple=_int_or_none(tx.get("CancelAfter")),
+            condition_hex=_str_or_none(tx.get("Condition")),
+            fulfillment_hex=_str_or_none(tx.get("Fulfillment")),
+            close_time_ripple=close_time if close_time is not None else _int_or_none(tx.get("date")),
+            ledger_index=_int_or_none(result.get("ledger_index")),
+        )
+
+    @classmethod
+    def from_row(cls, row: ValidatedTransaction) -> ValidatedTx:
+        return cls(**{name: getattr(row, name) for name in cls.__dataclass_fields__})
+
+    def as_row(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def as_ledger_result(self) -> dict[str, Any]:
+        """Rebuild the API v1 ``tx`` result shape so ledger mappers treat cached and fetched data identically."""
+        fields: dict[str, Any] = {
+            "TransactionType": self.transaction_type,
+            "Account": self.account,
+            "Destination": self.destination,
+            "Owner": self.owner,
+            "Sequence": self.sequence,
+            "OfferSequence": self.offer_sequence,
+            "Amount": str(self.amount_drops) if self.amount_drops is not None else None,
+            "FinishAfter": self.finish_after_ripple,
+            "CancelAfter": self.cancel_after_ripple,
+            "Condition": self.condition_hex,
+            "Fulfillment": self.fulfillment_hex,
+        }
+        result = {name: value for name, value in fields.items() if value is not None}
+        result.update(
+            hash=self.tx_hash,
+            validated=True,
+            meta={"TransactionResult": self.engine_result},
+            date=self.close_time_ripple,
+            ledger_index=self.ledger_index,
+        )
+        return result
+
+
+class ValidatedTxMemoryCache:
+    """Thread-safe in-process LRU of validated transactions shared by every request."""
+
+    def __init__(self, *, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, ValidatedTx] = OrderedDict()
+
+    def get(self, tx_hash: str) -> ValidatedTx | None:
+        with self._lock:
+            entry = self._entries.get(tx_hash)
+            if entry is not None:
+                self._entries.move_to_end(tx_hash)
+            return entry
+
+    def put(self, entry: ValidatedTx) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[entry.tx_hash] = entry
+            self._entries.move_to_end(entry.tx_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass
+class ValidatedTxLookup:
+    """Read-through ledger source: memory LRU, then ``validated_transactions``, then the XRPL node.
+
+    Only validated results are cached; unvalidated or unknown hashes always go back to the ledger.
+    """
+
+    session: Session
+    ledger: LedgerTxSource
+    memory: ValidatedTxMemoryCache
+
+    def tx(self, tx_hash: str) -> dict[str, Any] | None:
+        return self.tx_many([tx_hash])[tx_hash]
+
+    def tx_many(self, tx_hashes: Iterable[str]) -> dict[str, dict[str, Any] | None]:
+        requested = list(dict.fromkeys(tx_hashes))
+        found: dict[str, ValidatedTx] = {}
+        for tx_hash in requested:
+            cached = self.memory.get(tx_hash.upper())
+            if cached is not None:
+                found[tx_hash] = cached
+                _LOOKUPS.inc(tier="memory")
+
+        pending = [tx_hash for tx_hash in requested if tx_hash not in found]
+        if pending:
+            rows = ValidatedTransactionRepository(session=self.session).list_by_hashes(
+                tx_hashes=[tx_hash.upper() for tx_hash in pending]
+            )
+            by_hash = {row.tx_hash: ValidatedTx.from_row(row) for row in rows}
+            for tx_hash in pending:
+                stored = by_hash.get(tx_hash.upper())
+                if stored is not None:
+                    found[tx_hash] = stored
+                    self.memory.put(stored)
+                    _LOOKUPS.inc(tier="database")
+
+        results: dict[str, dict[str, Any] | None] = {
+            tx_hash: entry.as_ledger_result() for tx_hash, entry in found.items()
+        }
+        pending = [tx_hash for tx_hash in requested if tx_hash not in found]
+        if pending:
+            fetched = self.ledger.tx_many(pending)
+            new_rows: list[dict[str, Any]] = []
+            for tx_hash in pending:
+                result = fetched.get(tx_hash)
+                results[tx_hash] = result
+                entry = ValidatedTx.from_ledger_result(result) if result is not None else None
+                _LOOKUPS.inc(tier="ledger" if result is not None else "missing")
+                if entry is not None:
+                    self.memory.put(entry)
+                    new_rows.append(entry.as_row())
+            ValidatedTransactionRepository(session=self.session).insert_missing(rows=new_rows)
+        return {tx_hash: results[tx_hash] for tx_hash in requested}
+
+
+def build_ledger_tx_source(*, session: Session, ledger: LedgerTxSource | None) -> ValidatedTxLookup | None:
+    """Wrap the XRPL client (None in client verification mode) with the shared validated-tx cache tiers."""
+    if ledger is None:
+        return None
+    return ValidatedTxLookup(session=session, ledger=ledger, memory=get_shared_validated_tx_memory())
+
+
+_shared_memory: ValidatedTxMemoryCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_validated_tx_memory() -> ValidatedTxMemoryCache:
+    global _shared_memory
+    with _shared_lock:
+        if _shared_memory is None or _shared_memory.max_entries != settings.xrpl_tx_cache_size:
+            _shared_memory = ValidatedTxMemoryCache(max_entries=settings.xrpl_tx_cache_size)
+        return _shared_memory
+
+
+def _int_or_none(value: Any) -> int | None:
+    if isinstance(value, bool) or not isinstance(value, int):
+        return None
+    return value
+
+
+def _str_or_none(value: Any) -> str | None:
+    return value if isinstance(value, str) and value else None
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any
 
+from app.core.tracing import traced
 from app.models.escrow import Escrow
 
 
@@ -23,6 +26,7 @@ class EscrowCreateConfirmation:
     finish_after_ripple: int
     cancel_after_ripple: int | None
     condition_hex: str | None
+    transaction_type: str | None = None
 
 
 class EscrowPayoutAction(StrEnum):
@@ -86,11 +90,14 @@ class XrplEscrowService:
         }
 
     @staticmethod
+    @traced("xrpl.validate_escrow_create_confirmation")
     def validate_escrow_create_confirmation(*, escrow: Escrow, confirmation: EscrowCreateConfirmation) -> None:
         if not confirmation.validated:
             raise XrplEscrowValidationError("ledger_tx_not_validated")
         if confirmation.engine_result != "tesSUCCESS":
             raise XrplEscrowValidationError("ledger_tx_not_success")
+        if confirmation.transaction_type is not None and confirmation.transaction_type != "EscrowCreate":
+            raise XrplEscrowValidationError("ledger_transaction_type_mismatch")
         if confirmation.owner_address != escrow.owner_address:
             raise XrplEscrowValidationError("ledger_owner_address_mismatch")
         if confirmation.destination_address != escrow.destination_address:
@@ -108,6 +115,7 @@ class XrplEscrowService:
             raise XrplEscrowValidationError("ledger_condition_mismatch")
 
     @staticmethod
+    @traced("xrpl.validate_payout_confirmation")
     def validate_payout_confirmation(
         *,
         escrow: Escrow,
@@ -149,6 +157,89 @@ class XrplEscrowService:
             raise XrplEscrowValidationError("ledger_unexpected_fulfillment")
 
 
+def canonical_tx_json(tx: dict[str, Any]) -> str:
+    """Stable serialization of an unsigned transaction, used to compare and store prepared payloads."""
+    return json.dumps(tx, separators=(",", ":"), sort_keys=True, ensure_ascii=True)
+
+
+def tx_json_sha256(canonical_json: str) -> str:
+    """Hex SHA-256 of a ``canonical_tx_json`` string, served alongside the payload so clients can verify it."""
+    return hashlib.sha256(canonical_json.encode("ascii")).hexdigest()
+
+
+def escrow_create_confirmation_from_ledger(
+    *, tx_hash: str, tx_result: dict[str, Any] | None
+) -> EscrowCreateConfirmation:
+    """Map a rippled ``tx`` result (API v1 or v2 shape) onto the confirmation the validators check.
+
+    A missing transaction (``None``) maps to an unvalidated confirmation so callers get the usual timeout class.
+    """
+    result = tx_result or {}
+    tx = _ledger_tx_fields(result)
+    sequence = _ledger_int(tx.get("Sequence"))
+    if not sequence:
+        sequence = _ledger_int(tx.get("TicketSequence"))
+    amount = tx.get("Amount")
+    return EscrowCreateConfirmation(
+        tx_hash=_ledger_tx_hash(result, fallback=tx_hash),
+        offer_sequence=sequence or 0,
+        validated=result.get("validated") is True,
+        engine_result=_ledger_engine_result(result),
+        owner_address=str(tx.get("Account") or ""),
+        destination_address=str(tx.get("Destination") or ""),
+        amount_drops=int(amount) if isinstance(amount, str) and amount.isdigit() else -1,
+        finish_after_ripple=_ledger_int(tx.get("FinishAfter")) or 0,
+        cancel_after_ripple=_ledger_int(tx.get("CancelAfter")),
+        condition_hex=tx.get("Condition") if isinstance(tx.get("Condition"), str) else None,
+        transaction_type=str(tx.get("TransactionType") or ""),
+    )
+
+
+def payout_confirmation_from_ledger(*, tx_hash: str, tx_result: dict[str, Any] | None) -> EscrowPayoutConfirmation:
+    """Map a rippled ``tx`` result for an EscrowFinish/EscrowCancel onto a payout confirmation."""
+    result = tx_result or {}
+    tx = _ledger_tx_fields(result)
+    close_time = _ledger_int(result.get("date"))
+    if close_time is None:
+        close_time = _ledger_int(tx.get("date"))
+    return EscrowPayoutConfirmation(
+        tx_hash=_ledger_tx_hash(result, fallback=tx_hash),
+        validated=result.get("validated") is True,
+        engine_result=_ledger_engine_result(result),
+        transaction_type=str(tx.get("TransactionType") or ""),
+        owner_address=str(tx.get("Owner") or ""),
+        offer_sequence=_ledger_int(tx.get("OfferSequence")) or 0,
+        close_time_ripple=close_time or 0,
+        fulfillment_hex=tx.get("Fulfillment") if isinstance(tx.get("Fulfillment"), str) else None,
+    )
+
+
+def _ledger_tx_fields(result: dict[str, Any]) -> dict[str, Any]:
+    tx_json = result.get("tx_json")
+    return tx_json if isinstance(tx_json, dict) else result
+
+
+def _ledger_tx_hash(result: dict[str, Any], *, fallback: str) -> str:
+    tx_hash = result.get("hash")
+    return tx_hash.upper() if isinstance(tx_hash, str) and tx_hash else fallback
+
+
+def _ledger_engine_result(result: dict[str, Any]) -> str:
+    if not result:
+        return "txnNotFound"
+    meta = result.get("meta")
+    engine_result = meta.get("TransactionResult") if isinstance(meta, dict) else None
+    return engine_result if isinstance(engine_result, str) else "unknown"
+
+
+def _ledger_int(value: Any) -> int | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    return None
+
+
 def _normalize_optional_hex(value: str | None) -> str | None:
     if value is None:
         return None
@@ -1,5 +1,6 @@
 -- FightPurse MVP initial schema (PostgreSQL)
 -- R-02, R-03, R-04, R-07, R-09 foundation
+-- Mirrors the Alembic head (backend/alembic/versions); change both together.
 
 CREATE TYPE user_role AS ENUM ('promoter', 'fighter', 'management', 'admin');
 CREATE TYPE bout_status AS ENUM (
@@ -80,7 +81,7 @@ CREATE TABLE audit_log (
   entity_type VARCHAR(64) NOT NULL,
   entity_id VARCHAR(128) NOT NULL,
   outcome VARCHAR(32) NOT NULL,
-  details_json TEXT NULL,
+  details JSONB NULL,
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
@@ -90,15 +91,113 @@ CREATE TABLE idempotency_keys (
   idempotency_key VARCHAR(128) NOT NULL,
   request_hash VARCHAR(128) NOT NULL,
   response_code INTEGER NOT NULL,
-  response_body TEXT NOT NULL,
+  response_body BYTEA NOT NULL,
+  response_encoding VARCHAR(16) NOT NULL DEFAULT 'identity',
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
   CONSTRAINT uq_idempotency_scope_key UNIQUE (scope, idempotency_key)
 );
 
-CREATE INDEX idx_bouts_promoter_user_id ON bouts (promoter_user_id);
+CREATE TABLE validated_transactions (
+  tx_hash VARCHAR(128) PRIMARY KEY,
+  transaction_type VARCHAR(32) NOT NULL,
+  engine_result VARCHAR(32) NOT NULL,
+  account VARCHAR(64) NOT NULL,
+  destination VARCHAR(64) NULL,
+  owner VARCHAR(64) NULL,
+  sequence BIGINT NULL,
+  offer_sequence BIGINT NULL,
+  amount_drops BIGINT NULL,
+  finish_after_ripple INTEGER NULL,
+  cancel_after_ripple INTEGER NULL,
+  condition_hex VARCHAR(1024) NULL,
+  fulfillment_hex VARCHAR(4096) NULL,
+  close_time_ripple BIGINT NULL,
+  ledger_index BIGINT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE escrow_deadlines (
+  id UUID PRIMARY KEY,
+  escrow_id UUID NOT NULL REFERENCES escrows(id),
+  bout_id UUID NOT NULL REFERENCES bouts(id),
+  action VARCHAR(16) NOT NULL,
+  status VARCHAR(32) NOT NULL,
+  due_at_ripple INTEGER NOT NULL,
+  attempts INTEGER NOT NULL,
+  unsigned_tx_json TEXT NULL,
+  xaman_sign_request_json TEXT NULL,
+  last_error VARCHAR(64) NULL,
+  prepared_at TIMESTAMPTZ NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  CONSTRAINT uq_escrow_deadlines_escrow_action UNIQUE (escrow_id, action)
+);
+
+CREATE TABLE escrow_tx_payloads (
+  id UUID PRIMARY KEY,
+  escrow_id UUID NOT NULL REFERENCES escrows(id),
+  bout_id UUID NOT NULL REFERENCES bouts(id),
+  transaction_type VARCHAR(32) NOT NULL,
+  tx_json TEXT NOT NULL,
+  tx_sha256 VARCHAR(64) NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  CONSTRAINT uq_escrow_tx_payloads_escrow_type UNIQUE (escrow_id, transaction_type)
+);
+
+CREATE TABLE bout_summaries (
+  bout_id UUID PRIMARY KEY REFERENCES bouts(id),
+  promoter_user_id UUID NOT NULL REFERENCES users(id),
+  bout_status VARCHAR(32) NOT NULL,
+  winner VARCHAR(8) NULL,
+  locked_drops BIGINT NOT NULL,
+  paid_drops BIGINT NOT NULL,
+  cancelled_drops BIGINT NOT NULL,
+  show_a_status VARCHAR(32) NOT NULL,
+  show_b_status VARCHAR(32) NOT NULL,
+  bonus_a_status VARCHAR(32) NOT NULL,
+  bonus_b_status VARCHAR(32) NOT NULL,
+  last_failure_code VARCHAR(64) NULL,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE outbox_events (
+  id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+  event_type VARCHAR(64) NOT NULL,
+  bout_id UUID NOT NULL,
+  payload_json TEXT NOT NULL,
+  traceparent VARCHAR(55) NULL,
+  status VARCHAR(16) NOT NULL,
+  attempts INTEGER NOT NULL,
+  available_at TIMESTAMPTZ NOT NULL,
+  last_error VARCHAR(256) NULL,
+  dispatched_at TIMESTAMPTZ NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE bout_archives (
+  bout_id UUID PRIMARY KEY,
+  promoter_user_id UUID NOT NULL REFERENCES users(id),
+  event_datetime_utc TIMESTAMPTZ NOT NULL,
+  format_version INTEGER NOT NULL,
+  document BYTEA NOT NULL,
+  archived_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
 CREATE INDEX idx_bouts_event_datetime_utc ON bouts (event_datetime_utc);
 CREATE INDEX idx_bouts_status ON bouts (status);
-CREATE INDEX idx_escrows_bout_id ON escrows (bout_id);
 CREATE INDEX idx_escrows_status ON escrows (status);
 CREATE INDEX idx_escrows_owner_offer_sequence ON escrows (owner_address, offer_sequence);
 CREATE INDEX idx_fighter_profiles_xrpl_address ON fighter_profiles (xrpl_address);
+-- Keyset listing walks (promoter, [status,] event time, id); the INCLUDE columns make it index-only.
+CREATE INDEX idx_bouts_promoter_event_id ON bouts (promoter_user_id, event_datetime_utc, id) INCLUDE (status, winner, fighter_a_user_id, fighter_b_user_id);
+CREATE INDEX idx_bouts_promoter_status_event_id ON bouts (promoter_user_id, status, event_datetime_utc, id) INCLUDE (winner, fighter_a_user_id, fighter_b_user_id);
+CREATE INDEX idx_escrows_bout_status ON escrows (bout_id, status);
+CREATE UNIQUE INDEX uq_escrows_create_tx_hash ON escrows (create_tx_hash) WHERE create_tx_hash IS NOT NULL;
+CREATE UNIQUE INDEX uq_escrows_close_tx_hash ON escrows (close_tx_hash) WHERE close_tx_hash IS NOT NULL;
+CREATE INDEX idx_audit_log_entity ON audit_log (entity_type, entity_id);
+CREATE INDEX idx_audit_log_details ON audit_log USING gin (details jsonb_path_ops);
+CREATE INDEX idx_escrow_deadlines_status_due ON escrow_deadlines (status, due_at_ripple);
+CREATE INDEX ix_escrow_deadlines_bout_id ON escrow_deadlines (bout_id);
+CREATE INDEX ix_escrow_tx_payloads_bout_id ON escrow_tx_payloads (bout_id);
+CREATE INDEX ix_bout_summaries_promoter_user_id ON bout_summaries (promoter_user_id);
+CREATE INDEX idx_outbox_events_status_available ON outbox_events (status, available_at, id);
+CREATE INDEX ix_bout_archives_promoter_user_id ON bout_archives (promoter_user_id);
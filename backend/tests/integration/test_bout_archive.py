@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.main import create_app
+from app.middleware.idempotency import PAYOUT_CONFIRM_OPERATION, build_confirm_scope
+from app.models.audit_log import AuditLog
+from app.models.bout import Bout
+from app.models.bout_archive import BoutArchive
+from app.models.bout_summary import BoutSummary
+from app.models.enums import BoutStatus, BoutWinner, EscrowStatus, UserRole
+from app.models.escrow import Escrow
+from app.models.escrow_tx_payload import EscrowTxPayload
+from app.models.idempotency_key import IdempotencyKey
+from app.models.user import User
+from app.services.bout_archive import BoutArchiver
+from app.services.bout_service import BoutDraft, BoutService
+
+_NOW = datetime(2026, 10, 19, 12, 0, tzinfo=UTC).timestamp()
+_OLD_EVENT = datetime(2025, 3, 1, 20, 0, tzinfo=UTC)
+_RECENT_EVENT = datetime(2026, 9, 1, 20, 0, tzinfo=UTC)
+
+
+class BoutArchiveTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.promoter_id, self.other_promoter_id, self.fighter_a_id, self.fighter_b_id = self._seed_users()
+
+        self.init_db_patcher = patch("app.main.init_db")
+        self.init_db_patcher.start()
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._override_get_session
+        self.client = TestClient(self.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self.app.dependency_overrides.clear()
+        self.init_db_patcher.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_old_closed_bouts_move_to_the_archive_and_stay_readable(self) -> None:
+        old_closed, old_open, recent_closed = self._seed_bouts([_OLD_EVENT, _OLD_EVENT, _RECENT_EVENT])
+        self._close(old_closed, recent_closed)
+        detail_before = self.client.get(f"/bouts/{old_closed}", headers=self._headers(self.promoter_id)).json()
+        summary_before = self.client.get(f"/bouts/{old_closed}/summary", headers=self._headers(self.promoter_id))
+
+        archived = BoutArchiver(session_factory=self.SessionLocal, retention_days=365, clock=lambda: _NOW).run()
+
+        self.assertEqual(archived, 1)
+        with Session(self.engine) as session:
+            self.assertEqual(session.scalars(select(BoutArchive.bout_id)).all(), [old_closed])
+            self.assertEqual(set(session.scalars(select(Bout.id))), {old_open, recent_closed})
+            for model in (Escrow, EscrowTxPayload, BoutSummary):
+                self.assertEqual(session.scalar(select(func.count()).where(model.bout_id == old_closed)), 0)
+            self.assertEqual(
+                sorted(session.scalars(select(AuditLog.entity_id))), sorted([str(old_open), str(recent_closed)])
+            )
+            self.assertEqual(
+                session.scalars(select(IdempotencyKey.scope)).all(),
+                [build_confirm_scope(operation=PAYOUT_CONFIRM_OPERATION, bout_id=recent_closed)],
+            )
+
+        detail_after = self.client.get(f"/bouts/{old_closed}", headers=self._headers(self.promoter_id))
+        summary_after = self.client.get(f"/bouts/{old_closed}/summary", headers=self._headers(self.promoter_id))
+        foreign = self.client.get(f"/bouts/{old_closed}", headers=self._headers(self.other_promoter_id))
+        self.assertEqual(detail_after.status_code, 200, msg=detail_after.text)
+        self.assertEqual(_utc_naive(detail_after.json()), _utc_naive(detail_before))
+        self.assertEqual(_utc_naive(summary_after.json()), _utc_naive(summary_before.json()))
+        self.assertEqual(foreign.status_code, 404)
+
+    def test_archiver_works_in_bounded_batches(self) -> None:
+        bout_ids = self._seed_bouts([_OLD_EVENT] * 5)
+        self._close(*bout_ids)
+        archiver = BoutArchiver(session_factory=self.SessionLocal, retention_days=365, batch_size=2, clock=lambda: _NOW)
+
+        self.assertEqual(archiver.run(max_batches=2), 4)
+        self.assertEqual(archiver.run(), 1)
+        self.assertEqual(archiver.archive_batch(), 0)
+        with Session(self.engine) as session:
+            self.assertEqual(session.scalar(select(func.count()).select_from(Bout)), 0)
+            self.assertEqual(session.scalar(select(func.count()).select_from(BoutArchive)), 5)
+
+    def _close(self, *bout_ids: uuid.UUID) -> None:
+        """Jump bouts straight to a paid-out, closed state with the audit and replay rows a real close leaves."""
+        with Session(self.engine) as session:
+            session.execute(
+                update(Bout).where(Bout.id.in_(bout_ids)).values(status=BoutStatus.CLOSED, winner=BoutWinner.A)
+            )
+            for escrow in session.scalars(select(Escrow).where(Escrow.bout_id.in_(bout_ids))):
+                escrow.status = EscrowStatus.FINISHED
+                escrow.create_tx_hash = f"TXARCHIVECREATE{escrow.id.hex.upper()}"
+                escrow.close_tx_hash = f"TXARCHIVECLOSE{escrow.id.hex.upper()}"
+            session.execute(
+                update(BoutSummary)
+                .where(BoutSummary.bout_id.in_(bout_ids))
+                .values(bout_status=BoutStatus.CLOSED, winner=BoutWinner.A, paid_drops=2_700_000)
+            )
+            for bout_id in bout_ids:
+                session.add(
+                    IdempotencyKey(
+                        scope=build_confirm_scope(operation=PAYOUT_CONFIRM_OPERATION, bout_id=bout_id),
+                        idempotency_key="archive-key",
+                        request_hash="0" * 64,
+                        response_code=200,
+                        response_body=b"{}",
+                    )
+                )
+            session.commit()
+
+    def _seed_bouts(self, events: list[datetime]) -> list[uuid.UUID]:
+        with Session(self.engine) as session:
+            planned = BoutService(session=session).create_card(
+                promoter_user_id=self.promoter_id,
+                drafts=[
+                    BoutDraft(
+                        fighter_a_user_id=self.fighter_a_id,
+                        fighter_b_user_id=self.fighter_b_id,
+                        event_datetime_utc=event,
+                        promoter_owner_address="rPromoterArchive",
+                        fighter_a_destination="rFighterArchiveA",
+                        fighter_b_destination="rFighterArchiveB",
+                        show_a_drops=1_000_000,
+                        show_b_drops=1_200_000,
+                        bonus_a_drops=250_000,
+                        bonus_b_drops=250_000,
+                    )
+                    for event in events
+                ],
+            )
+            bout_ids = [item.bout.id for item in planned]
+            for bout_id in bout_ids:
+                session.add(
+                    AuditLog(
+                        action="bout_result_entered",
+                        entity_type="bout",
+                        entity_id=str(bout_id),
+                        outcome="success",
+                    )
+                )
+            session.commit()
+            return bout_ids
+
+    def _override_get_session(self) -> Session:
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _headers(self, promoter_id: uuid.UUID) -> dict[str, str]:
+        token = create_access_token(
+            subject=str(promoter_id),
+            email="promoter.archive@example.test",
+            role=UserRole.PROMOTER.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    def _seed_users(self) -> tuple[uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID]:
+        with Session(self.engine) as session:
+            ids = []
+            for email, role in (
+                ("promoter.archive@example.test", UserRole.PROMOTER),
+                ("promoter.archive.other@example.test", UserRole.PROMOTER),
+                ("fighter.archive.a@example.test", UserRole.FIGHTER),
+                ("fighter.archive.b@example.test", UserRole.FIGHTER),
+            ):
+                user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+                session.add(user)
+                ids.append(user.id)
+            session.commit()
+            return ids[0], ids[1], ids[2], ids[3]
+
+
+def _utc_naive(value: object) -> object:
+    """SQLite hands hot-table timestamps back naive while archived ones are restored as UTC; compare them alike."""
+    if isinstance(value, dict):
+        return {key: _utc_naive(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_utc_naive(item) for item in value]
+    if isinstance(value, str) and value.endswith("Z"):
+        return value[:-1]
+    return value
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import unittest
+import uuid
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.api.bouts_routes.bout_routes import BULK_CHUNK_LINES
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.main import create_app
+from app.models.bout import Bout
+from app.models.enums import UserRole
+from app.models.escrow import Escrow
+from app.models.user import User
+from app.services.card_import import NdjsonLineReader
+
+
+class BoutCreateApiTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.promoter_id, self.fighter_a_id, self.fighter_b_id = self._seed_users()
+
+        self.init_db_patcher = patch("app.main.init_db")
+        self.init_db_patcher.start()
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._override_get_session
+        self.client = TestClient(self.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self.app.dependency_overrides.clear()
+        self.init_db_patcher.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_post_bout_creates_draft_with_four_planned_escrows(self) -> None:
+        response = self.client.post("/bouts", headers=self._headers(UserRole.PROMOTER), json=self._bout())
+
+        self.assertEqual(response.status_code, 201, msg=response.text)
+        body = response.json()
+        self.assertEqual(body["bout_status"], "draft")
+        self.assertEqual(
+            [(item["escrow_kind"], item["escrow_status"]) for item in body["escrows"]],
+            [("show_a", "planned"), ("show_b", "planned"), ("bonus_a", "planned"), ("bonus_b", "planned")],
+        )
+        self.assertIsNone(body["escrows"][0]["cancel_after_ripple"])
+        self.assertIsNotNone(body["escrows"][2]["condition_hex"])
+        with Session(self.engine) as session:
+            self.assertEqual(
+                session.scalar(
+                    select(func.count()).select_from(Escrow).where(Escrow.bout_id == uuid.UUID(body["bout_id"]))
+                ),
+                4,
+            )
+
+    def test_post_bout_rejects_invalid_definitions(self) -> None:
+        cases = {
+            "drops_must_be_non_negative": self._bout(bonus_a_drops=-1),
+            "drops_overflow_bigint": self._bout(show_a_drops=2**63),
+            "datetime_must_be_timezone_aware": self._bout(event_datetime_utc="2026-03-01T20:00:00"),
+            "card_fighters_identical": self._bout(fighter_b_user_id=str(self.fighter_a_id)),
+        }
+        for code, bout in cases.items():
+            with self.subTest(code=code):
+                response = self.client.post("/bouts", headers=self._headers(UserRole.PROMOTER), json=bout)
+                self.assertEqual(response.status_code, 422)
+                self.assertIn(code, response.json()["detail"])
+
+        unknown = self.client.post(
+            "/bouts", headers=self._headers(UserRole.PROMOTER), json=self._bout(fighter_a_user_id=str(uuid.uuid4()))
+        )
+        forbidden = self.client.post("/bouts", headers=self._headers(UserRole.FIGHTER), json=self._bout())
+        self.assertEqual(unknown.status_code, 422)
+        self.assertEqual(forbidden.status_code, 403)
+        with Session(self.engine) as session:
+            self.assertEqual(session.scalar(select(func.count()).select_from(Bout)), 0)
+
+    def test_post_bout_reports_a_commit_conflict_without_a_created_response(self) -> None:
+        with self.engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+        def deferred_foreign_keys_session() -> Session:
+            # Deferred checks move the promoter foreign-key failure from the insert to the commit.
+            session = self.SessionLocal()
+            event.listen(
+                session,
+                "before_flush",
+                lambda flushing, _context, _instances: flushing.connection().exec_driver_sql(
+                    "PRAGMA defer_foreign_keys=ON"
+                ),
+            )
+            try:
+                yield session
+            finally:
+                session.close()
+
+        self.app.dependency_overrides[get_session] = deferred_foreign_keys_session
+        self.promoter_id = uuid.uuid4()
+        response = self.client.post("/bouts", headers=self._headers(UserRole.PROMOTER), json=self._bout())
+
+        self.assertEqual(response.status_code, 409, msg=response.text)
+        self.assertEqual(response.json()["detail"], "Bout could not be persisted safely.")
+        with Session(self.engine) as session:
+            self.assertEqual(session.scalar(select(func.count()).select_from(Bout)), 0)
+
+    def test_ndjson_bulk_reports_every_line_and_commits_valid_ones(self) -> None:
+        lines = [json.dumps(self._bout(show_a_drops=1_000_000 + index)) for index in range(BULK_CHUNK_LINES + 50)]
+        lines[3] = "{not json"
+        lines[7] = json.dumps(self._bout(show_b_drops=-5))
+        lines[BULK_CHUNK_LINES + 1] = json.dumps(self._bout(fighter_b_user_id=str(uuid.uuid4())))
+        lines[10] = ""
+        lines[11] = json.dumps({**self._bout(), "padding": "x" * 20_000})
+        body = ("\n".join(lines) + "\n").encode()
+
+        response = self.client.post(
+            "/bouts/bulk",
+            headers={**self._headers(UserRole.PROMOTER), "Content-Type": "application/x-ndjson"},
+            content=body,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        results = [json.loads(line) for line in response.text.splitlines()]
+        summary = results.pop()["summary"]
+        errors = {item["line"]: item["error"] for item in results if item["status"] == "rejected"}
+        self.assertEqual(
+            errors,
+            {
+                4: "line_json_invalid",
+                8: "drops_must_be_non_negative",
+                12: "line_too_long",
+                BULK_CHUNK_LINES + 2: "card_fighter_not_found",
+            },
+        )
+        self.assertEqual([item["line"] for item in results], [n for n in range(1, len(lines) + 1) if n != 11])
+        self.assertEqual(summary, {"created": len(lines) - 5, "rejected": 4})
+        with Session(self.engine) as session:
+            self.assertEqual(session.scalar(select(func.count()).select_from(Bout)), len(lines) - 5)
+
+    def _bout(self, **overrides: object) -> dict[str, object]:
+        return {
+            "fighter_a_user_id": str(self.fighter_a_id),
+            "fighter_b_user_id": str(self.fighter_b_id),
+            "event_datetime_utc": "2026-03-01T20:00:00+00:00",
+            "promoter_owner_address": "rPromoterApi",
+            "fighter_a_destination": "rFighterApiA",
+            "fighter_b_destination": "rFighterApiB",
+            "show_a_drops": 1_000_000,
+            "show_b_drops": 1_200_000,
+            "bonus_a_drops": 250_000,
+            "bonus_b_drops": 250_000,
+            **overrides,
+        }
+
+    def _override_get_session(self) -> Session:
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _headers(self, role: UserRole) -> dict[str, str]:
+        token = create_access_token(
+            subject=str(self.promoter_id),
+            email="promoter.api@example.test",
+            role=role.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    def _seed_users(self) -> tuple[uuid.UUID, uuid.UUID, uuid.UUID]:
+        with Session(self.engine) as session:
+            ids = []
+            for email, role in (
+                ("promoter.api@example.test", UserRole.PROMOTER),
+                ("fighter.api.a@example.test", UserRole.FIGHTER),
+                ("fighter.api.b@example.test", UserRole.FIGHTER),
+            ):
+                user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+                session.add(user)
+                ids.append(user.id)
+            session.commit()
+            return ids[0], ids[1], ids[2]
+
+
+class NdjsonLineReaderTests(unittest.TestCase):
+    def test_lines_split_across_chunks_are_numbered_and_overlong_lines_skipped(self) -> None:
+        reader = NdjsonLineReader(max_line_bytes=8)
+        stream = b'{"a":1}\n\n{"b":\n' + b"x" * 20 + b'\n{"c":3}'
+        lines = []
+        for offset in range(0, len(stream), 3):
+            lines.extend(reader.feed(stream[offset : offset + 3]))
+        lines.extend(reader.finish())
+
+        self.assertEqual(lines, [(1, b'{"a":1}'), (3, b'{"b":'), (4, None), (5, b'{"c":3}')])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.main import create_app
+from app.models.enums import EscrowKind, UserRole
+from app.models.escrow import Escrow
+from app.models.user import User
+from app.services.bout_events import bout_event_hub
+from app.services.bout_service import BoutService
+from app.services.escrow_service import EscrowService
+from app.services.xrpl_escrow_service import EscrowCreateConfirmation
+
+
+class BoutEventStreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Commits happen on a second thread while the stream is open, so use a file database rather than StaticPool.
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(
+            f"sqlite+pysqlite:///{self.tempdir.name}/events.db",
+            connect_args={"check_same_thread": False},
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.promoter_id, self.other_promoter_id = self._seed_users()
+        self.bout_id = self._create_bout(self.promoter_id)
+
+        self.init_db_patcher = patch("app.main.init_db")
+        self.init_db_patcher.start()
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._override_get_session
+        self.client = TestClient(self.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self.app.dependency_overrides.clear()
+        self.init_db_patcher.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+        self.tempdir.cleanup()
+
+    def test_bout_stream_pushes_committed_changes_and_skips_rolled_back_ones(self) -> None:
+        def changes() -> None:
+            with self.SessionLocal() as session:
+                with self.assertRaises(ValueError):
+                    self._confirm(session, EscrowKind.SHOW_A, validated=False)
+                session.commit()
+            with self.SessionLocal() as session:
+                self._confirm(session, EscrowKind.SHOW_B)
+                session.rollback()
+            with self.SessionLocal() as session:
+                self._confirm(session, EscrowKind.SHOW_A)
+                session.commit()
+
+        events = self._stream(f"/bouts/{self.bout_id}/events", self.promoter_id, changes)
+
+        self.assertEqual(
+            [(item["event"], item["escrow_kind"], item["escrow_status"]) for item in events],
+            [("escrow_failed", "show_a", "planned"), ("escrow_created", "show_a", "created")],
+        )
+        self.assertEqual(events[0]["failure_code"], "confirmation_timeout")
+
+    def test_promoter_stream_only_carries_the_promoters_bouts(self) -> None:
+        other_bout_id = self._create_bout(self.other_promoter_id)
+
+        def changes() -> None:
+            with self.SessionLocal() as session:
+                self._confirm(session, EscrowKind.SHOW_A, bout_id=other_bout_id)
+                self._confirm(session, EscrowKind.BONUS_B)
+                session.commit()
+
+        events = self._stream("/bouts/events", self.promoter_id, changes)
+
+        self.assertEqual([(item["bout_id"], item["escrow_kind"]) for item in events], [(str(self.bout_id), "bonus_b")])
+
+    def test_foreign_bout_stream_is_not_found(self) -> None:
+        response = self.client.get(f"/bouts/{self.bout_id}/events", headers=self._headers(self.other_promoter_id))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(bout_event_hub.subscriber_count, 0)
+
+    def _stream(self, path: str, promoter_id: uuid.UUID, changes) -> list[dict[str, object]]:
+        """Open the stream, apply ``changes`` once subscribed, then end every stream and parse what was sent."""
+
+        def driver() -> None:
+            deadline = time.monotonic() + 5
+            while bout_event_hub.subscriber_count == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            try:
+                changes()
+            finally:
+                time.sleep(0.05)
+                bout_event_hub.close_all()
+
+        thread = threading.Thread(target=driver)
+        thread.start()
+        response = self.client.get(path, headers=self._headers(promoter_id))
+        thread.join()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        return [json.loads(line[len("data: ") :]) for line in response.text.splitlines() if line.startswith("data: ")]
+
+    def _confirm(self, session: Session, kind: EscrowKind, *, bout_id: uuid.UUID | None = None, validated=True):
+        bout_id = bout_id or self.bout_id
+        escrow = session.scalars(select(Escrow).where(Escrow.bout_id == bout_id, Escrow.kind == kind)).one()
+        return EscrowService(session=session).confirm_escrow_create(
+            bout_id=bout_id,
+            escrow_kind=kind,
+            confirmation=EscrowCreateConfirmation(
+                tx_hash=f"TXSTREAM{kind.value.upper()}",
+                offer_sequence=8100 + list(EscrowKind).index(kind),
+                validated=validated,
+                engine_result="tesSUCCESS",
+                owner_address=escrow.owner_address,
+                destination_address=escrow.destination_address,
+                amount_drops=escrow.amount_drops,
+                finish_after_ripple=escrow.finish_after_ripple,
+                cancel_after_ripple=escrow.cancel_after_ripple,
+                condition_hex=escrow.condition_hex,
+            ),
+        )
+
+    def _create_bout(self, promoter_id: uuid.UUID) -> uuid.UUID:
+        with self.SessionLocal() as session:
+            fighter_a, fighter_b = session.scalars(select(User.id).where(User.role == UserRole.FIGHTER)).all()
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=promoter_id,
+                fighter_a_user_id=fighter_a,
+                fighter_b_user_id=fighter_b,
+                event_datetime_utc=datetime(2026, 3, 1, 20, 0, tzinfo=UTC),
+                promoter_owner_address="rPromoterStream",
+                fighter_a_destination="rFighterStreamA",
+                fighter_b_destination="rFighterStreamB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_200_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            session.commit()
+            return bout.id
+
+    def _override_get_session(self) -> Session:
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _headers(self, promoter_id: uuid.UUID) -> dict[str, str]:
+        token = create_access_token(
+            subject=str(promoter_id),
+            email="promoter.stream@example.test",
+            role=UserRole.PROMOTER.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    def _seed_users(self) -> tuple[uuid.UUID, uuid.UUID]:
+        with Session(self.engine) as session:
+            ids = []
+            for email, role in (
+                ("promoter.stream@example.test", UserRole.PROMOTER),
+                ("promoter.stream.other@example.test", UserRole.PROMOTER),
+                ("fighter.stream.a@example.test", UserRole.FIGHTER),
+                ("fighter.stream.b@example.test", UserRole.FIGHTER),
+            ):
+                user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+                session.add(user)
+                ids.append(user.id)
+            session.commit()
+            return ids[0], ids[1]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text, update
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.main import create_app
+from app.models.bout import Bout
+from app.models.enums import BoutStatus, EscrowKind, EscrowStatus, UserRole
+from app.models.escrow import Escrow
+from app.models.user import User
+from app.services.bout_service import BoutDraft, BoutService
+
+_EVENT_BASE = datetime(2026, 3, 1, 18, 0, tzinfo=UTC)
+
+
+class BoutListingApiTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.promoter_id, self.other_promoter_id, self.fighter_a_id, self.fighter_b_id = self._seed_users()
+
+        self.init_db_patcher = patch("app.main.init_db")
+        self.init_db_patcher.start()
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._override_get_session
+        self.client = TestClient(self.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self.app.dependency_overrides.clear()
+        self.init_db_patcher.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_keyset_pages_cover_every_bout_once_in_event_order(self) -> None:
+        # Two bouts per timestamp, so the id tie-breaker decides page boundaries.
+        bout_ids = self._seed_bouts(self.promoter_id, [_EVENT_BASE + timedelta(hours=index // 2) for index in range(7)])
+        self._seed_bouts(self.other_promoter_id, [_EVENT_BASE])
+
+        seen: list[dict[str, object]] = []
+        cursor = None
+        for _ in range(5):
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            response = self.client.get("/bouts", headers=self._headers(self.promoter_id), params=params)
+            self.assertEqual(response.status_code, 200, msg=response.text)
+            seen.extend(response.json()["items"])
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(sorted(item["bout_id"] for item in seen), sorted(str(bout_id) for bout_id in bout_ids))
+        keys = [(item["event_datetime_utc"], item["bout_id"]) for item in seen]
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(seen[0]["escrow_status_counts"], {"planned": 4})
+
+    def test_status_and_event_window_filters_and_escrow_counts(self) -> None:
+        early, late, later = self._seed_bouts(
+            self.promoter_id, [_EVENT_BASE, _EVENT_BASE + timedelta(days=1), _EVENT_BASE + timedelta(days=2)]
+        )
+        with Session(self.engine) as session:
+            session.execute(update(Bout).where(Bout.id == late).values(status=BoutStatus.ESCROWS_CREATED))
+            session.execute(
+                update(Escrow)
+                .where(Escrow.bout_id == late, Escrow.kind.in_([EscrowKind.SHOW_A, EscrowKind.SHOW_B]))
+                .values(status=EscrowStatus.CREATED)
+            )
+            session.commit()
+
+        by_status = self.client.get(
+            "/bouts", headers=self._headers(self.promoter_id), params={"status": "escrows_created"}
+        ).json()
+        window = self.client.get(
+            "/bouts",
+            headers=self._headers(self.promoter_id),
+            params={
+                "event_from": (_EVENT_BASE + timedelta(hours=1)).isoformat(),
+                "event_to": (_EVENT_BASE + timedelta(days=2)).isoformat(),
+            },
+        ).json()
+
+        self.assertEqual([item["bout_id"] for item in by_status["items"]], [str(late)])
+        self.assertEqual(by_status["items"][0]["escrow_status_counts"], {"created": 2, "planned": 2})
+        self.assertIsNone(by_status["next_cursor"])
+        self.assertEqual([item["bout_id"] for item in window["items"]], [str(late)])
+        self.assertNotIn(str(early), [item["bout_id"] for item in window["items"]])
+        self.assertNotIn(str(later), [item["bout_id"] for item in window["items"]])
+
+    def test_detail_is_scoped_to_the_owning_promoter_and_bad_cursors_are_rejected(self) -> None:
+        (bout_id,) = self._seed_bouts(self.promoter_id, [_EVENT_BASE])
+
+        own = self.client.get(f"/bouts/{bout_id}", headers=self._headers(self.promoter_id))
+        foreign = self.client.get(f"/bouts/{bout_id}", headers=self._headers(self.other_promoter_id))
+        bad_cursor = self.client.get("/bouts", headers=self._headers(self.promoter_id), params={"cursor": "%%%"})
+        naive = self.client.get(
+            "/bouts", headers=self._headers(self.promoter_id), params={"event_from": "2026-03-01T00:00:00"}
+        )
+
+        self.assertEqual(own.status_code, 200)
+        self.assertEqual([item["escrow_kind"] for item in own.json()["escrows"]], [kind.value for kind in EscrowKind])
+        self.assertIsNone(own.json()["escrows"][0]["create_tx_hash"])
+        self.assertEqual(foreign.status_code, 404)
+        summary = self.client.get(f"/bouts/{bout_id}/summary", headers=self._headers(self.promoter_id))
+        self.assertEqual(summary.status_code, 200)
+        self.assertEqual(
+            summary.json()["escrow_statuses"], dict.fromkeys([kind.value for kind in EscrowKind], "planned")
+        )
+        self.assertEqual(
+            self.client.get(f"/bouts/{bout_id}/summary", headers=self._headers(self.other_promoter_id)).status_code,
+            404,
+        )
+        self.assertEqual(bad_cursor.status_code, 422)
+        self.assertEqual(naive.status_code, 422)
+
+    def test_promoter_listing_uses_the_keyset_index_without_sorting(self) -> None:
+        with self.engine.connect() as connection:
+            plan = connection.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id, status, event_datetime_utc FROM bouts "
+                    "WHERE promoter_user_id = 'x' AND (event_datetime_utc, id) > ('2026-03-01', 'y') "
+                    "ORDER BY event_datetime_utc, id LIMIT 51"
+                )
+            ).all()
+            counts_plan = connection.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT bout_id, status, count(*) FROM escrows "
+                    "WHERE bout_id IN ('a', 'b') GROUP BY bout_id, status"
+                )
+            ).all()
+        detail = " ".join(str(row[-1]) for row in plan)
+        self.assertIn("idx_bouts_promoter_event_id", detail)
+        self.assertNotIn("TEMP B-TREE", detail)
+        self.assertIn("COVERING INDEX idx_escrows_bout_status", " ".join(str(row[-1]) for row in counts_plan))
+
+    def _seed_bouts(self, promoter_id: uuid.UUID, events: list[datetime]) -> list[uuid.UUID]:
+        with Session(self.engine) as session:
+            planned = BoutService(session=session).create_card(
+                promoter_user_id=promoter_id,
+                drafts=[
+                    BoutDraft(
+                        fighter_a_user_id=self.fighter_a_id,
+                        fighter_b_user_id=self.fighter_b_id,
+                        event_datetime_utc=event,
+                        promoter_owner_address="rPromoterList",
+                        fighter_a_destination="rFighterListA",
+                        fighter_b_destination="rFighterListB",
+                        show_a_drops=1_000_000,
+                        show_b_drops=1_200_000,
+                        bonus_a_drops=250_000,
+                        bonus_b_drops=250_000,
+                    )
+                    for event in events
+                ],
+            )
+            bout_ids = [item.bout.id for item in planned]
+            session.commit()
+            return bout_ids
+
+    def _override_get_session(self) -> Session:
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _headers(self, promoter_id: uuid.UUID) -> dict[str, str]:
+        token = create_access_token(
+            subject=str(promoter_id),
+            email="promoter.list@example.test",
+            role=UserRole.PROMOTER.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    def _seed_users(self) -> tuple[uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID]:
+        with Session(self.engine) as session:
+            ids = []
+            for email, role in (
+                ("promoter.list@example.test", UserRole.PROMOTER),
+                ("promoter.other@example.test", UserRole.PROMOTER),
+                ("fighter.list.a@example.test", UserRole.FIGHTER),
+                ("fighter.list.b@example.test", UserRole.FIGHTER),
+            ):
+                user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+                session.add(user)
+                ids.append(user.id)
+            session.commit()
+            return ids[0], ids[1], ids[2], ids[3]
+
+
+if __name__ == "__main__":
+    unittest.main()
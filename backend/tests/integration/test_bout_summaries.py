@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.db.base import Base
+from app.integrations.xaman_service import XamanService
+from app.models.bout_summary import BoutSummary
+from app.models.enums import BoutStatus, BoutWinner, EscrowKind, EscrowStatus, UserRole
+from app.models.escrow import Escrow
+from app.models.user import User
+from app.services.bout_service import BoutService
+from app.services.escrow_service import EscrowService
+from app.services.payout_service import PayoutService
+from app.services.signing_reconciliation_service import SigningReconciliationService
+from app.services.xrpl_escrow_service import EscrowCreateConfirmation, EscrowPayoutConfirmation
+
+_SHOW_A, _SHOW_B, _BONUS = 1_000_000, 1_200_000, 250_000
+
+
+class BoutSummaryReadModelTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.promoter_id = self._seed_users()
+
+    def tearDown(self) -> None:
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_summary_follows_every_state_change_in_the_same_transaction(self) -> None:
+        bout_id = self._create_bout()
+        drafted = self._summary(bout_id)
+        self.assertEqual(drafted.bout_status, BoutStatus.DRAFT)
+        self.assertEqual(
+            (drafted.locked_drops, drafted.paid_drops, drafted.cancelled_drops, drafted.show_a_status),
+            (0, 0, 0, "planned"),
+        )
+
+        with self.SessionLocal() as session:
+            with self.assertRaises(ValueError) as failure:
+                EscrowService(session=session).confirm_escrow_create(
+                    bout_id=bout_id,
+                    escrow_kind=EscrowKind.SHOW_A,
+                    confirmation=self._create_confirmation(session, bout_id, EscrowKind.SHOW_A, validated=False),
+                )
+            session.commit()
+        self.assertEqual(self._summary(bout_id).last_failure_code, str(failure.exception))
+        self.assertEqual(self._summary(bout_id).show_a_status, EscrowStatus.PLANNED)
+
+        with self.SessionLocal() as session:
+            service = EscrowService(session=session)
+            for kind in EscrowKind:
+                service.confirm_escrow_create(
+                    bout_id=bout_id, escrow_kind=kind, confirmation=self._create_confirmation(session, bout_id, kind)
+                )
+            session.commit()
+        created = self._summary(bout_id)
+        self.assertEqual(created.bout_status, BoutStatus.ESCROWS_CREATED)
+        self.assertEqual(created.locked_drops, _SHOW_A + _SHOW_B + 2 * _BONUS)
+        self.assertIsNone(created.last_failure_code)
+
+        with self.SessionLocal() as session:
+            payouts = PayoutService(session=session)
+            payouts.enter_bout_result(bout_id=bout_id, winner=BoutWinner.A, actor_user_id=self.promoter_id)
+            session.commit()
+        self.assertEqual((self._summary(bout_id).bout_status, self._summary(bout_id).winner), ("result_entered", "A"))
+
+        with self.SessionLocal() as session:
+            payouts = PayoutService(session=session)
+            for kind, transaction_type in ((EscrowKind.SHOW_A, "EscrowFinish"), (EscrowKind.BONUS_B, "EscrowCancel")):
+                payouts.confirm_payout(
+                    bout_id=bout_id,
+                    escrow_kind=kind,
+                    confirmation=self._payout_confirmation(session, bout_id, kind, transaction_type),
+                )
+            session.commit()
+        paying = self._summary(bout_id)
+        self.assertEqual(paying.bout_status, BoutStatus.PAYOUTS_IN_PROGRESS)
+        self.assertEqual(
+            (paying.locked_drops, paying.paid_drops, paying.cancelled_drops), (_SHOW_B + _BONUS, _SHOW_A, _BONUS)
+        )
+        self.assertEqual(
+            (paying.show_a_status, paying.show_b_status, paying.bonus_a_status, paying.bonus_b_status),
+            ("finished", "created", "created", "cancelled"),
+        )
+
+    def test_failure_code_is_the_first_outstanding_one_and_clears_when_signing_recovers(self) -> None:
+        bout_id = self._create_bout()
+        for kind, status in ((EscrowKind.BONUS_A, "expired"), (EscrowKind.SHOW_B, "declined")):
+            self._reconcile(bout_id, kind, status)
+        # Same meaning as a full rewrite: the first escrow in kind order that still has a failure.
+        self.assertEqual(self._summary(bout_id).last_failure_code, "signing_declined")
+
+        self._reconcile(bout_id, EscrowKind.SHOW_B, "signed")
+        self.assertEqual(self._summary(bout_id).last_failure_code, "signing_expired")
+        self._reconcile(bout_id, EscrowKind.BONUS_A, "signed")
+        self.assertIsNone(self._summary(bout_id).last_failure_code)
+
+    def _reconcile(self, bout_id: uuid.UUID, kind: EscrowKind, status: str) -> None:
+        with self.SessionLocal() as session:
+            SigningReconciliationService(
+                session=session, xaman_service=XamanService(mode="stub", api_base_url="", api_key=None, api_secret=None)
+            ).reconcile_escrow_create_signing(
+                bout_id=bout_id,
+                escrow_kind=kind,
+                payload_id=f"payload-{kind.value}-{status}",
+                actor_user_id=self.promoter_id,
+                observed_status=status,
+                observed_tx_hash=None,
+            )
+            session.commit()
+
+    def _summary(self, bout_id: uuid.UUID) -> BoutSummary:
+        with Session(self.engine) as session:
+            return session.scalars(select(BoutSummary).where(BoutSummary.bout_id == bout_id)).one()
+
+    def _create_bout(self) -> uuid.UUID:
+        with self.SessionLocal() as session:
+            fighter_a, fighter_b = session.scalars(select(User.id).where(User.role == UserRole.FIGHTER)).all()
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=self.promoter_id,
+                fighter_a_user_id=fighter_a,
+                fighter_b_user_id=fighter_b,
+                event_datetime_utc=datetime(2026, 3, 1, 20, 0, tzinfo=UTC),
+                promoter_owner_address="rPromoterSummary",
+                fighter_a_destination="rFighterSummaryA",
+                fighter_b_destination="rFighterSummaryB",
+                show_a_drops=_SHOW_A,
+                show_b_drops=_SHOW_B,
+                bonus_a_drops=_BONUS,
+                bonus_b_drops=_BONUS,
+            )
+            session.commit()
+            return bout.id
+
+    @staticmethod
+    def _escrow(session: Session, bout_id: uuid.UUID, kind: EscrowKind) -> Escrow:
+        return session.scalars(select(Escrow).where(Escrow.bout_id == bout_id, Escrow.kind == kind)).one()
+
+    def _create_confirmation(
+        self, session: Session, bout_id: uuid.UUID, kind: EscrowKind, *, validated: bool = True
+    ) -> EscrowCreateConfirmation:
+        escrow = self._escrow(session, bout_id, kind)
+        return EscrowCreateConfirmation(
+            tx_hash=f"TXSUMMARY{kind.value.upper()}",
+            offer_sequence=9000 + list(EscrowKind).index(kind),
+            validated=validated,
+            engine_result="tesSUCCESS",
+            owner_address=escrow.owner_address,
+            destination_address=escrow.destination_address,
+            amount_drops=escrow.amount_drops,
+            finish_after_ripple=escrow.finish_after_ripple,
+            cancel_after_ripple=escrow.cancel_after_ripple,
+            condition_hex=escrow.condition_hex,
+        )
+
+    def _payout_confirmation(
+        self, session: Session, bout_id: uuid.UUID, kind: EscrowKind, transaction_type: str
+    ) -> EscrowPayoutConfirmation:
+        escrow = self._escrow(session, bout_id, kind)
+        cancelling = transaction_type == "EscrowCancel"
+        return EscrowPayoutConfirmation(
+            tx_hash=f"TXSUMMARYCLOSE{kind.value.upper()}",
+            validated=True,
+            engine_result="tesSUCCESS",
+            transaction_type=transaction_type,
+            owner_address=escrow.owner_address,
+            offer_sequence=escrow.offer_sequence,
+            close_time_ripple=escrow.cancel_after_ripple if cancelling else escrow.finish_after_ripple,
+            fulfillment_hex=None,
+        )
+
+    def _seed_users(self) -> uuid.UUID:
+        with Session(self.engine) as session:
+            ids = []
+            for email, role in (
+                ("promoter.summary@example.test", UserRole.PROMOTER),
+                ("fighter.summary.a@example.test", UserRole.FIGHTER),
+                ("fighter.summary.b@example.test", UserRole.FIGHTER),
+            ):
+                user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+                session.add(user)
+                ids.append(user.id)
+            session.commit()
+            return ids[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.main import create_app
+from app.models.bout import Bout
+from app.models.enums import EscrowKind, UserRole
+from app.models.escrow import Escrow
+from app.models.escrow_tx_payload import EscrowTxPayload
+from app.models.user import User
+from app.services.card_import import CARD_FIELDS, main
+
+
+class CardImportIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.promoter_id, self.fighter_ids = self._seed_users(self.engine)
+
+        self.init_db_patcher = patch("app.main.init_db")
+        self.init_db_patcher.start()
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._override_get_session
+        self.client = TestClient(self.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self.app.dependency_overrides.clear()
+        self.init_db_patcher.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_csv_card_creates_every_bout_with_distinct_bonus_conditions(self) -> None:
+        response = self.client.post(
+            "/bouts/cards/import/csv",
+            headers={**self._promoter_headers(), "Content-Type": "text/csv"},
+            content=self._csv(self._rows(3)),
+        )
+
+        self.assertEqual(response.status_code, 201, msg=response.text)
+        self.assertEqual(response.json()["created"], 3)
+        with Session(self.engine) as session:
+            bouts = session.scalars(select(Bout).where(Bout.promoter_user_id == self.promoter_id)).all()
+            self.assertEqual({str(bout.id) for bout in bouts}, set(response.json()["bout_ids"]))
+            conditions = session.scalars(
+                select(Escrow.condition_hex).where(Escrow.kind.in_([EscrowKind.BONUS_A, EscrowKind.BONUS_B]))
+            ).all()
+            self.assertEqual(len(set(conditions)), 6)
+            self.assertEqual(session.scalar(select(func.count()).select_from(EscrowTxPayload)), 12)
+
+    def test_invalid_row_rejects_the_whole_card(self) -> None:
+        rows = self._rows(3)
+        rows[1]["bonus_b_drops"] = "-5"
+        csv_response = self.client.post(
+            "/bouts/cards/import/csv",
+            headers={**self._promoter_headers(), "Content-Type": "text/csv"},
+            content=self._csv(rows),
+        )
+        rows = self._rows(2)
+        rows[1]["fighter_b_user_id"] = str(uuid.uuid4())
+        json_response = self.client.post("/bouts/cards/import", headers=self._promoter_headers(), json={"bouts": rows})
+        naive_rows = self._rows(1)
+        naive_rows[0]["event_datetime_utc"] = "2026-03-01T20:00:00"
+        naive_response = self.client.post(
+            "/bouts/cards/import", headers=self._promoter_headers(), json={"bouts": naive_rows}
+        )
+
+        self.assertEqual(csv_response.status_code, 422)
+        self.assertEqual(csv_response.json()["detail"], "Bout 2 was rejected: drops_must_be_non_negative.")
+        self.assertEqual(json_response.json()["detail"], "Bout 2 was rejected: card_fighter_not_found.")
+        self.assertEqual(naive_response.json()["detail"], "Bout 1 was rejected: datetime_must_be_timezone_aware.")
+        with Session(self.engine) as session:
+            self.assertEqual(session.scalar(select(func.count()).select_from(Bout)), 0)
+
+    def test_cli_imports_json_card_and_dry_run_rolls_back(self) -> None:
+        with tempfile.TemporaryDirectory() as tempdir:
+            database_url = f"sqlite+pysqlite:///{tempdir}/cards.db"
+            engine = create_engine(database_url, future=True)
+            Base.metadata.create_all(bind=engine)
+            promoter_id, _ = self._seed_users(engine)
+            card_path = Path(tempdir) / "card.json"
+            card_path.write_text(json.dumps(self._rows(4)), encoding="utf-8")
+            argv = [str(card_path), "--promoter-user-id", str(promoter_id), "--database-url", database_url]
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main([*argv, "--dry-run"]), 0)
+                with Session(engine) as session:
+                    self.assertEqual(session.scalar(select(func.count()).select_from(Bout)), 0)
+                self.assertEqual(main(argv), 0)
+            with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                stranger = [str(card_path), "--promoter-user-id", str(uuid.uuid4()), "--database-url", database_url]
+                self.assertEqual(main(stranger), 1)
+                card_path.write_text(json.dumps({"bouts": "nope"}), encoding="utf-8")
+                self.assertEqual(main(argv), 1)
+
+            with Session(engine) as session:
+                self.assertEqual(session.scalar(select(func.count()).select_from(Bout)), 4)
+            engine.dispose()
+        self.assertIn("card rejected: card_promoter_not_found", stderr.getvalue())
+        self.assertIn("card_bouts_missing", stderr.getvalue())
+
+    def _rows(self, count: int) -> list[dict[str, str]]:
+        return [
+            {
+                "fighter_a_user_id": str(self.fighter_ids[0]),
+                "fighter_b_user_id": str(self.fighter_ids[1]),
+                "event_datetime_utc": f"2026-03-01T{18 + index % 4:02d}:00:00+00:00",
+                "promoter_owner_address": "rPromoterCard",
+                "fighter_a_destination": "rFighterCardA",
+                "fighter_b_destination": "rFighterCardB",
+                "show_a_drops": str(1_000_000 + index),
+                "show_b_drops": "1200000",
+                "bonus_a_drops": "250000",
+                "bonus_b_drops": "250000",
+            }
+            for index in range(count)
+        ]
+
+    @staticmethod
+    def _csv(rows: list[dict[str, str]]) -> str:
+        lines = [",".join(CARD_FIELDS)]
+        lines.extend(",".join(row[name] for name in CARD_FIELDS) for row in rows)
+        return "\n".join(lines) + "\n"
+
+    def _override_get_session(self) -> Session:
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _promoter_headers(self) -> dict[str, str]:
+        token = create_access_token(
+            subject=str(self.promoter_id),
+            email="promoter.card@example.test",
+            role=UserRole.PROMOTER.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    def _seed_users(self, engine) -> tuple[uuid.UUID, tuple[uuid.UUID, uuid.UUID]]:
+        # The CLI test seeds its own database with the same ids, so every card row resolves in both.
+        ids = getattr(self, "_user_ids", None) or (uuid.uuid4(), uuid.uuid4(), uuid.uuid4())
+        self._user_ids = ids
+        with Session(engine) as session:
+            for user_id, email, role in (
+                (ids[0], "promoter.card@example.test", UserRole.PROMOTER),
+                (ids[1], "fighter.card.a@example.test", UserRole.FIGHTER),
+                (ids[2], "fighter.card.b@example.test", UserRole.FIGHTER),
+            ):
+                session.add(User(id=user_id, email=email, password_hash="pbkdf2_sha256$1$00$00", role=role))
+            session.commit()
+        return ids[0], (ids[1], ids[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import json
+import unittest
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.domain.time_rules import ripple_epoch_to_unix
+from app.integrations.xaman_service import XamanService
+from app.main import create_app
+from app.models.enums import BoutWinner, EscrowCloseAction, EscrowDeadlineStatus, EscrowKind, UserRole
+from app.models.escrow import Escrow
+from app.models.escrow_deadline import EscrowDeadline
+from app.models.user import User
+from app.repositories.escrow_deadline_repository import EscrowDeadlineRepository
+from app.services.bout_service import BoutService
+from app.services.deadline_scheduler import EscrowDeadlineScheduler
+from app.services.escrow_service import EscrowService
+from app.services.payout_service import PayoutService
+from app.services.xrpl_escrow_service import EscrowCreateConfirmation
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def at_ripple(self, ripple_seconds: int) -> None:
+        self.now = float(ripple_epoch_to_unix(ripple_seconds))
+
+
+class EscrowDeadlineSchedulerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.clock = _Clock()
+        self.bout_id, self.promoter_id = self._seed_bout_with_created_escrows()
+        self.scheduler = EscrowDeadlineScheduler(
+            session_factory=self.SessionLocal,
+            xaman_factory=lambda: XamanService(mode="stub", api_base_url="", api_key=None, api_secret=None),
+            lookahead_seconds=300,
+            clock=self.clock,
+        )
+
+    def tearDown(self) -> None:
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_deadlines_prepare_close_payloads_once_due_and_result_known(self) -> None:
+        escrows = self._escrows()
+        finish_after = escrows[EscrowKind.SHOW_A].finish_after_ripple
+        cancel_after = escrows[EscrowKind.BONUS_B].cancel_after_ripple
+        assert cancel_after is not None
+
+        self.clock.at_ripple(finish_after - 3600)
+        self.assertEqual(self.scheduler.refill(), 0)
+
+        self.clock.at_ripple(finish_after - 60)
+        self.assertEqual(self.scheduler.refill(), 4)
+        self.assertEqual(self.scheduler.run_due(), {})
+
+        self.clock.at_ripple(finish_after)
+        self.assertEqual(self.scheduler.run_due(), {"awaiting_result": 4})
+
+        with self.SessionLocal() as session:
+            PayoutService(session=session).enter_bout_result(
+                bout_id=self.bout_id, winner=BoutWinner.A, actor_user_id=uuid.uuid4()
+            )
+            session.commit()
+        self.scheduler.refill()
+        self.assertEqual(self.scheduler.run_due(), {"prepared": 3, "not_applicable": 1})
+
+        self.clock.at_ripple(cancel_after)
+        self.scheduler.refill()
+        self.assertEqual(self.scheduler.run_due(), {"prepared": 1, "not_applicable": 1})
+
+        states = self._deadline_states()
+        self.assertEqual(states[(EscrowKind.BONUS_B, EscrowCloseAction.CANCEL)], EscrowDeadlineStatus.PREPARED)
+        self.assertEqual(states[(EscrowKind.BONUS_B, EscrowCloseAction.FINISH)], EscrowDeadlineStatus.NOT_APPLICABLE)
+        self.assertEqual(states[(EscrowKind.BONUS_A, EscrowCloseAction.CANCEL)], EscrowDeadlineStatus.NOT_APPLICABLE)
+        with Session(self.engine) as session:
+            prepared = EscrowDeadlineRepository(session=session).list_prepared_for_bout(bout_id=self.bout_id)
+            bonus_a = next(
+                item
+                for item in prepared
+                if item.escrow_id == escrows[EscrowKind.BONUS_A].id and item.action == EscrowCloseAction.FINISH
+            )
+            self.assertEqual(
+                json.loads(bonus_a.unsigned_tx_json)["Fulfillment"], escrows[EscrowKind.BONUS_A].encrypted_preimage_hex
+            )
+            self.assertEqual(json.loads(bonus_a.xaman_sign_request_json)["mode"], "stub")
+
+    def test_xaman_failures_back_off_then_fail(self) -> None:
+        self.scheduler.xaman_factory = lambda: XamanService(
+            mode="offline", api_base_url="", api_key=None, api_secret=None
+        )
+        self.scheduler.max_attempts = 2
+        with self.SessionLocal() as session:
+            PayoutService(session=session).enter_bout_result(
+                bout_id=self.bout_id, winner=BoutWinner.B, actor_user_id=uuid.uuid4()
+            )
+            session.commit()
+        finish_after = self._escrows()[EscrowKind.SHOW_A].finish_after_ripple
+
+        self.clock.at_ripple(finish_after)
+        self.scheduler.refill()
+        self.assertEqual(self.scheduler.run_due(), {"retry": 3, "not_applicable": 1})
+        self.clock.at_ripple(finish_after + 30)
+        self.scheduler.refill()
+        self.assertEqual(self.scheduler.run_due(), {"failed": 3})
+
+        with Session(self.engine) as session:
+            errors = set(session.scalars(select(EscrowDeadline.last_error).where(EscrowDeadline.attempts == 2)))
+        self.assertEqual(errors, {"xaman_mode_invalid"})
+
+    def test_unexpected_errors_back_off_then_dead_letter(self) -> None:
+        class BrokenXaman:
+            def create_sign_request(self, *, tx_json: dict[str, object], reference: str) -> None:
+                raise RuntimeError("boom")
+
+        self.scheduler.xaman_factory = BrokenXaman
+        self.scheduler.max_attempts = 2
+        with self.SessionLocal() as session:
+            PayoutService(session=session).enter_bout_result(
+                bout_id=self.bout_id, winner=BoutWinner.B, actor_user_id=uuid.uuid4()
+            )
+            session.commit()
+        finish_after = self._escrows()[EscrowKind.SHOW_A].finish_after_ripple
+
+        self.clock.at_ripple(finish_after)
+        self.scheduler.refill()
+        with self.assertLogs("app.services.deadline_scheduler", level="ERROR"):
+            self.assertEqual(self.scheduler.run_due(), {"error": 3, "not_applicable": 1})
+        # The failing rows are pushed out instead of being picked again on the next poll.
+        self.scheduler.refill()
+        self.assertEqual(self.scheduler.run_due(), {})
+
+        self.clock.at_ripple(finish_after + 30)
+        self.scheduler.refill()
+        with self.assertLogs("app.services.deadline_scheduler", level="ERROR"):
+            self.assertEqual(self.scheduler.run_due(), {"error": 3})
+        with Session(self.engine) as session:
+            failed = session.scalars(
+                select(EscrowDeadline).where(EscrowDeadline.status == EscrowDeadlineStatus.FAILED)
+            ).all()
+        self.assertEqual([(row.attempts, row.last_error) for row in failed], [(2, "RuntimeError")] * 3)
+
+    def test_sign_requests_are_created_with_no_transaction_open(self) -> None:
+        sessions: list[Session] = []
+
+        def tracking_factory() -> Session:
+            session = self.SessionLocal()
+            sessions.append(session)
+            return session
+
+        seen: list[bool] = []
+        stub = XamanService(mode="stub", api_base_url="", api_key=None, api_secret=None)
+
+        class InspectingXaman:
+            def create_sign_request(self, *, tx_json: dict[str, object], reference: str):
+                seen.append(any(session.in_transaction() for session in sessions))
+                return stub.create_sign_request(tx_json=tx_json, reference=reference)
+
+        self.scheduler.session_factory = tracking_factory
+        self.scheduler.xaman_factory = InspectingXaman
+        with self.SessionLocal() as session:
+            PayoutService(session=session).enter_bout_result(
+                bout_id=self.bout_id, winner=BoutWinner.A, actor_user_id=uuid.uuid4()
+            )
+            session.commit()
+
+        self.clock.at_ripple(self._escrows()[EscrowKind.SHOW_A].finish_after_ripple)
+        self.scheduler.refill()
+        self.assertEqual(self.scheduler.run_due(), {"prepared": 3, "not_applicable": 1})
+        self.assertEqual(seen, [False, False, False])
+
+    def test_refill_reads_the_due_index_instead_of_scanning(self) -> None:
+        with self.engine.connect() as connection:
+            plan = connection.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id, due_at_ripple FROM escrow_deadlines "
+                    "WHERE status = 'pending' AND due_at_ripple <= 100 ORDER BY due_at_ripple LIMIT 500"
+                )
+            ).all()
+        detail = " ".join(str(row[-1]) for row in plan)
+        self.assertIn("idx_escrow_deadlines_status_due", detail)
+        self.assertNotIn("TEMP B-TREE", detail)
+
+    def test_payout_prepare_reuses_sign_requests_created_by_the_scheduler(self) -> None:
+        with self.SessionLocal() as session:
+            PayoutService(session=session).enter_bout_result(
+                bout_id=self.bout_id, winner=BoutWinner.A, actor_user_id=uuid.uuid4()
+            )
+            session.commit()
+        self.clock.at_ripple(self._escrows()[EscrowKind.SHOW_A].finish_after_ripple)
+        self.scheduler.refill()
+        self.scheduler.run_due()
+        show_a = self._escrows()[EscrowKind.SHOW_A]
+        with Session(self.engine) as session:
+            deadline = session.scalar(
+                select(EscrowDeadline).where(
+                    EscrowDeadline.escrow_id == show_a.id, EscrowDeadline.action == EscrowCloseAction.FINISH
+                )
+            )
+            assert deadline is not None and deadline.xaman_sign_request_json is not None
+            stored = json.loads(deadline.xaman_sign_request_json)
+            stored["payload_id"] = "prepared-by-scheduler"
+            deadline.xaman_sign_request_json = json.dumps(stored)
+            session.commit()
+
+        with patch("app.main.init_db"):
+            app = create_app()
+            app.dependency_overrides[get_session] = self._override_get_session
+            with TestClient(app) as client:
+                response = client.post(f"/bouts/{self.bout_id}/payouts/prepare", headers=self._promoter_headers())
+
+        self.assertEqual(response.status_code, 200)
+        payload_ids = {
+            item["escrow_kind"]: item["xaman_sign_request"]["payload_id"] for item in response.json()["escrows"]
+        }
+        self.assertEqual(payload_ids[EscrowKind.SHOW_A.value], "prepared-by-scheduler")
+        self.assertNotEqual(payload_ids[EscrowKind.SHOW_B.value], "prepared-by-scheduler")
+
+    def _deadline_states(self) -> dict[tuple[EscrowKind, EscrowCloseAction], EscrowDeadlineStatus]:
+        with Session(self.engine) as session:
+            rows = session.execute(
+                select(Escrow.kind, EscrowDeadline.action, EscrowDeadline.status).join(
+                    Escrow, Escrow.id == EscrowDeadline.escrow_id
+                )
+            ).all()
+        return {(row.kind, row.action): row.status for row in rows}
+
+    def _escrows(self) -> dict[EscrowKind, Escrow]:
+        with Session(self.engine) as session:
+            escrows = session.scalars(select(Escrow).where(Escrow.bout_id == self.bout_id)).all()
+            session.expunge_all()
+            return {escrow.kind: escrow for escrow in escrows}
+
+    def _override_get_session(self) -> Session:
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _promoter_headers(self) -> dict[str, str]:
+        token = create_access_token(
+            subject=str(self.promoter_id),
+            email="promoter.deadline@example.test",
+            role=UserRole.PROMOTER.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    def _seed_bout_with_created_escrows(self) -> tuple[uuid.UUID, uuid.UUID]:
+        with Session(self.engine) as session:
+            user_ids = []
+            for email, role in (
+                ("promoter.deadline@example.test", UserRole.PROMOTER),
+                ("fighter.deadline.a@example.test", UserRole.FIGHTER),
+                ("fighter.deadline.b@example.test", UserRole.FIGHTER),
+            ):
+                user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+                session.add(user)
+                user_ids.append(user.id)
+            session.flush()
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=user_ids[0],
+                fighter_a_user_id=user_ids[1],
+                fighter_b_user_id=user_ids[2],
+                event_datetime_utc=datetime(2026, 2, 18, 20, 0, 0, tzinfo=UTC),
+                promoter_owner_address="rPromoterDeadline",
+                fighter_a_destination="rFighterDeadlineA",
+                fighter_b_destination="rFighterDeadlineB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_500_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            session.flush()
+            service = EscrowService(session=session)
+            for sequence, escrow in enumerate(session.scalars(select(Escrow).where(Escrow.bout_id == bout.id)), 300):
+                service.confirm_escrow_create(
+                    bout_id=bout.id,
+                    escrow_kind=escrow.kind,
+                    confirmation=EscrowCreateConfirmation(
+                        tx_hash=f"{sequence:064X}",
+                        offer_sequence=sequence,
+                        validated=True,
+                        engine_result="tesSUCCESS",
+                        owner_address=escrow.owner_address,
+                        destination_address=escrow.destination_address,
+                        amount_drops=escrow.amount_drops,
+                        finish_after_ripple=escrow.finish_after_ripple,
+                        cancel_after_ripple=escrow.cancel_after_ripple,
+                        condition_hex=escrow.condition_hex,
+                    ),
+                )
+            session.commit()
+            return bout.id, user_ids[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
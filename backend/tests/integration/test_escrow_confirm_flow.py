@@ -22,7 +22,9 @@ from app.models.enums import EscrowKind, EscrowStatus, UserRole
 from app.models.escrow import Escrow
 from app.models.idempotency_key import IdempotencyKey
 from app.models.user import User
+from app.repositories.escrow_repository import EscrowRepository
 from app.services.bout_service import BoutService
+from app.services.idempotency_service import decode_response_body
 
 
 class EscrowConfirmIntegrationTests(unittest.TestCase):
@@ -89,7 +91,7 @@ class EscrowConfirmIntegrationTests(unittest.TestCase):
     def test_prepare_returns_502_when_xaman_sign_request_fails(self) -> None:
         xaman_mock = Mock()
         xaman_mock.create_sign_request.side_effect = XamanIntegrationError("xaman_api_connection_error")
-        with patch("app.api.bouts_routes.escrow_routes.XamanService.from_settings", return_value=xaman_mock):
+        with patch("app.integrations.xaman_service.XamanService.from_settings", return_value=xaman_mock):
             response = self.client.post(
                 f"/bouts/{self.bout_id}/escrows/prepare",
                 headers=self._promoter_headers(),
@@ -98,6 +100,19 @@ class EscrowConfirmIntegrationTests(unittest.TestCase):
         self.assertEqual(response.status_code, 502)
         self.assertEqual(response.json()["detail"], "Xaman signing request could not be prepared.")
 
+    def test_prepare_returns_503_with_retry_after_when_xaman_is_rate_limiting(self) -> None:
+        xaman_mock = Mock()
+        xaman_mock.create_sign_request.side_effect = XamanIntegrationError("xaman_api_rate_limited")
+        with patch("app.integrations.xaman_service.XamanService.from_settings", return_value=xaman_mock):
+            response = self.client.post(
+                f"/bouts/{self.bout_id}/escrows/prepare",
+                headers=self._promoter_headers(),
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+        self.assertEqual(response.json()["detail"], "Xaman is rate limiting requests; retry shortly.")
+
     def test_signing_reconcile_declined_sets_failure_without_state_transition(self) -> None:
         payload_id = self._prepare_payload_id(EscrowKind.SHOW_A)
         response = self.client.post(
@@ -236,6 +251,7 @@ class EscrowConfirmIntegrationTests(unittest.TestCase):
         )
         self.assertEqual(response_two.status_code, 200)
         self.assertEqual(response_two.json(), response_one.json())
+        self.assertEqual(response_two.content, response_one.content)
 
         payload_collision = dict(payload)
         payload_collision["tx_hash"] = "TX00000999"
@@ -258,6 +274,45 @@ class EscrowConfirmIntegrationTests(unittest.TestCase):
                 )
             )
             self.assertEqual(stored_count, 1)
+            stored = session.scalar(select(IdempotencyKey).where(IdempotencyKey.idempotency_key == "replay-key"))
+            assert stored is not None
+            self.assertEqual(stored.response_encoding, "zlib")
+            self.assertEqual(
+                decode_response_body(stored.response_body, encoding=stored.response_encoding), response_one.content
+            )
+
+    def test_confirm_rejects_tx_hash_already_recorded_on_another_escrow(self) -> None:
+        first = self.client.post(
+            f"/bouts/{self.bout_id}/escrows/confirm",
+            headers=self._promoter_headers({"Idempotency-Key": "hash-first"}),
+            json=self._build_confirm_payload(kind=EscrowKind.SHOW_A, tx_hash="TX00000021", offer_sequence=1201),
+        )
+        self.assertEqual(first.status_code, 200)
+
+        reused = self.client.post(
+            f"/bouts/{self.bout_id}/escrows/confirm",
+            headers=self._promoter_headers({"Idempotency-Key": "hash-reused"}),
+            json=self._build_confirm_payload(kind=EscrowKind.SHOW_B, tx_hash="TX00000021", offer_sequence=1202),
+        )
+        self.assertEqual(reused.status_code, 409)
+        self.assertIn("already recorded", reused.json()["detail"])
+        lowercase = self.client.post(
+            f"/bouts/{self.bout_id}/escrows/confirm",
+            headers=self._promoter_headers({"Idempotency-Key": "hash-reused-lowercase"}),
+            json=self._build_confirm_payload(kind=EscrowKind.SHOW_B, tx_hash=" tx00000021", offer_sequence=1202),
+        )
+        self.assertEqual(lowercase.status_code, 409)
+        self.assertIn("already recorded", lowercase.json()["detail"])
+
+        with Session(self.engine) as session:
+            show_b = session.scalar(
+                select(Escrow).where(Escrow.bout_id == self.bout_id, Escrow.kind == EscrowKind.SHOW_B)
+            )
+            assert show_b is not None
+            self.assertEqual((show_b.status, show_b.create_tx_hash), (EscrowStatus.PLANNED, None))
+            owner = EscrowRepository(session=session).get_by_tx_hash(tx_hash="TX00000021")
+            assert owner is not None
+            self.assertEqual(owner.kind, EscrowKind.SHOW_A)
 
     def test_confirm_rejects_invalid_confirmation_and_records_audit(self) -> None:
         payload = self._build_confirm_payload(
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+import unittest
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.db.base import Base
+from app.models.enums import BoutWinner, EscrowKind, UserRole
+from app.models.escrow import Escrow
+from app.models.escrow_tx_payload import EscrowTxPayload
+from app.models.user import User
+from app.services.bout_service import BoutService
+from app.services.escrow_service import EscrowService
+from app.services.payout_service import PayoutService
+from app.services.xrpl_escrow_service import (
+    EscrowCreateConfirmation,
+    EscrowPayoutConfirmation,
+    canonical_tx_json,
+    tx_json_sha256,
+)
+
+
+class EscrowTxPayloadTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.bout_id = self._seed_bout()
+
+    def tearDown(self) -> None:
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_create_prepare_serves_the_payloads_stored_at_draft(self) -> None:
+        with self.SessionLocal() as session:
+            _, items = EscrowService(session=session).prepare_escrow_create_payloads(bout_id=self.bout_id)
+            show_a = session.scalar(
+                select(EscrowTxPayload)
+                .join(Escrow, Escrow.id == EscrowTxPayload.escrow_id)
+                .where(Escrow.bout_id == self.bout_id, Escrow.kind == EscrowKind.SHOW_A)
+            )
+            assert show_a is not None
+            self.assertEqual(show_a.tx_json, canonical_tx_json(items[0]["unsigned_tx"]))
+            for item in items:
+                self.assertEqual(item["unsigned_tx_hash"], tx_json_sha256(canonical_tx_json(item["unsigned_tx"])))
+
+            # Served from the stored row, not rebuilt from the escrow.
+            show_a.tx_json = canonical_tx_json({**json.loads(show_a.tx_json), "Memos": []})
+            session.flush()
+            _, served = EscrowService(session=session).prepare_escrow_create_payloads(bout_id=self.bout_id)
+            self.assertEqual(served[0]["unsigned_tx"]["Memos"], [])
+
+    def test_bouts_without_stored_payloads_are_built_on_the_fly(self) -> None:
+        with self.SessionLocal() as session:
+            _, stored_items = EscrowService(session=session).prepare_escrow_create_payloads(bout_id=self.bout_id)
+            session.execute(delete(EscrowTxPayload))
+            _, built_items = EscrowService(session=session).prepare_escrow_create_payloads(bout_id=self.bout_id)
+
+        self.assertEqual(stored_items, built_items)
+
+    def test_close_payloads_replace_the_create_payload_at_confirm_and_are_dropped_at_payout_confirm(self) -> None:
+        with self.SessionLocal() as session:
+            _, stored_items = EscrowService(session=session).prepare_escrow_create_payloads(bout_id=self.bout_id)
+        self._confirm_all_escrow_creates()
+        # The create payload is spent once the escrow leaves PLANNED. No bonus fulfillment is stored before the
+        # result: bonus escrows only get their cancel.
+        self.assertEqual(
+            self._stored_types(),
+            {
+                EscrowKind.SHOW_A: {"EscrowFinish"},
+                EscrowKind.SHOW_B: {"EscrowFinish"},
+                EscrowKind.BONUS_A: {"EscrowCancel"},
+                EscrowKind.BONUS_B: {"EscrowCancel"},
+            },
+        )
+        with self.SessionLocal() as session:
+            _, rebuilt_items = EscrowService(session=session).prepare_escrow_create_payloads(bout_id=self.bout_id)
+        self.assertEqual(rebuilt_items, stored_items)
+
+        with self.SessionLocal() as session:
+            service = PayoutService(session=session)
+            service.enter_bout_result(bout_id=self.bout_id, winner=BoutWinner.B, actor_user_id=uuid.uuid4())
+            session.commit()
+        stored = self._stored_types()
+        self.assertEqual(stored[EscrowKind.BONUS_B], {"EscrowFinish", "EscrowCancel"})
+        self.assertEqual(stored[EscrowKind.BONUS_A], {"EscrowCancel"})
+
+        with self.SessionLocal() as session:
+            service = PayoutService(session=session)
+            _, items = service.prepare_payout_payloads(bout_id=self.bout_id)
+            by_kind = {item["escrow_kind"]: item for item in items}
+            bonus_b = session.scalar(
+                select(Escrow).where(Escrow.bout_id == self.bout_id, Escrow.kind == EscrowKind.BONUS_B)
+            )
+            assert bonus_b is not None and bonus_b.offer_sequence is not None
+            self.assertEqual(by_kind[EscrowKind.BONUS_B]["unsigned_tx"]["Fulfillment"], bonus_b.encrypted_preimage_hex)
+            self.assertEqual(by_kind[EscrowKind.BONUS_A]["unsigned_tx"]["TransactionType"], "EscrowCancel")
+            for item in items:
+                self.assertEqual(item["unsigned_tx_hash"], tx_json_sha256(canonical_tx_json(item["unsigned_tx"])))
+
+            service.confirm_payout(
+                bout_id=self.bout_id,
+                escrow_kind=EscrowKind.BONUS_B,
+                confirmation=EscrowPayoutConfirmation(
+                    tx_hash="C" * 64,
+                    validated=True,
+                    engine_result="tesSUCCESS",
+                    transaction_type="EscrowFinish",
+                    owner_address=bonus_b.owner_address,
+                    offer_sequence=bonus_b.offer_sequence,
+                    close_time_ripple=bonus_b.finish_after_ripple + 10,
+                    fulfillment_hex=bonus_b.encrypted_preimage_hex,
+                ),
+            )
+            session.commit()
+
+        self.assertNotIn(EscrowKind.BONUS_B, self._stored_types())
+
+    def _confirm_all_escrow_creates(self) -> None:
+        with self.SessionLocal() as session:
+            service = EscrowService(session=session)
+            for sequence, escrow in enumerate(
+                session.scalars(select(Escrow).where(Escrow.bout_id == self.bout_id)), 500
+            ):
+                service.confirm_escrow_create(
+                    bout_id=self.bout_id,
+                    escrow_kind=escrow.kind,
+                    confirmation=EscrowCreateConfirmation(
+                        tx_hash=f"{sequence:064X}",
+                        offer_sequence=sequence,
+                        validated=True,
+                        engine_result="tesSUCCESS",
+                        owner_address=escrow.owner_address,
+                        destination_address=escrow.destination_address,
+                        amount_drops=escrow.amount_drops,
+                        finish_after_ripple=escrow.finish_after_ripple,
+                        cancel_after_ripple=escrow.cancel_after_ripple,
+                        condition_hex=escrow.condition_hex,
+                    ),
+                )
+            session.commit()
+
+    def _stored_types(self) -> dict[EscrowKind, set[str]]:
+        with Session(self.engine) as session:
+            rows = session.execute(
+                select(Escrow.kind, EscrowTxPayload.transaction_type).join(
+                    Escrow, Escrow.id == EscrowTxPayload.escrow_id
+                )
+            ).all()
+        stored: dict[EscrowKind, set[str]] = {}
+        for row in rows:
+            stored.setdefault(row.kind, set()).add(row.transaction_type)
+        return stored
+
+    def _seed_bout(self) -> uuid.UUID:
+        with Session(self.engine) as session:
+            user_ids = []
+            for email, role in (
+                ("promoter.payloads@example.test", UserRole.PROMOTER),
+                ("fighter.payloads.a@example.test", UserRole.FIGHTER),
+                ("fighter.payloads.b@example.test", UserRole.FIGHTER),
+            ):
+                user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+                session.add(user)
+                user_ids.append(user.id)
+            session.flush()
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=user_ids[0],
+                fighter_a_user_id=user_ids[1],
+                fighter_b_user_id=user_ids[2],
+                event_datetime_utc=datetime(2026, 2, 18, 20, 0, 0, tzinfo=UTC),
+                promoter_owner_address="rPromoterPayloads",
+                fighter_a_destination="rFighterPayloadsA",
+                fighter_b_destination="rFighterPayloadsB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_500_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            session.commit()
+            return bout.id
+
+
+if __name__ == "__main__":
+    unittest.main()
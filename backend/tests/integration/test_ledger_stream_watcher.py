@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.models  # noqa: F401
+from app.db.base import Base
+from app.models.audit_log import AuditLog
+from app.models.bout import Bout
+from app.models.enums import BoutStatus, BoutWinner, EscrowKind, EscrowStatus, UserRole
+from app.models.escrow import Escrow
+from app.models.user import User
+from app.models.validated_transaction import ValidatedTransaction
+from app.perf.xrpl_stand_in import XrplStandInServer
+from app.services.bout_service import BoutService
+from app.services.ledger_stream_watcher import LedgerStreamWatcher
+from app.services.payout_service import PayoutService
+
+_OWNER = "rPromoterStream"
+_KIND_SEQUENCES = {EscrowKind.SHOW_A: 201, EscrowKind.SHOW_B: 202, EscrowKind.BONUS_A: 203, EscrowKind.BONUS_B: 204}
+
+
+class LedgerStreamWatcherIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # A file database gives the watcher thread its own connection, as it would have against PostgreSQL.
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite+pysqlite:///{self.tempdir.name}/stream.db", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.bout_id = self._seed_bout()
+        self.stand_in = XrplStandInServer().start()
+        self.watcher = LedgerStreamWatcher(
+            url=self.stand_in.ws_url,
+            session_factory=self.SessionLocal,
+            timeout_seconds=5,
+            refresh_seconds=0.2,
+            poll_seconds=0.05,
+            reconnect_max_seconds=0.2,
+        )
+
+    def tearDown(self) -> None:
+        self.watcher.stop()
+        self.stand_in.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+        self.tempdir.cleanup()
+
+    def test_stream_drives_escrow_creation_and_payouts_without_client_confirms(self) -> None:
+        self.watcher.start()
+        self._wait_for(lambda: _OWNER in self.stand_in.subscribed_accounts)
+
+        for kind in _KIND_SEQUENCES:
+            self._publish_escrow_create(kind)
+        self._wait_for(lambda: self._bout().status == BoutStatus.ESCROWS_CREATED)
+        self.assertEqual({escrow.offer_sequence for escrow in self._escrows().values()}, set(_KIND_SEQUENCES.values()))
+
+        with self.SessionLocal() as session:
+            PayoutService(session=session).enter_bout_result(
+                bout_id=self.bout_id, winner=BoutWinner.A, actor_user_id=uuid.uuid4()
+            )
+            session.commit()
+
+        escrows = self._escrows()
+        for kind in (EscrowKind.SHOW_A, EscrowKind.SHOW_B, EscrowKind.BONUS_A):
+            escrow = escrows[kind]
+            tx_json: dict[str, object] = {
+                "TransactionType": "EscrowFinish",
+                "Account": "rAnyoneMayFinish",
+                "Owner": _OWNER,
+                "OfferSequence": escrow.offer_sequence,
+            }
+            if escrow.encrypted_preimage_hex:
+                tx_json.update(Condition=escrow.condition_hex, Fulfillment=escrow.encrypted_preimage_hex)
+            self.stand_in.publish_transaction(
+                uuid.uuid4().hex * 2, tx_json, close_time_ripple=escrow.finish_after_ripple + 5
+            )
+        self._wait_for(lambda: self._bout().status == BoutStatus.CLOSED)
+
+        escrows = self._escrows()
+        self.assertEqual(escrows[EscrowKind.BONUS_A].status, EscrowStatus.FINISHED)
+        self.assertEqual(escrows[EscrowKind.BONUS_B].status, EscrowStatus.CREATED)
+        with Session(self.engine) as session:
+            self.assertEqual(session.scalar(select(func.count()).select_from(ValidatedTransaction)), 7)
+
+    def test_replayed_unrelated_and_failed_transactions(self) -> None:
+        create_hash = self._publish_escrow_create(EscrowKind.SHOW_A)
+        message = self._stream_message(create_hash)
+
+        self.assertEqual(self.watcher.handle_message(message), "confirmed")
+        self.assertEqual(self.watcher.handle_message(message), "duplicate")
+        self.assertEqual(self.watcher.handle_message({"type": "response", "status": "success"}), "ignored")
+
+        foreign_hash = uuid.uuid4().hex.upper() * 2
+        self.stand_in.publish_transaction(
+            foreign_hash,
+            {"TransactionType": "EscrowFinish", "Account": _OWNER, "Owner": "rStranger", "OfferSequence": 201},
+        )
+        self.assertEqual(self.watcher.handle_message(self._stream_message(foreign_hash)), "unmatched")
+
+        failed_hash = self._publish_escrow_create(EscrowKind.SHOW_B, engine_result="tecUNFUNDED")
+        self.assertEqual(self.watcher.handle_message(self._stream_message(failed_hash)), "rejected")
+
+        escrows = self._escrows()
+        self.assertEqual(escrows[EscrowKind.SHOW_A].status, EscrowStatus.CREATED)
+        self.assertEqual(escrows[EscrowKind.SHOW_B].status, EscrowStatus.PLANNED)
+        self.assertEqual(escrows[EscrowKind.SHOW_B].failure_code, "ledger_tec_tem")
+        with Session(self.engine) as session:
+            outcomes = session.scalars(
+                select(AuditLog.outcome).where(AuditLog.action == "escrow_create_confirm").order_by(AuditLog.id)
+            ).all()
+        self.assertEqual(sorted(outcomes), ["rejected", "success"])
+
+    def test_watcher_reconnects_and_resubscribes_after_stream_drop(self) -> None:
+        self.watcher.start()
+        self._wait_for(lambda: _OWNER in self.stand_in.subscribed_accounts)
+
+        self.stand_in.disconnect_streams()
+        self._wait_for(lambda: _OWNER in self.stand_in.subscribed_accounts)
+        self._publish_escrow_create(EscrowKind.SHOW_A)
+
+        self._wait_for(lambda: self._escrows()[EscrowKind.SHOW_A].status == EscrowStatus.CREATED)
+
+    def _publish_escrow_create(self, kind: EscrowKind, *, engine_result: str = "tesSUCCESS") -> str:
+        escrow = self._escrows()[kind]
+        tx_json: dict[str, object] = {
+            "TransactionType": "EscrowCreate",
+            "Account": escrow.owner_address,
+            "Destination": escrow.destination_address,
+            "Amount": str(escrow.amount_drops),
+            "FinishAfter": escrow.finish_after_ripple,
+            "Sequence": _KIND_SEQUENCES[kind],
+        }
+        if escrow.cancel_after_ripple is not None:
+            tx_json["CancelAfter"] = escrow.cancel_after_ripple
+        if escrow.condition_hex is not None:
+            tx_json["Condition"] = escrow.condition_hex.lower()
+        tx_hash = uuid.uuid4().hex.upper() * 2
+        self.stand_in.publish_transaction(tx_hash, tx_json, engine_result=engine_result)
+        return tx_hash
+
+    def _stream_message(self, tx_hash: str) -> dict[str, object]:
+        with self.stand_in._lock:
+            stored = dict(self.stand_in._transactions[tx_hash])
+        return {
+            "type": "transaction",
+            "validated": True,
+            "ledger_index": stored.pop("ledger_index"),
+            "meta": stored.pop("meta"),
+            "transaction": stored,
+        }
+
+    def _wait_for(self, condition: Callable[[], bool], *, timeout_seconds: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout_seconds
+        while time.monotonic() < deadline:
+            if condition():
+                return
+            time.sleep(0.02)
+        self.fail("condition not reached before timeout")
+
+    def _bout(self) -> Bout:
+        with Session(self.engine) as session:
+            bout = session.get(Bout, self.bout_id)
+            assert bout is not None
+            session.expunge(bout)
+            return bout
+
+    def _escrows(self) -> dict[EscrowKind, Escrow]:
+        with Session(self.engine) as session:
+            escrows = session.scalars(select(Escrow).where(Escrow.bout_id == self.bout_id)).all()
+            session.expunge_all()
+            return {escrow.kind: escrow for escrow in escrows}
+
+    def _seed_bout(self) -> uuid.UUID:
+        with Session(self.engine) as session:
+            user_ids = []
+            for email, role in (
+                ("promoter.stream@example.test", UserRole.PROMOTER),
+                ("fighter.stream.a@example.test", UserRole.FIGHTER),
+                ("fighter.stream.b@example.test", UserRole.FIGHTER),
+            ):
+                user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+                session.add(user)
+                user_ids.append(user.id)
+            session.flush()
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=user_ids[0],
+                fighter_a_user_id=user_ids[1],
+                fighter_b_user_id=user_ids[2],
+                event_datetime_utc=datetime(2026, 2, 18, 20, 0, 0, tzinfo=UTC),
+                promoter_owner_address=_OWNER,
+                fighter_a_destination="rFighterStreamA",
+                fighter_b_destination="rFighterStreamB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_500_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            session.commit()
+            return bout.id
+
+
+if __name__ == "__main__":
+    unittest.main()
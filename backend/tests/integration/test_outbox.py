@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import json
+import unittest
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.tracing import InMemorySpanExporter, Tracer, configure_tracing, current_traceparent, start_span
+from app.db.base import Base
+from app.models.enums import BoutStatus, BoutWinner, OutboxStatus, UserRole
+from app.models.outbox_event import OutboxEvent
+from app.models.user import User
+from app.services.bout_event_bridge import PostgresEventBridge
+from app.services.bout_events import BoutEvent, BoutEventHub
+from app.services.bout_service import BoutService
+from app.services.outbox import (
+    OutboxDeliveryError,
+    OutboxDispatcher,
+    OutboxMessage,
+    OutboxSinkUnavailableError,
+)
+from app.services.payout_service import PayoutService
+
+_NOW = datetime(2026, 10, 19, 12, 0, tzinfo=UTC).timestamp()
+
+
+@dataclass
+class RecordingSink:
+    """Sink that keeps what it was given and rejects any batch containing a ``poison`` event id."""
+
+    name: str = "recording"
+    poison: set[int] = field(default_factory=set)
+    batches: list[list[int]] = field(default_factory=list)
+
+    def deliver(self, messages: Sequence[OutboxMessage]) -> None:
+        ids = [message.id for message in messages]
+        if self.poison.intersection(ids):
+            raise OutboxDeliveryError("poisoned")
+        self.batches.append(ids)
+
+
+class OutboxTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.promoter_id = self._seed_users()
+
+    def tearDown(self) -> None:
+        configure_tracing(None)
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_transitions_write_outbox_rows_only_when_they_commit(self) -> None:
+        rolled_back, committed = self._create_bout(), self._create_bout()
+        for bout_id, commit in ((rolled_back, False), (committed, True)):
+            with self.SessionLocal() as session:
+                PayoutService(session=session).enter_bout_result(
+                    bout_id=bout_id, winner=BoutWinner.A, actor_user_id=self.promoter_id
+                )
+                if commit:
+                    session.commit()
+
+        rows = self._outbox()
+        self.assertEqual(
+            [(row.bout_id, row.event_type, row.status) for row in rows], [(committed, "bout_status", "pending")]
+        )
+        payload = json.loads(rows[0].payload_json)
+        self.assertEqual((payload["bout_status"], payload["winner"]), ("result_entered", "A"))
+
+    def test_dispatcher_delivers_batches_and_marks_rows_dispatched(self) -> None:
+        self._seed_events(5)
+        sink = RecordingSink()
+        dispatcher = OutboxDispatcher(session_factory=self.SessionLocal, sinks=[sink], batch_size=3, clock=lambda: _NOW)
+
+        self.assertEqual(dispatcher.run_once(), {"dispatched": 3})
+        self.assertEqual(dispatcher.run_once(), {"dispatched": 2})
+        self.assertEqual(dispatcher.run_once(), {})
+
+        ids = [row.id for row in self._outbox()]
+        self.assertEqual(sink.batches, [ids[:3], ids[3:]])
+        self.assertTrue(all(row.status == OutboxStatus.DISPATCHED and row.dispatched_at for row in self._outbox()))
+
+    def test_run_forever_drains_full_batches_back_to_back_until_stopped(self) -> None:
+        self._seed_events(5)
+        sink = RecordingSink()
+
+        @dataclass
+        class StoppingSink:
+            name: str = "stopping"
+
+            def deliver(self, messages: Sequence[OutboxMessage]) -> None:
+                if sum(len(batch) for batch in sink.batches) == 5:
+                    dispatcher.stop()
+
+        dispatcher = OutboxDispatcher(
+            session_factory=self.SessionLocal,
+            sinks=[sink, StoppingSink()],
+            batch_size=3,
+            poll_seconds=60.0,
+            clock=lambda: _NOW,
+        )
+        # A full batch goes straight back for more; the short one waits out the poll, which stop interrupts.
+        dispatcher.run_forever()
+
+        self.assertEqual([len(batch) for batch in sink.batches], [3, 2])
+        self.assertTrue(all(row.status == OutboxStatus.DISPATCHED for row in self._outbox()))
+
+    def test_poison_event_is_isolated_backed_off_and_parked(self) -> None:
+        self._seed_events(3)
+        poison_id = self._outbox()[1].id
+        sink = RecordingSink(poison={poison_id})
+        now = [_NOW]
+        dispatcher = OutboxDispatcher(
+            session_factory=self.SessionLocal,
+            sinks=[sink],
+            max_attempts=2,
+            retry_base_seconds=30,
+            clock=lambda: now[0],
+        )
+
+        self.assertEqual(dispatcher.run_once(), {"dispatched": 2, "retried": 1})
+        poison = self._outbox()[1]
+        self.assertEqual((poison.status, poison.attempts, poison.last_error), ("pending", 1, "recording:poisoned"))
+        self.assertEqual(dispatcher.run_once(), {})
+
+        now[0] += 30
+        self.assertEqual(dispatcher.run_once(), {"dead": 1})
+        self.assertEqual(self._outbox()[1].status, OutboxStatus.DEAD)
+        self.assertEqual(len(sink.batches), 2)
+
+    def test_sinks_are_called_outside_any_transaction(self) -> None:
+        self._seed_events(2)
+        sessions: list[Session] = []
+
+        def tracking_factory() -> Session:
+            session = self.SessionLocal()
+            sessions.append(session)
+            return session
+
+        seen: list[bool] = []
+
+        @dataclass
+        class InspectingSink:
+            name: str = "inspecting"
+
+            def deliver(self, messages: Sequence[OutboxMessage]) -> None:
+                seen.append(any(session.in_transaction() for session in sessions))
+
+        dispatcher = OutboxDispatcher(session_factory=tracking_factory, sinks=[InspectingSink()], clock=lambda: _NOW)
+        self.assertEqual(dispatcher.run_once(), {"dispatched": 2})
+        self.assertEqual(seen, [False])
+
+    def test_delivery_outliving_its_lease_is_left_to_the_next_claimer(self) -> None:
+        self._seed_events(2)
+        now = [_NOW]
+        second = OutboxDispatcher(session_factory=self.SessionLocal, sinks=[RecordingSink()], clock=lambda: now[0])
+        second_outcomes: list[dict[str, int]] = []
+
+        @dataclass
+        class SlowSink:
+            name: str = "slow"
+
+            def deliver(self, messages: Sequence[OutboxMessage]) -> None:
+                now[0] += 61
+                second_outcomes.append(second.run_once())
+
+        first = OutboxDispatcher(
+            session_factory=self.SessionLocal, sinks=[SlowSink()], lease_seconds=60, clock=lambda: now[0]
+        )
+
+        self.assertEqual(first.run_once(), {})
+        self.assertEqual(second_outcomes, [{"dispatched": 2}])
+        self.assertTrue(all(row.status == OutboxStatus.DISPATCHED for row in self._outbox()))
+
+    def test_unavailable_sink_fails_the_batch_without_per_event_retries(self) -> None:
+        self._seed_events(3)
+        calls: list[int] = []
+
+        @dataclass
+        class DownSink:
+            name: str = "down"
+
+            def deliver(self, messages: Sequence[OutboxMessage]) -> None:
+                calls.append(len(messages))
+                raise OutboxSinkUnavailableError("outbox_webhook_unreachable")
+
+        dispatcher = OutboxDispatcher(session_factory=self.SessionLocal, sinks=[DownSink()], clock=lambda: _NOW)
+
+        self.assertEqual(dispatcher.run_once(), {"retried": 3})
+        self.assertEqual(calls, [3])
+
+    def test_dispatched_events_are_purged_after_the_retention_window(self) -> None:
+        self._seed_events(3)
+        poison_id = self._outbox()[2].id
+        now = [_NOW]
+        dispatcher = OutboxDispatcher(
+            session_factory=self.SessionLocal,
+            sinks=[RecordingSink(poison={poison_id})],
+            retention_days=7,
+            purge_batch_size=1,
+            clock=lambda: now[0],
+        )
+        dispatcher.run_once()
+
+        now[0] += 6 * 86400
+        self.assertEqual(dispatcher.purge_dispatched(), 0)
+        now[0] += 2 * 86400
+        self.assertEqual(dispatcher.purge_dispatched(), 2)
+        self.assertEqual([(row.id, row.status) for row in self._outbox()], [(poison_id, OutboxStatus.PENDING)])
+
+    def test_outbox_rows_carry_the_committing_trace_into_each_dispatch_pass(self) -> None:
+        bout_id = self._create_bout()
+        exporter = InMemorySpanExporter()
+        configure_tracing(Tracer(exporter))
+        with start_span("request") as request_span, self.SessionLocal() as session:
+            PayoutService(session=session).enter_bout_result(
+                bout_id=bout_id, winner=BoutWinner.A, actor_user_id=self.promoter_id
+            )
+            session.commit()
+        self.assertEqual(self._outbox()[0].traceparent, request_span.traceparent)
+
+        delivered: list[dict[str, object]] = []
+
+        @dataclass
+        class CapturingSink:
+            name: str = "capturing"
+
+            def deliver(self, messages: Sequence[OutboxMessage]) -> None:
+                delivered.extend(message.to_dict() for message in messages)
+
+        exporter.clear()
+        dispatcher = OutboxDispatcher(session_factory=self.SessionLocal, sinks=[CapturingSink()], clock=lambda: _NOW)
+        self.assertEqual(dispatcher.run_once(), {"dispatched": 1})
+
+        self.assertEqual(delivered[0]["traceparent"], request_span.traceparent)
+        dispatch = next(span for span in exporter.spans if span.name == "outbox.dispatch")
+        self.assertIsNone(dispatch.parent_span_id)
+        repository_spans = [span for span in exporter.spans if span.name.startswith("repository.outbox_events.")]
+        self.assertTrue(repository_spans)
+        self.assertTrue(all(span.trace_id == dispatch.trace_id for span in repository_spans))
+
+    def test_notifications_resume_the_committing_trace_on_the_listening_worker(self) -> None:
+        exporter = InMemorySpanExporter()
+        configure_tracing(Tracer(exporter))
+        with start_span("request") as request_span:
+            pass
+        item = BoutEvent(
+            event="bout_status",
+            bout_id=str(uuid.uuid4()),
+            promoter_user_id=str(self.promoter_id),
+            bout_status="result_entered",
+            traceparent=request_span.traceparent,
+        )
+        self.assertNotIn("traceparent", json.loads(item.to_json()))
+
+        published: list[tuple[BoutEvent, str | None]] = []
+
+        class RecordingHub(BoutEventHub):
+            def publish(self, item: BoutEvent) -> None:
+                published.append((item, current_traceparent()))
+
+        bridge = PostgresEventBridge(database_url="postgresql+psycopg://unused/unused", hub=RecordingHub())
+        bridge.handle_payload(item.to_notification())
+
+        publish = next(span for span in exporter.spans if span.name == "bout_events.bridge_publish")
+        self.assertEqual(published, [(item, publish.traceparent)])
+        self.assertEqual((publish.trace_id, publish.parent_span_id), (request_span.trace_id, request_span.span_id))
+
+    def _outbox(self) -> list[OutboxEvent]:
+        with Session(self.engine) as session:
+            return list(session.scalars(select(OutboxEvent).order_by(OutboxEvent.id)))
+
+    def _seed_events(self, count: int) -> None:
+        bout_ids = [self._create_bout() for _ in range(count)]
+        for bout_id in bout_ids:
+            with self.SessionLocal() as session:
+                PayoutService(session=session).enter_bout_result(
+                    bout_id=bout_id, winner=BoutWinner.B, actor_user_id=self.promoter_id
+                )
+                session.commit()
+
+    def _create_bout(self) -> uuid.UUID:
+        with self.SessionLocal() as session:
+            fighter_a, fighter_b = session.scalars(select(User.id).where(User.role == UserRole.FIGHTER)).all()
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=self.promoter_id,
+                fighter_a_user_id=fighter_a,
+                fighter_b_user_id=fighter_b,
+                event_datetime_utc=datetime(2026, 3, 1, 20, 0, tzinfo=UTC),
+                promoter_owner_address="rPromoterOutbox",
+                fighter_a_destination="rFighterOutboxA",
+                fighter_b_destination="rFighterOutboxB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_200_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            # Skip the escrow confirmations: these tests only need a bout that can take a result.
+            bout.status = BoutStatus.ESCROWS_CREATED
+            session.commit()
+            return bout.id
+
+    def _seed_users(self) -> uuid.UUID:
+        with Session(self.engine) as session:
+            ids = []
+            for email, role in (
+                ("promoter.outbox@example.test", UserRole.PROMOTER),
+                ("fighter.outbox.a@example.test", UserRole.FIGHTER),
+                ("fighter.outbox.b@example.test", UserRole.FIGHTER),
+            ):
+                user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+                session.add(user)
+                ids.append(user.id)
+            session.commit()
+            return ids[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
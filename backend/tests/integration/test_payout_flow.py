@@ -105,6 +105,21 @@ class PayoutFlowIntegrationTests(unittest.TestCase):
         self.assertEqual(show_a_confirm.status_code, 200)
         self.assertEqual(show_a_confirm.json()["bout_status"], BoutStatus.PAYOUTS_IN_PROGRESS.value)
 
+        lowercase_reuse = self.client.post(
+            f"/bouts/{self.bout_id}/payouts/confirm",
+            headers=self._auth_headers(
+                self.promoter_user_id,
+                self.promoter_email,
+                UserRole.PROMOTER,
+                extra={"Idempotency-Key": "payout-show-b-reused-hash"},
+            ),
+            json=self._build_confirm_payload(
+                escrow_kind=EscrowKind.SHOW_B, tx_hash="txpayout0001", transaction_type="EscrowFinish"
+            ),
+        )
+        self.assertEqual(lowercase_reuse.status_code, 409)
+        self.assertIn("already recorded", lowercase_reuse.json()["detail"])
+
         show_b_payload = self._build_confirm_payload(
             escrow_kind=EscrowKind.SHOW_B,
             tx_hash="TXPAYOUT0002",
@@ -162,7 +177,7 @@ class PayoutFlowIntegrationTests(unittest.TestCase):
 
         xaman_mock = Mock()
         xaman_mock.create_sign_request.side_effect = XamanIntegrationError("xaman_api_connection_error")
-        with patch("app.api.bouts_routes.payout_routes.XamanService.from_settings", return_value=xaman_mock):
+        with patch("app.integrations.xaman_service.XamanService.from_settings", return_value=xaman_mock):
             response = self.client.post(
                 f"/bouts/{self.bout_id}/payouts/prepare",
                 headers=self._auth_headers(self.promoter_user_id, self.promoter_email, UserRole.PROMOTER),
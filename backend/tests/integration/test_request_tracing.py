@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.core.tracing import InMemorySpanExporter, Tracer, configure_tracing
+from app.db.base import Base
+from app.db.session import get_session
+from app.main import create_app
+from app.models.enums import EscrowKind, UserRole
+from app.models.escrow import Escrow
+from app.models.user import User
+from app.services.bout_service import BoutService
+
+
+class RequestTracingIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.bout_id, self.promoter_user_id = self._seed_bout()
+
+        self.exporter = InMemorySpanExporter()
+        configure_tracing(Tracer(self.exporter))
+        self.init_db_patcher = patch("app.main.init_db")
+        self.init_db_patcher.start()
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._override_get_session
+        self.client = TestClient(self.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self.app.dependency_overrides.clear()
+        self.init_db_patcher.stop()
+        configure_tracing(None)
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_confirm_request_produces_single_trace_covering_each_layer(self) -> None:
+        response = self.client.post(
+            f"/bouts/{self.bout_id}/escrows/confirm",
+            headers={**self._promoter_headers(), "Idempotency-Key": "trace-confirm-1"},
+            json=self._build_confirm_payload(EscrowKind.SHOW_A),
+        )
+        self.assertEqual(response.status_code, 200)
+
+        spans = self.exporter.spans
+        root = next(span for span in spans if span.parent_span_id is None)
+        self.assertEqual(root.name, "POST /bouts/{bout_id}/escrows/confirm")
+        self.assertEqual(root.attributes["http.status_code"], 200)
+        self.assertTrue(all(span.trace_id == root.trace_id for span in spans))
+
+        names = {span.name for span in spans}
+        self.assertTrue(
+            {
+                "idempotency.load_replay",
+                "repository.idempotency_keys.get",
+                "repository.bouts.get",
+                "repository.escrows.get_for_bout_kind",
+                "xrpl.validate_escrow_create_confirmation",
+                "repository.audit_logs.add",
+                "uow.commit",
+            }.issubset(names),
+            msg=sorted(names),
+        )
+
+    def _override_get_session(self):
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _seed_bout(self) -> tuple[uuid.UUID, uuid.UUID]:
+        with Session(self.engine) as session:
+            promoter_id = self._insert_user(session, "promoter.trace@example.test", UserRole.PROMOTER)
+            fighter_a_id = self._insert_user(session, "fighter.trace.a@example.test", UserRole.FIGHTER)
+            fighter_b_id = self._insert_user(session, "fighter.trace.b@example.test", UserRole.FIGHTER)
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=promoter_id,
+                fighter_a_user_id=fighter_a_id,
+                fighter_b_user_id=fighter_b_id,
+                event_datetime_utc=datetime(2026, 2, 18, 20, 0, 0, tzinfo=UTC),
+                promoter_owner_address="rPromoterTrace",
+                fighter_a_destination="rFighterTraceA",
+                fighter_b_destination="rFighterTraceB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_500_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            session.commit()
+            return bout.id, promoter_id
+
+    def _build_confirm_payload(self, kind: EscrowKind) -> dict[str, object]:
+        with Session(self.engine) as session:
+            escrow = session.scalar(select(Escrow).where(Escrow.bout_id == self.bout_id, Escrow.kind == kind))
+            assert escrow is not None
+            return {
+                "escrow_kind": kind.value,
+                "tx_hash": "TXTRACE0001",
+                "offer_sequence": 101,
+                "validated": True,
+                "engine_result": "tesSUCCESS",
+                "owner_address": escrow.owner_address,
+                "destination_address": escrow.destination_address,
+                "amount_drops": escrow.amount_drops,
+                "finish_after_ripple": escrow.finish_after_ripple,
+                "cancel_after_ripple": escrow.cancel_after_ripple,
+                "condition_hex": escrow.condition_hex,
+            }
+
+    def _promoter_headers(self) -> dict[str, str]:
+        token = create_access_token(
+            subject=str(self.promoter_user_id),
+            email="promoter.trace@example.test",
+            role=UserRole.PROMOTER.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    @staticmethod
+    def _insert_user(session: Session, email: str, role: UserRole) -> uuid.UUID:
+        user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+        session.add(user)
+        session.flush()
+        return user.id
+
+
+if __name__ == "__main__":
+    unittest.main()
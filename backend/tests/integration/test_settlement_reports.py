@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import tempfile
+import unittest
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.api.dependencies import RequestActor
+from app.api.reports import settlement_report
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.main import create_app
+from app.models.enums import EscrowKind, EscrowStatus, UserRole
+from app.models.escrow import Escrow
+from app.models.user import User
+from app.services import settlement_reports
+from app.services.bout_service import BoutService
+
+_SHOW_A, _SHOW_B, _BONUS = 1_000_000, 1_200_000, 250_000
+
+
+class SettlementReportApiTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.promoter_id, self.other_promoter_id, self.fighter_a_id, self.fighter_b_id = _seed_users(self.engine)
+
+        self.init_db_patcher = patch("app.main.init_db")
+        self.init_db_patcher.start()
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._override_get_session
+        self.client = TestClient(self.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self.app.dependency_overrides.clear()
+        self.init_db_patcher.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_statement_streams_one_csv_line_per_escrow_in_the_window(self) -> None:
+        march = _seed_bout(self.SessionLocal, self.promoter_id, self.fighter_a_id, self.fighter_b_id, day=1)
+        _seed_bout(self.SessionLocal, self.promoter_id, self.fighter_a_id, self.fighter_b_id, day=20, month=4)
+        _seed_bout(self.SessionLocal, self.other_promoter_id, self.fighter_a_id, self.fighter_b_id, day=2)
+
+        response = self.client.get(
+            "/reports/statement",
+            headers=self._headers(),
+            params={"event_from": "2026-03-01T00:00:00+00:00", "event_to": "2026-04-01T00:00:00+00:00"},
+        )
+
+        self.assertEqual(response.status_code, 200, msg=response.text)
+        self.assertTrue(response.headers["content-type"].startswith("text/csv"))
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        self.assertEqual({row["bout_id"] for row in rows}, {str(march)})
+        show_a = next(row for row in rows if row["escrow_kind"] == "show_a")
+        self.assertEqual(
+            (show_a["fighter_user_id"], show_a["purse"], show_a["escrow_status"]),
+            (str(self.fighter_a_id), "show", "finished"),
+        )
+        self.assertEqual((show_a["amount_drops"], show_a["amount_xrp"]), (str(_SHOW_A), "1.000000"))
+        self.assertEqual(
+            (show_a["create_tx_hash"], show_a["close_tx_hash"]), ("TXREPORTCREATE0301SHOW_A", "TXREPORTCLOSE0301SHOW_A")
+        )
+
+    def test_purses_sum_each_fighters_show_and_bonus_by_status(self) -> None:
+        for day in (1, 2):
+            _seed_bout(self.SessionLocal, self.promoter_id, self.fighter_a_id, self.fighter_b_id, day=day)
+
+        response = self.client.get("/reports/purses", headers=self._headers(), params={"format": "ndjson"})
+
+        self.assertEqual(response.status_code, 200, msg=response.text)
+        rows = {(row["fighter_user_id"], row["purse"]): row for row in map(json.loads, response.text.splitlines())}
+        fighter_a_show = rows[(str(self.fighter_a_id), "show")]
+        self.assertEqual(
+            (fighter_a_show["bouts"], fighter_a_show["paid_drops"], fighter_a_show["paid_xrp"]),
+            (2, 2 * _SHOW_A, "2.000000"),
+        )
+        fighter_b_bonus = rows[(str(self.fighter_b_id), "bonus")]
+        self.assertEqual(
+            (fighter_b_bonus["cancelled_drops"], fighter_b_bonus["locked_drops"], fighter_b_bonus["planned_drops"]),
+            (2 * _BONUS, 0, 0),
+        )
+        self.assertEqual(rows[(str(self.fighter_b_id), "show")]["locked_drops"], 2 * _SHOW_B)
+
+    def test_report_body_releases_its_session_when_dependencies_close_early(self) -> None:
+        _seed_bout(self.SessionLocal, self.promoter_id, self.fighter_a_id, self.fighter_b_id, day=1)
+        session = self.SessionLocal()
+        actor = RequestActor(user_id=self.promoter_id, email="promoter@example.test", role=UserRole.PROMOTER)
+        response = settlement_report(
+            "statement", fmt="ndjson", event_from=None, event_to=None, actor=actor, session=session
+        )
+        # FastAPI releases yield dependencies before the body streams on versions older than 0.118.
+        session.close()
+
+        async def read_body() -> bytes:
+            return b"".join([chunk async for chunk in response.body_iterator])
+
+        self.assertEqual(len(asyncio.run(read_body()).splitlines()), 4)
+        self.assertFalse(session.in_transaction())
+
+    def test_rejects_naive_or_inverted_windows(self) -> None:
+        naive = self.client.get(
+            "/reports/statement", headers=self._headers(), params={"event_from": "2026-03-01T00:00:00"}
+        )
+        inverted = self.client.get(
+            "/reports/purses",
+            headers=self._headers(),
+            params={"event_from": "2026-04-01T00:00:00+00:00", "event_to": "2026-03-01T00:00:00+00:00"},
+        )
+        self.assertEqual((naive.status_code, inverted.status_code), (422, 422))
+
+    def _override_get_session(self) -> Session:
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _headers(self) -> dict[str, str]:
+        token = create_access_token(
+            subject=str(self.promoter_id),
+            email="promoter.report@example.test",
+            role=UserRole.PROMOTER.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+
+class SettlementReportCliTests(unittest.TestCase):
+    def test_cli_streams_report_in_chunks_across_every_promoter(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite+pysqlite:///{Path(tmp) / 'reports.db'}"
+            engine = create_engine(url, future=True)
+            Base.metadata.create_all(bind=engine)
+            promoter_id, other_promoter_id, fighter_a_id, fighter_b_id = _seed_users(engine)
+            SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+            for day, promoter in enumerate((promoter_id, other_promoter_id, promoter_id), start=1):
+                _seed_bout(SessionLocal, promoter, fighter_a_id, fighter_b_id, day=day)
+            engine.dispose()
+
+            output = Path(tmp) / "statement.ndjson"
+            with patch.object(settlement_reports, "REPORT_CHUNK_ROWS", 5):
+                exit_code = settlement_reports.main(
+                    ["statement", "--format", "ndjson", "--database-url", url, "--output", str(output)]
+                )
+            rows = [json.loads(line) for line in output.read_text().splitlines()]
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(len(rows), 12)
+        self.assertEqual({row["promoter_user_id"] for row in rows}, {str(promoter_id), str(other_promoter_id)})
+        self.assertEqual(
+            [row["event_datetime_utc"][:10] for row in rows[::4]], ["2026-03-01", "2026-03-02", "2026-03-03"]
+        )
+
+
+def _seed_users(engine) -> tuple[uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID]:
+    with Session(engine) as session:
+        ids = []
+        for email, role in (
+            ("promoter.report@example.test", UserRole.PROMOTER),
+            ("promoter.report.other@example.test", UserRole.PROMOTER),
+            ("fighter.report.a@example.test", UserRole.FIGHTER),
+            ("fighter.report.b@example.test", UserRole.FIGHTER),
+        ):
+            user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+            session.add(user)
+            ids.append(user.id)
+        session.commit()
+        return ids[0], ids[1], ids[2], ids[3]
+
+
+def _seed_bout(
+    session_factory: sessionmaker,
+    promoter_id: uuid.UUID,
+    fighter_a_id: uuid.UUID,
+    fighter_b_id: uuid.UUID,
+    *,
+    day: int,
+    month: int = 3,
+) -> uuid.UUID:
+    """A drafted bout whose escrows are moved straight to a mid-payout mix of statuses."""
+    with session_factory() as session:
+        bout = BoutService(session=session).create_bout_draft(
+            promoter_user_id=promoter_id,
+            fighter_a_user_id=fighter_a_id,
+            fighter_b_user_id=fighter_b_id,
+            event_datetime_utc=datetime(2026, month, day, 20, 0, tzinfo=UTC),
+            promoter_owner_address="rPromoterReport",
+            fighter_a_destination="rFighterReportA",
+            fighter_b_destination="rFighterReportB",
+            show_a_drops=_SHOW_A,
+            show_b_drops=_SHOW_B,
+            bonus_a_drops=_BONUS,
+            bonus_b_drops=_BONUS,
+        )
+        session.flush()
+        statuses = {
+            EscrowKind.SHOW_A: EscrowStatus.FINISHED,
+            EscrowKind.SHOW_B: EscrowStatus.CREATED,
+            EscrowKind.BONUS_A: EscrowStatus.FINISHED,
+            EscrowKind.BONUS_B: EscrowStatus.CANCELLED,
+        }
+        for escrow in session.scalars(select(Escrow).where(Escrow.bout_id == bout.id)):
+            escrow.status = statuses[escrow.kind]
+            # Tx hashes are unique per escrow (uq_escrows_*_tx_hash).
+            suffix = f"{month:02d}{day:02d}{escrow.kind.value.upper()}"
+            escrow.create_tx_hash = f"TXREPORTCREATE{suffix}"
+            if escrow.status != EscrowStatus.CREATED:
+                escrow.close_tx_hash = f"TXREPORTCLOSE{suffix}"
+        session.commit()
+        return bout.id
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import unittest
+
+from app.integrations.xaman_service import XamanIntegrationError, XamanPayloadStatus, XamanService
+from app.perf.xaman_stand_in import XamanStandInConfig, XamanStandInServer
+
+
+class XamanStandInIntegrationTests(unittest.TestCase):
+    def test_api_mode_round_trip_against_stand_in(self) -> None:
+        with XamanStandInServer() as stand_in:
+            service = self._service(stand_in.base_url)
+
+            sign_request = service.create_sign_request(
+                tx_json={"TransactionType": "EscrowFinish", "Account": "rStandIn"},
+                reference="stand-in-1",
+            )
+            self.assertEqual(sign_request.mode, "api")
+            self.assertEqual(
+                service.get_payload_status(payload_id=sign_request.payload_id).status,
+                XamanPayloadStatus.OPEN,
+            )
+
+            stand_in.resolve(sign_request.payload_id, signed=True, tx_hash="ABCDEF")
+            resolved = service.get_payload_status(payload_id=sign_request.payload_id)
+
+        self.assertEqual(resolved.status, XamanPayloadStatus.SIGNED)
+        self.assertEqual(resolved.tx_hash, "ABCDEF")
+        self.assertEqual(stand_in.stats.payloads_created, 1)
+        self.assertEqual(stand_in.stats.status_requests, 2)
+
+    def test_injected_errors_surface_as_http_errors(self) -> None:
+        with XamanStandInServer(config=XamanStandInConfig(error_rate=1.0, error_status=503)) as stand_in:
+            service = self._service(stand_in.base_url)
+            with self.assertRaisesRegex(XamanIntegrationError, "xaman_api_http_error"):
+                service.create_sign_request(tx_json={"TransactionType": "EscrowCancel"}, reference="stand-in-2")
+
+        self.assertEqual(stand_in.stats.injected_errors, 1)
+
+    @staticmethod
+    def _service(base_url: str) -> XamanService:
+        return XamanService(
+            mode="api",
+            api_base_url=base_url,
+            api_key="stand-in-key",
+            api_secret="stand-in-secret",
+            timeout_seconds=5,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
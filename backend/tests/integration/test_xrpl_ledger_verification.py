@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import socket
+import unittest
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.integrations.xrpl_client import XrplJsonRpcClient, get_xrpl_ledger_client
+from app.main import create_app
+from app.models.enums import BoutStatus, EscrowKind, EscrowStatus, UserRole
+from app.models.escrow import Escrow
+from app.models.idempotency_key import IdempotencyKey
+from app.models.user import User
+from app.perf.xrpl_stand_in import XrplStandInServer
+from app.services.bout_service import BoutService
+
+_KIND_SEQUENCES = {EscrowKind.SHOW_A: 101, EscrowKind.SHOW_B: 102, EscrowKind.BONUS_A: 103, EscrowKind.BONUS_B: 104}
+
+
+class XrplLedgerVerificationIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.bout_id, self.promoter_user_id, self.promoter_email = self._seed_bout()
+
+        self.stand_in = XrplStandInServer().start()
+        self.ledger = XrplJsonRpcClient(url=self.stand_in.url, timeout_seconds=5, pool_size=2)
+
+        self.init_db_patcher = patch("app.main.init_db")
+        self.init_db_patcher.start()
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._override_get_session
+        self.app.dependency_overrides[get_xrpl_ledger_client] = lambda: self.ledger
+        self.client = TestClient(self.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self.app.dependency_overrides.clear()
+        self.init_db_patcher.stop()
+        self.ledger.close()
+        self.stand_in.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_escrow_confirm_uses_ledger_data_instead_of_client_claims(self) -> None:
+        escrow = self._escrow(EscrowKind.SHOW_A)
+        tx_hash = self._publish_escrow_create(escrow)
+
+        response = self.client.post(
+            f"/bouts/{self.bout_id}/escrows/confirm",
+            json=self._untrusted_create_payload(EscrowKind.SHOW_A, tx_hash=tx_hash.lower()),
+            headers=self._headers({"Idempotency-Key": "ledger-create-1"}),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["offer_sequence"], _KIND_SEQUENCES[EscrowKind.SHOW_A])
+        self.assertEqual(body["tx_hash"], tx_hash)
+        self.assertEqual(self.stand_in.stats.requests_by_method, {"tx": 1})
+
+    def test_escrow_confirm_rejects_ledger_mismatch_even_when_client_payload_matches(self) -> None:
+        escrow = self._escrow(EscrowKind.SHOW_B)
+        tx_hash = self._publish_escrow_create(escrow, Amount=str(escrow.amount_drops + 1))
+        payload = self._untrusted_create_payload(EscrowKind.SHOW_B, tx_hash=tx_hash)
+        payload.update(validated=True, engine_result="tesSUCCESS", amount_drops=escrow.amount_drops)
+
+        response = self.client.post(
+            f"/bouts/{self.bout_id}/escrows/confirm",
+            json=payload,
+            headers=self._headers({"Idempotency-Key": "ledger-create-mismatch"}),
+        )
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self._escrow(EscrowKind.SHOW_B).failure_code, "invalid_confirmation")
+
+    def test_unknown_tx_hash_is_treated_as_unvalidated(self) -> None:
+        response = self.client.post(
+            f"/bouts/{self.bout_id}/escrows/confirm",
+            json=self._untrusted_create_payload(EscrowKind.SHOW_A, tx_hash="F" * 64),
+            headers=self._headers({"Idempotency-Key": "ledger-create-missing"}),
+        )
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self._escrow(EscrowKind.SHOW_A).failure_code, "confirmation_timeout")
+
+    def test_ledger_outage_returns_502_without_recording_an_outcome(self) -> None:
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            unused_port = probe.getsockname()[1]
+        offline = XrplJsonRpcClient(url=f"http://127.0.0.1:{unused_port}/", timeout_seconds=1, pool_size=1)
+        self.app.dependency_overrides[get_xrpl_ledger_client] = lambda: offline
+
+        response = self.client.post(
+            f"/bouts/{self.bout_id}/escrows/confirm",
+            json=self._untrusted_create_payload(EscrowKind.SHOW_A, tx_hash="E" * 64),
+            headers=self._headers({"Idempotency-Key": "ledger-create-outage"}),
+        )
+
+        self.assertEqual(response.status_code, 502)
+        with Session(self.engine) as session:
+            self.assertEqual(session.scalar(select(func.count()).select_from(IdempotencyKey)), 0)
+        self.assertEqual(self._escrow(EscrowKind.SHOW_A).status, EscrowStatus.PLANNED)
+
+    def test_payout_confirm_fetches_finish_transaction_from_ledger(self) -> None:
+        for kind in _KIND_SEQUENCES:
+            tx_hash = self._publish_escrow_create(self._escrow(kind))
+            response = self.client.post(
+                f"/bouts/{self.bout_id}/escrows/confirm",
+                json=self._untrusted_create_payload(kind, tx_hash=tx_hash),
+                headers=self._headers({"Idempotency-Key": f"ledger-create-{kind.value}"}),
+            )
+            self.assertEqual(response.status_code, 200)
+        result = self.client.post(
+            f"/bouts/{self.bout_id}/result",
+            json={"winner": "A"},
+            headers=self._headers(role=UserRole.ADMIN),
+        )
+        self.assertEqual(result.status_code, 200)
+
+        escrow = self._escrow(EscrowKind.SHOW_A)
+        finish_hash = "D" * 64
+        self.stand_in.add_transaction(
+            finish_hash,
+            {
+                "TransactionType": "EscrowFinish",
+                "Account": escrow.owner_address,
+                "Owner": escrow.owner_address,
+                "OfferSequence": escrow.offer_sequence,
+            },
+            close_time_ripple=escrow.finish_after_ripple + 60,
+        )
+        response = self.client.post(
+            f"/bouts/{self.bout_id}/payouts/confirm",
+            json={
+                "escrow_kind": EscrowKind.SHOW_A.value,
+                "tx_hash": finish_hash,
+                "validated": False,
+                "engine_result": "tecCLAIMED",
+                "transaction_type": "EscrowCancel",
+                "owner_address": "rSomeoneElse",
+                "offer_sequence": 1,
+                "close_time_ripple": 0,
+            },
+            headers=self._headers({"Idempotency-Key": "ledger-payout-show-a"}),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["escrow_status"], EscrowStatus.FINISHED.value)
+        self.assertEqual(response.json()["bout_status"], BoutStatus.PAYOUTS_IN_PROGRESS.value)
+        self.assertLessEqual(self.ledger.connections_opened, 2)
+
+    def _publish_escrow_create(self, escrow: Escrow, **overrides: object) -> str:
+        tx_hash = uuid.uuid4().hex.upper() * 2
+        tx_json: dict[str, object] = {
+            "TransactionType": "EscrowCreate",
+            "Account": escrow.owner_address,
+            "Destination": escrow.destination_address,
+            "Amount": str(escrow.amount_drops),
+            "FinishAfter": escrow.finish_after_ripple,
+            "Sequence": _KIND_SEQUENCES[escrow.kind],
+        }
+        if escrow.cancel_after_ripple is not None:
+            tx_json["CancelAfter"] = escrow.cancel_after_ripple
+        if escrow.condition_hex is not None:
+            tx_json["Condition"] = escrow.condition_hex
+        tx_json.update(overrides)
+        self.stand_in.add_transaction(tx_hash, tx_json)
+        return tx_hash
+
+    def _untrusted_create_payload(self, kind: EscrowKind, *, tx_hash: str) -> dict[str, object]:
+        """Client-posted fields that ledger verification must ignore (only ``tx_hash`` is used)."""
+        return {
+            "escrow_kind": kind.value,
+            "tx_hash": tx_hash,
+            "offer_sequence": 1,
+            "validated": False,
+            "engine_result": "unknown",
+            "owner_address": "rUntrusted",
+            "destination_address": "rUntrusted",
+            "amount_drops": 1,
+            "finish_after_ripple": 0,
+        }
+
+    def _escrow(self, kind: EscrowKind) -> Escrow:
+        with Session(self.engine) as session:
+            escrow = session.scalar(select(Escrow).where(Escrow.bout_id == self.bout_id, Escrow.kind == kind))
+            assert escrow is not None
+            session.expunge(escrow)
+            return escrow
+
+    def _override_get_session(self) -> Session:
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _seed_bout(self) -> tuple[uuid.UUID, uuid.UUID, str]:
+        with Session(self.engine) as session:
+            promoter_email = "promoter.ledger@example.test"
+            promoter_id = self._insert_user(session, promoter_email, UserRole.PROMOTER)
+            fighter_a_id = self._insert_user(session, "fighter.ledger.a@example.test", UserRole.FIGHTER)
+            fighter_b_id = self._insert_user(session, "fighter.ledger.b@example.test", UserRole.FIGHTER)
+            self.admin_user_id = self._insert_user(session, "admin.ledger@example.test", UserRole.ADMIN)
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=promoter_id,
+                fighter_a_user_id=fighter_a_id,
+                fighter_b_user_id=fighter_b_id,
+                event_datetime_utc=datetime(2026, 2, 18, 20, 0, 0, tzinfo=UTC),
+                promoter_owner_address="rPromoterLedger",
+                fighter_a_destination="rFighterLedgerA",
+                fighter_b_destination="rFighterLedgerB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_500_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            session.commit()
+            return bout.id, promoter_id, promoter_email
+
+    @staticmethod
+    def _insert_user(session: Session, email: str, role: UserRole) -> uuid.UUID:
+        user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+        session.add(user)
+        session.flush()
+        return user.id
+
+    def _headers(self, extra: dict[str, str] | None = None, *, role: UserRole = UserRole.PROMOTER) -> dict[str, str]:
+        is_admin = role == UserRole.ADMIN
+        token = create_access_token(
+            subject=str(self.admin_user_id if is_admin else self.promoter_user_id),
+            email="admin.ledger@example.test" if is_admin else self.promoter_email,
+            role=role.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        if extra:
+            headers.update(extra)
+        return headers
+
+
+if __name__ == "__main__":
+    unittest.main()
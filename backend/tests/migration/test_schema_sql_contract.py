@@ -1,13 +1,42 @@
 from __future__ import annotations
 
+import re
+import subprocess
+import sys
 import unittest
 from pathlib import Path
 
+import app.models  # noqa: F401
+from app.db.base import Base
+
+SQL_PATH = Path(__file__).resolve().parents[2] / "sql" / "001_init_schema.sql"
+_TABLE_PATTERN = re.compile(r"CREATE TABLE (\w+) \((.*?)\n\);", re.DOTALL)
+_CONSTRAINT_PREFIXES = ("CONSTRAINT", "CHECK", "PRIMARY", "UNIQUE", "FOREIGN")
+_INDEX_PATTERN = re.compile(r"^(CREATE (?:UNIQUE )?INDEX (\w+) .*;|DROP INDEX (\w+);)$", re.MULTILINE)
+
+
+def _sql_tables(text: str) -> dict[str, set[str]]:
+    tables: dict[str, set[str]] = {}
+    for name, body in _TABLE_PATTERN.findall(text):
+        lines = (line.strip() for line in body.splitlines())
+        tables[name] = {line.split()[0] for line in lines if line and not line.startswith(_CONSTRAINT_PREFIXES)}
+    return tables
+
+
+def _net_indexes(text: str) -> dict[str, str]:
+    """Index name to its CREATE statement, after replaying the CREATE/DROP INDEX statements in order."""
+    indexes: dict[str, str] = {}
+    for statement, created, dropped in _INDEX_PATTERN.findall(text):
+        if created:
+            indexes[created] = statement
+        else:
+            indexes.pop(dropped, None)
+    return indexes
+
 
 class SchemaSqlContractTests(unittest.TestCase):
     def test_schema_contains_required_enums_and_bigint_fields(self) -> None:
-        sql_path = Path(__file__).resolve().parents[2] / "sql" / "001_init_schema.sql"
-        text = sql_path.read_text(encoding="utf-8")
+        text = SQL_PATH.read_text(encoding="utf-8")
 
         self.assertIn("CREATE TYPE user_role", text)
         self.assertIn("CREATE TYPE bout_status", text)
@@ -18,6 +47,32 @@ class SchemaSqlContractTests(unittest.TestCase):
         for column in ["show_a_drops BIGINT", "show_b_drops BIGINT", "bonus_a_drops BIGINT", "bonus_b_drops BIGINT"]:
             self.assertIn(column, text)
 
+    def test_schema_declares_every_model_table_and_column(self) -> None:
+        tables = _sql_tables(SQL_PATH.read_text(encoding="utf-8"))
+
+        self.assertEqual(set(tables), set(Base.metadata.tables))
+        for name, table in Base.metadata.tables.items():
+            self.assertEqual(tables[name], {column.name for column in table.columns}, msg=name)
+
+    def test_schema_indexes_match_the_migration_head(self) -> None:
+        upgrade = subprocess.run(
+            [sys.executable, "-m", "alembic", "-c", "backend/alembic.ini", "upgrade", "head", "--sql"],
+            cwd=SQL_PATH.parents[2],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        self.assertEqual(upgrade.returncode, 0, msg=upgrade.stderr)
+
+        self.assertEqual(_net_indexes(SQL_PATH.read_text(encoding="utf-8")), _net_indexes(upgrade.stdout))
+
+    def test_schema_uses_the_migrated_storage_types(self) -> None:
+        text = SQL_PATH.read_text(encoding="utf-8")
+
+        self.assertIn("details JSONB NULL", text)
+        self.assertIn("response_body BYTEA NOT NULL", text)
+        self.assertIn("response_encoding VARCHAR(16) NOT NULL DEFAULT 'identity'", text)
+
 
 if __name__ == "__main__":
     unittest.main()
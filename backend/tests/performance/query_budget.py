@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+import unittest
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass(frozen=True)
+class RecordedStatement:
+    statement: str
+    duration_ms: float
+
+
+@dataclass
+class SqlStatementRecorder:
+    """Counts and times every SQL statement executed on an engine via cursor-execute events."""
+
+    engine: Engine
+    statements: list[RecordedStatement] = field(default_factory=list)
+    _started: list[float] = field(default_factory=list, repr=False)
+
+    def __enter__(self) -> SqlStatementRecorder:
+        event.listen(self.engine, "before_cursor_execute", self._before)
+        event.listen(self.engine, "after_cursor_execute", self._after)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        event.remove(self.engine, "before_cursor_execute", self._before)
+        event.remove(self.engine, "after_cursor_execute", self._after)
+        return False
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(item.duration_ms for item in self.statements)
+
+    def describe(self) -> str:
+        return "\n".join(
+            f"  {index:>2}. {item.duration_ms:7.2f}ms {' '.join(item.statement.split())[:160]}"
+            for index, item in enumerate(self.statements, start=1)
+        )
+
+    def _before(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        self._started.append(time.perf_counter())
+
+    def _after(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        started = self._started.pop()
+        self.statements.append(
+            RecordedStatement(statement=statement, duration_ms=(time.perf_counter() - started) * 1000)
+        )
+
+
+class QueryBudgetMixin(unittest.TestCase):
+    """TestCase helper asserting a block stays within a pinned statement count and SQL time budget."""
+
+    engine: Engine
+
+    @contextmanager
+    def assert_query_budget(self, *, flow: str, max_statements: int, max_total_ms: float):
+        recorder = SqlStatementRecorder(engine=self.engine)
+        with recorder:
+            yield recorder
+        self.assertLessEqual(
+            recorder.count,
+            max_statements,
+            msg=f"{flow} issued {recorder.count} SQL statements (budget {max_statements}):\n{recorder.describe()}",
+        )
+        self.assertLessEqual(
+            recorder.total_ms,
+            max_total_ms,
+            msg=f"{flow} spent {recorder.total_ms:.2f}ms in SQL (budget {max_total_ms:.0f}ms):\n{recorder.describe()}",
+        )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import unittest
+from pathlib import Path
+
+from app.perf.lifecycle_benchmark import (
+    LIFECYCLE_STEPS,
+    compare_to_baseline,
+    percentile,
+    run_lifecycle_benchmark,
+)
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "lifecycle_benchmark.json"
+
+
+class LifecycleBenchmarkTests(unittest.TestCase):
+    # In-suite run is short and machine-dependent, so latency is gated on p50 only, at twice the baseline
+    # (re-recorded at the tip, short runs land within 10% of it); allocation peaks are stable and gated tightly.
+    # Re-record the baseline whenever a change legitimately moves a step (docs/performance-regression-gates.md).
+    ITERATIONS = 5
+    LATENCY_TOLERANCE = 1.0
+    ALLOCATION_TOLERANCE = 0.5
+
+    def test_lifecycle_benchmark_stays_within_stored_baseline(self) -> None:
+        results = run_lifecycle_benchmark(iterations=self.ITERATIONS, allocation_iterations=2)
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+
+        self.assertEqual(tuple(results["steps"]), LIFECYCLE_STEPS)
+        self.assertEqual(results["steps"]["escrow_confirm"]["samples"], self.ITERATIONS * 4)
+        self.assertEqual(results["steps"]["payout_confirm"]["samples"], self.ITERATIONS * 4)
+        for step in results["steps"].values():
+            self.assertLessEqual(step["p50_ms"], step["p95_ms"])
+            self.assertLessEqual(step["p95_ms"], step["p99_ms"])
+            self.assertGreater(step["throughput_per_s"], 0)
+            self.assertGreater(step["peak_alloc_kib"], 0)
+
+        regressions = compare_to_baseline(
+            json.loads(json.dumps(results)),
+            baseline,
+            latency_tolerance=self.LATENCY_TOLERANCE,
+            allocation_tolerance=self.ALLOCATION_TOLERANCE,
+            latency_metrics=("p50_ms",),
+        )
+        self.assertEqual(regressions, [])
+
+    def test_compare_to_baseline_flags_latency_and_allocation_regressions(self) -> None:
+        baseline = {"steps": {"payout_confirm": {"p50_ms": 10.0, "p95_ms": 20.0, "peak_alloc_kib": 100.0}}}
+        results = {"steps": {"payout_confirm": {"p50_ms": 12.0, "p95_ms": 31.0, "peak_alloc_kib": 130.0}}}
+
+        regressions = compare_to_baseline(results, baseline, latency_tolerance=0.5, allocation_tolerance=0.25)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("payout_confirm: p95_ms"))
+        self.assertTrue(regressions[1].startswith("payout_confirm: peak_alloc_kib"))
+        self.assertEqual(
+            compare_to_baseline({"steps": {}}, baseline, latency_tolerance=0.5, allocation_tolerance=0.25),
+            ["payout_confirm: missing from results"],
+        )
+
+    def test_percentile_uses_nearest_rank(self) -> None:
+        values = [float(value) for value in range(1, 101)]
+
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 95), 95.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+        with self.assertRaisesRegex(ValueError, "benchmark_no_samples"):
+            percentile([], 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+
+class LoadHarnessCliTests(unittest.TestCase):
+    def test_cli_drives_concurrent_promoters_through_lifecycle(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "load.json"
+            completed = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "app.perf.load_harness",
+                    "--promoters",
+                    "1,3",
+                    "--bouts-per-promoter",
+                    "1",
+                    "--xaman-latency-ms",
+                    "1",
+                    "--xaman-jitter-ms",
+                    "0",
+                    "--output",
+                    str(output),
+                ],
+                cwd=BACKEND_ROOT,
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
+            reports = json.loads(output.read_text(encoding="utf-8"))
+
+        self.assertEqual([report["promoters"] for report in reports], [1, 3])
+        for report in reports:
+            self.assertEqual(report["failed_bouts"], 0)
+            self.assertEqual(report["completed_bouts"], report["promoters"])
+            self.assertEqual(report["rate_502"], 0.0)
+            self.assertGreater(report["throughput_rps"], 0)
+            self.assertGreater(report["pool_checkouts"], 0)
+        self.assertIn("promoters", completed.stdout.splitlines()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_session
+from app.main import create_app
+from app.models.enums import EscrowKind, UserRole
+from app.models.escrow import Escrow
+from app.models.user import User
+from app.services.bout_service import BoutService
+
+from .query_budget import QueryBudgetMixin
+
+
+class QueryBudgetTests(QueryBudgetMixin):
+    """Pinned SQL statement budgets per main flow; raise a budget only with a reviewed reason."""
+
+    # Drafting a bout and confirming an escrow store the unsigned payloads prepare serves (+1 multi-row insert
+    # each); an escrow confirm drops the spent create payload and a payout confirm the now-stale close payloads
+    # (+1 delete each).
+    # Every state change (and recorded failure) rewrites the bout_summaries row in one UPDATE, or one INSERT at
+    # drafting time (+1 on create, confirm, result, payout confirm and a declined signing reconcile).
+    # The same transitions append their domain events to outbox_events in one executemany INSERT at commit (+1 on
+    # confirm, result, payout confirm and a declined signing reconcile).
+    CREATE_BOUT_MAX_STATEMENTS = 5
+    ESCROW_PREPARE_MAX_STATEMENTS = 2
+    # Escrow confirm queues its finish/cancel deadlines (+1 multi-row insert); entering the result releases
+    # deadlines that were waiting on it (+1 update); payout prepare reads scheduler-prepared sign requests (+1 select).
+    # Escrow and payout confirms reject a tx hash already recorded on any escrow (+1 unique-index probe).
+    # Entering the result stores the winner's bonus finish, the only payload carrying a fulfillment (+1 escrow
+    # select, +1 insert).
+    ESCROW_CONFIRM_MAX_STATEMENTS = 13
+    ESCROW_CONFIRM_FINAL_MAX_STATEMENTS = 14
+    RESULT_MAX_STATEMENTS = 9
+    PAYOUT_PREPARE_MAX_STATEMENTS = 3
+    PAYOUT_CONFIRM_MAX_STATEMENTS = 11
+    PAYOUT_CONFIRM_CLOSING_MAX_STATEMENTS = 11
+    SIGNING_RECONCILE_MAX_STATEMENTS = 8
+    # Fighter lookup plus one multi-row insert each for bouts, summaries, escrows and payloads, whatever the card size.
+    CARD_IMPORT_MAX_STATEMENTS = 5
+    CARD_IMPORT_BOUTS = 200
+    # One keyset bout page plus one grouped escrow status count, independent of how many bouts the promoter has.
+    BOUT_LIST_MAX_STATEMENTS = 2
+    BOUT_LIST_PAGE_SIZE = 100
+    # Each settlement report is one set-based query read in chunks, however many bouts the window covers.
+    SETTLEMENT_REPORT_MAX_STATEMENTS = 1
+    FLOW_MAX_SQL_MS = 250.0
+
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        self.promoter_id, self.admin_id, self.fighter_a_id, self.fighter_b_id = self._seed_users()
+
+        self.init_db_patcher = patch("app.main.init_db")
+        self.init_db_patcher.start()
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._override_get_session
+        self.client = TestClient(self.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self.app.dependency_overrides.clear()
+        self.init_db_patcher.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_create_bout_budget(self) -> None:
+        with self.assert_query_budget(
+            flow="create bout",
+            max_statements=self.CREATE_BOUT_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            self._create_bout()
+
+    def test_escrow_prepare_budget(self) -> None:
+        bout_id = self._create_bout()
+
+        with self.assert_query_budget(
+            flow="escrow prepare",
+            max_statements=self.ESCROW_PREPARE_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            response = self.client.post(f"/bouts/{bout_id}/escrows/prepare", headers=self._promoter_headers())
+        self.assertEqual(response.status_code, 200)
+
+    def test_escrow_confirm_budgets(self) -> None:
+        bout_id = self._create_bout()
+        kinds = list(EscrowKind)
+        first_payload = self._escrow_confirm_payload(bout_id, kinds[0])
+
+        with self.assert_query_budget(
+            flow="escrow confirm",
+            max_statements=self.ESCROW_CONFIRM_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            self._confirm_escrow(bout_id, kinds[0], payload=first_payload)
+        for kind in kinds[1:-1]:
+            self._confirm_escrow(bout_id, kind)
+        final_payload = self._escrow_confirm_payload(bout_id, kinds[-1])
+        with self.assert_query_budget(
+            flow="escrow confirm (final, bout transition)",
+            max_statements=self.ESCROW_CONFIRM_FINAL_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            response = self._confirm_escrow(bout_id, kinds[-1], payload=final_payload)
+        self.assertEqual(response.json()["bout_status"], "escrows_created")
+
+    def test_result_and_payout_prepare_budgets(self) -> None:
+        bout_id = self._create_bout_with_confirmed_escrows()
+
+        with self.assert_query_budget(
+            flow="enter result",
+            max_statements=self.RESULT_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            self._enter_result(bout_id)
+        with self.assert_query_budget(
+            flow="payout prepare",
+            max_statements=self.PAYOUT_PREPARE_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            response = self.client.post(f"/bouts/{bout_id}/payouts/prepare", headers=self._promoter_headers())
+        self.assertEqual(response.status_code, 200)
+
+    def test_payout_confirm_budgets(self) -> None:
+        bout_id = self._create_bout_with_confirmed_escrows()
+        self._enter_result(bout_id)
+        show_a_payload = self._payout_confirm_payload(bout_id, EscrowKind.SHOW_A, "EscrowFinish")
+
+        with self.assert_query_budget(
+            flow="payout confirm",
+            max_statements=self.PAYOUT_CONFIRM_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            self._confirm_payout(bout_id, EscrowKind.SHOW_A, payload=show_a_payload)
+        self._confirm_payout(
+            bout_id, EscrowKind.SHOW_B, payload=self._payout_confirm_payload(bout_id, EscrowKind.SHOW_B, "EscrowFinish")
+        )
+        bonus_a_payload = self._payout_confirm_payload(bout_id, EscrowKind.BONUS_A, "EscrowFinish")
+        with self.assert_query_budget(
+            flow="payout confirm (closing)",
+            max_statements=self.PAYOUT_CONFIRM_CLOSING_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            response = self._confirm_payout(bout_id, EscrowKind.BONUS_A, payload=bonus_a_payload)
+        self.assertEqual(response.json()["bout_status"], "closed")
+
+    def test_signing_reconcile_budget(self) -> None:
+        bout_id = self._create_bout()
+
+        with self.assert_query_budget(
+            flow="escrow signing reconcile",
+            max_statements=self.SIGNING_RECONCILE_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            response = self.client.post(
+                f"/bouts/{bout_id}/escrows/signing/reconcile",
+                headers=self._promoter_headers(),
+                json={
+                    "escrow_kind": EscrowKind.SHOW_A.value,
+                    "payload_id": "payload-budget-1",
+                    "observed_status": "declined",
+                },
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_card_import_budget(self) -> None:
+        card = {"bouts": [self._card_bout(index) for index in range(self.CARD_IMPORT_BOUTS)]}
+
+        with self.assert_query_budget(
+            flow=f"card import ({self.CARD_IMPORT_BOUTS} bouts)",
+            max_statements=self.CARD_IMPORT_MAX_STATEMENTS,
+            max_total_ms=self.FLOW_MAX_SQL_MS,
+        ):
+            response = self.client.post("/bouts/cards/import", headers=self._promoter_headers(), json=card)
+        self.assertEqual(response.status_code, 201, msg=response.text)
+        self.assertEqual(response.json()["created"], self.CARD_IMPORT_BOUTS)
+
+    def test_bout_list_budget(self) -> None:
+        card = {"bouts": [self._card_bout(index) for index in range(self.CARD_IMPORT_BOUTS)]}
+        response = self.client.post("/bouts/cards/import", headers=self._promoter_headers(), json=card)
+        self.assertEqual(response.status_code, 201, msg=response.text)
+
+        cursor = None
+        for page in range(2):
+            with self.assert_query_budget(
+                flow=f"bout list page {page + 1}",
+                max_statements=self.BOUT_LIST_MAX_STATEMENTS,
+                max_total_ms=self.FLOW_MAX_SQL_MS,
+            ):
+                response = self.client.get(
+                    "/bouts",
+                    headers=self._promoter_headers(),
+                    params={"limit": self.BOUT_LIST_PAGE_SIZE, **({"cursor": cursor} if cursor else {})},
+                )
+            self.assertEqual(response.status_code, 200, msg=response.text)
+            self.assertEqual(len(response.json()["items"]), self.BOUT_LIST_PAGE_SIZE)
+            cursor = response.json()["next_cursor"]
+
+    def test_settlement_report_budgets(self) -> None:
+        card = {"bouts": [self._card_bout(index) for index in range(self.CARD_IMPORT_BOUTS)]}
+        response = self.client.post("/bouts/cards/import", headers=self._promoter_headers(), json=card)
+        self.assertEqual(response.status_code, 201, msg=response.text)
+
+        for report, expected_lines in (("statement", 4 * self.CARD_IMPORT_BOUTS + 1), ("purses", 5)):
+            with self.assert_query_budget(
+                flow=f"settlement report {report} ({self.CARD_IMPORT_BOUTS} bouts)",
+                max_statements=self.SETTLEMENT_REPORT_MAX_STATEMENTS,
+                max_total_ms=self.FLOW_MAX_SQL_MS,
+            ):
+                response = self.client.get(f"/reports/{report}", headers=self._promoter_headers())
+            self.assertEqual(response.status_code, 200, msg=response.text)
+            self.assertEqual(len(response.text.splitlines()), expected_lines)
+
+    def _card_bout(self, index: int) -> dict[str, object]:
+        return {
+            "fighter_a_user_id": str(self.fighter_a_id),
+            "fighter_b_user_id": str(self.fighter_b_id),
+            "event_datetime_utc": f"2026-03-01T{index % 24:02d}:00:00+00:00",
+            "promoter_owner_address": "rPromoterBudget",
+            "fighter_a_destination": "rFighterBudgetA",
+            "fighter_b_destination": "rFighterBudgetB",
+            "show_a_drops": 1_000_000 + index,
+            "show_b_drops": 1_200_000,
+            "bonus_a_drops": 250_000,
+            "bonus_b_drops": 250_000,
+        }
+
+    def _create_bout(self) -> uuid.UUID:
+        with Session(self.engine) as session:
+            bout = BoutService(session=session).create_bout_draft(
+                promoter_user_id=self.promoter_id,
+                fighter_a_user_id=self.fighter_a_id,
+                fighter_b_user_id=self.fighter_b_id,
+                event_datetime_utc=datetime(2026, 2, 18, 20, 0, 0, tzinfo=UTC),
+                promoter_owner_address="rPromoterBudget",
+                fighter_a_destination="rFighterBudgetA",
+                fighter_b_destination="rFighterBudgetB",
+                show_a_drops=1_000_000,
+                show_b_drops=1_200_000,
+                bonus_a_drops=250_000,
+                bonus_b_drops=250_000,
+            )
+            session.commit()
+            return bout.id
+
+    def _create_bout_with_confirmed_escrows(self) -> uuid.UUID:
+        bout_id = self._create_bout()
+        for kind in EscrowKind:
+            self._confirm_escrow(bout_id, kind)
+        return bout_id
+
+    def _confirm_escrow(self, bout_id: uuid.UUID, kind: EscrowKind, *, payload: dict[str, object] | None = None):
+        response = self.client.post(
+            f"/bouts/{bout_id}/escrows/confirm",
+            headers={**self._promoter_headers(), "Idempotency-Key": f"budget-create-{bout_id}-{kind.value}"},
+            json=payload or self._escrow_confirm_payload(bout_id, kind),
+        )
+        self.assertEqual(response.status_code, 200, msg=response.text)
+        return response
+
+    def _escrow_confirm_payload(self, bout_id: uuid.UUID, kind: EscrowKind) -> dict[str, object]:
+        escrow = self._load_escrow(bout_id, kind)
+        return {
+            "escrow_kind": kind.value,
+            "tx_hash": f"TXBUDGETCREATE{kind.value.upper()}",
+            "offer_sequence": 7000 + list(EscrowKind).index(kind),
+            "validated": True,
+            "engine_result": "tesSUCCESS",
+            "owner_address": escrow.owner_address,
+            "destination_address": escrow.destination_address,
+            "amount_drops": escrow.amount_drops,
+            "finish_after_ripple": escrow.finish_after_ripple,
+            "cancel_after_ripple": escrow.cancel_after_ripple,
+            "condition_hex": escrow.condition_hex,
+        }
+
+    def _enter_result(self, bout_id: uuid.UUID) -> None:
+        response = self.client.post(f"/bouts/{bout_id}/result", headers=self._admin_headers(), json={"winner": "A"})
+        self.assertEqual(response.status_code, 200)
+
+    def _confirm_payout(self, bout_id: uuid.UUID, kind: EscrowKind, *, payload: dict[str, object]):
+        response = self.client.post(
+            f"/bouts/{bout_id}/payouts/confirm",
+            headers={**self._promoter_headers(), "Idempotency-Key": f"budget-payout-{bout_id}-{kind.value}"},
+            json=payload,
+        )
+        self.assertEqual(response.status_code, 200, msg=response.text)
+        return response
+
+    def _payout_confirm_payload(self, bout_id: uuid.UUID, kind: EscrowKind, transaction_type: str) -> dict[str, object]:
+        escrow = self._load_escrow(bout_id, kind)
+        return {
+            "escrow_kind": kind.value,
+            "tx_hash": f"TXBUDGETPAYOUT{kind.value.upper()}",
+            "validated": True,
+            "engine_result": "tesSUCCESS",
+            "transaction_type": transaction_type,
+            "owner_address": escrow.owner_address,
+            "offer_sequence": escrow.offer_sequence,
+            "close_time_ripple": escrow.finish_after_ripple,
+            "fulfillment_hex": escrow.encrypted_preimage_hex if kind == EscrowKind.BONUS_A else None,
+        }
+
+    def _load_escrow(self, bout_id: uuid.UUID, kind: EscrowKind) -> Escrow:
+        with Session(self.engine, expire_on_commit=False) as session:
+            escrow = session.scalar(select(Escrow).where(Escrow.bout_id == bout_id, Escrow.kind == kind))
+            assert escrow is not None
+            session.expunge(escrow)
+            return escrow
+
+    def _seed_users(self) -> tuple[uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID]:
+        with Session(self.engine) as session:
+            ids = tuple(
+                self._insert_user(session, f"{label}.budget@example.test", role)
+                for label, role in (
+                    ("promoter", UserRole.PROMOTER),
+                    ("admin", UserRole.ADMIN),
+                    ("fighter.a", UserRole.FIGHTER),
+                    ("fighter.b", UserRole.FIGHTER),
+                )
+            )
+            session.commit()
+            return ids
+
+    def _override_get_session(self):
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _promoter_headers(self) -> dict[str, str]:
+        return self._auth_headers(self.promoter_id, "promoter.budget@example.test", UserRole.PROMOTER)
+
+    def _admin_headers(self) -> dict[str, str]:
+        return self._auth_headers(self.admin_id, "admin.budget@example.test", UserRole.ADMIN)
+
+    @staticmethod
+    def _auth_headers(user_id: uuid.UUID, email: str, role: UserRole) -> dict[str, str]:
+        token = create_access_token(
+            subject=str(user_id),
+            email=email,
+            role=role.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    @staticmethod
+    def _insert_user(session: Session, email: str, role: UserRole) -> uuid.UUID:
+        user = User(id=uuid.uuid4(), email=email, password_hash="pbkdf2_sha256$1$00$00", role=role)
+        session.add(user)
+        session.flush()
+        return user.id
+
+
+if __name__ == "__main__":
+    unittest.main()
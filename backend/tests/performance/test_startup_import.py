@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+_BACKEND_ROOT = Path(__file__).resolve().parents[2]
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+class StartupImportTests(unittest.TestCase):
+    """Cold ``import app.main`` in a fresh interpreter: what it loads and how long it takes."""
+
+    # Loaded on first use (login, Xaman-backed routes, enabled workers, startup migrations), never at import.
+    DEFERRED_MODULES = (
+        "alembic",
+        "passlib",
+        "psycopg",
+        "app.integrations.xaman_service",
+        "app.services.deadline_scheduler",
+        "app.services.ledger_stream_watcher",
+        "app.services.outbox",
+    )
+    # About 1.5s here once the modules above are deferred (2.2s before); generous for slow CI hosts.
+    IMPORT_MAX_SECONDS = 4.0
+
+    def test_app_import_defers_heavy_modules_and_stays_within_budget(self) -> None:
+        # One warm-up so the measured run reads compiled bytecode like a real worker start.
+        for _ in range(2):
+            completed = subprocess.run(
+                [sys.executable, "-c", _PROBE],
+                cwd=_BACKEND_ROOT,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=60,
+            )
+            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
+        probe = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        loaded = set(probe["modules"])
+        self.assertEqual([name for name in self.DEFERRED_MODULES if name in loaded], [])
+        self.assertLess(
+            probe["seconds"],
+            self.IMPORT_MAX_SECONDS,
+            msg=f"import app.main took {probe['seconds']:.2f}s > {self.IMPORT_MAX_SECONDS:.1f}s",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
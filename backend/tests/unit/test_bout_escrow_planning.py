@@ -5,6 +5,8 @@ import uuid
 from datetime import UTC, datetime
 
 from app.models.enums import EscrowKind, EscrowStatus
+from app.models.escrow import Escrow
+from app.models.escrow_tx_payload import EscrowTxPayload
 from app.services.bout_service import BoutService
 
 
@@ -49,9 +51,9 @@ class BoutEscrowPlanningUnitTests(unittest.TestCase):
         )
 
         self.assertIsNotNone(bout.id)
-        self.assertEqual(len(session.added_all), 4)
+        escrows = [value for value in session.added_all if isinstance(value, Escrow)]
+        self.assertEqual(len(escrows), 4)
 
-        escrows = session.added_all
         kinds = {escrow.kind for escrow in escrows}
         self.assertSetEqual(
             kinds,
@@ -66,6 +68,10 @@ class BoutEscrowPlanningUnitTests(unittest.TestCase):
             else:
                 self.assertIsNone(escrow.cancel_after_ripple)
 
+        payloads = [value for value in session.added_all if isinstance(value, EscrowTxPayload)]
+        self.assertEqual({payload.escrow_id for payload in payloads}, {escrow.id for escrow in escrows})
+        self.assertTrue(all(payload.transaction_type == "EscrowCreate" for payload in payloads))
+
 
 if __name__ == "__main__":
     unittest.main()
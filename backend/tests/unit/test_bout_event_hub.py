@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import unittest
+
+from app.services.bout_event_bridge import PostgresEventBridge, psycopg_conninfo
+from app.services.bout_events import BoutEvent, BoutEventHub
+
+
+def _event(bout_id: str, promoter_user_id: str = "promoter-1", event: str = "escrow_created") -> BoutEvent:
+    return BoutEvent(event=event, bout_id=bout_id, promoter_user_id=promoter_user_id, bout_status="draft")
+
+
+class BoutEventHubTests(unittest.TestCase):
+    def test_events_published_from_other_threads_reach_matching_subscribers_only(self) -> None:
+        async def scenario() -> tuple[list[BoutEvent], list[BoutEvent]]:
+            hub = BoutEventHub()
+            by_bout = hub.subscribe(bout_id="bout-1")
+            by_promoter = hub.subscribe(promoter_user_id="promoter-1")
+            publisher = threading.Thread(
+                target=lambda: [
+                    hub.publish(item)
+                    for item in (_event("bout-1"), _event("bout-2"), _event("bout-3", promoter_user_id="promoter-2"))
+                ]
+            )
+            publisher.start()
+            publisher.join()
+            hub.close_all()
+            return await _drain(by_bout), await _drain(by_promoter)
+
+        by_bout, by_promoter = asyncio.run(scenario())
+
+        self.assertEqual([item.bout_id for item in by_bout], ["bout-1"])
+        self.assertEqual([item.bout_id for item in by_promoter], ["bout-1", "bout-2"])
+
+    def test_subscriber_that_falls_behind_is_closed_and_unregistered(self) -> None:
+        async def scenario() -> tuple[list[BoutEvent], int]:
+            hub = BoutEventHub(max_pending=2)
+            subscription = hub.subscribe(bout_id="bout-1")
+            for index in range(4):
+                hub.publish(_event("bout-1", event=f"event-{index}"))
+            await asyncio.sleep(0)
+            return await _drain(subscription), hub.subscriber_count
+
+        received, remaining = asyncio.run(scenario())
+
+        self.assertEqual([item.event for item in received], ["event-0", "event-1"])
+        self.assertEqual(remaining, 0)
+
+    def test_bridge_republishes_notifications_and_ignores_malformed_ones(self) -> None:
+        async def scenario() -> list[BoutEvent]:
+            hub = BoutEventHub()
+            subscription = hub.subscribe(bout_id="bout-1")
+            bridge = PostgresEventBridge(database_url="postgresql+psycopg://u:p@db:5432/app", hub=hub)
+            bridge.handle_payload("not json")
+            bridge.handle_payload(_event("bout-1").to_json())
+            hub.close_all()
+            return await _drain(subscription)
+
+        self.assertEqual(asyncio.run(scenario()), [_event("bout-1")])
+        self.assertEqual(psycopg_conninfo("postgresql+psycopg://u:p@db:5432/app"), "postgresql://u:p@db:5432/app")
+
+
+async def _drain(subscription) -> list[BoutEvent]:
+    received = []
+    while True:
+        try:
+            item = await subscription.get(timeout_seconds=1.0)
+        except EOFError:
+            return received
+        if item is not None:
+            received.append(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
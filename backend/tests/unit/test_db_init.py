@@ -4,6 +4,8 @@ import unittest
 from dataclasses import replace
 from unittest.mock import patch
 
+from sqlalchemy import create_engine, text
+
 from app.core.config import settings
 from app.db import init_db as init_db_module
 
@@ -14,12 +16,57 @@ class InitDbUnitTests(unittest.TestCase):
 
         with (
             patch.object(init_db_module, "settings", test_settings),
+            patch.object(init_db_module, "database_at_head", return_value=False),
+            patch.object(init_db_module, "run_db_migrations") as migrate_mock,
+        ):
+            init_db_module.init_db()
+
+        migrate_mock.assert_called_once_with(revision="head")
+
+    def test_fast_boot_skips_alembic_when_database_is_at_head(self) -> None:
+        test_settings = replace(settings, app_env="development", db_auto_migrate_on_startup=True, db_fast_boot=True)
+
+        with (
+            patch.object(init_db_module, "settings", test_settings),
+            patch.object(init_db_module, "database_at_head", return_value=True),
+            patch.object(init_db_module, "run_db_migrations") as migrate_mock,
+        ):
+            init_db_module.init_db()
+
+        migrate_mock.assert_not_called()
+
+    def test_fast_boot_off_always_runs_the_upgrade(self) -> None:
+        test_settings = replace(settings, app_env="development", db_auto_migrate_on_startup=True, db_fast_boot=False)
+
+        with (
+            patch.object(init_db_module, "settings", test_settings),
+            patch.object(init_db_module, "database_at_head") as head_mock,
             patch.object(init_db_module, "run_db_migrations") as migrate_mock,
         ):
             init_db_module.init_db()
 
+        head_mock.assert_not_called()
         migrate_mock.assert_called_once_with(revision="head")
 
+    def test_head_check_reads_revision_files_and_the_stamped_version(self) -> None:
+        from alembic.script import ScriptDirectory
+
+        heads = init_db_module.head_revisions()
+        alembic_heads = ScriptDirectory.from_config(init_db_module._build_alembic_config()).get_heads()
+        self.assertEqual(heads, set(alembic_heads))
+        (head,) = heads
+
+        engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        try:
+            with patch.object(init_db_module, "get_engine", return_value=engine):
+                self.assertFalse(init_db_module.database_at_head())
+                with engine.begin() as connection:
+                    connection.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+                    connection.execute(text("INSERT INTO alembic_version VALUES (:head)"), {"head": head})
+                self.assertTrue(init_db_module.database_at_head())
+        finally:
+            engine.dispose()
+
     def test_init_db_skips_migrations_in_production(self) -> None:
         test_settings = replace(settings, app_env="production", db_auto_migrate_on_startup=True)
 
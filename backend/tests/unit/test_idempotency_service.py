@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import json
 import unittest
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session
 
 import app.models  # noqa: F401
 from app.db.base import Base
-from app.services.idempotency_service import IdempotencyKeyMismatchError, IdempotencyService
+from app.models.idempotency_key import IdempotencyKey
+from app.services.idempotency_service import (
+    RESPONSE_COMPRESS_MIN_BYTES,
+    IdempotencyKeyMismatchError,
+    IdempotencyService,
+    encode_response_body,
+)
 
 
 class IdempotencyServiceUnitTests(unittest.TestCase):
@@ -29,7 +36,7 @@ class IdempotencyServiceUnitTests(unittest.TestCase):
                 idempotency_key="key-1",
                 request_hash=request_hash,
                 status_code=200,
-                response_body={"detail": "ok"},
+                response_body=b'{"detail":"ok"}',
             )
             session.commit()
 
@@ -40,7 +47,57 @@ class IdempotencyServiceUnitTests(unittest.TestCase):
             )
             assert replay is not None
             self.assertEqual(replay.status_code, 200)
-            self.assertEqual(replay.response_body, {"detail": "ok"})
+            self.assertEqual(replay.response_body, b'{"detail":"ok"}')
+
+    def test_large_response_is_stored_compressed_and_replayed_intact(self) -> None:
+        body = json.dumps({"detail": "ok", "escrows": [{"tx_hash": f"TX{index:062d}"} for index in range(40)]}).encode()
+        with Session(self.engine) as session:
+            service = IdempotencyService(session=session)
+            for key, response_body in (("small", b'{"detail":"ok"}'), ("large", body)):
+                service.store_response(
+                    scope="payout_confirm:demo-bout",
+                    idempotency_key=key,
+                    request_hash="0" * 64,
+                    status_code=200,
+                    response_body=response_body,
+                )
+            session.commit()
+
+            stored = {row.idempotency_key: row for row in session.scalars(select(IdempotencyKey))}
+            self.assertEqual(
+                (stored["small"].response_encoding, stored["small"].response_body), ("identity", b'{"detail":"ok"}')
+            )
+            self.assertEqual(stored["large"].response_encoding, "zlib")
+            self.assertLess(len(stored["large"].response_body), len(body) // 2)
+
+            replay = service.load_replay(
+                scope="payout_confirm:demo-bout", idempotency_key="large", request_hash="0" * 64
+            )
+            assert replay is not None
+            self.assertEqual(replay.response_body, body)
+
+    def test_confirm_sized_responses_are_compressed_and_error_bodies_are_not(self) -> None:
+        confirm = json.dumps(
+            {
+                "bout_id": "8d6c1f5e-2f4b-4d8e-9a61-0c1e2b3a4d5f",
+                "escrow_id": "1f2e3d4c-5b6a-4978-8695-a4b3c2d1e0f9",
+                "escrow_kind": "show_a",
+                "escrow_status": "created",
+                "bout_status": "draft",
+                "tx_hash": "A3F0" * 16,
+                "offer_sequence": 12345678,
+            },
+            separators=(",", ":"),
+        ).encode()
+        self.assertGreaterEqual(len(confirm), RESPONSE_COMPRESS_MIN_BYTES)
+        stored, encoding = encode_response_body(confirm)
+        self.assertEqual(encoding, "zlib")
+        self.assertLess(len(stored), len(confirm))
+
+        self.assertEqual(
+            encode_response_body(b'{"detail":"tx_hash_already_used"}'),
+            (b'{"detail":"tx_hash_already_used"}', "identity"),
+        )
 
     def test_replay_rejects_payload_hash_mismatch(self) -> None:
         with Session(self.engine) as session:
@@ -52,7 +109,7 @@ class IdempotencyServiceUnitTests(unittest.TestCase):
                 idempotency_key="key-2",
                 request_hash=first_hash,
                 status_code=200,
-                response_body={"detail": "ok"},
+                response_body=b'{"detail":"ok"}',
             )
             session.commit()
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import unittest
 from decimal import Decimal
 
-from app.domain.money import drops_to_xrp, ensure_valid_drops, xrp_to_drops
+from app.domain.money import drops_to_xrp, drops_to_xrp_strings, ensure_valid_drops, xrp_to_drops
 
 
 class MoneyUnitTests(unittest.TestCase):
@@ -20,6 +20,13 @@ class MoneyUnitTests(unittest.TestCase):
         xrp = drops_to_xrp(original_drops)
         self.assertEqual(xrp_to_drops(xrp), original_drops)
 
+    def test_drops_to_xrp_strings_match_decimal_conversion(self) -> None:
+        drops = [0, 1, 999_999, 1_000_000, 1_250_000, 123_456_789]
+        self.assertEqual(drops_to_xrp_strings(drops), [f"{drops_to_xrp(d):.6f}" for d in drops])
+        self.assertEqual(drops_to_xrp_strings([1_250_000]), ["1.250000"])
+        with self.assertRaises(ValueError):
+            drops_to_xrp_strings([5, -1])
+
     def test_ensure_valid_drops(self) -> None:
         self.assertEqual(ensure_valid_drops(0), 0)
         self.assertEqual(ensure_valid_drops(10), 10)
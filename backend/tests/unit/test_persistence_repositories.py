@@ -5,6 +5,7 @@ import uuid
 from datetime import UTC, datetime
 
 from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 import app.models  # noqa: F401
@@ -15,7 +16,7 @@ from app.models.enums import EscrowKind, EscrowStatus, UserRole
 from app.models.escrow import Escrow
 from app.models.idempotency_key import IdempotencyKey
 from app.models.user import User
-from app.repositories.audit_log_repository import AuditLogRepository
+from app.repositories.audit_log_repository import AuditLogRepository, details_match
 from app.repositories.bout_repository import BoutRepository
 from app.repositories.escrow_repository import EscrowRepository
 from app.repositories.idempotency_key_repository import IdempotencyKeyRepository
@@ -58,7 +59,7 @@ class PersistenceRepositoriesUnitTests(unittest.TestCase):
                 idempotency_key="repo-key-1",
                 request_hash="hash-1",
                 response_code=200,
-                response_body='{"detail":"ok"}',
+                response_body=b'{"detail":"ok"}',
             )
             idempotency_repo.add(idempotency_key=idempotency)
             session.flush()
@@ -75,7 +76,7 @@ class PersistenceRepositoriesUnitTests(unittest.TestCase):
                     entity_type="bout",
                     entity_id=str(bout.id),
                     outcome="success",
-                    details_json='{"detail":"ok"}',
+                    details={"detail": "ok"},
                 )
             )
             session.flush()
@@ -87,6 +88,37 @@ class PersistenceRepositoriesUnitTests(unittest.TestCase):
             )
             self.assertIsNotNone(persisted_audit)
 
+    def test_audit_rows_are_found_by_detail_key(self) -> None:
+        with Session(self.engine) as session:
+            audit_repo = AuditLogRepository(session=session)
+            for entity_id, details in (
+                ("escrow-1", {"escrow_kind": "show_a", "tx_hash": "TXLOOKUP1"}),
+                ("escrow-2", {"escrow_kind": "show_b", "tx_hash": "TXLOOKUP2"}),
+                ("escrow-3", {"failure_code": "tecNO_TARGET"}),
+            ):
+                audit_repo.add(
+                    audit_log=AuditLog(
+                        action="escrow_create_confirmed",
+                        entity_type="escrow",
+                        entity_id=entity_id,
+                        outcome="success",
+                        details=details,
+                    )
+                )
+            session.flush()
+
+            by_hash = audit_repo.list_by_detail(key="tx_hash", value="TXLOOKUP2", entity_type="escrow")
+            self.assertEqual([row.entity_id for row in by_hash], ["escrow-2"])
+            self.assertEqual(audit_repo.list_by_detail(key="tx_hash", value="TXLOOKUP2", entity_type="bout"), [])
+
+        # On PostgreSQL the filter must be a containment test, the form the GIN index can serve.
+        compiled = str(
+            details_match(key="tx_hash", value="TXLOOKUP2", dialect_name="postgresql").compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        self.assertIn("@>", compiled)
+
     @staticmethod
     def _seed_users(session: Session) -> None:
         session.add_all(
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+import uuid
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.profiling import (
+    PROFILE_HEADER,
+    ProfileStore,
+    RequestProfile,
+    build_profile_token,
+    verify_profile_token,
+)
+from app.core.security import create_access_token
+from app.main import create_app
+from app.middleware.profiling import install_request_profiling
+from app.models.enums import UserRole
+
+
+def _slow_handler_body() -> None:
+    time.sleep(0.05)
+
+
+class RequestProfilingUnitTests(unittest.TestCase):
+    def test_profile_token_verification(self) -> None:
+        token = build_profile_token(secret="debug-secret", expires_at_unix=2_000)
+
+        self.assertTrue(verify_profile_token(token, secret="debug-secret", now_unix=1_000))
+        self.assertFalse(verify_profile_token(token, secret="other-secret", now_unix=1_000))
+        self.assertFalse(verify_profile_token(token, secret="debug-secret", now_unix=3_000))
+        self.assertFalse(verify_profile_token("2000.deadbeef", secret="debug-secret", now_unix=1_000))
+        self.assertFalse(verify_profile_token("not-a-token", secret="debug-secret", now_unix=1_000))
+
+    def test_store_keeps_most_recent_profiles_and_mirrors_to_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ProfileStore(max_profiles=2, output_dir=tmp)
+            for index in range(3):
+                store.add(self._profile(f"profile-{index}"))
+
+            self.assertEqual([item.profile_id for item in store.list()], ["profile-2", "profile-1"])
+            self.assertIsNone(store.get("profile-0"))
+            self.assertEqual(
+                (Path(tmp) / "profile-2.collapsed").read_text(encoding="utf-8"),
+                "root;leaf 3\n",
+            )
+
+    def test_sampled_requests_capture_collapsed_stacks_of_handler_thread(self) -> None:
+        store = ProfileStore(max_profiles=10)
+        client = TestClient(self._profiled_app(store=store, sample_rate=1.0, debug_secret=None))
+
+        response = client.get("/slow")
+
+        self.assertEqual(response.status_code, 200)
+        (profile,) = store.list()
+        self.assertEqual(profile.route, "/slow")
+        self.assertEqual(profile.trigger, "sampled")
+        self.assertGreater(profile.sample_count, 0)
+        self.assertIn("_slow_handler_body", profile.collapsed_stacks)
+
+    def test_signed_header_forces_profile_when_sampling_is_off(self) -> None:
+        store = ProfileStore(max_profiles=10)
+        client = TestClient(self._profiled_app(store=store, sample_rate=0.0, debug_secret="debug-secret"))
+
+        client.get("/slow")
+        client.get("/slow", headers={PROFILE_HEADER: "1.invalid"})
+        self.assertEqual(store.list(), [])
+
+        token = build_profile_token(secret="debug-secret", expires_at_unix=int(time.time()) + 60)
+        client.get("/slow", headers={PROFILE_HEADER: token})
+
+        (profile,) = store.list()
+        self.assertEqual(profile.trigger, "signed_header")
+
+    def test_create_app_exposes_admin_profiles_only_when_enabled(self) -> None:
+        with patch("app.main.init_db"):
+            disabled = create_app()
+            self.assertNotIn("/admin/profiles", {route.path for route in disabled.routes})
+
+            enabled_settings = replace(settings, profiling_debug_secret="debug-secret")
+            with patch("app.main.settings", enabled_settings):
+                enabled = create_app()
+
+        client = TestClient(enabled)
+        token = build_profile_token(secret="debug-secret", expires_at_unix=int(time.time()) + 60)
+        client.get("/healthz", headers={PROFILE_HEADER: token})
+
+        self.assertEqual(client.get("/admin/profiles").status_code, 401)
+        listing = client.get("/admin/profiles", headers=self._admin_headers())
+        self.assertEqual(listing.status_code, 200)
+        (summary,) = listing.json()["profiles"]
+        self.assertEqual(summary["route"], "/healthz")
+
+        stacks = client.get(f"/admin/profiles/{summary['profile_id']}", headers=self._admin_headers())
+        self.assertEqual(stacks.status_code, 200)
+        self.assertTrue(stacks.headers["content-type"].startswith("text/plain"))
+
+    @staticmethod
+    def _profiled_app(*, store: ProfileStore, sample_rate: float, debug_secret: str | None) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/slow")
+        def slow() -> dict[str, str]:
+            _slow_handler_body()
+            return {"status": "ok"}
+
+        install_request_profiling(
+            app,
+            store=store,
+            sample_rate=sample_rate,
+            debug_secret=debug_secret,
+            interval_seconds=0.001,
+        )
+        return app
+
+    @staticmethod
+    def _profile(profile_id: str) -> RequestProfile:
+        return RequestProfile(
+            profile_id=profile_id,
+            method="GET",
+            route="/slow",
+            trigger="sampled",
+            started_at=datetime(2026, 3, 1, tzinfo=UTC),
+            duration_ms=1.0,
+            sample_count=3,
+            collapsed_stacks="root;leaf 3\n",
+        )
+
+    @staticmethod
+    def _admin_headers() -> dict[str, str]:
+        token = create_access_token(
+            subject=str(uuid.uuid4()),
+            email="admin.profiles@example.test",
+            role=UserRole.ADMIN.value,
+            secret_key=settings.jwt_secret,
+            expires_minutes=settings.jwt_exp_minutes,
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+
+if __name__ == "__main__":
+    unittest.main()
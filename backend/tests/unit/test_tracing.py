@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.core.tracing import (
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    Tracer,
+    bind_trace_context,
+    configure_tracing,
+    current_traceparent,
+    start_span,
+    traced,
+    tracing_enabled,
+)
+from app.integrations.xaman_service import XamanService
+
+
+class _FakeHttpResponse:
+    status = 200
+
+    def __enter__(self) -> _FakeHttpResponse:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def read(self) -> bytes:
+        return json.dumps({"meta": {"signed": True}, "response": {"txid": "ABC"}}).encode("utf-8")
+
+
+class TracingUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.exporter = InMemorySpanExporter()
+
+    def tearDown(self) -> None:
+        configure_tracing(None)
+
+    def test_disabled_tracing_is_noop(self) -> None:
+        configure_tracing(None)
+
+        @traced("noop.fn")
+        def fn() -> int:
+            return 7
+
+        with start_span("ignored") as span:
+            span.set_attribute("key", "value")
+            self.assertEqual(fn(), 7)
+
+        self.assertFalse(tracing_enabled())
+        self.assertIsNone(current_traceparent())
+        self.assertEqual(self.exporter.spans, [])
+
+    def test_nested_spans_share_trace_and_link_parents(self) -> None:
+        configure_tracing(Tracer(self.exporter))
+
+        @traced("child.fn")
+        def child() -> None:
+            return None
+
+        with start_span("root", {"component": "test"}):
+            child()
+
+        child_span, root_span = self.exporter.spans
+        self.assertEqual(root_span.name, "root")
+        self.assertIsNone(root_span.parent_span_id)
+        self.assertEqual(child_span.trace_id, root_span.trace_id)
+        self.assertEqual(child_span.parent_span_id, root_span.span_id)
+        self.assertGreaterEqual(root_span.end_time_unix_nano, root_span.start_time_unix_nano)
+
+    def test_errors_mark_span_status(self) -> None:
+        configure_tracing(Tracer(self.exporter))
+
+        with self.assertRaises(ValueError), start_span("failing"):
+            raise ValueError("boom")
+
+        (span,) = self.exporter.spans
+        self.assertEqual(span.status, "error")
+        self.assertEqual(span.attributes["error.type"], "ValueError")
+
+    def test_remote_traceparent_is_continued(self) -> None:
+        configure_tracing(Tracer(self.exporter))
+        incoming = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+        with start_span("server", traceparent=incoming):
+            pass
+
+        (span,) = self.exporter.spans
+        self.assertEqual(span.trace_id, "0af7651916cd43dd8448eb211c80319c")
+        self.assertEqual(span.parent_span_id, "b7ad6b7169203331")
+
+    def test_bound_context_propagates_into_worker_thread(self) -> None:
+        configure_tracing(Tracer(self.exporter))
+
+        def work() -> None:
+            with start_span("worker.task"):
+                pass
+
+        with start_span("request"):
+            worker = threading.Thread(target=bind_trace_context(work))
+            worker.start()
+            worker.join()
+
+        worker_span, request_span = self.exporter.spans
+        self.assertEqual(worker_span.trace_id, request_span.trace_id)
+        self.assertEqual(worker_span.parent_span_id, request_span.span_id)
+
+    def test_json_lines_exporter_writes_one_record_per_span(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "spans.jsonl"
+            configure_tracing(Tracer(JsonLinesSpanExporter(path)))
+            with start_span("outer"), start_span("inner"):
+                pass
+
+            records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+        self.assertEqual([record["name"] for record in records], ["inner", "outer"])
+        self.assertEqual(records[0]["parent_span_id"], records[1]["span_id"])
+
+    @patch("app.integrations.xaman_service.urlopen")
+    def test_xaman_api_calls_emit_span_and_traceparent_header(self, urlopen_mock: object) -> None:
+        urlopen_mock.return_value = _FakeHttpResponse()
+        configure_tracing(Tracer(self.exporter))
+        service = XamanService(
+            mode="api",
+            api_base_url="https://xumm.app",
+            api_key="test-key",
+            api_secret="test-secret",
+            timeout_seconds=5,
+        )
+
+        with start_span("request"):
+            service.get_payload_status(payload_id="payload-1")
+
+        request = urlopen_mock.call_args.args[0]
+        xaman_span, request_span = self.exporter.spans
+        self.assertEqual(xaman_span.name, "xaman.get_payload_status")
+        self.assertEqual(xaman_span.attributes["http.status_code"], 200)
+        self.assertEqual(xaman_span.parent_span_id, request_span.span_id)
+        self.assertEqual(request.get_header("Traceparent"), xaman_span.traceparent)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import unittest
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.db.base import Base
+from app.integrations.xrpl_client import XrplJsonRpcClient
+from app.models.validated_transaction import ValidatedTransaction
+from app.perf.xrpl_stand_in import XrplStandInServer
+from app.services.validated_tx_cache import ValidatedTx, ValidatedTxLookup, ValidatedTxMemoryCache
+from app.services.xrpl_escrow_service import escrow_create_confirmation_from_ledger
+
+_CREATE_TX = {
+    "TransactionType": "EscrowCreate",
+    "Account": "rOwnerCache",
+    "Destination": "rDestCache",
+    "Amount": "2500000",
+    "FinishAfter": 800_000_100,
+    "CancelAfter": 800_000_900,
+    "Condition": "A0258020" + "00" * 32 + "810120",
+    "Sequence": 77,
+}
+
+
+class ValidatedTxLookupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.stand_in = XrplStandInServer().start()
+        self.client = XrplJsonRpcClient(url=self.stand_in.url, timeout_seconds=5, pool_size=4)
+        self.statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", self._record_statement)
+
+    def tearDown(self) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record_statement)
+        self.client.close()
+        self.stand_in.stop()
+        Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+    def test_tiers_answer_repeat_lookups_without_outbound_calls(self) -> None:
+        hashes = [f"{index:064X}" for index in range(12)]
+        for tx_hash in hashes:
+            self.stand_in.add_transaction(tx_hash, _CREATE_TX)
+
+        with Session(self.engine) as session:
+            ValidatedTxLookup(
+                session=session, ledger=self.client, memory=ValidatedTxMemoryCache(max_entries=100)
+            ).tx_many(hashes)
+            session.commit()
+        self.assertEqual(self.stand_in.stats.requests_by_method["tx"], 12)
+
+        memory = ValidatedTxMemoryCache(max_entries=100)
+        with Session(self.engine) as session:
+            stored = ValidatedTxLookup(session=session, ledger=self.client, memory=memory).tx_many(
+                [tx_hash.lower() for tx_hash in hashes]
+            )
+            self.assertEqual(session.scalar(select(func.count()).select_from(ValidatedTransaction)), 12)
+        self.assertEqual(self.stand_in.stats.requests_by_method["tx"], 12)
+        self.assertTrue(all(result is not None and result["validated"] for result in stored.values()))
+
+        self.statements.clear()
+        with Session(self.engine) as session:
+            ValidatedTxLookup(session=session, ledger=self.client, memory=memory).tx_many(hashes)
+        self.assertEqual(self.statements, [])
+        self.assertEqual(self.stand_in.stats.requests_by_method["tx"], 12)
+
+    def test_misses_are_fetched_as_one_tx_many_batch(self) -> None:
+        hashes = [f"{index:064X}" for index in range(6)]
+        for tx_hash in hashes:
+            self.stand_in.add_transaction(tx_hash, _CREATE_TX)
+        client = self.client
+        batches: list[list[str]] = []
+
+        class BatchRecordingLedger:
+            def tx(self, tx_hash: str) -> dict[str, object] | None:
+                raise AssertionError("misses must not be fetched one call at a time")
+
+            def tx_many(self, tx_hashes: list[str]) -> dict[str, dict[str, object] | None]:
+                batches.append(list(tx_hashes))
+                return client.tx_many(tx_hashes)
+
+        memory = ValidatedTxMemoryCache(max_entries=100)
+        with Session(self.engine) as session:
+            lookup = ValidatedTxLookup(session=session, ledger=BatchRecordingLedger(), memory=memory)
+            lookup.tx_many(hashes[:2])
+            lookup.tx_many(hashes)
+
+        self.assertEqual(batches, [hashes[:2], hashes[2:]])
+
+    def test_unvalidated_and_unknown_transactions_are_not_cached(self) -> None:
+        self.stand_in.add_transaction("AA" * 32, _CREATE_TX, validated=False)
+        memory = ValidatedTxMemoryCache(max_entries=100)
+
+        with Session(self.engine) as session:
+            lookup = ValidatedTxLookup(session=session, ledger=self.client, memory=memory)
+            self.assertFalse(lookup.tx("AA" * 32)["validated"])
+            self.assertIsNone(lookup.tx("BB" * 32))
+            lookup.tx("AA" * 32)
+            self.assertEqual(session.scalar(select(func.count()).select_from(ValidatedTransaction)), 0)
+
+        self.assertEqual(self.stand_in.stats.requests_by_method["tx"], 3)
+
+    def test_cached_snapshot_maps_to_the_same_confirmation_as_the_ledger_result(self) -> None:
+        self.stand_in.add_transaction("CC" * 32, _CREATE_TX)
+        fetched = self.client.tx("CC" * 32)
+        assert fetched is not None
+
+        snapshot = ValidatedTx.from_ledger_result(fetched)
+        assert snapshot is not None
+
+        self.assertEqual(
+            escrow_create_confirmation_from_ledger(tx_hash="CC" * 32, tx_result=snapshot.as_ledger_result()),
+            escrow_create_confirmation_from_ledger(tx_hash="CC" * 32, tx_result=fetched),
+        )
+
+    def test_memory_cache_evicts_least_recently_used(self) -> None:
+        memory = ValidatedTxMemoryCache(max_entries=2)
+        for tx_hash in ("A", "B"):
+            memory.put(
+                ValidatedTx(tx_hash=tx_hash, transaction_type="EscrowFinish", engine_result="tesSUCCESS", account="r")
+            )
+        memory.get("A")
+        memory.put(ValidatedTx(tx_hash="C", transaction_type="EscrowFinish", engine_result="tesSUCCESS", account="r"))
+
+        self.assertIsNotNone(memory.get("A"))
+        self.assertIsNone(memory.get("B"))
+
+    def _record_statement(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import time
+import unittest
+from dataclasses import dataclass, replace
+from typing import Any
+from unittest.mock import patch
+from urllib.request import Request
+
+from fastapi.testclient import TestClient
+
+from app.core.metrics import registry
+from app.integrations.xaman_circuit_breaker import XamanCircuitBreaker, XamanCircuitOpen, XamanCircuitState
+from app.integrations.xaman_rate_limiter import XamanRequestPriority
+from app.integrations.xaman_service import XamanCircuitOpenError, XamanIntegrationError, XamanService
+from app.main import create_app
+from app.perf.xaman_stand_in import XamanStandInConfig, XamanStandInServer
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class XamanCircuitBreakerUnitTests(unittest.TestCase):
+    def test_opens_after_threshold_and_fails_fast(self) -> None:
+        clock = _FakeClock()
+        breaker = XamanCircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure()
+
+        self.assertEqual(breaker.state, XamanCircuitState.OPEN)
+        clock.now += 4
+        with self.assertRaises(XamanCircuitOpen) as raised:
+            breaker.before_call()
+        self.assertAlmostEqual(raised.exception.retry_after_seconds, 6)
+
+    def test_half_open_admits_limited_probes_and_closes_on_success(self) -> None:
+        clock = _FakeClock()
+        breaker = XamanCircuitBreaker(failure_threshold=1, reset_timeout_seconds=5, half_open_max_probes=1, clock=clock)
+        breaker.before_call()
+        breaker.record_failure()
+
+        clock.now += 5
+        self.assertEqual(breaker.state, XamanCircuitState.HALF_OPEN)
+        breaker.before_call()
+        with self.assertRaises(XamanCircuitOpen):
+            breaker.before_call()
+        breaker.record_success()
+
+        self.assertEqual(breaker.state, XamanCircuitState.CLOSED)
+        breaker.before_call()
+
+    def test_failed_probe_reopens_for_a_full_interval(self) -> None:
+        clock = _FakeClock()
+        breaker = XamanCircuitBreaker(failure_threshold=1, reset_timeout_seconds=5, clock=clock)
+        breaker.before_call()
+        breaker.record_failure()
+        clock.now += 5
+
+        breaker.before_call()
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, XamanCircuitState.OPEN)
+        clock.now += 4.9
+        self.assertEqual(breaker.state, XamanCircuitState.OPEN)
+
+    def test_success_resets_consecutive_failure_count(self) -> None:
+        breaker = XamanCircuitBreaker(failure_threshold=2, reset_timeout_seconds=5)
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure()
+            breaker.before_call()
+            breaker.record_success()
+
+        self.assertEqual(breaker.state, XamanCircuitState.CLOSED)
+
+
+class XamanServiceResilienceTests(unittest.TestCase):
+    def test_breaker_opens_against_failing_provider_then_recovers(self) -> None:
+        breaker = XamanCircuitBreaker(failure_threshold=2, reset_timeout_seconds=0.2)
+        with XamanStandInServer(config=XamanStandInConfig(error_rate=1.0)) as stand_in:
+            service = _service(stand_in.base_url, circuit_breaker=breaker)
+            for index in range(2):
+                with self.assertRaisesRegex(XamanIntegrationError, "xaman_api_http_error"):
+                    service.create_sign_request(tx_json={"TransactionType": "EscrowCreate"}, reference=f"cb-{index}")
+            with self.assertRaises(XamanCircuitOpenError):
+                service.create_sign_request(tx_json={"TransactionType": "EscrowCreate"}, reference="cb-fast")
+            self.assertEqual(stand_in.stats.injected_errors, 2)
+
+            stand_in.config = replace(stand_in.config, error_rate=0.0)
+            time.sleep(0.25)
+            service.create_sign_request(tx_json={"TransactionType": "EscrowCreate"}, reference="cb-probe")
+
+        self.assertEqual(breaker.state, XamanCircuitState.CLOSED)
+
+    def test_client_errors_do_not_count_against_the_breaker(self) -> None:
+        breaker = XamanCircuitBreaker(failure_threshold=1, reset_timeout_seconds=30)
+        with XamanStandInServer() as stand_in:
+            service = _service(stand_in.base_url, circuit_breaker=breaker)
+            for _ in range(3):
+                with self.assertRaisesRegex(XamanIntegrationError, "xaman_api_http_error"):
+                    service.get_payload_status(payload_id="missing-payload")
+
+        self.assertEqual(breaker.state, XamanCircuitState.CLOSED)
+
+    def test_status_polls_retry_transient_failures_with_backoff(self) -> None:
+        config = XamanStandInConfig(error_rate=0.5, seed=7)
+        with XamanStandInServer(config=config) as stand_in:
+            service = _service(stand_in.base_url, status_max_retries=8)
+            stand_in.config = replace(config, error_rate=0.0)
+            payload_id = service.create_sign_request(
+                tx_json={"TransactionType": "EscrowCreate"}, reference="retry"
+            ).payload_id
+            stand_in.config = config
+            stand_in.resolve(payload_id, signed=True, tx_hash="A" * 64)
+            result = service.get_payload_status(payload_id=payload_id)
+
+        self.assertEqual(result.tx_hash, "A" * 64)
+        self.assertGreater(stand_in.stats.injected_errors, 0)
+
+    def test_sign_requests_are_not_retried(self) -> None:
+        with XamanStandInServer(config=XamanStandInConfig(error_rate=1.0)) as stand_in:
+            service = _service(stand_in.base_url, status_max_retries=3)
+            with self.assertRaisesRegex(XamanIntegrationError, "xaman_api_http_error"):
+                service.create_sign_request(tx_json={"TransactionType": "EscrowCreate"}, reference="no-retry")
+
+        self.assertEqual(stand_in.stats.injected_errors, 1)
+
+    def test_hedged_status_poll_returns_the_faster_attempt(self) -> None:
+        service = _SlowFirstAttemptService(
+            mode="api",
+            api_base_url="http://xaman.invalid",
+            api_key="key",
+            api_secret="secret",
+            hedge_after_seconds=0.02,
+        )
+        before = registry.counter("ringledger_xaman_hedged_requests_total", "").value(
+            operation="xaman.get_payload_status", winner="hedge"
+        )
+
+        started = time.perf_counter()
+        result = service.get_payload_status(payload_id="hedged")
+
+        self.assertLess(time.perf_counter() - started, 0.4)
+        self.assertEqual(result.tx_hash, "attempt-2")
+        after = registry.counter("ringledger_xaman_hedged_requests_total", "").value(
+            operation="xaman.get_payload_status", winner="hedge"
+        )
+        self.assertEqual(after - before, 1)
+
+    def test_metrics_endpoint_exposes_breaker_state(self) -> None:
+        breaker = XamanCircuitBreaker(failure_threshold=1, reset_timeout_seconds=30)
+        breaker.before_call()
+        breaker.record_failure()
+
+        with patch("app.main.init_db"), TestClient(create_app()) as client:
+            response = client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("text/plain", response.headers["content-type"])
+        self.assertIn("ringledger_xaman_circuit_state 2", response.text)
+        self.assertIn('ringledger_xaman_circuit_transitions_total{to="open"}', response.text)
+
+
+@dataclass(frozen=True)
+class _SlowFirstAttemptService(XamanService):
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_calls", [])
+
+    def _send_rate_limited(
+        self,
+        request: Request,
+        *,
+        operation: str,
+        priority: XamanRequestPriority,
+    ) -> dict[str, Any]:
+        self._calls.append(request.full_url)
+        attempt = len(self._calls)
+        if attempt == 1:
+            time.sleep(0.5)
+        return {"meta": {"resolved": True, "signed": True}, "response": {"txid": f"attempt-{attempt}"}}
+
+
+def _service(base_url: str, **overrides: Any) -> XamanService:
+    options: dict[str, Any] = {"timeout_seconds": 5, "retry_base_delay_seconds": 0.001}
+    options.update(overrides)
+    return XamanService(mode="api", api_base_url=base_url, api_key="cb-key", api_secret="cb-secret", **options)
+
+
+if __name__ == "__main__":
+    unittest.main()
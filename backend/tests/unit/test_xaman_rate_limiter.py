@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from datetime import UTC, datetime
+
+from app.integrations.xaman_rate_limiter import (
+    XamanRateLimiter,
+    XamanRateLimitTimeout,
+    XamanRequestPriority,
+    parse_retry_after,
+)
+from app.integrations.xaman_service import XamanIntegrationError, XamanService
+from app.perf.xaman_stand_in import XamanStandInConfig, XamanStandInServer
+
+
+class XamanRateLimiterUnitTests(unittest.TestCase):
+    def test_burst_is_immediate_then_refill_paces_callers(self) -> None:
+        limiter = XamanRateLimiter(rate_per_second=50, burst=2)
+
+        started = time.perf_counter()
+        for _ in range(3):
+            limiter.acquire(priority=XamanRequestPriority.STATUS_POLL, timeout_seconds=1)
+        elapsed = time.perf_counter() - started
+
+        self.assertGreaterEqual(elapsed, 0.015)
+        self.assertLess(elapsed, 0.5)
+
+    def test_higher_priority_waiter_is_served_first(self) -> None:
+        limiter = XamanRateLimiter(rate_per_second=5, burst=1)
+        limiter.acquire(priority=XamanRequestPriority.STATUS_POLL, timeout_seconds=1)
+        served: list[str] = []
+
+        def wait_for(name: str, priority: XamanRequestPriority) -> None:
+            limiter.acquire(priority=priority, timeout_seconds=2)
+            served.append(name)
+
+        poller = threading.Thread(target=wait_for, args=("status_poll", XamanRequestPriority.STATUS_POLL))
+        poller.start()
+        time.sleep(0.05)
+        payout = threading.Thread(target=wait_for, args=("payout", XamanRequestPriority.PAYOUT_SIGNING))
+        payout.start()
+        poller.join()
+        payout.join()
+
+        self.assertEqual(served, ["payout", "status_poll"])
+
+    def test_deadline_exceeded_raises_timeout(self) -> None:
+        limiter = XamanRateLimiter(rate_per_second=1, burst=1)
+        limiter.acquire(priority=XamanRequestPriority.PAYOUT_SIGNING, timeout_seconds=1)
+
+        with self.assertRaisesRegex(XamanRateLimitTimeout, "xaman_rate_limit_deadline_exceeded"):
+            limiter.acquire(priority=XamanRequestPriority.PAYOUT_SIGNING, timeout_seconds=0.05)
+
+    def test_throttling_halves_rate_and_pauses_until_retry_after(self) -> None:
+        limiter = XamanRateLimiter(rate_per_second=100, burst=5, recovery_step=0.25)
+
+        limiter.record_throttled(retry_after_seconds=0.1)
+        started = time.perf_counter()
+        limiter.acquire(priority=XamanRequestPriority.ESCROW_SIGNING, timeout_seconds=1)
+
+        self.assertGreaterEqual(time.perf_counter() - started, 0.09)
+        self.assertEqual(limiter.effective_rate_per_second, 50)
+        limiter.record_success()
+        limiter.record_success()
+        self.assertEqual(limiter.effective_rate_per_second, 100)
+
+    def test_parse_retry_after_accepts_seconds_and_http_dates(self) -> None:
+        now = datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC)
+
+        self.assertEqual(parse_retry_after("2"), 2.0)
+        self.assertEqual(parse_retry_after("Sun, 01 Mar 2026 12:00:03 GMT", now=now), 3.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class XamanServiceRateLimitTests(unittest.TestCase):
+    def test_provider_429_slows_down_and_retries_within_deadline(self) -> None:
+        limiter = XamanRateLimiter(rate_per_second=100, burst=10)
+        config = XamanStandInConfig(rate_limit_per_second=4, retry_after_seconds=0.1)
+        with XamanStandInServer(config=config) as stand_in:
+            service = self._service(stand_in.base_url, limiter=limiter, deadline=5)
+            payload_ids = [
+                service.create_sign_request(
+                    tx_json={"TransactionType": "EscrowFinish", "Account": "rLimiter"},
+                    reference=f"limiter-{index}",
+                ).payload_id
+                for index in range(6)
+            ]
+
+        self.assertEqual(len(set(payload_ids)), 6)
+        self.assertGreater(stand_in.stats.throttled, 0)
+        self.assertLess(limiter.effective_rate_per_second, 100)
+
+    def test_throttled_call_fails_with_rate_limited_code_after_deadline(self) -> None:
+        limiter = XamanRateLimiter(rate_per_second=100, burst=10)
+        config = XamanStandInConfig(rate_limit_per_second=1, retry_after_seconds=2)
+        with XamanStandInServer(config=config) as stand_in:
+            service = self._service(stand_in.base_url, limiter=limiter, deadline=0.3)
+            service.create_sign_request(tx_json={"TransactionType": "EscrowCreate"}, reference="limiter-first")
+            with self.assertRaisesRegex(XamanIntegrationError, "xaman_api_rate_limited"):
+                service.create_sign_request(tx_json={"TransactionType": "EscrowCreate"}, reference="limiter-second")
+
+    @staticmethod
+    def _service(base_url: str, *, limiter: XamanRateLimiter, deadline: float) -> XamanService:
+        return XamanService(
+            mode="api",
+            api_base_url=base_url,
+            api_key="limiter-key",
+            api_secret="limiter-secret",
+            timeout_seconds=5,
+            rate_limiter=limiter,
+            queue_deadline_seconds=deadline,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
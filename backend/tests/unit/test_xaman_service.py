@@ -8,6 +8,8 @@ from app.integrations.xaman_service import XamanIntegrationError, XamanPayloadSt
 
 
 class _FakeHttpResponse:
+    status = 200
+
     def __init__(self, payload: dict[str, object]) -> None:
         self._payload = payload
 
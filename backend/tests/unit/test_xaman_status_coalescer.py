@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from app.integrations.xaman_service import XamanIntegrationError, XamanPayloadStatus, XamanService
+from app.integrations.xaman_status_coalescer import XamanStatusCoalescer
+from app.perf.xaman_stand_in import XamanStandInConfig, XamanStandInServer
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class XamanStatusCoalescerUnitTests(unittest.TestCase):
+    def test_concurrent_lookups_share_one_load(self) -> None:
+        coalescer: XamanStatusCoalescer[str] = XamanStatusCoalescer(resolved_ttl_seconds=0)
+        loads: list[int] = []
+        release = threading.Event()
+
+        def load() -> str:
+            loads.append(1)
+            release.wait(2)
+            return "open"
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            futures = [pool.submit(coalescer.lookup, "payload", load, cacheable=lambda _: False) for _ in range(6)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result(timeout=2) for future in futures]
+
+        self.assertEqual(results, ["open"] * 6)
+        self.assertEqual(len(loads), 1)
+
+    def test_leader_error_reaches_followers_and_is_not_remembered(self) -> None:
+        coalescer: XamanStatusCoalescer[str] = XamanStatusCoalescer(resolved_ttl_seconds=30)
+        release = threading.Event()
+
+        def failing_load() -> str:
+            release.wait(2)
+            raise XamanIntegrationError("xaman_api_connection_error")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(coalescer.lookup, "payload", failing_load, cacheable=lambda _: True) for _ in range(3)
+            ]
+            time.sleep(0.05)
+            release.set()
+            for future in futures:
+                with self.assertRaisesRegex(XamanIntegrationError, "xaman_api_connection_error"):
+                    future.result(timeout=2)
+
+        self.assertEqual(coalescer.lookup("payload", lambda: "signed", cacheable=lambda _: True), "signed")
+
+    def test_only_resolved_results_are_cached_until_ttl(self) -> None:
+        clock = _FakeClock()
+        coalescer: XamanStatusCoalescer[str] = XamanStatusCoalescer(resolved_ttl_seconds=5, clock=clock)
+        loads: list[str] = []
+
+        def load(value: str):
+            def _load() -> str:
+                loads.append(value)
+                return value
+
+            return _load
+
+        def is_resolved(value: str) -> bool:
+            return value == "signed"
+
+        coalescer.lookup("open-payload", load("open"), cacheable=is_resolved)
+        coalescer.lookup("open-payload", load("open"), cacheable=is_resolved)
+        coalescer.lookup("signed-payload", load("signed"), cacheable=is_resolved)
+        clock.now = 4.9
+        coalescer.lookup("signed-payload", load("signed"), cacheable=is_resolved)
+        clock.now = 5.0
+        coalescer.lookup("signed-payload", load("signed"), cacheable=is_resolved)
+
+        self.assertEqual(loads, ["open", "open", "signed", "signed"])
+
+
+class XamanServiceCoalescingTests(unittest.TestCase):
+    def test_concurrent_reconcile_lookups_make_one_provider_call(self) -> None:
+        with XamanStandInServer(config=XamanStandInConfig(latency_ms=100)) as stand_in:
+            service = XamanService(
+                mode="api",
+                api_base_url=stand_in.base_url,
+                api_key="coalesce-key",
+                api_secret="coalesce-secret",
+                status_coalescer=XamanStatusCoalescer(resolved_ttl_seconds=30),
+            )
+            payload_id = service.create_sign_request(
+                tx_json={"TransactionType": "EscrowCreate"}, reference="coalesce"
+            ).payload_id
+            stand_in.resolve(payload_id, signed=True, tx_hash="B" * 64)
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda _: service.get_payload_status(payload_id=payload_id), range(8)))
+            repeated = service.get_payload_status(payload_id=payload_id)
+
+        self.assertTrue(all(result.status == XamanPayloadStatus.SIGNED for result in results))
+        self.assertEqual(repeated.tx_hash, "B" * 64)
+        self.assertEqual(stand_in.stats.status_requests, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
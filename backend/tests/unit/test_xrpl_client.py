@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from app.integrations.xrpl_client import XrplClientError, XrplJsonRpcClient
+from app.perf.xrpl_stand_in import XrplStandInServer
+from app.services.xrpl_escrow_service import (
+    escrow_create_confirmation_from_ledger,
+    payout_confirmation_from_ledger,
+)
+
+
+class XrplJsonRpcClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stand_in = XrplStandInServer().start()
+        self.client = XrplJsonRpcClient(url=self.stand_in.url, timeout_seconds=5, pool_size=4)
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.stand_in.stop()
+
+    def test_tx_returns_result_or_none_when_not_found(self) -> None:
+        self.stand_in.add_transaction("AB" * 32, {"TransactionType": "EscrowCreate", "Sequence": 7})
+
+        found = self.client.tx("ab" * 32)
+
+        assert found is not None
+        self.assertEqual(found["Sequence"], 7)
+        self.assertEqual(found["meta"]["TransactionResult"], "tesSUCCESS")
+        self.assertIsNone(self.client.tx("CD" * 32))
+
+    def test_concurrent_lookups_reuse_the_bounded_connection_pool(self) -> None:
+        hashes = [f"{index:064X}" for index in range(24)]
+        for tx_hash in hashes:
+            self.stand_in.add_transaction(tx_hash, {"TransactionType": "EscrowFinish"})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self.client.tx, hashes + hashes))
+
+        self.assertTrue(all(result is not None for result in results))
+        self.assertEqual(self.stand_in.stats.requests_by_method["tx"], 48)
+        self.assertLessEqual(self.client.connections_opened, 4)
+        self.assertLessEqual(self.stand_in.stats.connections, 4)
+
+    def test_tx_many_deduplicates_and_reuses_pooled_connections(self) -> None:
+        hashes = [f"{index:064X}" for index in range(24)]
+        for tx_hash in hashes:
+            self.stand_in.add_transaction(tx_hash, {"TransactionType": "EscrowFinish"})
+
+        results = self.client.tx_many(hashes + hashes[:6])
+        self.client.tx_many(hashes)
+
+        self.assertEqual(set(results), set(hashes))
+        self.assertTrue(all(result is not None for result in results.values()))
+        self.assertEqual(self.stand_in.stats.requests_by_method["tx"], 48)
+        self.assertLessEqual(self.client.connections_opened, 4)
+        self.assertLessEqual(self.stand_in.stats.connections, 4)
+
+    def test_account_objects_follows_markers(self) -> None:
+        for index in range(5):
+            self.stand_in.add_account_object("rOwner", {"LedgerEntryType": "Escrow", "index": str(index)})
+
+        objects = self.client.account_objects("rOwner", object_type="escrow", limit=2)
+
+        self.assertEqual([item["index"] for item in objects], ["0", "1", "2", "3", "4"])
+        self.assertEqual(self.stand_in.stats.requests_by_method["account_objects"], 3)
+
+    def test_ledger_and_rpc_errors(self) -> None:
+        ledger = self.client.ledger()
+
+        self.assertTrue(ledger["validated"])
+        with self.assertRaisesRegex(XrplClientError, "xrpl_rpc_error"):
+            self.client.call("submit", {})
+
+
+class LedgerConfirmationMappingTests(unittest.TestCase):
+    def test_escrow_create_mapping_reads_api_v2_tx_json_and_ticket_sequence(self) -> None:
+        confirmation = escrow_create_confirmation_from_ledger(
+            tx_hash="aa",
+            tx_result={
+                "hash": "AA",
+                "validated": True,
+                "meta": {"TransactionResult": "tesSUCCESS"},
+                "tx_json": {
+                    "TransactionType": "EscrowCreate",
+                    "Account": "rOwner",
+                    "Destination": "rDest",
+                    "Amount": "1000",
+                    "FinishAfter": 10,
+                    "Sequence": 0,
+                    "TicketSequence": 55,
+                },
+            },
+        )
+
+        self.assertEqual(confirmation.tx_hash, "AA")
+        self.assertEqual(confirmation.offer_sequence, 55)
+        self.assertEqual(confirmation.amount_drops, 1000)
+        self.assertIsNone(confirmation.cancel_after_ripple)
+
+    def test_missing_transaction_maps_to_unvalidated_confirmation(self) -> None:
+        confirmation = payout_confirmation_from_ledger(tx_hash="BB", tx_result=None)
+
+        self.assertFalse(confirmation.validated)
+        self.assertEqual(confirmation.engine_result, "txnNotFound")
+        self.assertEqual(confirmation.tx_hash, "BB")
+
+
+if __name__ == "__main__":
+    unittest.main()
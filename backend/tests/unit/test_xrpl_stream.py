@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+import unittest
+
+from app.integrations.xrpl_stream import (
+    WebSocketFrameDecoder,
+    XrplStreamConnection,
+    XrplStreamError,
+    encode_websocket_frame,
+    ledger_result_from_stream,
+)
+from app.perf.xrpl_stand_in import XrplStandInServer
+
+
+class WebSocketFrameTests(unittest.TestCase):
+    def test_masked_frames_round_trip_across_length_encodings_and_partial_reads(self) -> None:
+        payloads = [b"", b"x" * 125, b"y" * 126, b"z" * 70_000]
+        stream = b"".join(encode_websocket_frame(0x1, payload, mask=True) for payload in payloads)
+        decoder = WebSocketFrameDecoder()
+        decoded: list[bytes] = []
+
+        for offset in range(0, len(stream), 1000):
+            decoder.feed(stream[offset : offset + 1000])
+            while (message := decoder.next_message()) is not None:
+                decoded.append(message[1])
+
+        self.assertEqual(decoded, payloads)
+
+    def test_fragmented_message_is_reassembled_around_interleaved_ping(self) -> None:
+        first = bytearray(encode_websocket_frame(0x1, b'{"a":', mask=False))
+        first[0] &= 0x7F
+        last = bytearray(encode_websocket_frame(0x0, b"1}", mask=False))
+        decoder = WebSocketFrameDecoder()
+        decoder.feed(bytes(first) + encode_websocket_frame(0x9, b"p", mask=False) + bytes(last))
+
+        self.assertEqual(decoder.next_message(), (0x9, b"p"))
+        self.assertEqual(decoder.next_message(), (0x1, b'{"a":1}'))
+        self.assertIsNone(decoder.next_message())
+
+
+class XrplStreamConnectionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stand_in = XrplStandInServer().start()
+
+    def tearDown(self) -> None:
+        self.stand_in.stop()
+
+    def test_subscribed_account_receives_validated_transactions_only_for_its_accounts(self) -> None:
+        with XrplStreamConnection(url=self.stand_in.ws_url, timeout_seconds=5) as connection:
+            connection.subscribe_accounts({"rWatched"})
+            self.assertEqual(connection.recv_json(timeout_seconds=5)["status"], "success")
+
+            self.stand_in.publish_transaction("01" * 32, {"TransactionType": "Payment", "Account": "rOther"})
+            self.stand_in.publish_transaction(
+                "02" * 32,
+                {"TransactionType": "EscrowFinish", "Account": "rAnyone", "Owner": "rWatched", "OfferSequence": 9},
+            )
+            message = connection.recv_json(timeout_seconds=5)
+
+        assert message is not None
+        result = ledger_result_from_stream(message)
+        assert result is not None
+        self.assertEqual(result["hash"], "02" * 32)
+        self.assertEqual(result["OfferSequence"], 9)
+        self.assertEqual(result["meta"]["TransactionResult"], "tesSUCCESS")
+
+    def test_recv_times_out_quietly_and_server_close_raises(self) -> None:
+        connection = XrplStreamConnection(url=self.stand_in.ws_url, timeout_seconds=5).connect()
+        try:
+            started = time.monotonic()
+            self.assertIsNone(connection.recv_json(timeout_seconds=0.05))
+            self.assertLess(time.monotonic() - started, 1)
+
+            self.stand_in.disconnect_streams()
+            with self.assertRaisesRegex(XrplStreamError, "xrpl_stream_closed"):
+                connection.recv_json(timeout_seconds=5)
+        finally:
+            connection.close()
+
+
+class LedgerResultFromStreamTests(unittest.TestCase):
+    def test_api_v2_message_and_unvalidated_messages(self) -> None:
+        message = {
+            "type": "transaction",
+            "validated": True,
+            "hash": "ab" * 32,
+            "ledger_index": 5,
+            "meta": {"TransactionResult": "tesSUCCESS"},
+            "tx_json": {"TransactionType": "EscrowCreate", "Sequence": 4, "date": 700},
+        }
+
+        result = ledger_result_from_stream(message)
+
+        assert result is not None
+        self.assertEqual((result["hash"], result["Sequence"], result["date"]), ("AB" * 32, 4, 700))
+        self.assertIsNone(ledger_result_from_stream({**message, "validated": False}))
+        self.assertIsNone(ledger_result_from_stream({"type": "response", "status": "success"}))
+
+
+if __name__ == "__main__":
+    unittest.main()